@@ -1,20 +1,61 @@
 import os
 
 
+def getenv_int(key: str, default: int | None = None) -> int | None:
+    """Return an environmental variable as an int, `default` if unset or empty."""
+    value = os.getenv(key)
+
+    if value is None or value.strip() == "":
+        return default
+
+    return int(value)
+
+
+def parse_write_concerns(value: str) -> dict[str, int | str] | None:
+    """Parse w values by kind of write, e.g. "vote=1,vote_counter=0".
+
+    :return: w keyed by kind of write, None if `value` is empty.
+    :raises ValueError: On entries that aren't <kind of write>=<w>.
+    """
+    if value.strip() == "":
+        return None
+
+    write_concerns = {}
+    for entry in value.split(","):
+        write, separator, w = (part.strip() for part in entry.partition("="))
+
+        if not separator or write == "" or w == "" or "=" in w:
+            raise ValueError(
+                f"Invalid DATABASE_WRITE_CONCERNS entry {entry.strip()!r}, "
+                "expected <kind of write>=<w>"
+            )
+
+        write_concerns[write] = int(w) if w.isdigit() else w
+
+    return write_concerns
+
+
 class JafaConfigClass:
     """Class to load config values from environmental variables"""
 
     database_type: str | None
+    async_database_type: str | None
     database_host: str | None
     database_port: str | None
     database_username: str | None
     database_password: str | None
+    database_options: dict[str, int | str]
     cors_origins: list[str]
+    log_level: str
+    entity_cache_size: int
+    entity_cache_ttl: int
     testing: bool
 
     def __init__(self):
         self.database_type: str | None = os.getenv("DATABASE_TYPE")
         """Database type"""
+        self.async_database_type = os.getenv("ASYNC_DATABASE_TYPE")
+        """Database type of the async routes, which are disabled if unset"""
         self.database_host = os.getenv("DATABASE_HOST")
         """Database host"""
         self.database_port = os.getenv("DATABASE_PORT")
@@ -23,10 +64,44 @@ class JafaConfigClass:
         """Database username"""
         self.database_password = os.getenv("DATABASE_PASSWORD")
         """Database password"""
+        self.database_options = self.__load_database_options()
+        """Connection pool, timeout, compression, read, write and storage options, unset ones are left out"""
         self.cors_origins = os.getenv("WHITELISTED_ORIGINS", "").split(",")
         """List of whitelisted CORS urls"""
+        self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        """Level of application logs"""
+        self.entity_cache_size = getenv_int("ENTITY_CACHE_SIZE", 10000)
+        """Most posts, subforums and users each cached by a process, 0 disables caching"""
+        self.entity_cache_ttl = getenv_int("ENTITY_CACHE_TTL", 10)
+        """Seconds a cached post, subforum or user is served for"""
         self.testing = False
         """Indicate we are running tests, should be overriden"""
 
+    def __load_database_options(self) -> dict[str, int | str]:
+        options = dict(
+            max_pool_size=getenv_int("DATABASE_MAX_POOL_SIZE"),
+            min_pool_size=getenv_int("DATABASE_MIN_POOL_SIZE"),
+            wait_queue_timeout_ms=getenv_int("DATABASE_WAIT_QUEUE_TIMEOUT_MS"),
+            server_selection_timeout_ms=getenv_int(
+                "DATABASE_SERVER_SELECTION_TIMEOUT_MS"
+            ),
+            socket_timeout_ms=getenv_int("DATABASE_SOCKET_TIMEOUT_MS"),
+            max_idle_time_ms=getenv_int("DATABASE_MAX_IDLE_TIME_MS"),
+            app_name=os.getenv("DATABASE_APP_NAME", "jafa"),
+            compressors=os.getenv("DATABASE_COMPRESSORS"),
+            zlib_compression_level=getenv_int("DATABASE_ZLIB_COMPRESSION_LEVEL"),
+            read_preference=os.getenv("DATABASE_READ_PREFERENCE"),
+            max_staleness_seconds=getenv_int("DATABASE_MAX_STALENESS_SECONDS"),
+            write_concerns=self.__load_write_concerns(),
+            body_codec=os.getenv("POST_BODY_CODEC") or None,
+            body_codec_threshold=getenv_int("POST_BODY_CODEC_THRESHOLD"),
+            body_storage=os.getenv("POST_BODY_STORAGE") or None,
+        )
+
+        return {key: value for key, value in options.items() if value is not None}
+
+    def __load_write_concerns(self) -> dict[str, int | str] | None:
+        return parse_write_concerns(os.getenv("DATABASE_WRITE_CONCERNS", ""))
+
 
 jafa_config = JafaConfigClass()
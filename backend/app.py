@@ -1,3 +1,4 @@
+import logging
 from secrets import token_hex
 
 from flask import Flask
@@ -5,6 +6,7 @@ from flask_cors import CORS
 
 from backend.blueprints.APIBlueprintManager import APIBlueprintManager
 from backend.blueprints.APIRouteManager import RouteBlueprintManager
+from backend.commands import register_commands
 from backend.data.databases.DatabaseFactory import DatabaseFactory
 from backend.JafaConfigClass import jafa_config
 
@@ -23,6 +25,9 @@ def create_app() -> Flask:
     app.register_blueprint(APIBlueprintManager().get_blueprint())
     app.register_blueprint(RouteBlueprintManager().get_blueprint())
 
+    # Register maintenance commands
+    register_commands(app)
+
     # Register index endpoint
     @app.route("/")
     def index():
@@ -30,13 +35,29 @@ def create_app() -> Flask:
 
     # Connect to database if we are not testing
     if not jafa_config.testing:
+        logging.basicConfig(level=jafa_config.log_level)
+
         database = DatabaseFactory.create_database(jafa_config.database_type)
         database.connect(
             jafa_config.database_host,
             jafa_config.database_port,
             jafa_config.database_username,
             jafa_config.database_password,
+            **jafa_config.database_options,
         )
         database.setup()
 
+        if jafa_config.async_database_type is not None:
+            async_database = DatabaseFactory.create_database(
+                jafa_config.async_database_type
+            )
+            async_database.connect(
+                jafa_config.database_host,
+                jafa_config.database_port,
+                jafa_config.database_username,
+                jafa_config.database_password,
+                **jafa_config.database_options,
+            )
+            async_database.setup()
+
     return app
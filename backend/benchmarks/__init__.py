@@ -0,0 +1,54 @@
+"""Benchmarks for Jafa's data layer.
+
+Each module is runnable on its own, see `python -m backend.benchmarks.<name> --help`.
+"""
+
+import argparse
+import statistics
+
+from backend.data.databases.AbstractDatabase import AbstractDatabase
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.JafaConfigClass import jafa_config
+
+BENCHMARK_SUBFORUM = "jafa_benchmark"
+"""Subforum all benchmark posts are created in, so they can be cleaned up."""
+
+
+def make_parser(description: str) -> argparse.ArgumentParser:
+    """Return an argument parser with the database connection arguments."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--host", default="localhost", help="Database host")
+    parser.add_argument("--port", default=27017, type=int, help="Database port")
+    parser.add_argument("--username", default=None, help="Database username")
+    parser.add_argument("--password", default=None, help="Database password")
+
+    return parser
+
+
+def connect(
+    args: argparse.Namespace, database_type: str = "mongo", **options
+) -> AbstractDatabase:
+    """Connect and set up the database the models will use.
+
+    :param options: Database options, see JafaConfigClass.database_options.
+    """
+    jafa_config.database_type = database_type
+
+    database = DatabaseFactory.create_database(database_type)
+    database.connect(args.host, args.port, args.username, args.password, **options)
+    database.setup()
+
+    return database
+
+
+def report(name: str, timings: list[float]):
+    """Print a summary of timings, given in seconds."""
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+
+    print(
+        f"{name}: n={len(timings)} "
+        f"mean={statistics.mean(timings) * 1000:.3f}ms "
+        f"p50={statistics.median(timings) * 1000:.3f}ms "
+        f"p95={p95 * 1000:.3f}ms"
+    )
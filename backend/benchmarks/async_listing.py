@@ -0,0 +1,98 @@
+"""Compare post listing throughput of the sync and async data layers.
+
+Each request lists a page of posts with the requesting user's votes and the
+listing info, like the root route does. The sync managers serve concurrent
+requests from a thread pool, the async managers from a single event loop
+where each request reads the page and the info concurrently.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.benchmarks.delete_transaction import seed
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
+from backend.data.managers.PostMananger import PostManager
+from backend.data.managers.SubForumManager import SubForumManager
+from backend.JafaConfigClass import jafa_config
+
+
+def run_sync(requests: int, concurrency: int) -> tuple[list[float], float]:
+    post_manager = PostManager()
+    subforum_manager = SubForumManager()
+
+    def request(i: int) -> float:
+        start = time.perf_counter()
+        post_manager.get_post_list(BENCHMARK_SUBFORUM, username=f"benchmark{i % 10}")
+        subforum_manager.get_subforum_info()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = list(executor.map(request, range(requests)))
+
+    return timings, time.perf_counter() - start
+
+
+async def run_async(requests: int, concurrency: int) -> tuple[list[float], float]:
+    post_manager = AsyncPostManager()
+    subforum_manager = AsyncSubForumManager()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(i: int) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await asyncio.gather(
+                post_manager.get_post_list(
+                    BENCHMARK_SUBFORUM, username=f"benchmark{i % 10}"
+                ),
+                subforum_manager.get_subforum_info(),
+            )
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    timings = await asyncio.gather(*(request(i) for i in range(requests)))
+
+    return list(timings), time.perf_counter() - start
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=200, type=int, help="Posts to seed")
+    parser.add_argument("--requests", default=2000, type=int)
+    parser.add_argument("--concurrency", default=50, type=int)
+    args = parser.parse_args()
+
+    connect(args)
+
+    jafa_config.async_database_type = "async_mongo"
+    async_database = DatabaseFactory.create_database("async_mongo")
+    async_database.connect(args.host, args.port, args.username, args.password)
+
+    post_ids = seed(args.posts, 10)
+
+    try:
+        for name, run in [
+            ("sync", lambda: run_sync(args.requests, args.concurrency)),
+            (
+                "async",
+                lambda: async_database.run(run_async(args.requests, args.concurrency)),
+            ),
+        ]:
+            timings, elapsed = run()
+            report(f"listing ({name}, concurrency={args.concurrency})", timings)
+            print(f"listing ({name}): {len(timings) / elapsed:.1f} requests/s")
+    finally:
+        post_manager = PostManager()
+        for post_id in post_ids:
+            post_manager.model_factory.create_vote_model().clear_votes_by_id(post_id)
+            post_manager.model_factory.create_post_model().delete_by_post_id(post_id)
+
+        async_database.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Report the footprint of post bodies stored with each body codec.
+
+A synthetic corpus of posts is written to a scratch collection per codec,
+the way MongoPostModel stores them. The collection's data size approximates
+its footprint in the WiredTiger cache, which holds documents uncompressed,
+and its storage size the footprint on disk. Reading a post back includes
+decoding its body.
+"""
+
+import random
+import time
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from backend.benchmarks import connect, make_parser, report
+from backend.benchmarks.wire_compression import make_body
+from backend.data.models.mongo.BodyCodec import BodyCodec, decode_body, zstd
+from backend.data.models.PostModel import PREVIEW_MAX
+
+CODECS = [None, "zlib"] + (["zstd"] if zstd is not None else [])
+"""Codecs to compare, zstd only if it's installed."""
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=2000, type=int, help="Posts to store")
+    parser.add_argument(
+        "--min-body-size", default=200, type=int, help="Smallest body in characters"
+    )
+    parser.add_argument(
+        "--max-body-size", default=40000, type=int, help="Largest body in characters"
+    )
+    parser.add_argument("--threshold", default=None, type=int, help="Codec threshold")
+    parser.add_argument("--reads", default=1000, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Corpus random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    jafa = database.get_client().jafa
+
+    random.seed(args.seed)
+    bodies = [
+        make_body(random.randint(args.min_body_size, args.max_body_size))
+        for _ in range(args.posts)
+    ]
+    now = datetime.now()
+
+    for codec in CODECS:
+        name = codec or "none"
+        collection = jafa[f"benchmark_bodies_{name}"]
+        collection.drop()
+        body_codec = BodyCodec(codec, args.threshold)
+
+        try:
+            ids = collection.insert_many(
+                [
+                    dict(
+                        op="benchmark",
+                        title=f"Benchmark {i}",
+                        preview=body[:PREVIEW_MAX],
+                        creation_date=now,
+                        modified_date=now,
+                        likes=0,
+                        dislikes=0,
+                    )
+                    | body_codec.encode(body)
+                    for i, body in enumerate(bodies)
+                ]
+            ).inserted_ids
+
+            stats = jafa.command("collStats", collection.name)
+            print(
+                f"{name}: data (cache) size={stats['size'] / 1024 / 1024:.2f}MiB "
+                f"storage (disk) size={stats['storageSize'] / 1024 / 1024:.2f}MiB "
+                f"compressed bodies="
+                f"{collection.count_documents({'body_codec': {'$exists': True}})}"
+            )
+
+            timings = []
+            for i in range(args.reads):
+                post_id: ObjectId = ids[i % len(ids)]
+                start = time.perf_counter()
+                post = collection.find_one({"_id": post_id})
+                decode_body(post["body"], post.get("body_codec"))
+                timings.append(time.perf_counter() - start)
+
+            report(f"read and decode ({name})", timings)
+        finally:
+            collection.drop()
+
+
+if __name__ == "__main__":
+    main()
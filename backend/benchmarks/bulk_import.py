@@ -0,0 +1,117 @@
+"""Compare creating posts one by one with the bulk import pipeline.
+
+Posts are created through PostManager.create_post one at a time, the way the
+create post API does, then imported from a generated NDJSON file along with
+votes on them.
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser
+from backend.data.managers.PostMananger import PostManager
+from backend.data.models.ModelFactory import ModelFactory
+from backend.importer import Checkpoint, import_file
+
+
+def write_rows(path: str, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def import_rows(kind: str, path: str, batch_size: int) -> tuple[int, float]:
+    checkpoint = Checkpoint(f"{path}.checkpoint", kind, path)
+
+    start = time.perf_counter()
+    imported = sum(
+        batch["imported"] for batch in import_file(kind, path, checkpoint, batch_size)
+    )
+    elapsed = time.perf_counter() - start
+
+    checkpoint.remove()
+
+    return imported, elapsed
+
+
+def clean_up():
+    post_model = ModelFactory.create_post_model()
+    vote_model = ModelFactory.create_vote_model()
+
+    while posts := post_model.get_posts(1000, 0, BENCHMARK_SUBFORUM):
+        for post in posts:
+            vote_model.clear_votes_by_id(post["post_id"])
+            post_model.delete_by_post_id(post["post_id"])
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=2000, type=int, help="Posts to create")
+    parser.add_argument("--votes", default=10, type=int, help="Votes per post")
+    parser.add_argument("--batch-size", default=1000, type=int)
+    args = parser.parse_args()
+
+    connect(args)
+
+    subforum_model = ModelFactory.create_subforum_model()
+    subforum_model.create_subforum(
+        dict(
+            creator="benchmark",
+            title=BENCHMARK_SUBFORUM,
+            description="Benchmark subforum",
+            creation_date=datetime.now(),
+        )
+    )
+
+    try:
+        post_manager = PostManager()
+
+        start = time.perf_counter()
+        for i in range(args.posts):
+            post_manager.create_post(
+                "benchmark", BENCHMARK_SUBFORUM, f"Benchmark {i}", "Benchmark body"
+            )
+        elapsed = time.perf_counter() - start
+        print(f"create_post: {args.posts / elapsed:.1f} posts/s")
+
+        clean_up()
+
+        with tempfile.TemporaryDirectory() as directory:
+            posts_path = os.path.join(directory, "posts.ndjson")
+            votes_path = os.path.join(directory, "votes.ndjson")
+
+            write_rows(
+                posts_path,
+                (
+                    dict(
+                        id=i,
+                        op="benchmark",
+                        subforum=BENCHMARK_SUBFORUM,
+                        title=f"Benchmark {i}",
+                        body="Benchmark body",
+                    )
+                    for i in range(args.posts)
+                ),
+            )
+            write_rows(
+                votes_path,
+                (
+                    dict(username=f"benchmark{j}", post_id=i, is_like=j % 2 == 0)
+                    for i in range(args.posts)
+                    for j in range(args.votes)
+                ),
+            )
+
+            for kind, path in [("posts", posts_path), ("votes", votes_path)]:
+                imported, elapsed = import_rows(kind, path, args.batch_size)
+                print(f"import {kind}: {imported / elapsed:.1f} {kind}/s")
+    finally:
+        clean_up()
+        subforum_model.delete_subforum(BENCHMARK_SUBFORUM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare full responses of the read routes with revalidated ones.
+
+Posts are imported into the benchmark subforum, then the root, subforum and
+post routes are requested through Flask's test client, once without
+conditions and once with the ETag of an earlier response in If-None-Match,
+the way polling clients and caching proxies revalidate. Timings and the
+bytes of each response are printed.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.app import create_app
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.managers.ManagerFactory import ManagerFactory
+from backend.data.models.ModelFactory import ModelFactory
+from backend.JafaConfigClass import jafa_config
+
+USERNAME = "benchmark"
+
+
+def seed(posts: int) -> list[str]:
+    ManagerFactory.create_subforum_manager().create_subforum(
+        USERNAME, BENCHMARK_SUBFORUM, "Benchmark posts"
+    )
+
+    now = datetime.now()
+    batch = [
+        dict(
+            post_id=str(ObjectId()),
+            op=USERNAME,
+            subforum=BENCHMARK_SUBFORUM,
+            title=f"Benchmark post {i}",
+            body="Benchmark body " * 100,
+            media=None,
+            tags=None,
+            likes=random.randint(0, 100),
+            dislikes=random.randint(0, 100),
+            locked=False,
+            creation_date=now - timedelta(seconds=i),
+            modified_date=now - timedelta(seconds=i),
+        )
+        for i in range(posts)
+    ]
+
+    ModelFactory.create_post_model().import_posts(batch)
+
+    return [post["post_id"] for post in batch]
+
+
+def clean_up():
+    post_model = ModelFactory.create_post_model()
+
+    post_model.clear_posts(USERNAME)
+    post_model.reconcile_counts()
+    ModelFactory.create_subforum_model().delete_subforum(BENCHMARK_SUBFORUM)
+
+
+def measure(name: str, client, url: str, iterations: int):
+    etag, _ = client.get(url).get_etag()
+
+    for label, headers in (
+        ("full", {}),
+        ("revalidated", {"If-None-Match": f'"{etag}"'}),
+    ):
+        timings = []
+        sizes = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = client.get(url, headers=headers)
+            timings.append(time.perf_counter() - start)
+            sizes.append(len(response.get_data()))
+
+        report(f"{name} {label}", timings)
+        print(
+            f"{name} {label}: status={response.status_code} "
+            f"bytes={sum(sizes) / len(sizes):,.0f}"
+        )
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument(
+        "--database", default="mongo", choices=("mongo", "memory"), help="Database"
+    )
+    parser.add_argument("--posts", default=1000, type=int, help="Posts to seed")
+    parser.add_argument("--iterations", default=1000, type=int)
+    args = parser.parse_args()
+
+    connect(args, args.database)
+    random.seed(0)
+    post_ids = seed(args.posts)
+
+    # The database is already connected, the app must not connect again
+    jafa_config.testing = True
+    client = create_app().test_client()
+
+    try:
+        measure("GET /route/root/", client, "/route/root/", args.iterations)
+        measure(
+            "GET /route/subforum/<title>/",
+            client,
+            f"/route/subforum/{BENCHMARK_SUBFORUM}/",
+            args.iterations,
+        )
+        measure(
+            "GET /route/post/<post_id>/",
+            client,
+            f"/route/post/{post_ids[0]}/",
+            args.iterations,
+        )
+    finally:
+        clean_up()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure the overhead of deleting a post and its votes in a transaction.
+
+Transactions require a replica set, a single node one is enough:
+`mongod --replSet rs0` followed by `rs.initiate()` in mongosh.
+"""
+
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.models.ModelFactory import ModelFactory
+
+
+def seed(posts: int, votes: int) -> list[str]:
+    """Create posts with votes and return their IDs."""
+    post_model = ModelFactory.create_post_model()
+    vote_model = ModelFactory.create_vote_model()
+
+    now = datetime.now()
+    for i in range(posts):
+        post_model.create_post(
+            dict(
+                op="benchmark",
+                subforum=BENCHMARK_SUBFORUM,
+                title=f"Benchmark {i}",
+                body="Benchmark body",
+                media=None,
+                tags=None,
+                likes=0,
+                dislikes=0,
+                locked=False,
+                creation_date=now,
+                modified_date=now,
+            )
+        )
+
+    post_ids = [
+        post["post_id"] for post in post_model.get_posts(posts, 0, BENCHMARK_SUBFORUM)
+    ]
+
+    for post_id in post_ids:
+        for i in range(votes):
+            vote_model.add_vote(
+                dict(
+                    username=f"benchmark{i}",
+                    content_id=post_id,
+                    content_type="ContentType.POST",
+                    is_like=i % 2 == 0,
+                    creation_date=now,
+                )
+            )
+
+    return post_ids
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=500, type=int, help="Posts to delete")
+    parser.add_argument("--votes", default=10, type=int, help="Votes per post")
+    args = parser.parse_args()
+
+    database = connect(args)
+    post_model = ModelFactory.create_post_model()
+    vote_model = ModelFactory.create_vote_model()
+
+    for name, unit_of_work in [
+        ("plain", nullcontext),
+        ("unit_of_work", database.unit_of_work),
+    ]:
+        timings = []
+
+        for post_id in seed(args.posts, args.votes):
+            start = time.perf_counter()
+            with unit_of_work():
+                vote_model.clear_votes_by_id(post_id)
+                post_model.delete_by_post_id(post_id)
+            timings.append(time.perf_counter() - start)
+
+        report(f"delete post with {args.votes} votes ({name})", timings)
+
+
+if __name__ == "__main__":
+    main()
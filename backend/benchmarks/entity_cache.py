@@ -0,0 +1,99 @@
+"""Compare reading posts through the entity cache with reading them from the database.
+
+Posts are imported into the benchmark subforum, then single posts are read
+the way the post route reads them, most reads going to a few hot posts.
+Reads are measured with the cache disabled and with it enabled, and the
+cache's hit/miss counters are printed.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.EntityCache import EntityCache
+from backend.data.managers.PostMananger import PostManager
+from backend.data.models.ModelFactory import ModelFactory
+
+USERNAME = "benchmark"
+
+
+class UncachedModelFactory(ModelFactory):
+    @staticmethod
+    def entity_cache() -> EntityCache:
+        return EntityCache(0, 0)
+
+
+def seed(posts: int) -> list[str]:
+    now = datetime.now()
+    batch = [
+        dict(
+            post_id=str(ObjectId()),
+            op=USERNAME,
+            subforum=BENCHMARK_SUBFORUM,
+            title=f"Benchmark post {i}",
+            body="Benchmark body " * 100,
+            media=None,
+            tags=None,
+            likes=0,
+            dislikes=0,
+            locked=False,
+            creation_date=now - timedelta(seconds=i),
+            modified_date=now - timedelta(seconds=i),
+        )
+        for i in range(posts)
+    ]
+
+    ModelFactory.create_post_model().import_posts(batch)
+
+    return [post["post_id"] for post in batch]
+
+
+def clean_up():
+    post_model = ModelFactory.create_post_model()
+
+    post_model.clear_posts(USERNAME)
+    post_model.reconcile_counts()
+
+
+def measure(name: str, post_manager: PostManager, post_ids: list[str], reads: int):
+    # Pareto distributed, a few posts get most reads like front page posts do
+    picks = [
+        post_ids[min(int(random.paretovariate(1.2)) - 1, len(post_ids) - 1)]
+        for _ in range(reads)
+    ]
+
+    timings = []
+    for post_id in picks:
+        start = time.perf_counter()
+        post_manager.get_post(post_id, allow_stale=True)
+        timings.append(time.perf_counter() - start)
+
+    report(name, timings)
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=1000, type=int, help="Posts to seed")
+    parser.add_argument("--reads", default=5000, type=int)
+    args = parser.parse_args()
+
+    connect(args)
+    random.seed(0)
+    post_ids = seed(args.posts)
+
+    try:
+        measure("uncached", PostManager(UncachedModelFactory()), post_ids, args.reads)
+
+        cache = ModelFactory.entity_cache()
+        cache.clear()
+        measure("cached", PostManager(), post_ids, args.reads)
+        print(f"cache: {cache.stats()['posts']}")
+    finally:
+        clean_up()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare per-request cost of shared versus freshly built models and managers.
+
+Simulates the object graph a post listing request needs: the post and
+subforum managers, the post and vote models, and the vote manager the post
+manager uses to attach the user's votes. No queries are sent; the database
+connection is only needed so models can be constructed.
+"""
+
+import time
+import tracemalloc
+
+from backend.benchmarks import connect, make_parser, report
+from backend.data.managers.ManagerFactory import ManagerFactory
+from backend.data.managers.PostMananger import PostManager
+from backend.data.managers.SubForumManager import SubForumManager
+from backend.data.managers.VoteManager import VoteManager
+from backend.data.models.ModelFactory import ModelFactory
+
+
+def fresh_request():
+    """Build every object the way it was done before instances were shared."""
+    post_manager = PostManager()
+    SubForumManager()
+    VoteManager(post_manager.model_factory)
+
+    for model_type in ("post", "vote", "post"):
+        ModelFactory._import_model("mongo", model_type)()
+
+
+def shared_request():
+    post_manager = ManagerFactory.create_post_manager()
+    subforum_manager = ManagerFactory.create_subforum_manager()
+    post_manager._get_manager(VoteManager).model_factory.create_vote_model()
+    post_manager.model_factory.create_post_model()
+    subforum_manager.model_factory.create_post_model()
+
+
+def measure(name: str, request, iterations: int):
+    request()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        request()
+        timings.append(time.perf_counter() - start)
+
+    report(name, timings)
+
+    tracemalloc.start()
+    for _ in range(iterations):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        request()
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name}: peak allocation per request={peak - baseline} bytes")
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", default=10000, type=int)
+    args = parser.parse_args()
+
+    database = connect(args)
+
+    try:
+        measure("fresh", fresh_request, args.iterations)
+        measure("shared", shared_request, args.iterations)
+    finally:
+        database.disconnect()
+
+
+if __name__ == "__main__":
+    main()
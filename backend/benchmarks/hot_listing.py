@@ -0,0 +1,124 @@
+"""Compare hot listings read by the stored hot score with newest listings.
+
+Posts with random votes spread over a month are imported into the benchmark
+subforum. Pages are listed newest first, by the indexed hot score, and by a
+hot score computed on every request the way a listing without a stored score
+would have to, sorting the whole subforum in memory.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.models.ModelFactory import ModelFactory
+from backend.data.models.mongo.MongoPostModel import (
+    HOT_SCORE,
+    HOT_SORT,
+    LIST_PROJECTION,
+    POSTS_COLLECTION,
+)
+
+PAGE_SIZE = 20
+
+
+def seed(posts: int, batch_size: int = 1000):
+    post_model = ModelFactory.create_post_model()
+
+    now = datetime.now()
+    for start in range(0, posts, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, posts)):
+            creation_date = now - timedelta(seconds=random.randint(0, 30 * 86400))
+            batch.append(
+                dict(
+                    post_id=str(ObjectId()),
+                    op="benchmark",
+                    subforum=BENCHMARK_SUBFORUM,
+                    title=f"Benchmark {i}",
+                    body="Benchmark body",
+                    media=None,
+                    tags=None,
+                    likes=int(random.paretovariate(1.2)) - 1,
+                    dislikes=int(random.paretovariate(1.5)) - 1,
+                    locked=False,
+                    creation_date=creation_date,
+                    modified_date=creation_date,
+                )
+            )
+
+        post_model.import_posts(batch)
+
+
+def clean_up(database):
+    database.get_client().jafa[POSTS_COLLECTION].delete_many(
+        {"subforum": BENCHMARK_SUBFORUM}
+    )
+    ModelFactory.create_post_model().reconcile_counts()
+
+
+def measure(name: str, read, pages: int, iterations: int):
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        read(i % pages)
+        timings.append(time.perf_counter() - start)
+
+    report(name, timings)
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=20000, type=int, help="Posts to seed")
+    parser.add_argument("--pages", default=10, type=int, help="Pages deep to list")
+    parser.add_argument("--iterations", default=200, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Vote random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    post_model = ModelFactory.create_post_model()
+    posts_collection = database.get_client().jafa[POSTS_COLLECTION]
+
+    random.seed(args.seed)
+    seed(args.posts)
+
+    def computed_hot(page: int):
+        return list(
+            posts_collection.aggregate(
+                [
+                    {"$match": {"subforum": BENCHMARK_SUBFORUM}},
+                    {"$project": LIST_PROJECTION | dict(hot=HOT_SCORE)},
+                    {"$sort": dict(HOT_SORT)},
+                    {"$skip": PAGE_SIZE * page},
+                    {"$limit": PAGE_SIZE},
+                ]
+            )
+        )
+
+    try:
+        for sort in ("new", "hot"):
+            measure(
+                f"get_posts ({sort})",
+                lambda page: post_model.get_posts(
+                    PAGE_SIZE, PAGE_SIZE * page, BENCHMARK_SUBFORUM, sort=sort
+                ),
+                args.pages,
+                args.iterations,
+            )
+
+        measure("computed hot", computed_hot, args.pages, args.iterations)
+
+        start = time.perf_counter()
+        corrected = post_model.recompute_scores()
+        print(
+            f"recompute_scores: {time.perf_counter() - start:.3f}s, "
+            f"{corrected} corrected"
+        )
+    finally:
+        clean_up(database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Measure the manager and blueprint layers in isolation on the memory database.
+
+Posts are imported into the benchmark subforum of an in-process memory
+database, so every operation is bound by the managers and blueprints rather
+than by a database server. Listings, single post reads, votes and searches
+are measured through the managers, then the listing and post routes through
+Flask's test client. The connection arguments are accepted but ignored.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.app import create_app
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.managers.ManagerFactory import ManagerFactory
+from backend.data.models.VoteModel import ContentType
+from backend.JafaConfigClass import jafa_config
+
+USERNAME = "benchmark"
+
+
+def seed(posts: int) -> list[str]:
+    """Import `posts` posts, returning their IDs."""
+    post_manager = ManagerFactory.create_post_manager()
+
+    ManagerFactory.create_user_manager().create_user(USERNAME, "Benchmark1")
+    ManagerFactory.create_subforum_manager().create_subforum(
+        USERNAME, BENCHMARK_SUBFORUM, "Benchmark posts"
+    )
+
+    now = datetime.now()
+    batch = []
+    for i in range(posts):
+        creation_date = now - timedelta(minutes=i)
+        batch.append(
+            dict(
+                post_id=str(ObjectId()),
+                op=USERNAME,
+                subforum=BENCHMARK_SUBFORUM,
+                title=f"Benchmark post {i}",
+                body="Benchmark body " * 20,
+                media=None,
+                tags=[f"tag{i % 10}"],
+                likes=random.randint(0, 100),
+                dislikes=random.randint(0, 100),
+                locked=False,
+                creation_date=creation_date,
+                modified_date=creation_date,
+            )
+        )
+
+    post_manager.import_posts(batch)
+
+    return [post["post_id"] for post in batch]
+
+
+def measure(name: str, operation, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    report(name, timings)
+    print(f"{name}: {iterations / sum(timings):,.0f} ops/sec")
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=10000, type=int, help="Posts to seed")
+    parser.add_argument("--iterations", default=20000, type=int)
+    args = parser.parse_args()
+
+    connect(args, "memory")
+    random.seed(0)
+    post_ids = seed(args.posts)
+
+    post_manager = ManagerFactory.create_post_manager()
+    vote_manager = ManagerFactory.create_vote_manager()
+
+    measure(
+        "get_post_list new",
+        lambda: post_manager.get_post_list(page=random.randrange(10)),
+        args.iterations,
+    )
+    measure(
+        "get_post_list hot",
+        lambda: post_manager.get_post_list(page=random.randrange(10), sort="hot"),
+        args.iterations,
+    )
+    measure(
+        "get_post_list tag",
+        lambda: post_manager.get_post_list(tags=["tag3"], username=USERNAME),
+        args.iterations,
+    )
+    measure(
+        "get_post",
+        lambda: post_manager.get_post(random.choice(post_ids)),
+        args.iterations,
+    )
+    measure(
+        "add_vote",
+        lambda: vote_manager.add_vote(
+            USERNAME, random.choice(post_ids), ContentType.POST, random.random() < 0.5
+        ),
+        args.iterations,
+    )
+    measure(
+        "search_posts",
+        lambda: post_manager.search_posts("post 42"),
+        args.iterations // 10,
+    )
+
+    # The database is already connected, the app must not connect again
+    jafa_config.testing = True
+    client = create_app().test_client()
+
+    measure(
+        "GET /route/root/",
+        lambda: client.get(f"/route/root/{random.randrange(10)}"),
+        args.iterations // 10,
+    )
+    measure(
+        "GET /route/post/<post_id>/",
+        lambda: client.get(f"/route/post/{random.choice(post_ids)}/"),
+        args.iterations // 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
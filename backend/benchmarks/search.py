@@ -0,0 +1,131 @@
+"""Compare full-text search with filtering listing pages client-side.
+
+Posts with random titles, tags and bodies are imported into the benchmark
+subforum. A page of results for a word is read by search_posts with an
+empty cache, by search_posts repeated within the cache TTL, and by listing
+pages newest first and keeping the posts whose title, tags or preview
+contain the word, until a page of results is found.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.benchmarks.wire_compression import WORDS, make_body
+from backend.data.models.ModelFactory import ModelFactory
+from backend.data.models.mongo.MongoPostModel import POSTS_COLLECTION, MongoPostModel
+
+PAGE_SIZE = 20
+
+
+def seed(posts: int, batch_size: int = 1000):
+    post_model = ModelFactory.create_post_model()
+
+    now = datetime.now()
+    for start in range(0, posts, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, posts)):
+            creation_date = now - timedelta(seconds=i)
+            batch.append(
+                dict(
+                    post_id=str(ObjectId()),
+                    op="benchmark",
+                    subforum=BENCHMARK_SUBFORUM,
+                    title=" ".join(random.sample(WORDS, 3)),
+                    body=make_body(random.randint(200, 2000)),
+                    media=None,
+                    tags=random.sample(WORDS, 2),
+                    likes=0,
+                    dislikes=0,
+                    locked=False,
+                    creation_date=creation_date,
+                    modified_date=creation_date,
+                )
+            )
+
+        post_model.import_posts(batch)
+
+
+def clean_up(database):
+    database.get_client().jafa[POSTS_COLLECTION].delete_many(
+        {"subforum": BENCHMARK_SUBFORUM}
+    )
+    ModelFactory.create_post_model().reconcile_counts()
+
+
+def measure(name: str, read, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - start)
+
+    report(name, timings)
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=20000, type=int, help="Posts to seed")
+    parser.add_argument(
+        "--pages", default=50, type=int, help="Most pages filtered client-side"
+    )
+    parser.add_argument("--iterations", default=100, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Corpus random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    post_model = ModelFactory.create_post_model()
+
+    random.seed(args.seed)
+    seed(args.posts)
+
+    def client_side(word: str):
+        found = []
+        for page in range(args.pages):
+            posts = post_model.get_posts(
+                PAGE_SIZE, PAGE_SIZE * page, BENCHMARK_SUBFORUM
+            )
+            found += [
+                post
+                for post in posts
+                if word in post["title"]
+                or word in (post["tags"] or [])
+                or word in post["preview"]
+            ]
+
+            if len(found) >= PAGE_SIZE or len(posts) < PAGE_SIZE:
+                break
+
+        return found[:PAGE_SIZE]
+
+    try:
+        for word in ("replica", "cursor"):
+            measure(
+                f"search_posts uncached ({word})",
+                # Fresh models start with an empty cache
+                lambda: MongoPostModel().search_posts(
+                    word, PAGE_SIZE, subforum=BENCHMARK_SUBFORUM
+                ),
+                args.iterations,
+            )
+            measure(
+                f"search_posts cached ({word})",
+                lambda: post_model.search_posts(
+                    word, PAGE_SIZE, subforum=BENCHMARK_SUBFORUM
+                ),
+                args.iterations,
+            )
+            measure(
+                f"client-side filter ({word})",
+                lambda: client_side(word),
+                args.iterations,
+            )
+    finally:
+        clean_up(database)
+
+
+if __name__ == "__main__":
+    main()
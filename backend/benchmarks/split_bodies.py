@@ -0,0 +1,101 @@
+"""Compare the posts collection footprint with bodies inline or split off.
+
+A synthetic corpus is stored both ways in scratch collections, the way
+MongoPostModel stores it. Listings, votes and counters only touch the posts
+collection, so its data size is what they need cached: the smaller it is,
+the more posts fit in the same cache. Listing pages are read from both.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from pymongo import IndexModel
+
+from backend.benchmarks import connect, make_parser, report
+from backend.benchmarks.wire_compression import make_body
+from backend.data.models.mongo.MongoPostModel import LIST_PROJECTION, LISTING_SORT
+from backend.data.models.PostModel import PREVIEW_MAX
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=5000, type=int, help="Posts to store")
+    parser.add_argument(
+        "--max-body-size", default=40000, type=int, help="Largest body in characters"
+    )
+    parser.add_argument("--pages", default=1000, type=int, help="Pages to list")
+    parser.add_argument("--seed", default=0, type=int, help="Corpus random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    jafa = database.get_client().jafa
+
+    random.seed(args.seed)
+    now = datetime.now()
+    posts = [
+        dict(
+            op="benchmark",
+            subforum="benchmark",
+            title=f"Benchmark {i}",
+            body=make_body(random.randint(200, args.max_body_size)),
+            media=None,
+            tags=None,
+            likes=0,
+            dislikes=0,
+            locked=False,
+            creation_date=now - timedelta(seconds=i),
+            modified_date=now,
+        )
+        for i in range(args.posts)
+    ]
+
+    for storage in ("inline", "split"):
+        posts_collection = jafa[f"benchmark_posts_{storage}"]
+        bodies_collection = jafa[f"benchmark_post_bodies_{storage}"]
+
+        try:
+            posts_collection.create_indexes([IndexModel(LISTING_SORT)])
+            documents = [
+                post | dict(preview=post["body"][:PREVIEW_MAX]) for post in posts
+            ]
+
+            if storage == "split":
+                ids = posts_collection.insert_many(
+                    [
+                        {key: value for key, value in document.items() if key != "body"}
+                        for document in documents
+                    ]
+                ).inserted_ids
+                bodies_collection.insert_many(
+                    [dict(_id=_id, body=post["body"]) for _id, post in zip(ids, posts)]
+                )
+            else:
+                posts_collection.insert_many(documents)
+
+            stats = jafa.command("collStats", posts_collection.name)
+            print(
+                f"{storage}: posts data size={stats['size'] / 1024 / 1024:.2f}MiB "
+                f"avg post={stats['avgObjSize'] / 1024:.2f}KiB"
+            )
+
+            timings = []
+            page_count = max(len(posts) // 20, 1)
+            for i in range(args.pages):
+                start = time.perf_counter()
+                list(
+                    posts_collection.find({}, projection=LIST_PROJECTION)
+                    .sort(LISTING_SORT)
+                    .skip(20 * (i % page_count))
+                    .limit(20)
+                )
+                timings.append(time.perf_counter() - start)
+
+            report(f"list page ({storage})", timings)
+        finally:
+            posts_collection.drop()
+            bodies_collection.drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Compare SQLite with Mongo on the read-heavy routes.
+
+The same posts are imported into the benchmark subforum of each database,
+then the root and subforum listings, single posts and searches are read
+through Flask's test client, one database after the other. Mongo is reached
+with the connection arguments, SQLite uses the file at --path.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.app import create_app
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.benchmarks.wire_compression import WORDS, make_body
+from backend.data.models.ModelFactory import ModelFactory
+from backend.JafaConfigClass import jafa_config
+
+USERNAME = "benchmark"
+
+
+def make_posts(posts: int) -> list[dict]:
+    now = datetime.now()
+    batch = []
+
+    for i in range(posts):
+        creation_date = now - timedelta(minutes=i)
+        batch.append(
+            dict(
+                post_id=str(ObjectId()),
+                op=USERNAME,
+                subforum=BENCHMARK_SUBFORUM,
+                title=" ".join(random.sample(WORDS, 3)),
+                body=make_body(random.randint(200, 2000)),
+                media=None,
+                tags=random.sample(WORDS, 2),
+                likes=random.randint(0, 100),
+                dislikes=random.randint(0, 100),
+                locked=False,
+                creation_date=creation_date,
+                modified_date=creation_date,
+            )
+        )
+
+    return batch
+
+
+def seed(posts: list[dict], batch_size: int = 1000):
+    ModelFactory.create_subforum_model().import_subforums(
+        [
+            dict(
+                creator=USERNAME,
+                title=BENCHMARK_SUBFORUM,
+                description="Benchmark posts",
+                creation_date=datetime.now(),
+            )
+        ]
+    )
+
+    post_model = ModelFactory.create_post_model()
+    for start in range(0, len(posts), batch_size):
+        post_model.import_posts(posts[start : start + batch_size])
+
+
+def clean_up():
+    post_model = ModelFactory.create_post_model()
+
+    post_model.clear_posts(USERNAME)
+    post_model.reconcile_counts()
+    ModelFactory.create_subforum_model().delete_subforum(BENCHMARK_SUBFORUM)
+
+
+def measure(name: str, request, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = request()
+        timings.append(time.perf_counter() - start)
+
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    report(name, timings)
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument(
+        "--path",
+        default=os.path.join(tempfile.gettempdir(), "jafa_benchmark.db"),
+        help="SQLite database file, removed afterwards",
+    )
+    parser.add_argument(
+        "--databases",
+        default="mongo,sqlite",
+        help="Comma separated database types to compare",
+    )
+    parser.add_argument("--posts", default=5000, type=int, help="Posts to seed")
+    parser.add_argument("--iterations", default=500, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Corpus random seed")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    posts = make_posts(args.posts)
+    post_ids = [post["post_id"] for post in posts]
+
+    # Every database is connected here, the app must not connect again
+    jafa_config.testing = True
+    # Compare the databases rather than the cache in front of them
+    jafa_config.entity_cache_size = 0
+    client = create_app().test_client()
+
+    for database_type in args.databases.split(","):
+        if database_type == "sqlite":
+            database = connect(
+                argparse.Namespace(**vars(args) | dict(host=args.path)), database_type
+            )
+        else:
+            database = connect(args, database_type)
+
+        seed(posts)
+
+        try:
+            for name, request in (
+                ("root", lambda: client.get(f"/route/root/{random.randrange(10)}")),
+                (
+                    "hot root",
+                    lambda: client.get(f"/route/root/{random.randrange(10)}?sort=hot"),
+                ),
+                (
+                    "top day root",
+                    lambda: client.get(
+                        f"/route/root/{random.randrange(10)}?sort=top&t=day"
+                    ),
+                ),
+                (
+                    "subforum",
+                    lambda: client.get(
+                        f"/route/subforum/{BENCHMARK_SUBFORUM}/{random.randrange(10)}"
+                    ),
+                ),
+                (
+                    "post",
+                    lambda: client.get(f"/route/post/{random.choice(post_ids)}/"),
+                ),
+                (
+                    "search",
+                    lambda: client.get(f"/api/post/search?q={random.choice(WORDS)}"),
+                ),
+            ):
+                measure(f"{database_type} {name}", request, args.iterations)
+        finally:
+            clean_up()
+            database.disconnect()
+
+    # The database file and its write-ahead log
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(args.path + suffix):
+            os.remove(args.path + suffix)
+
+
+if __name__ == "__main__":
+    main()
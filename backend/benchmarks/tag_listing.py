@@ -0,0 +1,118 @@
+"""Compare tag filtered listings read by the tags index with a collection scan.
+
+Posts tagged from a skewed vocabulary are imported into the benchmark
+subforum. Newest first pages of a rare and a common tag, of any of two tags
+and of both of them are listed through get_posts, which is served by the
+multikey index on tags, and by the same query forced to scan the collection.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.models.ModelFactory import ModelFactory
+from backend.data.models.mongo.MongoPostModel import (
+    LIST_PROJECTION,
+    LISTING_SORT,
+    POSTS_COLLECTION,
+    tag_query,
+)
+
+PAGE_SIZE = 20
+VOCABULARY = [f"bench{i}" for i in range(200)]
+"""Tags to draw from, earlier ones are used far more often."""
+
+
+def seed(posts: int, batch_size: int = 1000):
+    post_model = ModelFactory.create_post_model()
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+    now = datetime.now()
+    for start in range(0, posts, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, posts)):
+            creation_date = now - timedelta(seconds=i)
+            tags = random.choices(VOCABULARY, weights, k=random.randint(1, 5))
+            batch.append(
+                dict(
+                    post_id=str(ObjectId()),
+                    op="benchmark",
+                    subforum=BENCHMARK_SUBFORUM,
+                    title=f"Benchmark {i}",
+                    body="Benchmark body",
+                    media=None,
+                    tags=list(dict.fromkeys(tags)),
+                    likes=0,
+                    dislikes=0,
+                    locked=False,
+                    creation_date=creation_date,
+                    modified_date=creation_date,
+                )
+            )
+
+        post_model.import_posts(batch)
+
+
+def clean_up(database):
+    database.get_client().jafa[POSTS_COLLECTION].delete_many(
+        {"subforum": BENCHMARK_SUBFORUM}
+    )
+    ModelFactory.create_post_model().reconcile_counts()
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=20000, type=int, help="Posts to seed")
+    parser.add_argument("--iterations", default=200, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Tag random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    post_model = ModelFactory.create_post_model()
+    posts_collection = database.get_client().jafa[POSTS_COLLECTION]
+
+    random.seed(args.seed)
+    seed(args.posts)
+
+    filters = {
+        "rare tag": (["bench150"], "any"),
+        "common tag": (["bench0"], "any"),
+        "any of two": (["bench0", "bench1"], "any"),
+        "all of two": (["bench0", "bench1"], "all"),
+    }
+
+    try:
+        for name, (tags, tag_match) in filters.items():
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                post_model.get_posts(PAGE_SIZE, 0, tags=tags, tag_match=tag_match)
+                timings.append(time.perf_counter() - start)
+
+            report(f"get_posts ({name})", timings)
+
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                list(
+                    posts_collection.find(
+                        tag_query(tags, tag_match), projection=LIST_PROJECTION
+                    )
+                    .sort(LISTING_SORT)
+                    .hint([("$natural", 1)])
+                    .limit(PAGE_SIZE)
+                )
+                timings.append(time.perf_counter() - start)
+
+            report(f"collection scan ({name})", timings)
+
+        print(f"get_tags: {post_model.get_tags(5)}")
+    finally:
+        clean_up(database)
+
+
+if __name__ == "__main__":
+    main()
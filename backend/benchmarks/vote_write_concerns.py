@@ -0,0 +1,78 @@
+"""Measure vote throughput under different write concern policies.
+
+Every policy runs in a fresh process, since models keep their collection
+handles for the lifetime of the process. Majority acknowledgement needs a
+replica set to differ from w=1.
+"""
+
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.benchmarks.delete_transaction import seed
+from backend.data.managers.VoteManager import ContentType, VoteManager
+from backend.data.models.ModelFactory import ModelFactory
+from backend.JafaConfigClass import parse_write_concerns
+
+POLICIES = {
+    "majority": "vote=majority,vote_counter=majority",
+    "w1": "vote=1,vote_counter=1",
+    "w1, unacknowledged counters": "vote=1,vote_counter=0",
+}
+"""DATABASE_WRITE_CONCERNS values to compare."""
+
+
+def run_policy(args):
+    connect(args, write_concerns=parse_write_concerns(args.write_concerns))
+
+    post_ids = seed(args.posts, 0)
+    vote_manager = VoteManager()
+    timings = []
+
+    start = time.perf_counter()
+    for i in range(args.votes):
+        # Flip between like and dislike so every vote changes the counters
+        vote_start = time.perf_counter()
+        vote_manager.add_vote(
+            f"benchmark{i % args.users}",
+            post_ids[i % len(post_ids)],
+            ContentType.POST,
+            (i // args.users) % 2 == 0,
+        )
+        timings.append(time.perf_counter() - vote_start)
+    elapsed = time.perf_counter() - start
+
+    report(f"vote ({args.policy})", timings)
+    print(f"vote ({args.policy}): {len(timings) / elapsed:.1f} votes/s")
+
+    post_model = ModelFactory.create_post_model()
+    vote_model = ModelFactory.create_vote_model()
+    for post_id in post_ids:
+        vote_model.clear_votes_by_id(post_id)
+        post_model.delete_by_post_id(post_id)
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=50, type=int, help="Posts to vote on")
+    parser.add_argument("--users", default=20, type=int, help="Distinct voters")
+    parser.add_argument("--votes", default=5000, type=int, help="Votes to cast")
+    parser.add_argument("--policy", help="Only run this policy, see POLICIES")
+    args = parser.parse_args()
+
+    if args.policy is not None:
+        args.write_concerns = POLICIES[args.policy]
+        run_policy(args)
+        return
+
+    for policy in POLICIES:
+        subprocess.run(
+            [sys.executable, "-m", __spec__.name, *sys.argv[1:], "--policy", policy],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
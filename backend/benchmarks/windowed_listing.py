@@ -0,0 +1,114 @@
+"""Compare top and controversial listings read from the window rankings with
+ones computed by an aggregation over the window on every request.
+
+Posts with random votes spread over a month are imported into the benchmark
+subforum and ranked. A round of votes is then cast on some of them to time
+an incremental refresh_rankings.
+"""
+
+import random
+import time
+from datetime import datetime
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser
+from backend.benchmarks.hot_listing import PAGE_SIZE, clean_up, measure, seed
+from backend.data.models.ModelFactory import ModelFactory
+from backend.data.models.mongo.MongoPostModel import (
+    LIST_PROJECTION,
+    LISTING_SORTS,
+    POSTS_COLLECTION,
+    RANKINGS_COLLECTIONS,
+    SCORES,
+)
+from backend.data.models.PostModel import WINDOWED_SORTS, WINDOWS
+
+
+def timed_refresh(name: str, post_model):
+    start = time.perf_counter()
+    ranked = post_model.refresh_rankings()
+    print(
+        f"refresh_rankings ({name}): {time.perf_counter() - start:.3f}s, {ranked} ranked"
+    )
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=20000, type=int, help="Posts to seed")
+    parser.add_argument("--votes", default=1000, type=int, help="Votes to refresh")
+    parser.add_argument("--pages", default=10, type=int, help="Pages deep to list")
+    parser.add_argument("--iterations", default=200, type=int)
+    parser.add_argument("--seed", default=0, type=int, help="Vote random seed")
+    args = parser.parse_args()
+
+    database = connect(args)
+    post_model = ModelFactory.create_post_model()
+    posts_collection = database.get_client().jafa[POSTS_COLLECTION]
+
+    random.seed(args.seed)
+    seed(args.posts)
+
+    def computed(sort: str, window: str):
+        def read(page: int):
+            return list(
+                posts_collection.aggregate(
+                    [
+                        {
+                            "$match": {
+                                "subforum": BENCHMARK_SUBFORUM,
+                                "creation_date": {
+                                    "$gte": datetime.now() - WINDOWS[window]
+                                },
+                            }
+                        },
+                        {"$project": LIST_PROJECTION | {sort: SCORES[sort]}},
+                        {"$sort": dict(LISTING_SORTS[sort])},
+                        {"$skip": PAGE_SIZE * page},
+                        {"$limit": PAGE_SIZE},
+                    ]
+                )
+            )
+
+        return read
+
+    try:
+        timed_refresh("all posts", post_model)
+
+        post_ids = [
+            post["post_id"]
+            for post in post_model.get_posts(args.posts, 0, BENCHMARK_SUBFORUM)
+        ]
+        for post_id in random.sample(post_ids, min(args.votes, len(post_ids))):
+            post_model.increment_votes(post_id, likes=1)
+
+        timed_refresh(f"after {args.votes} votes", post_model)
+
+        for sort in WINDOWED_SORTS:
+            for window in RANKINGS_COLLECTIONS:
+                measure(
+                    f"get_posts ({sort}, {window})",
+                    lambda page: post_model.get_posts(
+                        PAGE_SIZE,
+                        PAGE_SIZE * page,
+                        BENCHMARK_SUBFORUM,
+                        sort=sort,
+                        window=window,
+                    ),
+                    args.pages,
+                    args.iterations,
+                )
+                measure(
+                    f"computed ({sort}, {window})",
+                    computed(sort, window),
+                    args.pages,
+                    args.iterations,
+                )
+    finally:
+        clean_up(database)
+        for collection in RANKINGS_COLLECTIONS.values():
+            database.get_client().jafa[collection].delete_many(
+                {"subforum": BENCHMARK_SUBFORUM}
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Measure bytes transferred and latency of post reads per wire compressor.
+
+Posts with large bodies are read as listing pages (get_posts, previews only)
+and one by one (get_by_post_id, full bodies). Bytes are the server's physical
+network counters, so run it against a local mongod nothing else talks to.
+
+Every compressor runs in a fresh process with its own client.
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from backend.benchmarks import BENCHMARK_SUBFORUM, connect, make_parser, report
+from backend.data.databases.MongoDatabase import make_compressors
+from backend.data.models.ModelFactory import ModelFactory
+
+COMPRESSORS = ["none", "zlib", "snappy", "zstd"]
+"""DATABASE_COMPRESSORS values to compare, none leaves traffic uncompressed."""
+WORDS = (
+    "the forum post reply thread user vote like dislike subforum title body "
+    "media tag page cursor listing database replica index cache query"
+).split()
+
+
+def make_body(length: int) -> str:
+    """Return text of roughly `length` characters out of common words."""
+    words = []
+    size = 0
+    while size < length:
+        word = random.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+
+    return " ".join(words)[:length]
+
+
+def seed(posts: int, body_size: int) -> list[str]:
+    post_model = ModelFactory.create_post_model()
+
+    now = datetime.now()
+    for i in range(posts):
+        post_model.create_post(
+            dict(
+                op="benchmark",
+                subforum=BENCHMARK_SUBFORUM,
+                title=f"Benchmark {i}",
+                body=make_body(body_size),
+                media=None,
+                tags=None,
+                likes=0,
+                dislikes=0,
+                locked=False,
+                creation_date=now,
+                modified_date=now,
+            )
+        )
+
+    return [
+        post["post_id"] for post in post_model.get_posts(posts, 0, BENCHMARK_SUBFORUM)
+    ]
+
+
+def physical_bytes(database) -> int:
+    network = database.get_client().admin.command("serverStatus")["network"]
+
+    return network["physicalBytesIn"] + network["physicalBytesOut"]
+
+
+def measure(name: str, database, read, iterations: int):
+    timings = []
+    before = physical_bytes(database)
+
+    for i in range(iterations):
+        start = time.perf_counter()
+        read(i)
+        timings.append(time.perf_counter() - start)
+
+    transferred = physical_bytes(database) - before
+
+    report(name, timings)
+    print(f"{name}: {transferred / iterations / 1024:.1f} KiB per read")
+
+
+def run_compressor(args):
+    options = {} if args.compressor == "none" else dict(compressors=args.compressor)
+    database = connect(args, **options)
+    post_model = ModelFactory.create_post_model()
+    post_ids = args.post_ids.split(",")
+    page_size = 20
+
+    measure(
+        f"get_posts ({args.compressor})",
+        database,
+        lambda i: post_model.get_posts(page_size, 0, BENCHMARK_SUBFORUM),
+        args.iterations,
+    )
+    measure(
+        f"get_by_post_id ({args.compressor})",
+        database,
+        lambda i: post_model.get_by_post_id(post_ids[i % len(post_ids)]),
+        args.iterations,
+    )
+
+    database.disconnect()
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", default=100, type=int, help="Posts to seed")
+    parser.add_argument(
+        "--body-size", default=40000, type=int, help="Characters per body"
+    )
+    parser.add_argument("--iterations", default=500, type=int)
+    parser.add_argument("--compressor", help="Only run this compressor")
+    parser.add_argument("--post-ids", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compressor is not None:
+        run_compressor(args)
+        return
+
+    connect(args)
+    post_ids = seed(args.posts, args.body_size)
+    post_model = ModelFactory.create_post_model()
+
+    try:
+        for compressor in COMPRESSORS:
+            if compressor != "none":
+                try:
+                    make_compressors(compressor)
+                except ValueError as e:
+                    print(f"Skipping {compressor}: {e}")
+                    continue
+
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    __spec__.name,
+                    *sys.argv[1:],
+                    "--compressor",
+                    compressor,
+                    "--post-ids",
+                    ",".join(post_ids),
+                ],
+                check=True,
+            )
+    finally:
+        for post_id in post_ids:
+            post_model.delete_by_post_id(post_id)
+
+
+if __name__ == "__main__":
+    main()
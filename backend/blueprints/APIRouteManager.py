@@ -1,7 +1,9 @@
 from backend.blueprints.AbstractBlueprintManager import AbstractBlueprintManager
+from backend.blueprints.routes.AsyncRoute import AsyncRoute
 from backend.blueprints.routes.PostRoute import PostRoute
 from backend.blueprints.routes.RootRoute import RootRoute
 from backend.blueprints.routes.SubforumRoute import SubforumRoute
+from backend.JafaConfigClass import jafa_config
 
 
 class RouteBlueprintManager(AbstractBlueprintManager):
@@ -11,3 +13,6 @@ class RouteBlueprintManager(AbstractBlueprintManager):
         self.get_blueprint().register_blueprint(PostRoute().blueprint)
         self.get_blueprint().register_blueprint(RootRoute().blueprint)
         self.get_blueprint().register_blueprint(SubforumRoute().blueprint)
+
+        if jafa_config.async_database_type is not None:
+            self.get_blueprint().register_blueprint(AsyncRoute().blueprint)
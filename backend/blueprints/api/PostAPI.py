@@ -1,13 +1,15 @@
 from flask import request, session
 from backend.blueprints.AbstractBlueprintWrapper import AbstractBlueprintWrapper
-from backend.blueprints.api.UserAPI import require_logged_in
+from backend.blueprints.api.UserAPI import get_username, require_logged_in
 
 from backend.constants import DATA
 from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
 from backend.data.managers.PostMananger import (
+    InvalidCursorError,
     InvalidPostBody,
     InvalidPostTag,
     InvalidPostTitle,
+    InvalidSearchError,
     NoPostFoundError,
     PostAlreadyLockedError,
     PostNotLockedError,
@@ -21,7 +23,7 @@ from backend.data.managers.VoteManager import (
     InvalidContentType,
     NoVoteFoundError,
 )
-from backend.utils import make_error, make_success, require_keys
+from backend.utils import make_error, make_success, require_keys, split_list
 
 
 class PostAPI(AbstractBlueprintWrapper):
@@ -35,6 +37,8 @@ class PostAPI(AbstractBlueprintWrapper):
         self.route("/unlock", self.unlock, methods=["POST"])
         self.route("/vote", self.vote, methods=["POST"])
         self.route("/unvote", self.unvote, methods=["POST"])
+        self.route("/tags", self.tags, methods=["GET"])
+        self.route("/search", self.search, methods=["GET"])
 
     @require_keys(["subforum", "title", "body"])
     @require_logged_in
@@ -52,7 +56,7 @@ class PostAPI(AbstractBlueprintWrapper):
         >
         > media: Post media | Optional
         >
-        > tags: Post tags separated by comma | Optional
+        > tags: Post tags separated by comma, stored lowercase | Optional
 
         ###Error Types:
         * InvalidPostTitle
@@ -69,7 +73,7 @@ class PostAPI(AbstractBlueprintWrapper):
 
         # Optional
         media = request.form.get("media")
-        tags = request.form.get("tags", "").split(",")
+        tags = split_list(request.form.get("tags"))
 
         post_manager = self.manager_factory.create_post_manager()
         try:
@@ -130,7 +134,7 @@ class PostAPI(AbstractBlueprintWrapper):
         >
         > media: Media objects | Optional
         >
-        > tags: Comma separated tags | Optional
+        > tags: Comma separated tags, stored lowercase | Optional
 
         ###Error Types:
         * InvalidPostTitle
@@ -144,7 +148,7 @@ class PostAPI(AbstractBlueprintWrapper):
         title = request.form.get("title")
         body = request.form.get("body")
         media = request.form.get("media")
-        tags = request.form.get("tags")
+        tags = split_list(request.form.get("tags"))
         username = session[DATA.USER]["username"]
 
         post_manager = self.manager_factory.create_post_manager()
@@ -283,3 +287,50 @@ class PostAPI(AbstractBlueprintWrapper):
             return make_error("Could not remove post vote")
 
         return make_success("Post vote removed")
+
+    def tags(self):
+        """
+        ###**GET /api/post/tags**
+
+        List the most used tags with their post counts, most used first.
+
+        > limit: Amount of tags, at most 50 | Optional
+        """
+        limit = request.args.get("limit", type=int)
+
+        post_manager = self.manager_factory.create_post_manager()
+
+        return make_success(dict(tags=post_manager.get_tags(limit)))
+
+    def search(self):
+        """
+        ###**GET /api/post/search**
+
+        Search post titles, tags and bodies, best matching first.
+        Newer posts rank higher than older ones matching as well.
+
+        > q: Words to search for
+        >
+        > subforum: Subforum title | Optional
+        >
+        > cursor: next_cursor of the previous page | Optional
+
+        ###Error Types:
+        * InvalidSearchError
+        * InvalidCursorError
+        """
+        query = request.args.get("q", "")
+        subforum = request.args.get("subforum")
+        cursor = request.args.get("cursor")
+
+        post_manager = self.manager_factory.create_post_manager()
+        try:
+            posts = post_manager.search_posts(
+                query, subforum=subforum, cursor=cursor, username=get_username()
+            )
+        except (InvalidSearchError, InvalidCursorError) as e:
+            return make_error(str(e), e=e)
+
+        next_cursor = post_manager.get_next_cursor(posts, sort="rank")
+
+        return make_success(dict(posts=posts, next_cursor=next_cursor))
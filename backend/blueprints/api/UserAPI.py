@@ -38,6 +38,14 @@ def require_logged_in(f):
     return wrapper
 
 
+def get_username() -> str | None:
+    """Return the username of the logged in user, if any."""
+    if DATA.USER not in session:
+        return None
+
+    return session[DATA.USER]["username"]
+
+
 class UserAPI(AbstractBlueprintWrapper):
     def __init__(self, manager_factory: type[AbstractManagerFactory] | None = None):
         super().__init__("user", __name__, manager_factory=manager_factory)
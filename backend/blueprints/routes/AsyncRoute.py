@@ -0,0 +1,108 @@
+import asyncio
+
+from flask import request
+
+from backend.blueprints.AbstractBlueprintWrapper import AbstractBlueprintWrapper
+from backend.blueprints.api.UserAPI import get_username
+from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
+from backend.data.managers.PostMananger import InvalidPageError, NoPostFoundError
+from backend.data.managers.SubForumManager import NoSubForumFoundError
+from backend.utils import make_error, make_success, split_list
+
+
+class AsyncRoute(AbstractBlueprintWrapper):
+    """Root, subforum and post routes served by the async managers.
+
+    Responses match RootRoute, SubforumRoute and PostRoute. Independent
+    queries of a request run concurrently.
+    """
+
+    def __init__(self, manager_factory: type[AbstractManagerFactory] | None = None):
+        super().__init__("async", __name__, manager_factory=manager_factory)
+
+        self.route("/<int:page>", self.root)
+        self.route("/", self.root)
+        self.route("/subforum/<title>/", self.subforum)
+        self.route("/subforum/<title>/<int:page>", self.subforum)
+        self.route("/post/<post_id>/", self.post)
+
+    def root(self, page: int = 0):
+        post_manager = self.manager_factory.create_async_post_manager()
+        subforum_manager = self.manager_factory.create_async_subforum_manager()
+
+        # Optional, takes priority over page
+        cursor = request.args.get("cursor")
+        sort = request.args.get("sort", "new")
+        window = request.args.get("t", "all")
+        tags = split_list(request.args.get("tag"))
+        tag_match = request.args.get("match", "any")
+        username = get_username()
+
+        async def root():
+            return await asyncio.gather(
+                post_manager.get_post_list(
+                    page=page,
+                    cursor=cursor,
+                    username=username,
+                    sort=sort,
+                    window=window,
+                    tags=tags,
+                    tag_match=tag_match,
+                ),
+                subforum_manager.get_subforum_info(current_page=page),
+            )
+
+        try:
+            posts, info = post_manager.run(root())
+        except InvalidPageError as e:
+            return make_error(str(e), e=e)
+
+        next_cursor = post_manager.get_next_cursor(posts, sort=sort, window=window)
+
+        return make_success(dict(posts=posts, info=info, next_cursor=next_cursor))
+
+    def subforum(self, title: str | None = None, page: int = 0):
+        post_manager = self.manager_factory.create_async_post_manager()
+        subforum_manager = self.manager_factory.create_async_subforum_manager()
+
+        # Optional, takes priority over page
+        cursor = request.args.get("cursor")
+        sort = request.args.get("sort", "new")
+        window = request.args.get("t", "all")
+        tags = split_list(request.args.get("tag"))
+        tag_match = request.args.get("match", "any")
+        username = get_username()
+
+        async def subforum():
+            return await asyncio.gather(
+                subforum_manager.get_subforum_info(title, page),
+                post_manager.get_post_list(
+                    title,
+                    page,
+                    cursor=cursor,
+                    username=username,
+                    sort=sort,
+                    window=window,
+                    tags=tags,
+                    tag_match=tag_match,
+                ),
+            )
+
+        try:
+            info, posts = post_manager.run(subforum())
+        except (NoSubForumFoundError, InvalidPageError) as e:
+            return make_error(str(e), e=e)
+
+        next_cursor = post_manager.get_next_cursor(posts, sort=sort, window=window)
+
+        return make_success(dict(posts=posts, info=info, next_cursor=next_cursor))
+
+    def post(self, post_id: str):
+        post_manager = self.manager_factory.create_async_post_manager()
+
+        try:
+            post = post_manager.run(post_manager.get_post(post_id, allow_stale=True))
+        except NoPostFoundError as e:
+            return make_error(str(e), e=e)
+
+        return make_success(post)
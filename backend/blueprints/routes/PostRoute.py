@@ -1,7 +1,14 @@
+from flask import request
+from werkzeug.http import is_resource_modified
+
 from backend.blueprints.AbstractBlueprintWrapper import AbstractBlueprintWrapper
 from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
-from backend.data.managers.PostMananger import NoPostFoundError
-from backend.utils import make_error, make_success
+from backend.data.managers.PostMananger import (
+    NoPostFoundError,
+    last_modified,
+    post_version,
+)
+from backend.utils import fingerprint, make_conditional_success, make_error
 
 
 class PostRoute(AbstractBlueprintWrapper):
@@ -12,10 +19,17 @@ class PostRoute(AbstractBlueprintWrapper):
 
     def post(self, post_id: str):
         post_manager = self.manager_factory.create_post_manager()
+        post = None
 
         try:
-            post = post_manager.get_post(post_id)
+            version = post_manager.get_post_version(post_id, allow_stale=True)
+            etag = fingerprint(post_version(version))
+
+            # Only read the body when the client doesn't have this version yet
+            if is_resource_modified(request.environ, etag=etag):
+                version = post = post_manager.get_post(post_id, allow_stale=True)
+                etag = fingerprint(post_version(post))
         except NoPostFoundError as e:
             return make_error(str(e), e=e)
 
-        return make_success(post)
+        return make_conditional_success(post, etag, last_modified([version]))
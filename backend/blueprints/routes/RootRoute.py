@@ -1,7 +1,19 @@
+from flask import request
+
 from backend.blueprints.AbstractBlueprintWrapper import AbstractBlueprintWrapper
+from backend.blueprints.api.UserAPI import get_username
 from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
-from backend.data.managers.PostMananger import InvalidPageError
-from backend.utils import make_error, make_success
+from backend.data.managers.PostMananger import (
+    InvalidPageError,
+    last_modified,
+    post_version,
+)
+from backend.utils import (
+    fingerprint,
+    make_conditional_success,
+    make_error,
+    split_list,
+)
 
 
 class RootRoute(AbstractBlueprintWrapper):
@@ -15,12 +27,35 @@ class RootRoute(AbstractBlueprintWrapper):
         post_manager = self.manager_factory.create_post_manager()
         subforum_manager = self.manager_factory.create_subforum_manager()
 
+        # Optional, takes priority over page
+        cursor = request.args.get("cursor")
+        sort = request.args.get("sort", "new")
+        window = request.args.get("t", "all")
+        tags = split_list(request.args.get("tag"))
+        tag_match = request.args.get("match", "any")
+
         try:
-            posts = post_manager.get_post_list(page)
-            # TODO: Indicate if a user liked/disliked a post
+            posts = post_manager.get_post_list(
+                page=page,
+                cursor=cursor,
+                username=get_username(),
+                sort=sort,
+                window=window,
+                tags=tags,
+                tag_match=tag_match,
+            )
         except InvalidPageError as e:
             return make_error(str(e), e=e)
 
         info = subforum_manager.get_subforum_info(current_page=page)
+        next_cursor = post_manager.get_next_cursor(posts, sort=sort, window=window)
+
+        # Listings hold previews, whose posts' versions cover them
+        etag = fingerprint([post_version(post) for post in posts], info, next_cursor)
 
-        return make_success(dict(posts=posts, info=info))
+        return make_conditional_success(
+            dict(posts=posts, info=info, next_cursor=next_cursor),
+            etag,
+            last_modified(posts),
+            private=True,
+        )
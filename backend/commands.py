@@ -0,0 +1,121 @@
+import click
+from flask import Flask
+
+from backend.data.managers.ManagerFactory import ManagerFactory
+from backend.data.models.ModelFactory import ModelFactory
+from backend.data.models.mongo.MongoPostModel import MongoPostModel
+from backend.importer import BATCH_SIZE, KINDS, Checkpoint, import_file
+
+
+@click.command("reconcile-counts")
+def reconcile_counts():
+    """Recount posts and tags and correct drift in their stored counts.
+
+    Tags stored before tags were normalized are normalized first.
+    """
+    post_manager = ManagerFactory.create_post_manager()
+    normalized = post_manager.normalize_post_tags()
+    corrected = post_manager.reconcile_post_counts()
+
+    click.echo(f"Normalized the tags of {normalized} post(s)")
+    click.echo(f"Corrected {corrected} post and tag count(s)")
+
+
+@click.command("recompute-scores")
+def recompute_scores():
+    """Recompute the scores that order hot, top and controversial listings."""
+    post_manager = ManagerFactory.create_post_manager()
+    corrected = post_manager.recompute_scores()
+
+    click.echo(f"Corrected the scores of {corrected} post(s)")
+
+
+@click.command("refresh-rankings")
+def refresh_rankings():
+    """Rank recently voted on posts within the day, week and month windows."""
+    post_manager = ManagerFactory.create_post_manager()
+    ranked = post_manager.refresh_rankings()
+
+    click.echo(f"Ranked {ranked} post(s)")
+
+
+@click.command("import")
+@click.argument("kind", type=click.Choice(KINDS))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--batch-size",
+    default=BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Rows written at once.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False),
+    help="Where progress is saved, defaults to PATH.checkpoint.",
+)
+def import_content(kind: str, path: str, batch_size: int, checkpoint_path: str):
+    """Import subforums, posts or votes from an NDJSON or CSV file.
+
+    Import subforums first, then posts, then votes. Running the same import
+    again after an interruption resumes from its checkpoint.
+    """
+    try:
+        checkpoint = Checkpoint(checkpoint_path or f"{path}.checkpoint", kind, path)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    if checkpoint.rows > 0:
+        click.echo(f"Resuming after row {checkpoint.rows}")
+
+    imported = skipped = rejected = 0
+    for batch in import_file(kind, path, checkpoint, batch_size):
+        for row, reason in batch["rejected"].items():
+            click.echo(f"Row {row}: {reason}", err=True)
+
+        imported += batch["imported"]
+        skipped += batch["skipped"]
+        rejected += len(batch["rejected"])
+
+    checkpoint.remove()
+
+    click.echo(
+        f"Imported {imported} {kind}, skipped {skipped} existing, rejected {rejected}"
+    )
+
+
+@click.command("split-post-bodies")
+@click.option(
+    "--batch-size",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Bodies moved at once.",
+)
+def split_post_bodies(batch_size: int):
+    """Move post bodies stored inside posts to their own collection.
+
+    Run once before setting POST_BODY_STORAGE=split, and again after
+    restarting with it to move the bodies written in between.
+    """
+    post_model = ModelFactory.create_post_model()
+
+    if not isinstance(post_model, MongoPostModel):
+        raise click.ClickException("Only Mongo stores post bodies apart")
+
+    moved = post_model.split_bodies(batch_size)
+
+    click.echo(f"Moved {moved} post body(s)")
+
+
+def register_commands(app: Flask):
+    """Register maintenance commands with the Flask CLI.
+
+    Run with `flask --app "backend.app:create_app()" <command>`.
+    """
+    app.cli.add_command(reconcile_counts)
+    app.cli.add_command(recompute_scores)
+    app.cli.add_command(refresh_rankings)
+    app.cli.add_command(import_content)
+    app.cli.add_command(split_post_bodies)
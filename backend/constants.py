@@ -1,5 +1,6 @@
 class HTTP:
     SUCCESS = 200
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     CONFLICT = 409
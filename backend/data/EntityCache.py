@@ -0,0 +1,46 @@
+from typing import TypedDict
+
+from backend.data.TTLCache import TTLCache
+
+
+class CacheStats(TypedDict):
+    """Counters of one kind of entity held by an EntityCache."""
+
+    hits: int
+    misses: int
+    size: int
+    """Entries currently held, including expired ones not yet evicted."""
+
+
+class EntityCache:
+    """Posts, subforums and users recently read by the managers.
+
+    Entities are cached by their ID, title and username respectively, see
+    TTLCache. Only entities that exist are cached, and managers delete them
+    as they are changed. Each process holds its own, so changes made by
+    another process can be served for up to `ttl` seconds.
+
+    :param maxsize: Most entities of each kind held at once, 0 disables caching.
+    :param ttl: Seconds an entity is served for.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.posts = TTLCache(maxsize, ttl)
+        self.subforums = TTLCache(maxsize, ttl)
+        self.users = TTLCache(maxsize, ttl)
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return the counters of each kind of entity, keyed by kind."""
+        return {
+            kind: dict(hits=cache.hits, misses=cache.misses, size=len(cache))
+            for kind, cache in (
+                ("posts", self.posts),
+                ("subforums", self.subforums),
+                ("users", self.users),
+            )
+        }
+
+    def clear(self):
+        self.posts.clear()
+        self.subforums.clear()
+        self.users.clear()
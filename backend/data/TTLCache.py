@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded in-process cache, entries expire `ttl` seconds after being set.
+
+    Once `maxsize` entries are held, the least recently used one is evicted
+    to make room. Thread and greenlet safe (with gevent monkey patching).
+
+    :param maxsize: Most entries held at once.
+    :param ttl: Seconds an entry is served for.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None):
+        """Return the value set for `key`, `default` if missing or expired."""
+        with self.__lock:
+            expires, value = self.__entries.get(key, (None, _MISSING))
+
+            if value is _MISSING or expires <= time.monotonic():
+                self.__entries.pop(key, None)
+                self.misses += 1
+                return default
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.ttl, value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self):
+        return len(self.__entries)
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class AbstractAsyncDatabase(ABC):
+    """Async counterpart of AbstractDatabase, for the async models.
+
+    Connecting, setting up and disconnecting are called from synchronous
+    code, the models' queries run as coroutines through run().
+    """
+
+    @abstractmethod
+    def __init__(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def connect(
+        self, hostname: str, port=None, username=None, password=None, **options
+    ):
+        """Run database connect logic, see AbstractDatabase.connect."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def setup(self):
+        """Post-connect setup call, see AbstractDatabase.setup."""
+        pass
+
+    @abstractmethod
+    def disconnect(self):
+        """Run database disconnect logic."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_client(self):
+        """Return the async client the models query through."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine using the database from synchronous code."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def unit_of_work(self) -> AbstractAsyncContextManager:
+        """Group the writes made inside the returned async context manager.
+
+        See AbstractDatabase.unit_of_work, enter it with `async with`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stale_reads(self) -> AbstractContextManager:
+        """Mark the reads made inside the returned context manager as stale-tolerant.
+
+        See AbstractDatabase.stale_reads, enter it inside the coroutine.
+        """
+        raise NotImplementedError
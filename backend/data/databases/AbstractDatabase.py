@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 
 
 class AbstractDatabase(ABC):
@@ -7,8 +8,14 @@ class AbstractDatabase(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def connect(self, hostname: str, port=None, username=None, password=None):
-        """Run database connect logic."""
+    def connect(
+        self, hostname: str, port=None, username=None, password=None, **options
+    ):
+        """Run database connect logic.
+
+        :param options: Connection pool, timeout and read preference options, see
+        JafaConfigClass.database_options. Unsupported options are ignored.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -28,3 +35,22 @@ class AbstractDatabase(ABC):
     def get_client(self):
         """Run database disconnect logic."""
         raise NotImplementedError
+
+    @abstractmethod
+    def unit_of_work(self) -> AbstractContextManager:
+        """Group the writes made inside the returned context manager.
+
+        Writes are committed together on exit and discarded if an exception
+        is raised, as far as the database supports it. Nested units join the
+        outermost one.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stale_reads(self) -> AbstractContextManager:
+        """Mark the reads made inside the returned context manager as stale-tolerant.
+
+        They may be served by replicas that lag behind, as configured.
+        Writes, and reads that must see them, should not be made inside.
+        """
+        raise NotImplementedError
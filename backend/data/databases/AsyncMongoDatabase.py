@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import sys
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, TypeVar
+
+from pymongo import AsyncMongoClient, WriteConcern
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.errors import PyMongoError
+
+from backend.data.databases.AbstractAsyncDatabase import AbstractAsyncDatabase
+from backend.data.models.mongo.BodyCodec import BodyCodec
+from backend.data.databases.MongoDatabase import (
+    MONGO_CLIENT_OPTIONS,
+    StaleReadPreference,
+    make_body_storage,
+    make_compressors,
+    make_read_preference,
+    make_write_concerns,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_session: ContextVar[AsyncClientSession | None] = ContextVar(
+    "async_mongo_session", default=None
+)
+"""Session of the unit of work in progress, local to each task."""
+_stale_reads: ContextVar[bool] = ContextVar("async_mongo_stale_reads", default=False)
+"""If reads in progress tolerate stale data, local to each task."""
+
+
+class UnsupportedWorkerError(Exception):
+    """Indicate a worker the async client can't be served from."""
+
+    pass
+
+
+def gevent_patched() -> bool:
+    """Return if gevent monkey patching is active, as under gevent workers."""
+    monkey = sys.modules.get("gevent.monkey")
+
+    return monkey is not None and monkey.is_module_patched("threading")
+
+
+class AsyncMongoDatabase(AbstractAsyncDatabase):
+    """MongoDB through pymongo's asyncio client.
+
+    The client is bound to a single event loop, which runs on its own thread
+    for the lifetime of the connection. Synchronous code (Flask views) hands
+    coroutines to it with run(), so queries from every request share one
+    loop and one pool, and independent queries can overlap with
+    asyncio.gather.
+
+    Collections and indexes are the same as MongoDatabase's, which sets
+    them up.
+    """
+
+    def __init__(self):
+        self.__client = None
+        self.__loop = None
+        self.__thread = None
+        self.__connection = None
+        self.__supports_transactions = None
+        self.__stale_read_preference = None
+        self.__write_concerns = make_write_concerns()
+        self.__body_codec = BodyCodec()
+        self.__split_post_bodies = False
+
+    def connect(
+        self, hostname: str, port=27017, username=None, password=None, **options
+    ):
+        """Start the event loop thread and connect via Mongo URI
+
+        If username or password is None, its excluded from the URI.
+
+        :raises UnsupportedWorkerError: Under gevent monkey patching, where
+        views waiting on the loop thread would block the whole worker.
+        """
+        if gevent_patched():
+            raise UnsupportedWorkerError(
+                "The async database needs a threaded worker (e.g. gunicorn "
+                "--worker-class gthread), not gevent"
+            )
+
+        client_options = {
+            MONGO_CLIENT_OPTIONS[key]: value
+            for key, value in options.items()
+            if key in MONGO_CLIENT_OPTIONS
+        }
+        compressors = make_compressors(options.get("compressors"))
+
+        if compressors is not None:
+            client_options["compressors"] = compressors
+
+        if username is None or password is None:
+            uri = f"mongodb://{hostname}:{port}"
+        else:
+            uri = f"mongodb://{username}:{password}@{hostname}:{port}"
+
+        self.__connection = (hostname, port, username, password, options)
+        self.__stale_read_preference = make_read_preference(
+            options.get("read_preference"), options.get("max_staleness_seconds")
+        )
+        self.__write_concerns = make_write_concerns(options.get("write_concerns"))
+        self.__body_codec = BodyCodec(
+            options.get("body_codec"), options.get("body_codec_threshold")
+        )
+        self.__split_post_bodies = (
+            make_body_storage(options.get("body_storage")) == "split"
+        )
+
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(
+            target=self.__loop.run_forever, name="async-mongo", daemon=True
+        )
+        self.__thread.start()
+
+        self.run(self.__connect(uri, client_options))
+
+    async def __connect(self, uri: str, client_options: dict):
+        # Created on the loop it will be bound to
+        self.__client = AsyncMongoClient(uri, **client_options)
+
+        try:
+            await self.__client.admin.command("ping")
+        except PyMongoError as e:
+            logger.warning("Could not reach Mongo: %s", e)
+
+    def setup(self):
+        """Apply indexes declared by the Mongo models and prepare their data
+
+        The async models read the Mongo models' collections, so this is
+        MongoDatabase.setup. Unless the regular Mongo database is connected,
+        and so already set up as the DATABASE_TYPE, it's connected to the
+        same server first and set up.
+
+        :raises IndexBuildError: If a unique index can't be built.
+        """
+        # Imported here, the factory imports this module
+        from backend.data.databases.DatabaseFactory import DatabaseFactory
+
+        database = DatabaseFactory.create_database("mongo")
+
+        if database.get_client() is not None:
+            return
+
+        hostname, port, username, password, options = self.__connection
+        database.connect(hostname, port, username, password, **options)
+        database.setup()
+
+    def disconnect(self):
+        self.run(self.__client.close())
+
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+
+    def get_client(self) -> AsyncMongoClient:
+        return self.__client
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the database's event loop and wait for its result.
+
+        Meant to be called from synchronous code, never from the loop itself.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.__loop).result()
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """Run the writes inside a transaction, use with `async with`
+
+        Operations inside it must not run concurrently, as they share a
+        session. Standalone servers don't support transactions, in which case
+        writes are applied one by one as they are made.
+        """
+        if _session.get() is not None:
+            # Join the unit of work in progress
+            yield
+            return
+
+        if not await self.__transactions_supported():
+            yield
+            return
+
+        async with self.__client.start_session() as session:
+            async with await session.start_transaction():
+                token = _session.set(session)
+                try:
+                    yield
+                finally:
+                    _session.reset(token)
+
+    def get_session(self) -> AsyncClientSession | None:
+        """Return the session of the unit of work in progress, if any."""
+        return _session.get()
+
+    @contextmanager
+    def stale_reads(self):
+        """See MongoDatabase.stale_reads, enter it inside the coroutine
+
+        Tasks started inside, e.g. by asyncio.gather, inherit it.
+        """
+        token = _stale_reads.set(True)
+        try:
+            yield
+        finally:
+            _stale_reads.reset(token)
+
+    def get_read_preference(self) -> StaleReadPreference | None:
+        """Return the read preference reads in progress should use.
+
+        :return: Read preference, or None for the client's default.
+        """
+        if _stale_reads.get() and _session.get() is None:
+            return self.__stale_read_preference
+
+        return None
+
+    def get_write_concern(self, write: str) -> WriteConcern | None:
+        """See MongoDatabase.get_write_concern."""
+        return self.__write_concerns[write]
+
+    def get_body_codec(self) -> BodyCodec:
+        """See MongoDatabase.get_body_codec."""
+        return self.__body_codec
+
+    def splits_post_bodies(self) -> bool:
+        """See MongoDatabase.splits_post_bodies."""
+        return self.__split_post_bodies
+
+    async def __transactions_supported(self) -> bool:
+        """Check if the server is a replica set member or mongos."""
+        if self.__supports_transactions is None:
+            hello = await self.__client.admin.command("hello")
+            self.__supports_transactions = (
+                "setName" in hello or hello.get("msg") == "isdbgrid"
+            )
+
+            if not self.__supports_transactions:
+                logger.warning(
+                    "Standalone server, units of work will not be transactional"
+                )
+
+        return self.__supports_transactions
@@ -1,5 +1,9 @@
+from backend.data.databases.AbstractAsyncDatabase import AbstractAsyncDatabase
 from backend.data.databases.AbstractDatabase import AbstractDatabase
+from backend.data.databases.AsyncMongoDatabase import AsyncMongoDatabase
+from backend.data.databases.MemoryDatabase import MemoryDatabase
 from backend.data.databases.MongoDatabase import MongoDatabase
+from backend.data.databases.SQLiteDatabase import SQLiteDatabase
 
 
 class DatabaseFactory:
@@ -7,7 +11,9 @@ class DatabaseFactory:
     _cache = {}
 
     @staticmethod
-    def create_database(database_type: str) -> AbstractDatabase:
+    def create_database(
+        database_type: str,
+    ) -> AbstractDatabase | AbstractAsyncDatabase:
         """Return the database associated with the provided type.
 
         Raises NotImplementedError if it doesn't exist.
@@ -30,3 +36,9 @@ class DatabaseFactory:
 
 DatabaseFactory.register_database("mongo", MongoDatabase)
 """MongoDB"""
+DatabaseFactory.register_database("async_mongo", AsyncMongoDatabase)
+"""MongoDB via the asyncio client, used by the async models"""
+DatabaseFactory.register_database("memory", MemoryDatabase)
+"""In process memory, for tests and benchmarks"""
+DatabaseFactory.register_database("sqlite", SQLiteDatabase)
+"""A single SQLite file, for single node installations"""
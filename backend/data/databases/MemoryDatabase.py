@@ -0,0 +1,61 @@
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from typing import Callable, TypeVar
+
+from backend.data.databases.AbstractDatabase import AbstractDatabase
+
+T = TypeVar("T")
+
+
+class MemoryStore:
+    """Tables of a MemoryDatabase, keyed by name and created on first use."""
+
+    def __init__(self):
+        self.__tables = {}
+
+    def get_table(self, name: str, factory: Callable[[], T]) -> T:
+        table = self.__tables.get(name)
+
+        if table is None:
+            table = self.__tables.setdefault(name, factory())
+
+        return table
+
+
+class MemoryDatabase(AbstractDatabase):
+    """Keeps all data in process memory, nothing outlives a connection.
+
+    Meant for tests and for benchmarking the managers and blueprints without
+    a database server. Models serialize every operation with a single lock,
+    which a unit of work holds until it ends. Units of work are therefore
+    isolated, but their writes are not discarded if an exception is raised.
+    """
+
+    def __init__(self):
+        self.__store = MemoryStore()
+        self.__lock = threading.RLock()
+
+    def connect(
+        self, hostname: str, port=None, username=None, password=None, **options
+    ):
+        """Start from an empty store, the arguments are ignored."""
+        self.__store = MemoryStore()
+
+    def setup(self):
+        pass
+
+    def disconnect(self):
+        self.__store = MemoryStore()
+
+    def get_client(self) -> MemoryStore:
+        return self.__store
+
+    def get_lock(self) -> threading.RLock:
+        """Return the lock models hold while reading or writing the store."""
+        return self.__lock
+
+    def unit_of_work(self) -> AbstractContextManager:
+        return self.__lock
+
+    def stale_reads(self) -> AbstractContextManager:
+        return nullcontext()
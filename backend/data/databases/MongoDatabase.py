@@ -1,35 +1,585 @@
-from typing import Optional
+import logging
+import pkgutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib import import_module
+from typing import Optional, TypedDict
 
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient, WriteConcern
+from pymongo.client_session import ClientSession
+from pymongo.errors import OperationFailure, PyMongoError
+from pymongo.read_preferences import (
+    Nearest,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
 
 from backend.data.databases.AbstractDatabase import AbstractDatabase
+from backend.data.models.mongo.BodyCodec import BodyCodec, zstd
+
+try:
+    import snappy
+except ImportError:
+    # Installed by pymongo[snappy]
+    snappy = None
+
+logger = logging.getLogger(__name__)
+
+MONGO_CLIENT_OPTIONS = dict(
+    max_pool_size="maxPoolSize",
+    min_pool_size="minPoolSize",
+    wait_queue_timeout_ms="waitQueueTimeoutMS",
+    server_selection_timeout_ms="serverSelectionTimeoutMS",
+    socket_timeout_ms="socketTimeoutMS",
+    max_idle_time_ms="maxIdleTimeMS",
+    app_name="appname",
+    zlib_compression_level="zlibCompressionLevel",
+)
+"""Database options mapped to their MongoClient keyword arguments."""
+
+COMPRESSORS = ("zstd", "snappy", "zlib")
+"""Wire protocol compressors, zstd and snappy need pymongo[zstd,snappy]."""
+
+BODY_STORAGES = ("inline", "split")
+"""Where post bodies are written: inside their posts, or apart from them in
+their own collection so that the posts collection holds only metadata."""
+
+StaleReadPreference = PrimaryPreferred | Secondary | SecondaryPreferred | Nearest
+"""Read preference stale reads may use, see READ_PREFERENCES."""
+
+READ_PREFERENCES = dict(
+    primaryPreferred=PrimaryPreferred,
+    secondary=Secondary,
+    secondaryPreferred=SecondaryPreferred,
+    nearest=Nearest,
+)
+"""Read preferences stale reads may use, by their connection string name."""
+
+WRITE_CONCERN_POLICY: dict[str, int | str | None] = dict(
+    user_create="majority",
+    user_delete=None,
+    subforum_create=None,
+    subforum_edit=None,
+    subforum_delete="majority",
+    post=None,
+    vote=1,
+    vote_counter=1,
+)
+"""Default w of each kind of write, None leaves it to the client's default."""
+UNACKNOWLEDGED_WRITES = {"vote_counter"}
+"""Kinds of writes that work without acknowledgement (w=0).
+
+The others rely on the write's result.
+"""
+
+DUPLICATE_KEY = 11000
+"""Server error code of a write or index build that would duplicate a key."""
+
+_session: ContextVar[ClientSession | None] = ContextVar("mongo_session", default=None)
+"""Session of the unit of work in progress, local to each thread/greenlet."""
+_stale_reads: ContextVar[bool] = ContextVar("mongo_stale_reads", default=False)
+"""If reads in progress tolerate stale data, local to each thread/greenlet."""
+
+
+def _to_ms(seconds: float | None) -> int | None:
+    return None if seconds is None else int(seconds * 1000)
+
+
+def make_read_preference(
+    mode: str | None, max_staleness_seconds: int | None = None
+) -> StaleReadPreference | None:
+    """Return the read preference of reads that tolerate stale data.
+
+    :param mode: Read preference name, such as secondaryPreferred. A value of
+    None or primary keeps every read on the primary.
+    :param max_staleness_seconds: How far behind the primary a secondary may be,
+    at least 90 seconds. A value of None leaves it unbounded.
+
+    :return: Read preference, or None for the primary.
+    :raises ValueError: If `mode` is unknown.
+    """
+    if mode is None or mode == "primary":
+        return None
+
+    if mode not in READ_PREFERENCES:
+        raise ValueError(f"Unknown read preference {mode}")
+
+    return READ_PREFERENCES[mode](max_staleness=max_staleness_seconds or -1)
+
+
+def make_body_storage(value: str | None) -> str:
+    """Return where post bodies are written, see BODY_STORAGES.
+
+    :param value: One of BODY_STORAGES, None for inline.
+    :raises ValueError: On unknown values.
+    """
+    if value is None:
+        return "inline"
+
+    if value not in BODY_STORAGES:
+        raise ValueError(f"Unknown post body storage {value}")
+
+    return value
+
+
+def make_compressors(value: str | None) -> list[str] | None:
+    """Return the wire compressors to offer the server, most preferred first.
+
+    :param value: Comma separated compressor names, e.g. "zstd,zlib".
+
+    :return: Compressor names, or None to leave traffic uncompressed.
+    :raises ValueError: On unknown compressors, or ones whose library is
+        missing, which pymongo would otherwise drop without a word.
+    """
+    if value is None or value.strip() == "":
+        return None
+
+    compressors = [compressor.strip() for compressor in value.split(",")]
+
+    for compressor in compressors:
+        if compressor not in COMPRESSORS:
+            raise ValueError(f"Unknown compressor {compressor}")
+        if (compressor == "zstd" and zstd is None) or (
+            compressor == "snappy" and snappy is None
+        ):
+            raise ValueError(
+                f"The {compressor} compressor needs pymongo[{compressor}] installed"
+            )
+
+    return compressors
+
+
+def make_write_concerns(
+    overrides: dict[str, int | str] | None = None,
+) -> dict[str, WriteConcern | None]:
+    """Return the write concern of each kind of write.
+
+    :param overrides: w values replacing those of WRITE_CONCERN_POLICY.
+
+    :return: WriteConcern keyed by kind of write, None for the client's default.
+    :raises ValueError: On unknown kinds of writes, or w=0 where it's unsupported.
+    """
+    policy = WRITE_CONCERN_POLICY | (overrides or {})
+
+    for write, w in policy.items():
+        if write not in WRITE_CONCERN_POLICY:
+            raise ValueError(f"Unknown kind of write {write}")
+        if w == 0 and write not in UNACKNOWLEDGED_WRITES:
+            raise ValueError(f"{write} writes must be acknowledged")
+
+    return {
+        write: None if w is None else WriteConcern(w=w) for write, w in policy.items()
+    }
+
+
+class IndexBuildError(Exception):
+    """Indicate that a unique index could not be built."""
+
+    pass
+
+
+class IndexReport(TypedDict):
+    """State of the declared indexes of a single collection."""
+
+    missing: list[str]
+    """Declared indexes that do not exist and are not being built."""
+    extra: list[str]
+    """Existing indexes that no model declares."""
+    building: list[str]
+    """Declared indexes currently being built."""
 
 
 class MongoDatabase(AbstractDatabase):
+    _indexes: dict[str, list[IndexModel]] = {}
+    _index_models: dict[str, type] = {}
+
     def __init__(self):
         self.__client = None
         self.__db = None
+        self.__supports_transactions = None
+        self.__stale_read_preference = None
+        self.__write_concerns = make_write_concerns()
+        self.__body_codec = BodyCodec()
+        self.__split_post_bodies = False
+
+    @staticmethod
+    def register_indexes(
+        collection_name: str, indexes: list[IndexModel], model: type | None = None
+    ):
+        """Declare indexes that setup() should ensure exist on a collection.
+
+        :param model: The MongoMixin model declaring them, which removes the
+        duplicates that keep its unique indexes from being built.
+        """
+        MongoDatabase._indexes.setdefault(collection_name, []).extend(indexes)
 
-    def connect(self, hostname: str, port=27017, username=None, password=None):
+        if model is not None:
+            MongoDatabase._index_models[collection_name] = model
+
+    def connect(
+        self, hostname: str, port=27017, username=None, password=None, **options
+    ):
         """Connect via Mongo URI
 
         If username or password is None, its excluded from the URI.
+        The connection pool is warmed up to min_pool_size connections.
+        Reads go to the primary unless made inside stale_reads().
         """
+        client_options = {
+            MONGO_CLIENT_OPTIONS[key]: value
+            for key, value in options.items()
+            if key in MONGO_CLIENT_OPTIONS
+        }
+        compressors = make_compressors(options.get("compressors"))
+
+        if compressors is not None:
+            client_options["compressors"] = compressors
+
         if username is None or password is None:
-            self.__client = MongoClient(f"mongodb://{hostname}:{port}")
+            self.__client = MongoClient(
+                f"mongodb://{hostname}:{port}", **client_options
+            )
         else:
             self.__client = MongoClient(
-                f"mongodb://{username}:{password}@{hostname}:{port}"
+                f"mongodb://{username}:{password}@{hostname}:{port}", **client_options
             )
 
         self.__db = self.__client.jafa
+        self.__stale_read_preference = make_read_preference(
+            options.get("read_preference"), options.get("max_staleness_seconds")
+        )
+        self.__write_concerns = make_write_concerns(options.get("write_concerns"))
+        self.__body_codec = BodyCodec(
+            options.get("body_codec"), options.get("body_codec_threshold")
+        )
+        self.__split_post_bodies = (
+            make_body_storage(options.get("body_storage")) == "split"
+        )
+
+        self.__log_pool_options()
+        self.__warm_up(options.get("min_pool_size", 1))
+        self.__log_compression(compressors)
+
+    def __log_pool_options(self):
+        pool_options = self.__client.options.pool_options
+        application = pool_options.metadata.get("application", {})
+
+        logger.info(
+            "Mongo pool: maxPoolSize=%s minPoolSize=%s waitQueueTimeoutMS=%s "
+            "serverSelectionTimeoutMS=%s socketTimeoutMS=%s maxIdleTimeMS=%s "
+            "appname=%s",
+            pool_options.max_pool_size,
+            pool_options.min_pool_size,
+            _to_ms(pool_options.wait_queue_timeout),
+            _to_ms(self.__client.options.server_selection_timeout),
+            _to_ms(pool_options.socket_timeout),
+            _to_ms(pool_options.max_idle_time_seconds),
+            application.get("name"),
+        )
+        logger.info("Mongo stale reads: %s", self.__stale_read_preference or "primary")
+        logger.info(
+            "Mongo write concerns: %s",
+            {
+                write: "default" if concern is None else concern.document
+                for write, concern in self.__write_concerns.items()
+            },
+        )
+        logger.info(
+            "Post body codec: %s, from %s bytes",
+            self.__body_codec.codec or "none",
+            self.__body_codec.threshold,
+        )
+        logger.info(
+            "Post body storage: %s", "split" if self.__split_post_bodies else "inline"
+        )
+
+    def __warm_up(self, connections: int):
+        """Open `connections` pooled connections up front.
+
+        Connections are only created when checked out concurrently, so this
+        runs that many pings at once. Failures are logged, not raised.
+        """
+        connections = max(connections, 1)
+
+        try:
+            with ThreadPoolExecutor(max_workers=connections) as executor:
+                list(
+                    executor.map(
+                        lambda _: self.__client.admin.command("ping"),
+                        range(connections),
+                    )
+                )
+        except PyMongoError as e:
+            logger.warning("Could not warm up Mongo pool: %s", e)
+            return
+
+        logger.info("Mongo pool warmed up with %s connection(s)", connections)
+
+    def __log_compression(self, compressors: list[str] | None):
+        """Log the wire compressor negotiated with the server.
+
+        The server answers a hello carrying compressors with the ones it
+        negotiated for the connection, pymongo compresses with the first.
+        """
+        if compressors is None:
+            logger.info("Mongo wire compression: off")
+            return
+
+        try:
+            hello = self.__client.admin.command("hello", compression=compressors)
+        except PyMongoError as e:
+            logger.warning("Could not check Mongo wire compression: %s", e)
+            return
+
+        negotiated = hello.get("compression") or ["none"]
+        logger.info(
+            "Mongo wire compression: offered %s, negotiated %s",
+            ",".join(compressors),
+            negotiated[0],
+        )
 
     def setup(self):
-        """Apply indexes"""
-        self.__db["users"].create_index("username", unique=True)
+        """Apply indexes declared by the Mongo models and prepare their data
+
+        Missing unique indexes are built before startup goes on, as writes
+        rely on them to reject duplicates, then each model is prepared, see
+        MongoMixin.prepare. Missing indexes that aren't unique
+        are built on a background thread so startup is not blocked by large
+        collections.
+
+        :raises IndexBuildError: If a unique index can't be built.
+        """
+        self.__import_models()
+
+        report = self.verify_indexes()
+        unique = {}
+        missing = {}
+
+        for collection_name, state in report.items():
+            if state["missing"]:
+                logger.warning(
+                    "%s: missing indexes %s", collection_name, state["missing"]
+                )
+
+                for index in MongoDatabase._indexes[collection_name]:
+                    if index.document["name"] in state["missing"]:
+                        pending = unique if index.document.get("unique") else missing
+                        pending.setdefault(collection_name, []).append(index)
+            if state["extra"]:
+                logger.warning(
+                    "%s: undeclared indexes %s", collection_name, state["extra"]
+                )
+            if state["building"]:
+                logger.info(
+                    "%s: indexes being built %s", collection_name, state["building"]
+                )
+
+        for collection_name, indexes in unique.items():
+            self.__build_unique_indexes(collection_name, indexes)
+
+        for model in dict.fromkeys(MongoDatabase._index_models.values()):
+            model().prepare()
+
+        if missing:
+            threading.Thread(
+                target=self.__build_indexes, args=(missing,), daemon=True
+            ).start()
+
+    def verify_indexes(self) -> dict[str, IndexReport]:
+        """Compare the declared indexes against the ones in the database.
+
+        :return: IndexReport for each collection with declared indexes.
+        """
+        building = self.__get_building_indexes()
+        report = {}
+
+        for collection_name, indexes in MongoDatabase._indexes.items():
+            declared = [index.document["name"] for index in indexes]
+            existing = set(self.__db[collection_name].index_information())
+            existing.discard("_id_")
+            in_progress = building.get(collection_name, set())
+
+            report[collection_name] = dict(
+                missing=[
+                    name
+                    for name in declared
+                    if name not in existing and name not in in_progress
+                ],
+                extra=sorted(existing - set(declared)),
+                building=[name for name in declared if name in in_progress],
+            )
+
+        return report
+
+    def __import_models(self):
+        """Import every Mongo model so that their indexes are registered."""
+        package = import_module("backend.data.models.mongo")
+
+        for module in pkgutil.iter_modules(package.__path__):
+            import_module(f"{package.__name__}.{module.name}")
+
+    def __get_building_indexes(self) -> dict[str, set[str]]:
+        """Return index names currently being built, keyed by collection name.
+
+        Requires permission to run $currentOp, otherwise nothing is reported.
+        """
+        building = {}
+
+        try:
+            operations = self.__client.admin.aggregate(
+                [
+                    {"$currentOp": {}},
+                    {
+                        "$match": {
+                            "ns": {"$regex": f"^{self.__db.name}\\."},
+                            "command.createIndexes": {"$exists": True},
+                        }
+                    },
+                ]
+            )
+
+            for operation in operations:
+                command = operation["command"]
+                names = building.setdefault(command["createIndexes"], set())
+                names.update(index["name"] for index in command.get("indexes", []))
+        except OperationFailure:
+            logger.info("Not permitted to list in-progress index builds")
+
+        return building
+
+    def __build_unique_indexes(self, collection_name: str, indexes: list[IndexModel]):
+        """Build unique indexes, removing the duplicates that keep them from it.
+
+        Duplicates are removed by the model that declared the indexes, see
+        MongoMixin.remove_duplicates.
+
+        :raises IndexBuildError:
+        """
+        collection = self.__db[collection_name]
+
+        try:
+            names = collection.create_indexes(indexes)
+        except OperationFailure as e:
+            model = MongoDatabase._index_models.get(collection_name)
+
+            if e.code != DUPLICATE_KEY or model is None:
+                raise IndexBuildError(
+                    f"{collection_name}: could not build unique indexes: {e}"
+                ) from e
+
+            removed = model().remove_duplicates(collection_name)
+            logger.warning(
+                "%s: removed %s duplicate document(s)", collection_name, removed
+            )
+
+            try:
+                names = collection.create_indexes(indexes)
+            except OperationFailure as e:
+                raise IndexBuildError(
+                    f"{collection_name}: could not build unique indexes, "
+                    f"remove the duplicates first: {e}"
+                ) from e
+
+        logger.info("%s: built unique indexes %s", collection_name, names)
+
+    def __build_indexes(self, missing: dict[str, list[IndexModel]]):
+        for collection_name, indexes in missing.items():
+            try:
+                names = self.__db[collection_name].create_indexes(indexes)
+                logger.info("%s: built indexes %s", collection_name, names)
+            except PyMongoError as e:
+                logger.error("%s: could not build indexes: %s", collection_name, e)
 
     def disconnect(self):
         self.__client.close()
 
     def get_client(self):
         return self.__client
+
+    @contextmanager
+    def unit_of_work(self):
+        """Run the writes inside a transaction
+
+        Standalone servers don't support transactions, in which case writes
+        are applied one by one as they are made.
+        """
+        if _session.get() is not None:
+            # Join the unit of work in progress
+            yield
+            return
+
+        if not self.__transactions_supported():
+            yield
+            return
+
+        with self.__client.start_session() as session:
+            with session.start_transaction():
+                token = _session.set(session)
+                try:
+                    yield
+                finally:
+                    _session.reset(token)
+
+    def get_session(self) -> ClientSession | None:
+        """Return the session of the unit of work in progress, if any."""
+        return _session.get()
+
+    @contextmanager
+    def stale_reads(self):
+        """Let the reads inside use the configured read preference
+
+        Reads that are part of a unit of work stay on the primary.
+        """
+        token = _stale_reads.set(True)
+        try:
+            yield
+        finally:
+            _stale_reads.reset(token)
+
+    def get_read_preference(self) -> StaleReadPreference | None:
+        """Return the read preference reads in progress should use.
+
+        :return: Read preference, or None for the client's default.
+        """
+        if _stale_reads.get() and _session.get() is None:
+            return self.__stale_read_preference
+
+        return None
+
+    def get_write_concern(self, write: str) -> WriteConcern | None:
+        """Return the write concern of a kind of write, see WRITE_CONCERN_POLICY.
+
+        Writes that are part of a unit of work use the transaction's instead.
+
+        :return: WriteConcern, or None for the client's default.
+        """
+        return self.__write_concerns[write]
+
+    def get_body_codec(self) -> BodyCodec:
+        """Return the codec post bodies are stored with."""
+        return self.__body_codec
+
+    def splits_post_bodies(self) -> bool:
+        """Return if post bodies are written apart from their posts.
+
+        Bodies are stored inside their posts otherwise, see BODY_STORAGES.
+        """
+        return self.__split_post_bodies
+
+    def __transactions_supported(self) -> bool:
+        """Check if the server is a replica set member or mongos."""
+        if self.__supports_transactions is None:
+            hello = self.__client.admin.command("hello")
+            self.__supports_transactions = (
+                "setName" in hello or hello.get("msg") == "isdbgrid"
+            )
+
+            if not self.__supports_transactions:
+                logger.warning(
+                    "Standalone server, units of work will not be transactional"
+                )
+
+        return self.__supports_transactions
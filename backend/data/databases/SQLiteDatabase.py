@@ -0,0 +1,215 @@
+import logging
+import os
+import pkgutil
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import Iterator
+
+from backend.data.databases.AbstractDatabase import AbstractDatabase
+from backend.data.models.PostModel import (
+    controversy_score,
+    hot_score,
+    search_rank,
+    wilson_score,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "jafa.db"
+"""Database file used when no host is configured."""
+BUSY_TIMEOUT_MS = 5000
+"""How long a write waits on another process's write before failing."""
+STATEMENT_CACHE_SIZE = 256
+"""Prepared statements kept per connection, every model's statements fit."""
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+)
+"""Run on every new connection. In WAL mode readers never wait on writers,
+and commits only sync at checkpoints, which loses no data on a crash of the
+process, only possibly the latest commits on a crash of the OS."""
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+"""Dates are stored as naive UTC text of a fixed width, so they sort as text."""
+
+_connection: ContextVar[sqlite3.Connection | None] = ContextVar(
+    "sqlite_connection", default=None
+)
+"""Connection of the unit of work in progress, local to each thread/greenlet."""
+
+
+def to_timestamp(value: datetime | None) -> str | None:
+    """Return a date as stored, see TIMESTAMP_FORMAT.
+
+    Aware dates are converted to UTC first, like Mongo does.
+    """
+    if value is None:
+        return None
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value.strftime(TIMESTAMP_FORMAT)
+
+
+def from_timestamp(value: str | None) -> datetime | None:
+    return None if value is None else datetime.strptime(value, TIMESTAMP_FORMAT)
+
+
+def _parsing_dates(score):
+    """Wrap a score function to take a stored creation date."""
+    return lambda *args: score(*args[:-1], from_timestamp(args[-1]))
+
+
+SQL_FUNCTIONS = dict(
+    hot_score=(3, _parsing_dates(hot_score)),
+    wilson_score=(2, wilson_score),
+    controversy_score=(2, controversy_score),
+    search_rank=(2, _parsing_dates(search_rank)),
+)
+"""Python functions statements can call, by name, with their argument count."""
+
+
+class SQLiteDatabase(AbstractDatabase):
+    """A single SQLite file, for installations that don't need a server.
+
+    Each thread or greenlet checks a connection out of a pool for as long
+    as it needs it, so no connection is ever used by two of them at once,
+    and each worker process opens its own after forking.
+
+    Writes are serialized by a lock within the process before they touch
+    the file. With gevent monkey patching the lock yields to other
+    greenlets, whereas waiting on SQLite's own file lock would block the
+    whole worker until the busy timeout.
+    """
+
+    _schema: list[str] = []
+
+    def __init__(self):
+        self.__path = DEFAULT_PATH
+        self.__pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self.__pid = os.getpid()
+        self.__write_lock = threading.Lock()
+
+    @staticmethod
+    def register_schema(statements: list[str]):
+        """Declare tables, indexes and triggers that setup() should create."""
+        SQLiteDatabase._schema.extend(statements)
+
+    def connect(
+        self, hostname: str, port=None, username=None, password=None, **options
+    ):
+        """Open the database file at `hostname`, created if missing.
+
+        The other arguments are ignored. Connections are opened as needed.
+        """
+        self.disconnect()
+        self.__path = hostname or DEFAULT_PATH
+
+        logger.info("SQLite database: %s", self.__path)
+
+    def setup(self):
+        """Create the tables, indexes and triggers declared by the SQLite models."""
+        package = import_module("backend.data.models.sqlite")
+
+        for module in pkgutil.iter_modules(package.__path__):
+            import_module(f"{package.__name__}.{module.name}")
+
+        with self.unit_of_work():
+            connection = _connection.get()
+
+            for statement in SQLiteDatabase._schema:
+                connection.execute(statement)
+
+    def disconnect(self):
+        while True:
+            try:
+                self.__pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def get_client(self) -> str:
+        """Return the path of the database file."""
+        return self.__path
+
+    def __open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.__path,
+            # Autocommit, transactions are begun explicitly by units of work
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.row_factory = sqlite3.Row
+
+        for pragma in PRAGMAS:
+            connection.execute(pragma)
+
+        for name, (arguments, function) in SQL_FUNCTIONS.items():
+            connection.create_function(name, arguments, function, deterministic=True)
+
+        return connection
+
+    def __check_out(self) -> sqlite3.Connection:
+        if os.getpid() != self.__pid:
+            # Forked, the pooled connections belong to the parent process
+            self.__pool = queue.LifoQueue()
+            self.__pid = os.getpid()
+            self.__write_lock = threading.Lock()
+
+        try:
+            return self.__pool.get_nowait()
+        except queue.Empty:
+            return self.__open()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Return the connection to run statements on.
+
+        Inside a unit of work its connection, otherwise one checked out for
+        the duration of the context. Statements outside units of work commit
+        on their own, so only reads should be made there.
+        """
+        connection = _connection.get()
+
+        if connection is not None:
+            yield connection
+            return
+
+        connection = self.__check_out()
+        try:
+            yield connection
+        finally:
+            self.__pool.put(connection)
+
+    @contextmanager
+    def unit_of_work(self):
+        """Run the statements inside a transaction
+
+        Its connection is held and writes are locked until it ends.
+        """
+        if _connection.get() is not None:
+            # Join the unit of work in progress
+            yield
+            return
+
+        with self.__write_lock, self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            token = _connection.set(connection)
+            try:
+                yield
+            except BaseException:
+                connection.rollback()
+                raise
+            else:
+                connection.commit()
+            finally:
+                _connection.reset(token)
+
+    def stale_reads(self):
+        return nullcontext()
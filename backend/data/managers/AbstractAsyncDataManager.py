@@ -0,0 +1,25 @@
+from typing import Awaitable, Type, TypeVar
+
+from backend.data.managers.AbstractDataManager import AbstractDataManager
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
+from backend.data.models.AsyncModelFactory import AsyncModelFactory
+
+T = TypeVar("T")
+
+
+class AbstractAsyncDataManager(AbstractDataManager):
+    """Abstract DataManager class built on the async models.
+
+    :param: model_factory: The backend.data.models.AbstractAsyncModelFactory to use.
+    A value of None will create a backend.data.models.AsyncModelFactory object.
+    """
+
+    def __init__(self, model_factory: Type[AbstractAsyncModelFactory] | None = None):
+        if model_factory is None:
+            model_factory = AsyncModelFactory()
+
+        super().__init__(model_factory)
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine of this manager from synchronous code, such as a view."""
+        return self.model_factory.run(coroutine)
@@ -1,9 +1,20 @@
 from abc import ABC
-from typing import Type
+from typing import Type, TypedDict, TypeVar
 
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
 from backend.data.models.ModelFactory import ModelFactory
 
+Manager = TypeVar("Manager", bound="AbstractDataManager")
+
+
+class ImportResult(TypedDict):
+    """Outcome of importing a batch of content."""
+
+    imported: int
+    """Amount of content created, content that already existed is left out."""
+    rejected: dict[int, str]
+    """Reason each invalid item was rejected, keyed by its index in the batch."""
+
 
 class AbstractDataManager(ABC):
     """Abstract DataManager class.
@@ -17,3 +28,20 @@ class AbstractDataManager(ABC):
             self.model_factory = ModelFactory()
         else:
             self.model_factory = model_factory
+
+        self.__managers = {}
+
+    def _get_manager(self, manager_class: Type[Manager]) -> Manager:
+        """Return another manager sharing this manager's model factory.
+
+        It is created on first use and reused afterwards.
+        """
+        manager = self.__managers.get(manager_class)
+
+        if manager is None:
+            # setdefault keeps the first instance if two are created concurrently
+            manager = self.__managers.setdefault(
+                manager_class, manager_class(self.model_factory)
+            )
+
+        return manager
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from backend.data.managers import SubForumManager, UserManager, VoteManager
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
 from backend.data.managers.PostMananger import PostManager
 
 
@@ -26,3 +28,11 @@ class AbstractManagerFactory(ABC):
     @abstractmethod
     def create_vote_manager(self) -> VoteManager:
         raise NotImplementedError()
+
+    @abstractmethod
+    def create_async_post_manager(self) -> AsyncPostManager:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def create_async_subforum_manager(self) -> AsyncSubForumManager:
+        raise NotImplementedError()
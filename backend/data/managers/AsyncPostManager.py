@@ -0,0 +1,130 @@
+from contextlib import nullcontext
+from typing import Type
+
+from backend.data.managers.AbstractAsyncDataManager import AbstractAsyncDataManager
+from backend.data.managers.AsyncVoteManager import AsyncVoteManager
+from backend.data.managers.PostMananger import (
+    PAGE_LIMIT,
+    InvalidPageError,
+    NoPostFoundError,
+    check_sort,
+    decode_cursor,
+    encode_cursor,
+    process_tag_filter,
+)
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
+from backend.data.models.PostModel import Post
+from backend.data.models.VoteModel import ContentType
+
+
+class AsyncPostManager(AbstractAsyncDataManager):
+    """Async counterpart of PostManager's read paths."""
+
+    def __init__(self, model_factory: Type[AbstractAsyncModelFactory] | None = None):
+        super().__init__(model_factory)
+
+    async def __add_user_votes(self, posts: list[Post], username: str | None):
+        """Set my_vote on each post to the user's is_like, None if they haven't voted."""
+        votes = {}
+
+        if username is not None and len(posts) > 0:
+            vote_manager = self._get_manager(AsyncVoteManager)
+            votes = await vote_manager.get_user_votes(
+                username, [post["post_id"] for post in posts], ContentType.POST
+            )
+
+        for post in posts:
+            post["my_vote"] = votes.get(post["post_id"])
+
+        return posts
+
+    async def get_post(self, post_id: str, allow_stale: bool = False) -> Post:
+        """Return post with specified id
+
+        :param allow_stale: Allow reading from a replica that lags behind.
+        Leave False when the post must reflect the latest writes.
+        :raises NoPostFoundError:
+        """
+        post_model = self.model_factory.create_post_model()
+
+        with self.model_factory.stale_reads() if allow_stale else nullcontext():
+            post = await post_model.get_by_post_id(post_id)
+
+        if post is None:
+            raise NoPostFoundError("A post with that ID does not exist")
+
+        return post
+
+    async def get_post_list(
+        self,
+        subforum: str | None = None,
+        page: int = 0,
+        page_limit=None,
+        cursor: str | None = None,
+        username: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        """Returns a list of posts, see PostManager.get_post_list
+
+        :raises InvalidPageError:
+        :raises InvalidCursorError:
+        :raises InvalidSortError:
+        :raises InvalidTagFilterError:
+        """
+        post_model = self.model_factory.create_post_model()
+        check_sort(sort, window)
+        tags = process_tag_filter(tags, tag_match)
+
+        if page_limit is None:
+            page_limit = PAGE_LIMIT
+
+        # Listings tolerate stale reads, the user's votes don't
+        with self.model_factory.stale_reads():
+            if cursor is not None:
+                posts = await post_model.get_posts_after(
+                    page_limit,
+                    decode_cursor(cursor, sort, window),
+                    subforum,
+                    sort=sort,
+                    window=window,
+                    tags=tags,
+                    tag_match=tag_match,
+                )
+            else:
+                try:
+                    posts = await post_model.get_posts(
+                        page_limit,
+                        page_limit * page,
+                        subforum,
+                        sort=sort,
+                        window=window,
+                        tags=tags,
+                        tag_match=tag_match,
+                    )
+                except OverflowError:
+                    # Reraise OverflowErrors into something neater
+                    raise InvalidPageError("Invalid page number")
+
+        return await self.__add_user_votes(posts, username)
+
+    def get_next_cursor(
+        self,
+        posts: list[Post],
+        page_limit=None,
+        sort: str = "new",
+        window: str = "all",
+    ) -> str | None:
+        """Return an opaque cursor for the page following `posts`
+
+        :return: Cursor string, or None if `posts` was the last page.
+        """
+        if page_limit is None:
+            page_limit = PAGE_LIMIT
+
+        if len(posts) == 0 or len(posts) < page_limit:
+            return None
+
+        return encode_cursor(posts[-1], sort, window)
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Type
+
+from backend.data.managers.AbstractAsyncDataManager import AbstractAsyncDataManager
+from backend.data.managers.SubForumManager import (
+    NoSubForumFoundError,
+    SubForumInfoGeneric,
+    SubForumInfoSpecific,
+)
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
+from backend.data.models.SubForumModel import SubForum
+from backend.utils import ceil_division
+
+
+class AsyncSubForumManager(AbstractAsyncDataManager):
+    """Async counterpart of SubForumManager's read paths."""
+
+    def __init__(self, model_factory: Type[AbstractAsyncModelFactory] | None = None):
+        super().__init__(model_factory)
+
+    def __raise_or_return(self, subforum):
+        if subforum is None:
+            raise NoSubForumFoundError("A subforum with that title does not exist")
+
+        return subforum
+
+    async def get_subforum(self, title: str) -> SubForum:
+        """Return a subforum with a given title
+
+        :raises NoSubForumFoundError:
+        """
+        subforum_model = self.model_factory.create_subforum_model()
+
+        return self.__raise_or_return(await subforum_model.get_subforum_by_title(title))
+
+    async def get_subforum_info(
+        self,
+        title: str | None = None,
+        current_page: int = 0,
+        page_limit: int | None = None,
+    ) -> SubForumInfoGeneric | SubForumInfoSpecific:
+        """Returns a dict of info for a valid subforum or generic info if None
+
+        The subforum and its post count are read concurrently, possibly from
+        a replica that lags behind.
+
+        :returns: SubForumInfoGeneric | SubForumInfoSpecific
+        :raises NoSubForumFoundError:
+        """
+        if page_limit is None:
+            from backend.data.managers.PostMananger import PAGE_LIMIT
+
+            page_limit = PAGE_LIMIT
+
+        post_model = self.model_factory.create_post_model()
+
+        with self.model_factory.stale_reads():
+            if title is None:
+                post_count = await post_model.get_count()
+            else:
+                subforum, post_count = await asyncio.gather(
+                    self.get_subforum(title), post_model.get_count(title)
+                )
+
+        page_count = ceil_division(post_count, page_limit)
+        subforum_info = dict(
+            post_count=post_count, page_count=page_count, current_page=current_page
+        )
+
+        if title is None:
+            return subforum_info
+
+        return subforum | subforum_info
@@ -0,0 +1,25 @@
+from typing import Type
+
+from backend.data.managers.AbstractAsyncDataManager import AbstractAsyncDataManager
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
+from backend.data.models.VoteModel import ContentType
+
+
+class AsyncVoteManager(AbstractAsyncDataManager):
+    """Async counterpart of VoteManager's read paths."""
+
+    def __init__(self, model_factory: Type[AbstractAsyncModelFactory] | None = None):
+        super().__init__(model_factory)
+
+    async def get_user_votes(
+        self, username: str, content_ids: list[str], content_type: ContentType
+    ) -> dict[str, bool]:
+        """Return a user's votes on several pieces of content
+
+        :returns: is_like keyed by content ID, content without a vote is left out.
+        """
+        vote_model = self.model_factory.create_vote_model()
+
+        return await vote_model.get_votes_by_ids(
+            username, content_ids, str(content_type)
+        )
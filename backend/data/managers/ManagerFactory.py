@@ -1,4 +1,9 @@
+import threading
+
+from backend.data.managers.AbstractDataManager import AbstractDataManager
 from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
 from backend.data.managers.PostMananger import PostManager
 from backend.data.managers.SubForumManager import SubForumManager
 from backend.data.managers.UserManager import UserManager
@@ -6,18 +11,48 @@ from backend.data.managers.VoteManager import VoteManager
 
 
 class ManagerFactory(AbstractManagerFactory):
+    _managers: dict[type, AbstractDataManager] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def __get_manager(manager_class: type[AbstractDataManager]):
+        """Return the manager instance shared by the whole process.
+
+        Managers hold no per-request state. Thread and greenlet safe (with
+        gevent monkey patching).
+        """
+        manager = ManagerFactory._managers.get(manager_class)
+
+        if manager is None:
+            with ManagerFactory._lock:
+                manager = ManagerFactory._managers.get(manager_class)
+
+                if manager is None:
+                    manager = manager_class()
+                    ManagerFactory._managers[manager_class] = manager
+
+        return manager
+
     @staticmethod
     def create_post_manager() -> PostManager:
-        return PostManager()
+        return ManagerFactory.__get_manager(PostManager)
 
     @staticmethod
     def create_subforum_manager() -> SubForumManager:
-        return SubForumManager()
+        return ManagerFactory.__get_manager(SubForumManager)
 
     @staticmethod
     def create_user_manager() -> UserManager:
-        return UserManager()
+        return ManagerFactory.__get_manager(UserManager)
 
     @staticmethod
     def create_vote_manager() -> VoteManager:
-        return VoteManager()
+        return ManagerFactory.__get_manager(VoteManager)
+
+    @staticmethod
+    def create_async_post_manager() -> AsyncPostManager:
+        return ManagerFactory.__get_manager(AsyncPostManager)
+
+    @staticmethod
+    def create_async_subforum_manager() -> AsyncSubForumManager:
+        return ManagerFactory.__get_manager(AsyncSubForumManager)
@@ -1,11 +1,29 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Type
 
-from backend.data.managers.AbstractDataManager import AbstractDataManager
-from backend.data.managers.SubForumManager import SubForumManager
-from backend.data.managers.VoteManager import VoteManager
+from backend.data.managers.AbstractDataManager import (
+    AbstractDataManager,
+    ImportResult,
+)
+from backend.data.managers.SubForumManager import NoSubForumFoundError, SubForumManager
+from backend.data.managers.VoteManager import ContentType, VoteManager
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
-from backend.data.models.PostModel import Post
+from backend.data.models.PostModel import (
+    SORTS,
+    TAG_MATCHES,
+    WINDOWED_SORTS,
+    WINDOWS,
+    ImportPost,
+    Post,
+    PostCursor,
+    PostVersion,
+    PostVoteCounts,
+    TagCount,
+    normalize_tag,
+)
 from backend.utils import RolePermissionError
 
 TITLE_MIN = 3
@@ -24,6 +42,15 @@ MEDIA_LIMIT = 10
 """Maximum media count."""
 PAGE_LIMIT = 20
 """Maximum page count."""
+TAG_LIST_LIMIT = 50
+"""Maximum amount of tags listed by usage."""
+SEARCH_MAX = 100
+"""Maximum search query character limit."""
+VERSION_FIELDS = ("post_id", "modified_date", "likes", "dislikes", "locked", "my_vote")
+"""Fields of a post that change whenever the rest of it does, see post_version.
+
+Creating and editing a post set modified_date, the scores follow the votes.
+"""
 
 
 class InvalidPostTitle(Exception):
@@ -58,6 +85,110 @@ class InvalidPageError(Exception):
     pass
 
 
+class InvalidCursorError(InvalidPageError):
+    pass
+
+
+class InvalidSortError(InvalidPageError):
+    pass
+
+
+class InvalidTagFilterError(InvalidPageError):
+    pass
+
+
+class InvalidSearchError(InvalidPageError):
+    pass
+
+
+def _cursor_listing(sort: str, window: str) -> str:
+    """Name the listing a cursor belongs to, windows only matter to some sorts."""
+    if sort in WINDOWED_SORTS and window != "all":
+        return f"{sort}:{window}"
+
+    return sort
+
+
+def encode_cursor(post: Post, sort: str = "new", window: str = "all") -> str:
+    """Return an opaque cursor pointing just past `post` in `sort` order."""
+    if sort == "new":
+        raw = f"{post['creation_date'].isoformat()}|{post['post_id']}"
+    else:
+        raw = f"{_cursor_listing(sort, window)}|{post[sort]!r}|{post['post_id']}"
+
+    return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: str = "new", window: str = "all") -> PostCursor:
+    """Parse an opaque cursor created by encode_cursor for the same listing.
+
+    :raises InvalidCursorError:
+    """
+    try:
+        decoded = urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+
+        if sort == "new":
+            creation_date, post_id = decoded.split("|")
+
+            return dict(
+                creation_date=datetime.fromisoformat(creation_date), post_id=post_id
+            )
+
+        listing, score, post_id = decoded.split("|")
+        if listing != _cursor_listing(sort, window):
+            raise ValueError()
+
+        return dict(score=float(score), post_id=post_id)
+    except (Base64Error, UnicodeError, ValueError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def post_version(post: Post) -> list:
+    """Return what identifies the current version of a post, to fingerprint it."""
+    return [post.get(field) for field in VERSION_FIELDS]
+
+
+def last_modified(posts: list[Post]) -> datetime | None:
+    """Return when the latest of `posts` was created or edited, None if unknown."""
+    dates = [post.get("modified_date") or post.get("creation_date") for post in posts]
+
+    return max(filter(None, dates), default=None)
+
+
+def check_sort(sort: str, window: str = "all"):
+    """Verify that posts can be listed in `sort` order within `window`.
+
+    :raises InvalidSortError:
+    """
+    if sort not in SORTS:
+        raise InvalidSortError(f"Sort must be one of {', '.join(SORTS)}")
+
+    if window not in WINDOWS:
+        raise InvalidSortError(f"Time window must be one of {', '.join(WINDOWS)}")
+
+
+def process_tag_filter(tags: list[str] | None, tag_match: str = "any"):
+    """Normalize the tags a listing is filtered by and verify the filter.
+
+    :param tag_match: One of TAG_MATCHES, whether posts need any or all tags.
+    :return: Tags to filter by, None to not filter.
+    :raises InvalidTagFilterError:
+    """
+    if tag_match not in TAG_MATCHES:
+        raise InvalidTagFilterError(
+            f"Tag match must be one of {', '.join(TAG_MATCHES)}"
+        )
+
+    if tags is None:
+        return None
+
+    tags = list(dict.fromkeys(filter(None, map(normalize_tag, tags))))
+    if len(tags) > TAGS_LIMIT:
+        raise InvalidTagFilterError(f"Cannot filter by more than {TAGS_LIMIT} tags")
+
+    return tags or None
+
+
 class PostManager(AbstractDataManager):
     """Handle post related functionality."""
 
@@ -98,7 +229,7 @@ class PostManager(AbstractDataManager):
         return body
 
     def __process_tags(self, tags: list[str] | None):
-        """Strip tags and verify character limits.
+        """Strip, lowercase and deduplicate tags and verify character limits.
 
         :raises TagLimitExceeded:
         :raises InvalidPostTag:
@@ -112,7 +243,7 @@ class PostManager(AbstractDataManager):
             raise TagLimitExceeded(f"Exceeded tag limit of {TAGS_LIMIT}")
 
         def __check_tag(tag: str):
-            tag = tag.strip()
+            tag = normalize_tag(tag)
             if tag == "":
                 raise InvalidPostTag("Tag cannot be empty")
             elif len(tag) > TAG_MAX:
@@ -120,16 +251,52 @@ class PostManager(AbstractDataManager):
 
             return tag
 
-        return list(map(__check_tag, tags))
+        return list(dict.fromkeys(map(__check_tag, tags)))
+
+    def __add_user_votes(self, posts: list[Post], username: str | None):
+        """Set my_vote on each post to the user's is_like, None if they haven't voted."""
+        votes = {}
+
+        if username is not None and len(posts) > 0:
+            vote_manager = self._get_manager(VoteManager)
+            votes = vote_manager.get_user_votes(
+                username, [post["post_id"] for post in posts], ContentType.POST
+            )
+
+        for post in posts:
+            post["my_vote"] = votes.get(post["post_id"])
+
+        return posts
 
-    def get_post(self, post_id: str) -> Post:
+    def __forget_post(self, post_id: str):
+        """Drop a changed post from the entity cache."""
+        self.model_factory.entity_cache().posts.delete(post_id)
+
+    def get_post(self, post_id: str, allow_stale: bool = False) -> Post:
         """Return post with specified id
 
+        :param allow_stale: Allow reading from a replica that lags behind, or
+        from the entity cache. Leave False when the post must reflect the
+        latest writes.
         :raises NoPostFoundError:
         """
+        cache = self.model_factory.entity_cache().posts
+
+        if allow_stale:
+            post = cache.get(post_id)
+
+            if post is not None:
+                # Callers may modify what they're given
+                return dict(post)
+
         post_model = self.model_factory.create_post_model()
 
-        return self.__raise_or_return(post_model.get_by_post_id(post_id))
+        with self.model_factory.stale_reads() if allow_stale else nullcontext():
+            post = self.__raise_or_return(post_model.get_by_post_id(post_id))
+
+        cache.set(post_id, dict(post))
+
+        return post
 
     def create_post(
         self,
@@ -150,7 +317,7 @@ class PostManager(AbstractDataManager):
         :raises NoSubForumFoundError:
         """
         post_model = self.model_factory.create_post_model()
-        subforum_manager = SubForumManager(self.model_factory)
+        subforum_manager = self._get_manager(SubForumManager)
 
         # Throw NoSubForumFoundError if invalid subforum
         subforum_manager.get_subforum(subforum)
@@ -160,21 +327,72 @@ class PostManager(AbstractDataManager):
         tags = self.__process_tags(tags)
 
         now = datetime.now()
-        return post_model.create_post(
-            dict(
-                op=op,
-                subforum=subforum,
-                title=self.__process_title(title),
-                body=self.__process_body(body),
-                media=media,
-                tags=self.__process_tags(tags),
-                likes=0,
-                dislikes=0,
-                locked=False,
-                creation_date=now,
-                modified_date=now,
+        with self.model_factory.unit_of_work():
+            return post_model.create_post(
+                dict(
+                    op=op,
+                    subforum=subforum,
+                    title=self.__process_title(title),
+                    body=self.__process_body(body),
+                    media=media,
+                    tags=self.__process_tags(tags),
+                    likes=0,
+                    dislikes=0,
+                    locked=False,
+                    creation_date=now,
+                    modified_date=now,
+                )
             )
-        )
+
+    def import_posts(self, posts: list[ImportPost]) -> ImportResult:
+        """Validate and create several posts at once, keeping their given IDs
+
+        Posts are validated like create_post, each subforum is looked up once.
+        Likes and dislikes start at 0, import votes to count them. Posts whose
+        ID already exists are skipped.
+
+        :returns: Amount of posts created and the rejected ones.
+        """
+        post_model = self.model_factory.create_post_model()
+        subforum_manager = self._get_manager(SubForumManager)
+        missing_subforums = {}
+
+        for subforum in {post["subforum"] for post in posts}:
+            try:
+                subforum_manager.get_subforum(subforum)
+            except NoSubForumFoundError as e:
+                missing_subforums[subforum] = str(e)
+
+        valid = []
+        rejected = {}
+
+        for i, post in enumerate(posts):
+            if post["subforum"] in missing_subforums:
+                rejected[i] = missing_subforums[post["subforum"]]
+                continue
+
+            try:
+                valid.append(
+                    post
+                    | dict(
+                        title=self.__process_title(post["title"]),
+                        body=self.__process_body(post["body"]),
+                        tags=self.__process_tags(post["tags"]),
+                        likes=0,
+                        dislikes=0,
+                    )
+                )
+            except (
+                InvalidPostTitle,
+                InvalidPostBody,
+                InvalidPostTag,
+                TagLimitExceeded,
+            ) as e:
+                rejected[i] = str(e)
+
+        imported = post_model.import_posts(valid) if valid else 0
+
+        return dict(imported=imported, rejected=rejected)
 
     def edit_post(
         self,
@@ -208,7 +426,7 @@ class PostManager(AbstractDataManager):
         body = self.__process_body(body)
         tags = self.__process_tags(tags)
 
-        return post_model.edit_post(
+        edited = post_model.edit_post(
             post_id,
             dict(
                 op=op,
@@ -221,6 +439,9 @@ class PostManager(AbstractDataManager):
                 dislikes=post["dislikes"],
             ),
         )
+        self.__forget_post(post_id)
+
+        return edited
 
     def delete_post(self, username: str, post_id: str) -> bool:
         """Delete a post of a given ID on behalf of a user as permitted
@@ -230,7 +451,7 @@ class PostManager(AbstractDataManager):
         :raises NoPostFoundError:
         """
         post_model = self.model_factory.create_post_model()
-        vote_manager = VoteManager(self.model_factory)
+        vote_manager = self._get_manager(VoteManager)
         post = self.get_post(post_id)
 
         op = post["op"]
@@ -239,10 +460,14 @@ class PostManager(AbstractDataManager):
             # TODO: Allow moderators to bypass
             raise RolePermissionError()
 
-        # Also clear associated votes
-        vote_manager.clear_votes_by_id(post_id)
+        with self.model_factory.unit_of_work():
+            # Also clear associated votes
+            vote_manager.clear_votes_by_id(post_id)
+            deleted = post_model.delete_by_post_id(post_id)
 
-        return post_model.delete_by_post_id(post_id)
+        self.__forget_post(post_id)
+
+        return deleted
 
     def lock_post(self, username: str, post_id: str) -> bool:
         """Mark a post as locked on behalf of a user as permitted
@@ -265,7 +490,10 @@ class PostManager(AbstractDataManager):
             # TODO: Allow moderators to bypass
             raise RolePermissionError()
 
-        return post_model.lock_post(post_id)
+        changed = post_model.lock_post(post_id)
+        self.__forget_post(post_id)
+
+        return changed
 
     def unlock_post(self, username: str, post_id: str) -> bool:
         """Mark a post as unlocked on behalf of a user as permitted
@@ -288,40 +516,40 @@ class PostManager(AbstractDataManager):
             # TODO: Allow moderators to bypass
             raise RolePermissionError()
 
-        return post_model.unlock_post(post_id)
+        changed = post_model.unlock_post(post_id)
+        self.__forget_post(post_id)
+
+        return changed
 
     def add_like(self, post_id: str, is_like: bool, positive: bool = True) -> bool:
         """Add to a post's like/dislike count. positive indicates whether it should be 1 or -1
 
+        Counts never go below 0.
+
         :raises NoPostFoundError:
         """
-        post_model = self.model_factory.create_post_model()
-        post = self.get_post(post_id)
-
-        likes = post["likes"]
-        dislikes = post["dislikes"]
-
         amount = 1 if positive else -1
 
-        # Add amount, ensure values never go below 0
         if is_like:
-            likes = max(likes + amount, 0)
-        else:
-            dislikes = max(dislikes + amount, 0)
+            return self.update_vote_counts(post_id, likes=amount)
 
-        return post_model.edit_post(
-            post_id,
-            dict(
-                op=post["op"],
-                title=post["title"],
-                body=post["body"],
-                media=post["media"],
-                tags=post["tags"],
-                modified_date=post["modified_date"],
-                likes=likes,
-                dislikes=dislikes,
-            ),
-        )
+        return self.update_vote_counts(post_id, dislikes=amount)
+
+    def update_vote_counts(self, post_id: str, likes: int = 0, dislikes: int = 0):
+        """Add to both of a post's like/dislike counts in a single update
+
+        Counts never go below 0.
+
+        :raises NoPostFoundError:
+        """
+        post_model = self.model_factory.create_post_model()
+
+        if not post_model.increment_votes(post_id, likes=likes, dislikes=dislikes):
+            raise NoPostFoundError("A post with that ID does not exist")
+
+        self.__forget_post(post_id)
+
+        return True
 
     def post_exists(self, post_id: str) -> bool:
         """Ensure a posts exists
@@ -330,21 +558,214 @@ class PostManager(AbstractDataManager):
         """
         post_model = self.model_factory.create_post_model()
 
-        return post_model.get_by_post_id(post_id) is not None
+        return post_model.post_exists(post_id)
+
+    def get_vote_counts(self, post_id: str) -> PostVoteCounts:
+        """Return only the like/dislike counts of a post
+
+        :raises NoPostFoundError:
+        """
+        post_model = self.model_factory.create_post_model()
+
+        return self.__raise_or_return(post_model.get_vote_counts(post_id))
+
+    def get_post_version(self, post_id: str, allow_stale: bool = False) -> PostVersion:
+        """Return what tells versions of a post apart, without reading its content
+
+        post_version gives the same result for it as for the post from get_post.
+
+        :param allow_stale: Like get_post, may also answer from the entity cache.
+        :raises NoPostFoundError:
+        """
+        if allow_stale:
+            post = self.model_factory.entity_cache().posts.get(post_id)
+
+            if post is not None:
+                return {field: post.get(field) for field in PostVersion.__annotations__}
+
+        post_model = self.model_factory.create_post_model()
+
+        with self.model_factory.stale_reads() if allow_stale else nullcontext():
+            return self.__raise_or_return(post_model.get_post_version(post_id))
 
     def get_post_list(
-        self, subforum: str | None = None, page: int = 0, page_limit=None
+        self,
+        subforum: str | None = None,
+        page: int = 0,
+        page_limit=None,
+        cursor: str | None = None,
+        username: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
     ) -> list[Post]:
         """Returns a list of posts
 
-        :raises InvalidPageError"
+        Posts are paged by `cursor` when given, otherwise by `page`.
+        Each post has my_vote set to the is_like of `username`'s vote on it,
+        None if they haven't voted or no username is given. Posts may be read
+        from a replica that lags behind.
+
+        :param sort: One of SORTS, newest first by default.
+        :param window: One of WINDOWS, limits top and controversial listings
+        to posts created within it.
+        :param tags: Only list posts tagged with these, normalized like post tags.
+        :param tag_match: One of TAG_MATCHES, whether posts need any or all `tags`.
+        :raises InvalidPageError:
+        :raises InvalidCursorError:
+        :raises InvalidSortError:
+        :raises InvalidTagFilterError:
+        """
+        post_model = self.model_factory.create_post_model()
+        check_sort(sort, window)
+        tags = process_tag_filter(tags, tag_match)
+
+        if page_limit is None:
+            page_limit = PAGE_LIMIT
+
+        # Listings tolerate stale reads, the user's votes don't
+        with self.model_factory.stale_reads():
+            if cursor is not None:
+                posts = post_model.get_posts_after(
+                    page_limit,
+                    decode_cursor(cursor, sort, window),
+                    subforum,
+                    sort=sort,
+                    window=window,
+                    tags=tags,
+                    tag_match=tag_match,
+                )
+            else:
+                try:
+                    posts = post_model.get_posts(
+                        page_limit,
+                        page_limit * page,
+                        subforum,
+                        sort=sort,
+                        window=window,
+                        tags=tags,
+                        tag_match=tag_match,
+                    )
+                except OverflowError:
+                    # Reraise OverflowErrors into something neater
+                    raise InvalidPageError("Invalid page number")
+
+        return self.__add_user_votes(posts, username)
+
+    def search_posts(
+        self,
+        query: str,
+        subforum: str | None = None,
+        page_limit=None,
+        cursor: str | None = None,
+        username: str | None = None,
+    ) -> list[Post]:
+        """Returns a list of posts matching a full-text search, best ranked first
+
+        Posts are ranked by relevance and recency, see search_rank, and paged
+        by `cursor`. my_vote is set like get_post_list does. Results may be
+        served from a short-lived cache and read from a replica that lags
+        behind.
+
+        :raises InvalidSearchError:
+        :raises InvalidCursorError:
+        """
+        post_model = self.model_factory.create_post_model()
+        query = query.strip()
+
+        if query == "":
+            raise InvalidSearchError("Search cannot be empty")
+        elif len(query) > SEARCH_MAX:
+            raise InvalidSearchError(f"Search cannot exceed {SEARCH_MAX} characters")
+
+        if page_limit is None:
+            page_limit = PAGE_LIMIT
+
+        if cursor is not None:
+            cursor = decode_cursor(cursor, "rank")
+
+        with self.model_factory.stale_reads():
+            posts = post_model.search_posts(
+                query, page_limit, cursor=cursor, subforum=subforum
+            )
+
+        return self.__add_user_votes(posts, username)
+
+    def get_tags(self, limit=None) -> list[TagCount]:
+        """Return the most used tags with their post counts, most used first
+
+        :param limit: Amount of tags to return, at most TAG_LIST_LIMIT.
+        """
+        post_model = self.model_factory.create_post_model()
+
+        if limit is None or limit > TAG_LIST_LIMIT:
+            limit = TAG_LIST_LIMIT
+
+        # Counts tolerate stale reads
+        with self.model_factory.stale_reads():
+            return post_model.get_tags(limit)
+
+    def reconcile_post_counts(self) -> int:
+        """Recount posts and tags and correct drift in their maintained counts
+
+        Meant to be run periodically, see the reconcile-counts command.
+
+        :return: Amount of counts that were corrected.
         """
         post_model = self.model_factory.create_post_model()
 
+        return post_model.reconcile_counts()
+
+    def normalize_post_tags(self) -> int:
+        """Normalize the tags of posts stored before tags were normalized
+
+        Meant to be run once after upgrading, see the reconcile-counts command.
+
+        :return: Amount of posts whose tags were normalized.
+        """
+        post_model = self.model_factory.create_post_model()
+
+        return post_model.normalize_stored_tags()
+
+    def recompute_scores(self) -> int:
+        """Recompute the stored scores that order hot, top and controversial listings
+
+        Meant to be run periodically, see the recompute-scores command.
+
+        :return: Amount of posts whose scores were corrected.
+        """
+        post_model = self.model_factory.create_post_model()
+
+        return post_model.recompute_scores()
+
+    def refresh_rankings(self) -> int:
+        """Rank posts voted on or created since the last refresh within each window
+
+        Meant to be run frequently, see the refresh-rankings command.
+
+        :return: Amount of posts ranked again.
+        """
+        post_model = self.model_factory.create_post_model()
+
+        return post_model.refresh_rankings()
+
+    def get_next_cursor(
+        self,
+        posts: list[Post],
+        page_limit=None,
+        sort: str = "new",
+        window: str = "all",
+    ) -> str | None:
+        """Return an opaque cursor for the page following `posts`
+
+        :param sort: Sort `posts` were listed in, "rank" for search results.
+        :return: Cursor string, or None if `posts` was the last page.
+        """
         if page_limit is None:
             page_limit = PAGE_LIMIT
-        try:
-            return post_model.get_posts(page_limit, page_limit * page, subforum)
-        except OverflowError:
-            # Reraise OverflowErrors into something neater
-            raise InvalidPageError("Invalid page number")
+
+        if len(posts) == 0 or len(posts) < page_limit:
+            return None
+
+        return encode_cursor(posts[-1], sort, window)
@@ -2,7 +2,10 @@ import re
 from datetime import datetime
 from typing import Optional, Type, TypedDict
 
-from backend.data.managers.AbstractDataManager import AbstractDataManager
+from backend.data.managers.AbstractDataManager import (
+    AbstractDataManager,
+    ImportResult,
+)
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
 from backend.data.models.SubForumModel import SubForum
 from backend.utils import RolePermissionError, ceil_division
@@ -67,11 +70,23 @@ class SubForumManager(AbstractDataManager):
     def get_subforum(self, title: str) -> SubForum:
         """Return a subforum with a given title
 
+        Subforums are read through the entity cache, so changes made by
+        another process may take its TTL to show up.
+
         :raises NoSubForumFoundError:
         """
-        subforum_model = self.model_factory.create_subforum_model()
+        cache = self.model_factory.entity_cache().subforums
+        subforum = cache.get(title)
+
+        if subforum is None:
+            subforum_model = self.model_factory.create_subforum_model()
+            subforum = self.__raise_or_return(
+                subforum_model.get_subforum_by_title(title)
+            )
+            cache.set(title, subforum)
 
-        return self.__raise_or_return(subforum_model.get_subforum_by_title(title))
+        # Callers may modify what they're given
+        return dict(subforum)
 
     def create_subforum(self, creator: str, title: str, description: str) -> bool:
         """Create a subforum inside the database if the title doesn't already exist
@@ -103,6 +118,30 @@ class SubForumManager(AbstractDataManager):
             )
         )
 
+    def import_subforums(self, subforums: list[SubForum]) -> ImportResult:
+        """Validate and create several subforums at once
+
+        Subforums are validated like create_subforum. Subforums whose title
+        already exists are skipped.
+
+        :returns: Amount of subforums created and the rejected ones.
+        """
+        subforum_model = self.model_factory.create_subforum_model()
+        valid = []
+        rejected = {}
+
+        for i, subforum in enumerate(subforums):
+            if not self.__valid_description(subforum["description"]):
+                rejected[i] = "Description cannot be empty"
+            elif not self.__valid_title(subforum["title"]):
+                rejected[i] = "Invalid title"
+            else:
+                valid.append(subforum)
+
+        imported = subforum_model.import_subforums(valid) if valid else 0
+
+        return dict(imported=imported, rejected=rejected)
+
     def delete_subforum(self, username: str, title: str) -> bool:
         """Delete a subforum on behalf of a user as permitted
 
@@ -117,7 +156,10 @@ class SubForumManager(AbstractDataManager):
             # TODO: Allow admins to bypass
             raise RolePermissionError()
 
-        return subforum_model.delete_subforum(title)
+        deleted = subforum_model.delete_subforum(title)
+        self.model_factory.entity_cache().subforums.delete(title)
+
+        return deleted
 
     def edit_subforum(self, username: str, title: str, description: str) -> bool:
         """Edit a subforum on behalf of a user as permitted
@@ -137,7 +179,10 @@ class SubForumManager(AbstractDataManager):
             # TODO: Allow moderators to bypass
             raise RolePermissionError()
 
-        return subforum_model.edit_subforum(title, description)
+        edited = subforum_model.edit_subforum(title, description)
+        self.model_factory.entity_cache().subforums.delete(title)
+
+        return edited
 
     def get_subforum_info(
         self,
@@ -147,6 +192,8 @@ class SubForumManager(AbstractDataManager):
     ) -> SubForumInfoGeneric | SubForumInfoSpecific:
         """Returns a dict of info for a valid subforum or generic info if None
 
+        Info may be read from a replica that lags behind.
+
         :returns: SubForumInfoGeneric | SubForumInfoSpecific
         :raises NoSubForumFoundError:
         """
@@ -156,16 +203,17 @@ class SubForumManager(AbstractDataManager):
 
             page_limit = PAGE_LIMIT
 
-        post_model = self.model_factory.create_post_model()
-        post_count = post_model.get_count(title)
-        page_count = ceil_division(post_count, page_limit)
-        subforum_info = dict(
-            post_count=post_count, page_count=page_count, current_page=current_page
-        )
+        with self.model_factory.stale_reads():
+            post_model = self.model_factory.create_post_model()
+            post_count = post_model.get_count(title)
+            page_count = ceil_division(post_count, page_limit)
+            subforum_info = dict(
+                post_count=post_count, page_count=page_count, current_page=current_page
+            )
 
-        if title is None:
-            return subforum_info
+            if title is None:
+                return subforum_info
 
-        subforum = self.get_subforum(title)
+            subforum = self.get_subforum(title)
 
         return subforum | subforum_info
@@ -56,21 +56,36 @@ class UserManager(AbstractDataManager):
 
         return True
 
+    def __get_user(self, username: str) -> User | None:
+        """Return a user read through the entity cache, None if not found."""
+        cache = self.model_factory.entity_cache().users
+        user = cache.get(username)
+
+        if user is None:
+            user_model = self.model_factory.create_user_model()
+            user = user_model.get_by_username(username)
+
+            if user is None:
+                return None
+
+            cache.set(username, user)
+
+        # Callers may modify what they're given
+        return dict(user)
+
     def user_exists(self, username: str) -> bool:
         """Check database for username
 
         :returns: True if the username exists, false otherwise.
         """
-        user_model = self.model_factory.create_user_model()
-        return user_model.get_by_username(username) is not None
+        return self.__get_user(username) is not None
 
     def check_password(self, username: str, password: str) -> tuple[bool, User]:
         """Check if a given password corresponds to the saved hash
 
         :returns: Tuple[bool: password_is_valid, dict: user]
         """
-        user_model = self.model_factory.create_user_model()
-        user = user_model.get_by_username(username)
+        user = self.__get_user(username)
         if user is None:
             return False, None
 
@@ -1,7 +1,11 @@
+from collections import defaultdict
 from datetime import datetime
 from typing import Type
 
-from backend.data.managers.AbstractDataManager import AbstractDataManager
+from backend.data.managers.AbstractDataManager import (
+    AbstractDataManager,
+    ImportResult,
+)
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
 from backend.data.models.VoteModel import ContentType, Vote
 
@@ -66,6 +70,17 @@ class VoteManager(AbstractDataManager):
 
         return self.__raise_or_return(vote)
 
+    def get_user_votes(
+        self, username: str, content_ids: list[str], content_type: ContentType
+    ) -> dict[str, bool]:
+        """Return a user's votes on several pieces of content
+
+        :returns: is_like keyed by content ID, content without a vote is left out.
+        """
+        vote_model = self.model_factory.create_vote_model()
+
+        return vote_model.get_votes_by_ids(username, content_ids, str(content_type))
+
     def add_vote(
         self,
         username: str,
@@ -79,71 +94,90 @@ class VoteManager(AbstractDataManager):
         :raises InvalidContent:
         :raises InvalidContentType:
         """
-        from backend.data.managers.PostMananger import PostManager
+        if content_type not in (ContentType.POST, ContentType.COMMENT):
+            raise InvalidContentType("Unknown content type: " + str(content_type))
+
+        vote_model = self.model_factory.create_vote_model()
+        vote = dict(
+            username=username,
+            content_id=content_id,
+            content_type=str(content_type),
+            is_like=is_like,
+            creation_date=datetime.now(),
+        )
+
+        previous = vote_model.upsert_vote(vote)
 
-        post_manager = PostManager(self.model_factory)
+        if previous == is_like:
+            # is_like is unchanged, counts stay the same
+            return True
+
+        # Count the new vote, and take back the previous one if any
+        likes = int(is_like) - int(previous is True)
+        dislikes = int(not is_like) - int(previous is False)
 
         if content_type == ContentType.POST:
-            if not post_manager.post_exists(content_id):
-                raise InvalidContent("Invalid post given")
+            from backend.data.managers.PostMananger import (
+                NoPostFoundError,
+                PostManager,
+            )
+
+            post_manager = self._get_manager(PostManager)
 
+            try:
+                post_manager.update_vote_counts(content_id, likes, dislikes)
+            except NoPostFoundError:
+                # Don't keep votes for posts that don't exist
+                vote_model.remove_vote(vote)
+                raise InvalidContent("Invalid post given")
         elif content_type == ContentType.COMMENT:
-            # TODO: Check if comment exists
+            # TODO: Update comment likes
             pass
-        else:
-            # Should be unreachable
-            raise InvalidContentType("Unknown content type: " + str(content_type))
 
-        vote_model = self.model_factory.create_vote_model()
+        return True
 
-        try:
-            vote = self.get_vote(username, content_id, content_type)
-        except NoVoteFoundError:
-            if content_type == ContentType.POST:
-                # Update post likes
-                post_manager.add_like(content_id, is_like)
-            elif content_type == ContentType.COMMENT:
-                # TODO: Update comment likes
-                pass
-            else:
-                # Unreachable code
-                pass
-
-            # Create new vote
-            return vote_model.add_vote(
-                dict(
-                    username=username,
-                    content_id=content_id,
-                    content_type=str(content_type),
-                    is_like=is_like,
-                    creation_date=datetime.now(),
-                )
-            )
+    def import_votes(self, votes: list[Vote]) -> ImportResult:
+        """Create several post votes at once and count them on their posts
 
-        # No exception raised, update existing vote
-        if vote["is_like"] != is_like:
-            # If is_like is changing, update counts
-
-            if content_type == ContentType.POST:
-                # Update post likes
-                post_manager.add_like(content_id, is_like)
-                post_manager.add_like(content_id, vote["is_like"], False)
-            elif content_type == ContentType.COMMENT:
-                # TODO: Update comment likes
-                pass
-            else:
-                # Unreachable code
-                pass
+        Votes and counts are written in one unit of work. Votes that already
+        exist are left unchanged and aren't counted again.
 
-        return vote_model.update_vote(
-            dict(
-                username=username,
-                content_id=content_id,
-                content_type=str(content_type),
-                is_like=is_like,
-                creation_date=datetime.now(),
-            )
+        :returns: Amount of votes created and the rejected ones.
+        """
+        post_model = self.model_factory.create_post_model()
+        vote_model = self.model_factory.create_vote_model()
+        existing = post_model.get_existing_post_ids(
+            [vote["content_id"] for vote in votes]
         )
+        valid = []
+        rejected = {}
+
+        for i, vote in enumerate(votes):
+            if vote["content_type"] != ContentType.POST:
+                rejected[i] = "Unknown content type: " + str(vote["content_type"])
+            elif vote["content_id"] not in existing:
+                rejected[i] = "Invalid post given"
+            else:
+                valid.append(vote | dict(content_type=str(vote["content_type"])))
+
+        if not valid:
+            return dict(imported=0, rejected=rejected)
+
+        with self.model_factory.unit_of_work():
+            created = vote_model.import_votes(valid)
+
+            counts = defaultdict(lambda: dict(likes=0, dislikes=0))
+            for vote in created:
+                counts[vote["content_id"]][
+                    "likes" if vote["is_like"] else "dislikes"
+                ] += 1
+
+            if counts:
+                post_model.add_vote_counts(
+                    [dict(post_id=post_id) | count for post_id, count in counts.items()]
+                )
+
+        return dict(imported=len(created), rejected=rejected)
 
     def remove_vote(self, username: str, content_id: str, content_type: ContentType):
         """Remove a user vote for some content
@@ -158,7 +192,7 @@ class VoteManager(AbstractDataManager):
         if content_type == ContentType.POST:
             from backend.data.managers.PostMananger import PostManager
 
-            post_manager = PostManager(self.model_factory)
+            post_manager = self._get_manager(PostManager)
             if not post_manager.post_exists(content_id):
                 raise InvalidContent("Invalid post given")
 
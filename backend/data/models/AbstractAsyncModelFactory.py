@@ -0,0 +1,61 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, nullcontext
+from typing import Awaitable, TypeVar
+
+from backend.data.models.AsyncPostModel import AsyncPostModel
+from backend.data.models.AsyncSubForumModel import AsyncSubForumModel
+from backend.data.models.AsyncUserModel import AsyncUserModel
+from backend.data.models.AsyncVoteModel import AsyncVoteModel
+
+T = TypeVar("T")
+
+
+class AbstractAsyncModelFactory(ABC):
+    @staticmethod
+    @abstractmethod
+    def create_user_model() -> AsyncUserModel:
+        """Create instance of AsyncUserModel"""
+        raise NotImplementedError()
+
+    @staticmethod
+    @abstractmethod
+    def create_subforum_model() -> AsyncSubForumModel:
+        """Create instance of AsyncSubForumModel"""
+        raise NotImplementedError()
+
+    @staticmethod
+    @abstractmethod
+    def create_vote_model() -> AsyncVoteModel:
+        """Create instance of AsyncVoteModel"""
+        raise NotImplementedError()
+
+    @staticmethod
+    @abstractmethod
+    def create_post_model() -> AsyncPostModel:
+        """Create instance of AsyncPostModel"""
+        raise NotImplementedError()
+
+    @staticmethod
+    def unit_of_work() -> AbstractAsyncContextManager:
+        """Async counterpart of AbstractModelFactory.unit_of_work.
+
+        Writes are not grouped unless overridden.
+        """
+        return nullcontext()
+
+    @staticmethod
+    def stale_reads() -> AbstractContextManager:
+        """Async counterpart of AbstractModelFactory.stale_reads.
+
+        Enter it inside the coroutine making the reads.
+        """
+        return nullcontext()
+
+    @staticmethod
+    def run(coroutine: Awaitable[T]) -> T:
+        """Run a coroutine using the models from synchronous code.
+
+        Runs it in a new event loop unless overridden.
+        """
+        return asyncio.run(coroutine)
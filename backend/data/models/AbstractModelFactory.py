@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 
+from backend.data.EntityCache import EntityCache
 from backend.data.models.PostModel import PostModel
 from backend.data.models.SubForumModel import SubForumModel
 from backend.data.models.UserModel import UserModel
 from backend.data.models.VoteModel import VoteModel
 
+_NO_CACHE = EntityCache(0, 0)
+
 
 class AbstractModelFactory(ABC):
     @staticmethod
@@ -30,3 +34,27 @@ class AbstractModelFactory(ABC):
     def create_post_model() -> PostModel:
         """Create instance of PostModel"""
         raise NotImplementedError()
+
+    @staticmethod
+    def unit_of_work() -> AbstractContextManager:
+        """Group the writes made by models inside it into a single atomic unit.
+
+        Writes are not grouped unless overridden.
+        """
+        return nullcontext()
+
+    @staticmethod
+    def stale_reads() -> AbstractContextManager:
+        """Let the reads made by models inside it be served by lagging replicas.
+
+        Reads are not redirected unless overridden.
+        """
+        return nullcontext()
+
+    @staticmethod
+    def entity_cache() -> EntityCache:
+        """Return the cache managers read posts, subforums and users through.
+
+        Nothing is cached unless overridden.
+        """
+        return _NO_CACHE
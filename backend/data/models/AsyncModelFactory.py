@@ -0,0 +1,49 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Awaitable, TypeVar
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
+from backend.data.models.AsyncPostModel import AsyncPostModel
+from backend.data.models.AsyncSubForumModel import AsyncSubForumModel
+from backend.data.models.AsyncUserModel import AsyncUserModel
+from backend.data.models.AsyncVoteModel import AsyncVoteModel
+from backend.data.models.ModelFactory import ModelFactory
+from backend.JafaConfigClass import jafa_config
+
+T = TypeVar("T")
+
+
+class AsyncModelFactory(AbstractAsyncModelFactory):
+    """Create the async models of the configured async database type."""
+
+    @staticmethod
+    def create_user_model() -> AsyncUserModel:
+        return ModelFactory._get_model(jafa_config.async_database_type, "user")
+
+    @staticmethod
+    def create_subforum_model() -> AsyncSubForumModel:
+        return ModelFactory._get_model(jafa_config.async_database_type, "subforum")
+
+    @staticmethod
+    def create_vote_model() -> AsyncVoteModel:
+        return ModelFactory._get_model(jafa_config.async_database_type, "vote")
+
+    @staticmethod
+    def create_post_model() -> AsyncPostModel:
+        return ModelFactory._get_model(jafa_config.async_database_type, "post")
+
+    @staticmethod
+    def unit_of_work() -> AbstractAsyncContextManager:
+        database = DatabaseFactory.create_database(jafa_config.async_database_type)
+        return database.unit_of_work()
+
+    @staticmethod
+    def stale_reads() -> AbstractContextManager:
+        database = DatabaseFactory.create_database(jafa_config.async_database_type)
+        return database.stale_reads()
+
+    @staticmethod
+    def run(coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the async database's event loop."""
+        database = DatabaseFactory.create_database(jafa_config.async_database_type)
+        return database.run(coroutine)
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+
+from backend.data.models.Model import Model
+from backend.data.models.PostModel import Post, PostCursor
+
+
+class AsyncPostModel(ABC, Model):
+    """Async counterpart of the reads of PostModel, see it for what each
+    method does. Posts are written through PostModel."""
+
+    @abstractmethod
+    async def get_by_post_id(self, post_id: str) -> Post | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def post_exists(self, post_id: str) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_posts(
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_count(self, subforum: str | None = None) -> int:
+        raise NotImplementedError()
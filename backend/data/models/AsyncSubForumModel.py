@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from backend.data.models.Model import Model
+from backend.data.models.SubForumModel import SubForum
+
+
+class AsyncSubForumModel(ABC, Model):
+    """Async counterpart of the reads of SubForumModel, see it for what each
+    method does. Subforums are written through SubForumModel."""
+
+    @abstractmethod
+    async def get_subforum_by_title(self, title: str) -> SubForum | None:
+        raise NotImplementedError()
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from backend.data.models.Model import Model
+from backend.data.models.UserModel import User
+
+
+class AsyncUserModel(ABC, Model):
+    """Async counterpart of the reads of UserModel, see it for what each
+    method does. Users are written through UserModel."""
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> User | None:
+        raise NotImplementedError()
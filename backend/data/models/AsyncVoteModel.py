@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from backend.data.models.Model import Model
+from backend.data.models.VoteModel import BaseVote, Vote
+
+
+class AsyncVoteModel(ABC, Model):
+    """Async counterpart of the reads of VoteModel, see it for what each
+    method does. Votes are written through VoteModel."""
+
+    @abstractmethod
+    async def get_vote(self, data: BaseVote) -> Vote | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        raise NotImplementedError()
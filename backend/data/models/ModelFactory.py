@@ -1,8 +1,13 @@
 import os.path
+import threading
+from contextlib import AbstractContextManager
 from glob import glob
 from importlib import import_module
 
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.EntityCache import EntityCache
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
+from backend.data.models.Model import Model
 from backend.data.models.PostModel import PostModel
 from backend.data.models.SubForumModel import SubForumModel
 from backend.data.models.UserModel import UserModel
@@ -12,6 +17,9 @@ from backend.JafaConfigClass import jafa_config
 
 class ModelFactory(AbstractModelFactory):
     _associations = None
+    _models: dict[tuple[str, str], Model] = {}
+    _caches: dict[str, EntityCache] = {}
+    _lock = threading.Lock()
 
     @staticmethod
     def __setup_associations():
@@ -32,32 +40,79 @@ class ModelFactory(AbstractModelFactory):
             ModelFactory._associations[base.lower()] = base
 
     @staticmethod
-    def __import_model(model_type):
-        """Dynamically import a model based on the database type and model type."""
+    def _import_model(database, model_type):
+        """Dynamically import the model class of a database type and model type."""
         if ModelFactory._associations is None:
             ModelFactory.__setup_associations()
 
-        database = jafa_config.database_type
-        path = ModelFactory._associations[database + model_type + "model"]
+        # Database types may contain underscores, module names don't
+        key = database.replace("_", "") + model_type + "model"
+        path = ModelFactory._associations[key]
         module = import_module(f"backend.data.models.{database}.{path}")
         return getattr(module, path)
 
+    @staticmethod
+    def _get_model(database, model_type):
+        """Return the model instance shared by the whole process.
+
+        Models hold no per-request state, so each one is created once per
+        database type. Thread and greenlet safe (with gevent monkey patching).
+        """
+        key = (database, model_type)
+        model = ModelFactory._models.get(key)
+
+        if model is None:
+            with ModelFactory._lock:
+                model = ModelFactory._models.get(key)
+
+                if model is None:
+                    model = ModelFactory._import_model(database, model_type)()
+                    ModelFactory._models[key] = model
+
+        return model
+
     @staticmethod
     def create_user_model() -> UserModel:
-        model = ModelFactory.__import_model("user")
-        return model()
+        return ModelFactory._get_model(jafa_config.database_type, "user")
 
     @staticmethod
     def create_subforum_model() -> SubForumModel:
-        model = ModelFactory.__import_model("subforum")
-        return model()
+        return ModelFactory._get_model(jafa_config.database_type, "subforum")
 
     @staticmethod
     def create_vote_model() -> VoteModel:
-        model = ModelFactory.__import_model("vote")
-        return model()
+        return ModelFactory._get_model(jafa_config.database_type, "vote")
 
     @staticmethod
     def create_post_model() -> PostModel:
-        model = ModelFactory.__import_model("post")
-        return model()
+        return ModelFactory._get_model(jafa_config.database_type, "post")
+
+    @staticmethod
+    def unit_of_work() -> AbstractContextManager:
+        database = DatabaseFactory.create_database(jafa_config.database_type)
+        return database.unit_of_work()
+
+    @staticmethod
+    def stale_reads() -> AbstractContextManager:
+        database = DatabaseFactory.create_database(jafa_config.database_type)
+        return database.stale_reads()
+
+    @staticmethod
+    def entity_cache() -> EntityCache:
+        """Return the cache shared by the whole process, one per database type.
+
+        Sized by jafa_config.entity_cache_size and entity_cache_ttl.
+        """
+        database_type = jafa_config.database_type
+        cache = ModelFactory._caches.get(database_type)
+
+        if cache is None:
+            # setdefault keeps the first instance if two are created concurrently
+            cache = ModelFactory._caches.setdefault(
+                database_type,
+                EntityCache(
+                    jafa_config.entity_cache_size, jafa_config.entity_cache_ttl
+                ),
+            )
+
+        return cache
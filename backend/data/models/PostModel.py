@@ -1,9 +1,118 @@
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import TypedDict
+from datetime import date, datetime, timedelta
+from math import log2, log10, sqrt
+from typing import NotRequired, TypedDict
 
 from backend.data.models.Model import Model
 
+PREVIEW_MAX = 300
+"""Maximum preview character length."""
+SORTS = ("new", "hot", "top", "controversial")
+"""Orders posts can be listed in."""
+WINDOWED_SORTS = ("top", "controversial")
+"""Sorts that can be limited to posts created within one of WINDOWS."""
+WINDOWS = dict(
+    day=timedelta(days=1), week=timedelta(weeks=1), month=timedelta(days=30), all=None
+)
+"""How far back windowed listings go, all doesn't limit them."""
+TAG_MATCHES = ("any", "all")
+"""How posts are matched against several tags, having any or all of them."""
+WILSON_Z = 1.96
+"""Standard score of the confidence wilson_score is computed with, 95%."""
+HOT_EPOCH = datetime(2024, 1, 1)
+"""Creation date from which hot scores count age."""
+HOT_TIMESCALE = 45000
+"""Seconds of age worth a tenfold difference in net votes to hot_score."""
+SEARCH_TIMESCALE = 7 * 86400
+"""Seconds of age worth a twofold difference in relevance to search_rank."""
+SEARCH_WEIGHTS = dict(title=10, tags=5, body=1)
+"""Weight of each field searched by search_posts."""
+
+
+def hot_score(likes: int, dislikes: int, creation_date: datetime) -> float:
+    """Return the hot ranking score of a post.
+
+    Net votes count logarithmically and newer posts get a linear head
+    start, so a post needs ten times the net votes of one posted
+    HOT_TIMESCALE seconds later to rank above it. The score of a post only
+    changes with its votes.
+    """
+    net = likes - dislikes
+    sign = (net > 0) - (net < 0)
+    age = (creation_date - HOT_EPOCH).total_seconds()
+
+    return sign * log10(max(abs(net), 1)) + age / HOT_TIMESCALE
+
+
+def wilson_score(likes: int, dislikes: int) -> float:
+    """Return the top ranking score of a post.
+
+    The lower bound of the Wilson score interval of the post's like ratio,
+    so a few likes rank below many likes with the same ratio. Posts without
+    votes score 0.
+    """
+    total = likes + dislikes
+
+    if total == 0:
+        return 0.0
+
+    ratio = likes / total
+    z2 = WILSON_Z * WILSON_Z
+    spread = WILSON_Z * sqrt((ratio * (1 - ratio) + z2 / (4 * total)) / total)
+
+    return (ratio + z2 / (2 * total) - spread) / (1 + z2 / total)
+
+
+def controversy_score(likes: int, dislikes: int) -> float:
+    """Return the controversial ranking score of a post.
+
+    Grows with the amount of votes, the more so the closer likes and
+    dislikes are to even. Posts without both likes and dislikes score 0.
+    """
+    if likes <= 0 or dislikes <= 0:
+        return 0.0
+
+    return (likes + dislikes) ** (min(likes, dislikes) / max(likes, dislikes))
+
+
+def search_rank(relevance: float, creation_date: datetime) -> float:
+    """Return the rank of a post matching a search.
+
+    Relevance counts logarithmically and newer posts get a linear head
+    start, like hot_score, so a post needs twice the relevance of one
+    posted SEARCH_TIMESCALE seconds later to rank above it.
+
+    :param relevance: How well the post matches the search, greater than 0.
+    """
+    age = (creation_date - HOT_EPOCH).total_seconds()
+
+    return log2(relevance) + age / SEARCH_TIMESCALE
+
+
+def post_scores(likes: int, dislikes: int, creation_date: datetime) -> dict:
+    """Return the score of a post for every sort other than new, keyed by sort."""
+    return dict(
+        hot=hot_score(likes, dislikes, creation_date),
+        top=wilson_score(likes, dislikes),
+        controversial=controversy_score(likes, dislikes),
+    )
+
+
+def normalize_tag(tag: str) -> str:
+    """Return a tag the way it's stored, stripped and lowercase."""
+    return tag.strip().lower()
+
+
+def normalize_tags(tags: list[str] | None) -> list[str] | None:
+    """Return tags the way they're stored, normalized without empty tags or duplicates.
+
+    :return: Normalized tags in their original order, None if none are left.
+    """
+    if tags is None:
+        return None
+
+    return list(dict.fromkeys(filter(None, map(normalize_tag, tags)))) or None
+
 
 class BasePost(TypedDict):
     """Generic post data."""
@@ -17,7 +126,7 @@ class BasePost(TypedDict):
     media: list[str] | None
     """Media within a post."""
     tags: list[str] | None
-    """Tags associated with a post."""
+    """Tags associated with a post, lowercase and without duplicates."""
     modified_date: date | None
     """Last time a post was modified."""
     likes: int
@@ -38,11 +147,73 @@ class CreatePost(BasePost):
     """If a post is currently locked."""
 
 
+class ImportPost(CreatePost):
+    """Post data brought in by a bulk import, keeping the ID it was given."""
+
+    post_id: str
+    """Unique ID of a post."""
+
+
 class Post(CreatePost):
-    """Complete post data when retreiving from the database."""
+    """Complete post data when retreiving from the database.
+
+    Listings return a preview in place of the body.
+    """
 
     post_id: str
     """Unique ID of a post."""
+    preview: str
+    """First PREVIEW_MAX characters of the body."""
+    hot: float
+    """Hot ranking score, see hot_score."""
+    top: float
+    """Top ranking score, see wilson_score."""
+    controversial: float
+    """Controversial ranking score, see controversy_score."""
+    rank: NotRequired[float]
+    """Search rank, see search_rank. Only set on search results."""
+
+
+class PostVoteCounts(TypedDict):
+    """Vote counters of a post."""
+
+    post_id: str
+    """Unique ID of a post."""
+    likes: int
+    """Current amount of likes a post has."""
+    dislikes: int
+    """Current amount of dislikes a post has."""
+
+
+class PostVersion(PostVoteCounts):
+    """Fields of a post telling its versions apart, without its content."""
+
+    creation_date: date
+    """The date of when a post was created."""
+    modified_date: date | None
+    """Last time a post was modified."""
+    locked: bool
+    """Whether a post is locked."""
+
+
+class TagCount(TypedDict):
+    """Usage count of a tag."""
+
+    tag: str
+    """Lowercase tag."""
+    count: int
+    """Amount of posts tagged with it."""
+
+
+class PostCursor(TypedDict):
+    """Position of the last post seen within a listing."""
+
+    creation_date: NotRequired[date]
+    """Creation date of the last post seen, for the new sort."""
+    score: NotRequired[float]
+    """Score of the last post seen, for sorts other than new."""
+    post_id: str
+    """Unique ID of the last post seen, used to break ties."""
 
 
 class PostModel(ABC, Model):
@@ -66,6 +237,36 @@ class PostModel(ABC, Model):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def post_exists(self, post_id: str) -> bool:
+        """Check if a post exists without reading its content.
+
+        :param post_id: Unique ID of post.
+
+        :return: True if the post exists.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_vote_counts(self, post_id: str) -> PostVoteCounts | None:
+        """Return only the vote counters of a post.
+
+        :param post_id: Unique ID of post.
+
+        :return: PostVoteCounts or None if no post found.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_post_version(self, post_id: str) -> PostVersion | None:
+        """Return the vote counters, dates and lock of a post, without its content.
+
+        :param post_id: Unique ID of post.
+
+        :return: PostVersion or None if no post found.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def delete_by_post_id(self, post_id: str) -> bool:
         """Delete a post from the database associated with a given id, if any.
@@ -90,6 +291,8 @@ class PostModel(ABC, Model):
     def edit_post(self, post_id: str, data: BasePost) -> bool:
         """Modify post data to the contents of `data`.
 
+        Like/dislike counts are left untouched, see increment_votes.
+
         :param post_id: Unique ID of post to edit.
         :param data: Data to edit post to.
 
@@ -97,6 +300,21 @@ class PostModel(ABC, Model):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def increment_votes(self, post_id: str, likes: int = 0, dislikes: int = 0) -> bool:
+        """Atomically add to a post's like/dislike counts, never going below 0.
+
+        Only the counters are modified.
+
+        :param post_id: Unique ID of post.
+        :param likes: Amount to add to the like count, may be negative.
+        :param dislikes: Amount to add to the dislike count, may be negative.
+
+        :return: True if the post exists. Implementations that don't wait for
+        the write to be acknowledged may return True regardless.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def lock_post(self, post_id: str) -> bool:
         """Lock a post associated with a given id.
@@ -119,12 +337,77 @@ class PostModel(ABC, Model):
 
     @abstractmethod
     def get_posts(
-        self, limit: int, skip: int, subforum: str | None = None
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
     ) -> list[Post]:
         """Return a list of posts within the given parameters.
+
+        Posts are returned with a preview in place of the body.
+
         :param limit: Max amount of posts to return.
         :param skip: Amount of posts to skip before grabbing.
         :param subforum: Subforum to filter posts from. A value of None indicates that all subforums should be used.
+        :param sort: One of SORTS, see get_posts_after.
+        :param window: One of WINDOWS, see get_posts_after.
+        :param tags: Tags to filter posts by, see get_posts_after.
+        :param tag_match: One of TAG_MATCHES, see get_posts_after.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        """Return a list of posts that follow `cursor` in listing order.
+
+        Posts are ordered newest first, or by highest score for the other
+        sorts, ties broken by post ID, and are returned with a preview in
+        place of the body.
+
+        :param limit: Max amount of posts to return.
+        :param cursor: Last post seen. A value of None starts from the first post.
+        :param subforum: Subforum to filter posts from. A value of None indicates that all subforums should be used.
+        :param sort: One of SORTS.
+        :param window: One of WINDOWS, only posts created within it are
+        listed. Windowed sorts may list scores as of the last refresh_rankings,
+        other sorts ignore it.
+        :param tags: Lowercase tags to filter posts by. A value of None lists posts regardless of tags.
+        :param tag_match: One of TAG_MATCHES, whether posts need any or all of `tags`.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def search_posts(
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None = None,
+        subforum: str | None = None,
+    ) -> list[Post]:
+        """Return a list of posts matching a full-text search.
+
+        Titles, tags and bodies are searched, in order of weight. Posts are
+        ordered by highest search_rank, ties broken by post ID, and are
+        returned with a preview in place of the body and their rank set.
+        Implementations may serve repeated searches from a short-lived cache.
+
+        :param query: Words to search for.
+        :param limit: Max amount of posts to return.
+        :param cursor: Last post seen, its score being its rank. A value of None starts from the first post.
+        :param subforum: Subforum to filter posts from. A value of None indicates that all subforums should be used.
         """
         raise NotImplementedError()
 
@@ -132,6 +415,92 @@ class PostModel(ABC, Model):
     def get_count(self, subforum: str | None = None) -> int:
         """Return the amount of existing posts.
 
+        Implementations may maintain counts incrementally, see reconcile_counts.
+
         :param subforum: Subforum to filter posts from. A value of None indicates that all subforums should be used.
         """
         raise NotImplementedError()
+
+    @abstractmethod
+    def reconcile_counts(self) -> int:
+        """Recount posts and tags and correct any drift in maintained counts.
+
+        :return: Amount of counts that were corrected.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def normalize_stored_tags(self) -> int:
+        """Normalize the tags of posts stored before tags were, see normalize_tags.
+
+        Posts whose tags change are ranked again, tag counts are left to
+        reconcile_counts.
+
+        :return: Amount of posts whose tags were normalized.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_tags(self, limit: int) -> list[TagCount]:
+        """Return the most used tags, most used first.
+
+        Implementations may maintain counts incrementally, see reconcile_counts.
+
+        :param limit: Max amount of tags to return.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def recompute_scores(self) -> int:
+        """Recompute the stored scores of every post from its votes.
+
+        Scores are kept up to date as posts are created and voted on, this
+        corrects any drift and fills in scores missing from older posts.
+
+        :return: Amount of posts whose scores were corrected.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def refresh_rankings(self) -> int:
+        """Bring the rankings windowed sorts list from up to date.
+
+        Only posts voted on or created since the last refresh are ranked
+        again, and posts that fell out of a window are dropped from it.
+
+        :return: Amount of posts ranked again.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def import_posts(self, posts: list[ImportPost]) -> int:
+        """Create several posts at once, keeping their given IDs.
+
+        Posts whose ID already exists are skipped, so an interrupted import
+        can be repeated. Post counts are maintained for the created posts.
+
+        :param posts: Posts to create.
+
+        :return: Amount of posts created.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_existing_post_ids(self, post_ids: list[str]) -> set[str]:
+        """Check which of several posts exist with a single query.
+
+        :param post_ids: Unique IDs of posts.
+
+        :return: The IDs of `post_ids` that exist.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def add_vote_counts(self, counts: list[PostVoteCounts]) -> int:
+        """Add to the like/dislike counts of several posts at once.
+
+        :param counts: Amounts to add to each post's counters, never negative.
+
+        :return: Amount of posts updated.
+        """
+        raise NotImplementedError()
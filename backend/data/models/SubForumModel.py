@@ -60,3 +60,16 @@ class SubForumModel(ABC, Model):
         """
 
         raise NotImplementedError()
+
+    @abstractmethod
+    def import_subforums(self, subforums: list[SubForum]) -> int:
+        """Create several subforum entries at once.
+
+        Subforums whose title already exists are skipped, so an interrupted
+        import can be repeated.
+
+        :param subforums: Subforum data.
+
+        :return: Amount of subforums created.
+        """
+        raise NotImplementedError()
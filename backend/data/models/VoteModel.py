@@ -30,6 +30,24 @@ class VoteModel(ABC, Model):
     def get_vote(self, data: BaseVote) -> Vote | None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        """Return a user's votes on several pieces of content with a single query.
+
+        :return: is_like keyed by content ID. Content without a vote is left out.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def upsert_vote(self, data: Vote) -> bool | None:
+        """Atomically create a vote, or update it if it already exists.
+
+        :return: The previous is_like of the vote, None if it was created.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def update_vote(self, data: Vote) -> bool:
         raise NotImplementedError()
@@ -45,3 +63,14 @@ class VoteModel(ABC, Model):
     @abstractmethod
     def clear_votes_by_id(self, content_id: str) -> bool:
         raise NotImplementedError()
+
+    @abstractmethod
+    def import_votes(self, votes: list[Vote]) -> list[Vote]:
+        """Create several votes at once.
+
+        Votes that already exist are left untouched, so an interrupted import
+        can be repeated.
+
+        :return: The votes that were created.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,48 @@
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+
+
+class AsyncMongoMixin:
+    """Async counterpart of MongoMixin.
+
+    Indexes are declared by the Mongo models sharing the same collections.
+    """
+
+    def __init__(self):
+        self.database: AsyncDatabase = (
+            DatabaseFactory.create_database("async_mongo").get_client().jafa
+        )
+        self.__collections: dict[tuple[str, bool, str | None], AsyncCollection] = {}
+
+    def _get_collection(
+        self, colleciton_name: str, write: str | None = None
+    ) -> AsyncCollection:
+        """Return a collection handle, reused across calls.
+
+        Inside stale_reads() the handle reads with the configured read preference.
+
+        :param write: Kind of write the handle is for, which picks its write
+        concern. See WRITE_CONCERN_POLICY.
+        """
+        database = DatabaseFactory.create_database("async_mongo")
+        read_preference = database.get_read_preference()
+        key = (colleciton_name, read_preference is not None, write)
+        collection = self.__collections.get(key)
+
+        if collection is None:
+            collection = self.database[colleciton_name].with_options(
+                read_preference=read_preference,
+                write_concern=(
+                    None if write is None else database.get_write_concern(write)
+                ),
+            )
+            collection = self.__collections.setdefault(key, collection)
+
+        return collection
+
+    def _session(self) -> AsyncClientSession | None:
+        """Session to pass to every operation so it joins the unit of work, if any."""
+        return DatabaseFactory.create_database("async_mongo").get_session()
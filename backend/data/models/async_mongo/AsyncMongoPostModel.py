@@ -0,0 +1,168 @@
+from typing import Optional
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+from pymongo import ReadPreference
+
+from backend.data.models.async_mongo.AsyncMongoMixin import AsyncMongoMixin
+from backend.data.models.AsyncPostModel import AsyncPostModel
+from backend.data.models.mongo.MongoPostModel import (
+    BODIES_COLLECTION,
+    COUNTERS_COLLECTION,
+    LIST_PROJECTION,
+    POSTS_COLLECTION,
+    RANKINGS_COLLECTIONS,
+    filter_post_result,
+    find_listing,
+    is_ranked,
+    listing_query,
+    post_counter_id,
+    ranked_posts,
+    subforum_query,
+)
+from backend.data.models.PostModel import Post, PostCursor
+
+
+class AsyncMongoPostModel(AsyncMongoMixin, AsyncPostModel):
+    """Async counterpart of the reads of MongoPostModel, sharing its queries."""
+
+    def __init__(self):
+        super().__init__()
+
+    def __posts_collection(self):
+        return self._get_collection(POSTS_COLLECTION)
+
+    def __counters_collection(self):
+        return self._get_collection(COUNTERS_COLLECTION)
+
+    def __bodies_collection(self):
+        return self._get_collection(BODIES_COLLECTION)
+
+    def __rankings_collection(self, window: str):
+        return self._get_collection(RANKINGS_COLLECTIONS[window])
+
+    async def get_by_post_id(self, post_id: str) -> Optional[Post]:
+        try:
+            post = await self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)}, session=self._session()
+            )
+        except InvalidId:
+            return None
+
+        if post is None:
+            return None
+
+        if "body" not in post:
+            body = await self.__bodies_collection().find_one(
+                {"_id": post["_id"]}, session=self._session()
+            )
+            post |= body or dict(body="")
+
+        return filter_post_result(post)
+
+    async def post_exists(self, post_id: str) -> bool:
+        try:
+            post = await self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)},
+                projection=dict(_id=True),
+                session=self._session(),
+            )
+        except InvalidId:
+            return False
+
+        return post is not None
+
+    async def __list_posts(
+        self, query: dict, limit: int, skip: int, sort: str, window: str
+    ) -> list[Post]:
+        """Return the posts matching a listing query, see MongoPostModel."""
+        if not is_ranked(sort, window):
+            results = find_listing(
+                self.__posts_collection(),
+                query,
+                LIST_PROJECTION,
+                sort,
+                limit,
+                skip,
+                self._session(),
+            )
+
+            return [filter_post_result(post) async for post in results]
+
+        rankings = find_listing(
+            self.__rankings_collection(window),
+            query,
+            {sort: True},
+            sort,
+            limit,
+            skip,
+            self._session(),
+        )
+        scores = {ranking["_id"]: ranking[sort] async for ranking in rankings}
+        posts = {
+            post["_id"]: post
+            async for post in self.__posts_collection().find(
+                {"_id": {"$in": list(scores)}},
+                projection=LIST_PROJECTION,
+                session=self._session(),
+            )
+        }
+
+        return ranked_posts(scores, posts, sort)
+
+    async def get_posts(
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ):
+        query = listing_query(subforum, tags, tag_match)
+
+        return await self.__list_posts(query, limit, skip, sort, window)
+
+    async def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ):
+        try:
+            query = listing_query(subforum, tags, tag_match, cursor, sort)
+        except InvalidId:
+            return []
+
+        return await self.__list_posts(query, limit, 0, sort, window)
+
+    async def get_count(self, subforum: str | None = None) -> int:
+        counter_id = post_counter_id(subforum)
+        counter = await self.__counters_collection().find_one(
+            {"_id": counter_id}, session=self._session()
+        )
+
+        if counter is not None:
+            return counter["count"]
+
+        # Seed a missing counter, unless a concurrent update created it first.
+        # Counted on the primary, a stale count would be kept for good
+        posts = self.__posts_collection().with_options(
+            read_preference=ReadPreference.PRIMARY
+        )
+        count = await posts.count_documents(
+            subforum_query(subforum), session=self._session()
+        )
+        await self.__counters_collection().update_one(
+            {"_id": counter_id},
+            {"$setOnInsert": {"count": count}},
+            upsert=True,
+            session=self._session(),
+        )
+
+        return count
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from backend.data.models.async_mongo.AsyncMongoMixin import AsyncMongoMixin
+from backend.data.models.AsyncSubForumModel import AsyncSubForumModel
+from backend.data.models.mongo.MongoSubForumModel import SUBFORUMS_COLLECTION
+from backend.data.models.SubForumModel import SubForum
+
+
+class AsyncMongoSubForumModel(AsyncMongoMixin, AsyncSubForumModel):
+    def __init__(self):
+        super().__init__()
+
+    def __subforums_collection(self):
+        return self._get_collection(SUBFORUMS_COLLECTION)
+
+    async def get_subforum_by_title(self, title: str) -> Optional[SubForum]:
+        subforum = await self.__subforums_collection().find_one(
+            {"title": title}, session=self._session()
+        )
+
+        if subforum is None:
+            return None
+
+        return {
+            "creator": subforum["creator"],
+            "title": subforum["title"],
+            "description": subforum["description"],
+            "creation_date": subforum["creation_date"],
+        }
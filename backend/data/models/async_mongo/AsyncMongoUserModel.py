@@ -0,0 +1,25 @@
+from typing import Optional
+
+from backend.data.models.async_mongo.AsyncMongoMixin import AsyncMongoMixin
+from backend.data.models.AsyncUserModel import AsyncUserModel
+from backend.data.models.mongo.MongoUserModel import USERS_COLLECTION
+from backend.data.models.UserModel import User
+
+
+class AsyncMongoUserModel(AsyncMongoMixin, AsyncUserModel):
+    def __init__(self):
+        super().__init__()
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        user = await self._get_collection(USERS_COLLECTION).find_one(
+            {"username": username}, session=self._session()
+        )
+
+        if user is None:
+            return None
+
+        return {
+            "username": user["username"],
+            "password": user["password"],
+            "registration_date": user["registration_date"],
+        }
@@ -0,0 +1,65 @@
+from typing import Optional
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+
+from backend.data.models.async_mongo.AsyncMongoMixin import AsyncMongoMixin
+from backend.data.models.AsyncVoteModel import AsyncVoteModel
+from backend.data.models.mongo.MongoVoteModel import VOTES_COLLECTION
+from backend.data.models.VoteModel import BaseVote, Vote
+
+
+class AsyncMongoVoteModel(AsyncMongoMixin, AsyncVoteModel):
+    """Async counterpart of the reads of MongoVoteModel."""
+
+    def __init__(self):
+        super().__init__()
+
+    def __votes_collection(self):
+        return self._get_collection(VOTES_COLLECTION)
+
+    async def get_vote(self, data: BaseVote) -> Optional[Vote]:
+        try:
+            vote = await self.__votes_collection().find_one(
+                dict(
+                    username=data["username"],
+                    content_id=ObjectId(data["content_id"]),
+                    content_type=data["content_type"],
+                ),
+                session=self._session(),
+            )
+        except InvalidId:
+            return None
+
+        if vote is None:
+            return None
+
+        return dict(
+            username=vote["username"],
+            content_id=str(vote["content_id"]),
+            content_type=vote["content_type"],
+            is_like=vote["is_like"],
+            creation_date=vote["creation_date"],
+        )
+
+    async def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        object_ids = []
+        for content_id in content_ids:
+            try:
+                object_ids.append(ObjectId(content_id))
+            except InvalidId:
+                continue
+
+        votes = self.__votes_collection().find(
+            dict(
+                username=username,
+                content_id={"$in": object_ids},
+                content_type=content_type,
+            ),
+            projection=dict(_id=False, content_id=True, is_like=True),
+            session=self._session(),
+        )
+
+        return {str(vote["content_id"]): vote["is_like"] async for vote in votes}
@@ -0,0 +1,57 @@
+from bisect import bisect_left, insort
+from functools import wraps
+from typing import Callable, Iterator, TypeVar
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+
+T = TypeVar("T")
+
+
+def locked(method):
+    """Decorator: Hold the memory database's lock for the call."""
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with DatabaseFactory.create_database("memory").get_lock():
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+class SortedIndex:
+    """Keys kept in ascending order, read from highest to lowest like listings."""
+
+    def __init__(self):
+        self.__keys = []
+
+    def add(self, key):
+        insort(self.__keys, key)
+
+    def remove(self, key):
+        i = bisect_left(self.__keys, key)
+
+        if i < len(self.__keys) and self.__keys[i] == key:
+            del self.__keys[i]
+
+    def descending(self, before=None, since=None) -> Iterator:
+        """Yield keys from highest to lowest, only those below `before` and at
+        least `since` if given."""
+        end = len(self.__keys) if before is None else bisect_left(self.__keys, before)
+        start = 0 if since is None else bisect_left(self.__keys, since)
+
+        for i in range(end - 1, start - 1, -1):
+            yield self.__keys[i]
+
+    def __len__(self):
+        return len(self.__keys)
+
+
+class MemoryMixin:
+    def _get_table(self, name: str, factory: Callable[[], T] = dict) -> T:
+        """Return a table of the connected store, created by `factory` on first use.
+
+        Only touch tables from methods decorated with locked.
+        """
+        store = DatabaseFactory.create_database("memory").get_client()
+
+        return store.get_table(name, factory)
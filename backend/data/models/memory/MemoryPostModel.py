@@ -0,0 +1,547 @@
+import heapq
+import re
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Optional
+
+from bson.objectid import ObjectId
+
+from backend.data.models.memory.MemoryMixin import MemoryMixin, SortedIndex, locked
+from backend.data.models.PostModel import (
+    PREVIEW_MAX,
+    SEARCH_WEIGHTS,
+    SORTS,
+    WINDOWED_SORTS,
+    WINDOWS,
+    BasePost,
+    CreatePost,
+    ImportPost,
+    Post,
+    PostCursor,
+    PostModel,
+    PostVersion,
+    PostVoteCounts,
+    TagCount,
+    normalize_tags,
+    post_scores,
+    search_rank,
+)
+
+POSTS_TABLE = "posts"
+SCORE_SORTS = tuple(sort for sort in SORTS if sort != "new")
+"""Sorts whose order changes as posts are voted on."""
+TERM_PATTERN = re.compile(r"\w+")
+"""Words searched by search_posts, matched case-insensitively."""
+
+
+def _sort_field(sort: str) -> str:
+    return "creation_date" if sort == "new" else sort
+
+
+def _terms(post: dict) -> Counter:
+    """Return the weighted frequency of each search term within a post."""
+    terms = Counter()
+
+    for field, weight in SEARCH_WEIGHTS.items():
+        value = post.get(field) or ""
+        text = " ".join(value) if isinstance(value, list) else value
+
+        for term in TERM_PATTERN.findall(text.lower()):
+            terms[term] += weight
+
+    return terms
+
+
+class PostTable:
+    """Posts keyed by post ID, with the indexes listings and searches read."""
+
+    def __init__(self):
+        self.posts: dict[str, dict] = {}
+        self.listings: dict[tuple[str, str | None], SortedIndex] = defaultdict(
+            SortedIndex
+        )
+        """(sort field, post ID) of each post by sort and subforum, None for all."""
+        self.tagged: dict[str, SortedIndex] = defaultdict(SortedIndex)
+        """(creation date, post ID) of each post by tag."""
+        self.terms: dict[str, dict[str, int]] = defaultdict(dict)
+        """Weighted frequency of each search term by post ID."""
+        self.counts: Counter[str] = Counter()
+        """Post count by subforum."""
+        self.tag_counts: Counter[str] = Counter()
+
+    def add_to_listings(self, post: dict, sorts=SORTS):
+        for sort in sorts:
+            key = (post[_sort_field(sort)], post["post_id"])
+            self.listings[(sort, None)].add(key)
+            self.listings[(sort, post["subforum"])].add(key)
+
+    def remove_from_listings(self, post: dict, sorts=SORTS):
+        for sort in sorts:
+            key = (post[_sort_field(sort)], post["post_id"])
+            self.listings[(sort, None)].remove(key)
+            self.listings[(sort, post["subforum"])].remove(key)
+
+    def add_content(self, post: dict):
+        """Index the tags and search terms of a post."""
+        for tag in post["tags"] or []:
+            self.tagged[tag].add((post["creation_date"], post["post_id"]))
+            self.tag_counts[tag] += 1
+
+        for term, frequency in _terms(post).items():
+            self.terms[term][post["post_id"]] = frequency
+
+    def remove_content(self, post: dict):
+        for tag in post["tags"] or []:
+            self.tagged[tag].remove((post["creation_date"], post["post_id"]))
+            self.tag_counts[tag] -= 1
+
+            if self.tag_counts[tag] <= 0:
+                del self.tagged[tag], self.tag_counts[tag]
+
+        for term in _terms(post):
+            self.terms[term].pop(post["post_id"], None)
+            if not self.terms[term]:
+                del self.terms[term]
+
+    def insert(self, post: dict):
+        self.posts[post["post_id"]] = post
+        self.counts[post["subforum"]] += 1
+        self.add_to_listings(post)
+        self.add_content(post)
+
+    def delete(self, post_id: str) -> dict | None:
+        post = self.posts.pop(post_id, None)
+
+        if post is not None:
+            self.counts[post["subforum"]] -= 1
+            if self.counts[post["subforum"]] <= 0:
+                del self.counts[post["subforum"]]
+
+            self.remove_from_listings(post)
+            self.remove_content(post)
+
+        return post
+
+    def rescore(self, post: dict) -> bool:
+        """Score a post again from its votes.
+
+        :return: True if any of its scores changed.
+        """
+        scores = post_scores(post["likes"], post["dislikes"], post["creation_date"])
+
+        if all(post[sort] == score for sort, score in scores.items()):
+            return False
+
+        self.remove_from_listings(post, SCORE_SORTS)
+        post.update(scores)
+        self.add_to_listings(post, SCORE_SORTS)
+
+        return True
+
+
+def _has_tags(post: dict, tags: set[str], tag_match: str) -> bool:
+    """Return whether a post has any or all of `tags`, see TAG_MATCHES."""
+    if tag_match == "all":
+        return tags.issubset(post["tags"] or [])
+
+    return not tags.isdisjoint(post["tags"] or [])
+
+
+def _listed(post: dict) -> Post:
+    """Return the fields of a post listings return, leaving out the body."""
+    return {key: value for key, value in post.items() if key != "body"}
+
+
+class MemoryPostModel(MemoryMixin, PostModel):
+    def __init__(self):
+        super().__init__()
+
+    def __posts(self) -> PostTable:
+        return self._get_table(POSTS_TABLE, PostTable)
+
+    def __to_document(self, data: CreatePost, post_id: str) -> dict:
+        return (
+            dict(data)
+            | dict(post_id=post_id, preview=data["body"][:PREVIEW_MAX])
+            | post_scores(data["likes"], data["dislikes"], data["creation_date"])
+        )
+
+    @locked
+    def create_post(self, data: CreatePost) -> bool:
+        self.__posts().insert(self.__to_document(data, str(ObjectId())))
+
+        return True
+
+    @locked
+    def import_posts(self, posts: list[ImportPost]) -> int:
+        table = self.__posts()
+        imported = 0
+
+        for post in posts:
+            if post["post_id"] in table.posts:
+                continue
+
+            data = {key: value for key, value in post.items() if key != "post_id"}
+            table.insert(self.__to_document(data, post["post_id"]))
+            imported += 1
+
+        return imported
+
+    @locked
+    def get_by_post_id(self, post_id: str) -> Optional[Post]:
+        post = self.__posts().posts.get(post_id)
+
+        return None if post is None else dict(post)
+
+    @locked
+    def post_exists(self, post_id: str) -> bool:
+        return post_id in self.__posts().posts
+
+    @locked
+    def get_existing_post_ids(self, post_ids: list[str]) -> set[str]:
+        posts = self.__posts().posts
+
+        return {post_id for post_id in post_ids if post_id in posts}
+
+    @locked
+    def get_vote_counts(self, post_id: str) -> Optional[PostVoteCounts]:
+        post = self.__posts().posts.get(post_id)
+
+        if post is None:
+            return None
+
+        return dict(post_id=post_id, likes=post["likes"], dislikes=post["dislikes"])
+
+    @locked
+    def get_post_version(self, post_id: str) -> Optional[PostVersion]:
+        post = self.__posts().posts.get(post_id)
+
+        if post is None:
+            return None
+
+        return dict(
+            post_id=post_id,
+            likes=post["likes"],
+            dislikes=post["dislikes"],
+            creation_date=post["creation_date"],
+            modified_date=post["modified_date"],
+            locked=post["locked"],
+        )
+
+    @locked
+    def delete_by_post_id(self, post_id: str) -> bool:
+        return self.__posts().delete(post_id) is not None
+
+    @locked
+    def clear_posts(self, username: str) -> bool:
+        table = self.__posts()
+
+        for post_id in [
+            post_id for post_id, post in table.posts.items() if post["op"] == username
+        ]:
+            table.delete(post_id)
+
+        return True
+
+    @locked
+    def edit_post(self, post_id: str, data: BasePost) -> bool:
+        table = self.__posts()
+        post = table.posts.get(post_id)
+
+        if post is None:
+            return False
+
+        table.remove_content(post)
+        post.update(
+            op=data["op"],
+            title=data["title"],
+            body=data["body"],
+            preview=data["body"][:PREVIEW_MAX],
+            media=data["media"],
+            tags=data["tags"],
+            modified_date=data["modified_date"],
+        )
+        table.add_content(post)
+
+        return True
+
+    @locked
+    def increment_votes(self, post_id: str, likes: int = 0, dislikes: int = 0) -> bool:
+        table = self.__posts()
+        post = table.posts.get(post_id)
+
+        if post is None:
+            return False
+
+        post["likes"] = max(post["likes"] + likes, 0)
+        post["dislikes"] = max(post["dislikes"] + dislikes, 0)
+        table.rescore(post)
+
+        return True
+
+    @locked
+    def add_vote_counts(self, counts: list[PostVoteCounts]) -> int:
+        table = self.__posts()
+        updated = 0
+
+        for count in counts:
+            post = table.posts.get(count["post_id"])
+
+            if post is None:
+                continue
+
+            post["likes"] += count["likes"]
+            post["dislikes"] += count["dislikes"]
+            table.rescore(post)
+            updated += 1
+
+        return updated
+
+    @locked
+    def lock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, True)
+
+    @locked
+    def unlock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, False)
+
+    def __set_locked(self, post_id: str, locked: bool) -> bool:
+        post = self.__posts().posts.get(post_id)
+
+        if post is None or post["locked"] == locked:
+            return False
+
+        post["locked"] = locked
+
+        return True
+
+    def __list_posts(
+        self,
+        limit: int,
+        skip: int,
+        before: tuple | None,
+        subforum: str | None,
+        sort: str,
+        window: str,
+        tags: list[str] | None,
+        tag_match: str,
+    ) -> list[Post]:
+        """Return the posts of a listing in `sort` order.
+
+        Posts are read from the narrowest index that covers the listing and
+        the rest of the filters are applied as they are read.
+
+        :param before: Key of the last post seen, see PostTable.listings.
+        """
+        table = self.__posts()
+        span = WINDOWS[window] if sort in WINDOWED_SORTS else None
+        wanted = set(tags) if tags else None
+
+        if span is not None:
+            return self.__rank_window(
+                table,
+                limit,
+                skip,
+                before,
+                subforum,
+                sort,
+                datetime.now() - span,
+                wanted,
+                tag_match,
+            )
+
+        if subforum:
+            index = table.listings.get((sort, subforum))
+        elif sort == "new" and tags and len(tags) == 1:
+            index = table.tagged.get(tags[0])
+        else:
+            index = table.listings.get((sort, None))
+
+        if index is None:
+            return []
+
+        posts = []
+        for _, post_id in index.descending(before):
+            post = table.posts[post_id]
+
+            if wanted is not None and not _has_tags(post, wanted, tag_match):
+                continue
+
+            if skip > 0:
+                skip -= 1
+                continue
+
+            posts.append(_listed(post))
+            if len(posts) == limit:
+                break
+
+        return posts
+
+    def __rank_window(
+        self,
+        table: PostTable,
+        limit: int,
+        skip: int,
+        before: tuple | None,
+        subforum: str | None,
+        sort: str,
+        since: datetime,
+        wanted: set[str] | None,
+        tag_match: str,
+    ) -> list[Post]:
+        """Return the posts of a windowed listing in `sort` order.
+
+        Only the posts created since the start of the window are read, from
+        the new listing, and ranked, rather than walking the whole `sort`
+        listing past every older post.
+        """
+        index = table.listings.get(("new", subforum or None))
+
+        if index is None:
+            return []
+
+        ranked = []
+        for _, post_id in index.descending(since=(since,)):
+            post = table.posts[post_id]
+
+            if wanted is not None and not _has_tags(post, wanted, tag_match):
+                continue
+
+            key = (post[sort], post_id)
+            if before is None or key < before:
+                ranked.append(key)
+
+        return [
+            _listed(table.posts[post_id])
+            for _, post_id in heapq.nlargest(skip + limit, ranked)[skip:]
+        ]
+
+    @locked
+    def get_posts(
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        return self.__list_posts(
+            limit, skip, None, subforum, sort, window, tags, tag_match
+        )
+
+    @locked
+    def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        before = None
+        if cursor is not None:
+            last = cursor["creation_date"] if sort == "new" else cursor["score"]
+            before = (last, cursor["post_id"])
+
+        return self.__list_posts(
+            limit, 0, before, subforum, sort, window, tags, tag_match
+        )
+
+    @locked
+    def search_posts(
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None = None,
+        subforum: str | None = None,
+    ) -> list[Post]:
+        table = self.__posts()
+        relevance = Counter()
+
+        for term in set(TERM_PATTERN.findall(query.lower())):
+            relevance.update(table.terms.get(term, {}))
+
+        ranked = []
+        for post_id, score in relevance.items():
+            post = table.posts[post_id]
+
+            if subforum and post["subforum"] != subforum:
+                continue
+
+            key = (search_rank(score, post["creation_date"]), post_id)
+            if cursor is None or key < (cursor["score"], cursor["post_id"]):
+                ranked.append(key)
+
+        ranked.sort(reverse=True)
+
+        return [
+            _listed(table.posts[post_id]) | dict(rank=rank)
+            for rank, post_id in ranked[:limit]
+        ]
+
+    @locked
+    def get_count(self, subforum: str | None = None) -> int:
+        table = self.__posts()
+
+        return table.counts[subforum] if subforum else len(table.posts)
+
+    @locked
+    def reconcile_counts(self) -> int:
+        table = self.__posts()
+        posts = table.posts.values()
+        corrected = 0
+
+        for counts, actual in (
+            (table.counts, Counter(post["subforum"] for post in posts)),
+            (
+                table.tag_counts,
+                Counter(tag for post in posts for tag in post["tags"] or []),
+            ),
+        ):
+            for key in counts.keys() | actual.keys():
+                if counts[key] != actual[key]:
+                    counts[key] = actual[key]
+                    corrected += 1
+
+            # Drop what nothing counts anymore
+            for key in [key for key, count in counts.items() if count == 0]:
+                del counts[key]
+
+        return corrected
+
+    @locked
+    def normalize_stored_tags(self) -> int:
+        table = self.__posts()
+        normalized = 0
+
+        for post in table.posts.values():
+            tags = normalize_tags(post["tags"])
+
+            if tags != post["tags"]:
+                table.remove_content(post)
+                post["tags"] = tags
+                table.add_content(post)
+                normalized += 1
+
+        return normalized
+
+    @locked
+    def get_tags(self, limit: int) -> list[TagCount]:
+        return [
+            dict(tag=tag, count=count)
+            for tag, count in self.__posts().tag_counts.most_common(limit)
+        ]
+
+    @locked
+    def recompute_scores(self) -> int:
+        table = self.__posts()
+
+        return sum(table.rescore(post) for post in table.posts.values())
+
+    def refresh_rankings(self) -> int:
+        # Windowed listings read posts as they are, there are no rankings
+        return 0
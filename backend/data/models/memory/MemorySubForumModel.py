@@ -0,0 +1,64 @@
+from typing import Optional
+
+from backend.data.models.memory.MemoryMixin import MemoryMixin, locked
+from backend.data.models.SubForumModel import SubForum, SubForumModel
+
+SUBFORUMS_TABLE = "subforums"
+"""Subforums keyed by title."""
+
+
+class MemorySubForumModel(MemoryMixin, SubForumModel):
+    def __init__(self):
+        super().__init__()
+
+    def __to_document(self, data: SubForum) -> SubForum:
+        return {
+            "creator": data["creator"],
+            "title": data["title"],
+            "description": data["description"],
+            "creation_date": data["creation_date"],
+        }
+
+    @locked
+    def create_subforum(self, data: SubForum) -> bool:
+        subforums = self._get_table(SUBFORUMS_TABLE)
+
+        if data["title"] in subforums:
+            return False
+
+        subforums[data["title"]] = self.__to_document(data)
+
+        return True
+
+    @locked
+    def import_subforums(self, subforums: list[SubForum]) -> int:
+        table = self._get_table(SUBFORUMS_TABLE)
+        imported = 0
+
+        for data in subforums:
+            if data["title"] not in table:
+                table[data["title"]] = self.__to_document(data)
+                imported += 1
+
+        return imported
+
+    @locked
+    def delete_subforum(self, title: str) -> bool:
+        return self._get_table(SUBFORUMS_TABLE).pop(title, None) is not None
+
+    @locked
+    def edit_subforum(self, title: str, description: str) -> bool:
+        subforum = self._get_table(SUBFORUMS_TABLE).get(title)
+
+        if subforum is None or subforum["description"] == description:
+            return False
+
+        subforum["description"] = description
+
+        return True
+
+    @locked
+    def get_subforum_by_title(self, title: str) -> Optional[SubForum]:
+        subforum = self._get_table(SUBFORUMS_TABLE).get(title)
+
+        return None if subforum is None else dict(subforum)
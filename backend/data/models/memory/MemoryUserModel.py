@@ -0,0 +1,37 @@
+from typing import Optional
+
+from backend.data.models.memory.MemoryMixin import MemoryMixin, locked
+from backend.data.models.UserModel import User, UserModel
+
+USERS_TABLE = "users"
+"""Users keyed by username."""
+
+
+class MemoryUserModel(MemoryMixin, UserModel):
+    def __init__(self):
+        super().__init__()
+
+    @locked
+    def create_user(self, data: User) -> bool:
+        users = self._get_table(USERS_TABLE)
+
+        if data["username"] in users:
+            return False
+
+        users[data["username"]] = dict(
+            username=data["username"],
+            password=data["password"],
+            registration_date=data["registration_date"],
+        )
+
+        return True
+
+    @locked
+    def get_by_username(self, username: str) -> Optional[User]:
+        user = self._get_table(USERS_TABLE).get(username)
+
+        return None if user is None else dict(user)
+
+    @locked
+    def delete_user(self, username) -> bool:
+        return self._get_table(USERS_TABLE).pop(username, None) is not None
@@ -0,0 +1,146 @@
+from collections import defaultdict
+from typing import Optional
+
+from backend.data.models.memory.MemoryMixin import MemoryMixin, locked
+from backend.data.models.VoteModel import BaseVote, Vote, VoteModel
+
+VOTES_TABLE = "votes"
+
+VoteKey = tuple[str, str, str]
+"""Username, content ID and content type, unique to a vote."""
+
+
+class VoteTable:
+    """Votes keyed by VoteKey, indexed by content ID and by username."""
+
+    def __init__(self):
+        self.votes: dict[VoteKey, Vote] = {}
+        self.by_content_id: dict[str, set[VoteKey]] = defaultdict(set)
+        self.by_username: dict[str, set[VoteKey]] = defaultdict(set)
+
+    def add(self, key: VoteKey, vote: Vote):
+        self.votes[key] = vote
+        self.by_username[key[0]].add(key)
+        self.by_content_id[key[1]].add(key)
+
+    def remove(self, key: VoteKey) -> bool:
+        if self.votes.pop(key, None) is None:
+            return False
+
+        for index, value in ((self.by_username, key[0]), (self.by_content_id, key[1])):
+            index[value].discard(key)
+            if not index[value]:
+                del index[value]
+
+        return True
+
+
+def _key(data: BaseVote) -> VoteKey:
+    return (data["username"], data["content_id"], data["content_type"])
+
+
+class MemoryVoteModel(MemoryMixin, VoteModel):
+    def __init__(self):
+        super().__init__()
+
+    def __votes(self) -> VoteTable:
+        return self._get_table(VOTES_TABLE, VoteTable)
+
+    def __to_document(self, data: Vote) -> Vote:
+        return dict(
+            username=data["username"],
+            content_id=data["content_id"],
+            content_type=data["content_type"],
+            is_like=data["is_like"],
+            creation_date=data["creation_date"],
+        )
+
+    @locked
+    def add_vote(self, data: Vote) -> bool:
+        votes = self.__votes()
+
+        if _key(data) in votes.votes:
+            return False
+
+        votes.add(_key(data), self.__to_document(data))
+
+        return True
+
+    @locked
+    def get_vote(self, data: BaseVote) -> Optional[Vote]:
+        vote = self.__votes().votes.get(_key(data))
+
+        return None if vote is None else dict(vote)
+
+    @locked
+    def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        votes = self.__votes().votes
+        found = {}
+
+        for content_id in content_ids:
+            vote = votes.get((username, content_id, content_type))
+
+            if vote is not None:
+                found[content_id] = vote["is_like"]
+
+        return found
+
+    @locked
+    def upsert_vote(self, data: Vote) -> bool | None:
+        votes = self.__votes()
+        previous = votes.votes.get(_key(data))
+
+        votes.add(_key(data), self.__to_document(data))
+
+        return None if previous is None else previous["is_like"]
+
+    @locked
+    def import_votes(self, votes: list[Vote]) -> list[Vote]:
+        table = self.__votes()
+        imported = []
+
+        for vote in votes:
+            if _key(vote) not in table.votes:
+                table.add(_key(vote), self.__to_document(vote))
+                imported.append(vote)
+
+        return imported
+
+    @locked
+    def update_vote(self, data: Vote) -> bool:
+        vote = self.__votes().votes.get(_key(data))
+
+        if vote is None:
+            return False
+
+        update = dict(is_like=data["is_like"], creation_date=data["creation_date"])
+        if all(vote[field] == value for field, value in update.items()):
+            return False
+
+        vote.update(update)
+
+        return True
+
+    @locked
+    def remove_vote(self, data: BaseVote) -> bool:
+        return self.__votes().remove(_key(data))
+
+    @locked
+    def clear_votes_by_username(self, username: str) -> bool:
+        votes = self.__votes()
+
+        for key in list(votes.by_username.get(username, ())):
+            votes.remove(key)
+
+        return True
+
+    @locked
+    def clear_votes_by_id(self, content_id: str) -> bool:
+        votes = self.__votes()
+
+        for key in list(votes.by_content_id.get(content_id, ())):
+            votes.remove(key)
+
+        return True
@@ -0,0 +1,83 @@
+import zlib
+
+from bson.binary import Binary
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        # Installed by pymongo[zstd] before Python 3.14
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+BODY_CODECS = ("zlib", "zstd")
+"""Codecs post bodies can be compressed with at rest."""
+BODY_CODEC_THRESHOLD = 2048
+"""Default size in bytes from which bodies are compressed, smaller ones gain little."""
+
+
+def _check_codec(codec: str):
+    if codec not in BODY_CODECS:
+        raise ValueError(f"Unknown body codec {codec}")
+    if codec == "zstd" and zstd is None:
+        raise ValueError("The zstd body codec needs pymongo[zstd] installed")
+
+
+def decode_body(body: str | bytes, codec: str | None) -> str:
+    """Return a body as stored by BodyCodec.encode in its original form.
+
+    :param codec: The post's body_codec field, None if uncompressed.
+    :raises ValueError: If the codec is unknown or unavailable.
+    """
+    if codec is None:
+        return body
+
+    _check_codec(codec)
+
+    if codec == "zstd":
+        return zstd.decompress(body).decode("utf-8")
+
+    return zlib.decompress(body).decode("utf-8")
+
+
+class BodyCodec:
+    """Compresses post bodies of at least `threshold` bytes with `codec`.
+
+    Compressed bodies are stored as binary next to a body_codec field naming
+    their codec, which is left out for uncompressed ones. Bodies are decoded
+    by the field, so posts stay readable when the codec is changed or turned
+    off.
+
+    :param codec: One of BODY_CODECS, None stores bodies uncompressed.
+    :param threshold: Size in bytes from which bodies are compressed.
+    :raises ValueError: If the codec is unknown or unavailable.
+    """
+
+    def __init__(self, codec: str | None = None, threshold: int | None = None):
+        if codec is not None:
+            _check_codec(codec)
+
+        self.codec = codec
+        self.threshold = BODY_CODEC_THRESHOLD if threshold is None else threshold
+
+    def encode(self, body: str) -> dict:
+        """Return the body and body_codec fields to store a body with.
+
+        body_codec is left out if the body is stored as is.
+        """
+        data = body.encode("utf-8")
+
+        if self.codec is None or len(data) < self.threshold:
+            return dict(body=body)
+
+        if self.codec == "zstd":
+            compressed = zstd.compress(data)
+        else:
+            compressed = zlib.compress(data)
+
+        if len(compressed) >= len(data):
+            # Nothing gained, keep it readable as is
+            return dict(body=body)
+
+        return dict(body=Binary(compressed), body_codec=self.codec)
@@ -1,13 +1,100 @@
+from pymongo import IndexModel
+from pymongo.client_session import ClientSession
 from pymongo.database import Collection, Database
+from pymongo.errors import BulkWriteError
 
 from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.databases.MongoDatabase import DUPLICATE_KEY, MongoDatabase
 
 
 class MongoMixin:
+    INDEXES: dict[str, list[IndexModel]] = {}
+    """Indexes a model relies on, keyed by collection name.
+
+    Registered with MongoDatabase and applied during setup.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Only register what the subclass itself declares
+        for collection_name, indexes in cls.__dict__.get("INDEXES", {}).items():
+            MongoDatabase.register_indexes(collection_name, indexes, cls)
+
     def __init__(self):
         self.database: Database = (
             DatabaseFactory.create_database("mongo").get_client().jafa
         )
+        self.__collections: dict[tuple[str, bool, str | None], Collection] = {}
+
+    def prepare(self):
+        """Bring the model's data up to date before it's used.
+
+        Called by setup once the unique indexes are built.
+        """
+        pass
+
+    def remove_duplicates(self, collection_name: str) -> int:
+        """Remove the documents that keep a unique index from being built.
+
+        Called by setup when building one of the model's unique indexes
+        failed. Removes nothing unless a model knows which duplicates can go.
+
+        :return: Amount of documents removed.
+        """
+        return 0
+
+    def _get_collection(
+        self, colleciton_name: str, write: str | None = None
+    ) -> Collection:
+        """Return a collection handle, reused across calls.
+
+        Inside stale_reads() the handle reads with the configured read preference.
+
+        :param write: Kind of write the handle is for, which picks its write
+        concern. See WRITE_CONCERN_POLICY.
+        """
+        database = DatabaseFactory.create_database("mongo")
+        read_preference = database.get_read_preference()
+        key = (colleciton_name, read_preference is not None, write)
+        collection = self.__collections.get(key)
+
+        if collection is None:
+            collection = self.database[colleciton_name].with_options(
+                read_preference=read_preference,
+                write_concern=(
+                    None if write is None else database.get_write_concern(write)
+                ),
+            )
+            collection = self.__collections.setdefault(key, collection)
+
+        return collection
+
+    def _session(self) -> ClientSession | None:
+        """Session to pass to every operation so it joins the unit of work, if any."""
+        return DatabaseFactory.create_database("mongo").get_session()
+
+    def _insert_new(self, collection: Collection, documents: list[dict]) -> list[int]:
+        """Insert documents unordered in one batch, skipping duplicates.
+
+        Not for use inside a unit of work, where a duplicate aborts the
+        transaction.
+
+        :return: Indexes within `documents` of the documents inserted.
+        """
+        if not documents:
+            return []
+
+        try:
+            collection.insert_many(documents, ordered=False, session=self._session())
+        except BulkWriteError as e:
+            errors = e.details["writeErrors"]
+
+            if any(error["code"] != DUPLICATE_KEY for error in errors):
+                raise
+
+            duplicates = {error["index"] for error in errors}
+
+            return [i for i in range(len(documents)) if i not in duplicates]
 
-    def _get_collection(self, colleciton_name: str) -> Collection:
-        return self.database[colleciton_name]
+        return list(range(len(documents)))
@@ -1,116 +1,1284 @@
+from collections import Counter
+from datetime import datetime
 from typing import Optional
 
 from bson.errors import InvalidId
 from bson.objectid import ObjectId
-from pymongo import DESCENDING
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    TEXT,
+    DeleteOne,
+    IndexModel,
+    ReadPreference,
+    ReplaceOne,
+    ReturnDocument,
+    UpdateOne,
+)
 
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.TTLCache import TTLCache
+from backend.data.models.mongo.BodyCodec import decode_body
 from backend.data.models.mongo.MongoMixin import MongoMixin
-from backend.data.models.PostModel import BasePost, CreatePost, Post, PostModel
+from backend.data.models.PostModel import (
+    HOT_EPOCH,
+    HOT_TIMESCALE,
+    PREVIEW_MAX,
+    SEARCH_TIMESCALE,
+    SEARCH_WEIGHTS,
+    WILSON_Z,
+    WINDOWED_SORTS,
+    WINDOWS,
+    BasePost,
+    CreatePost,
+    ImportPost,
+    Post,
+    PostCursor,
+    PostModel,
+    PostVersion,
+    PostVoteCounts,
+    TagCount,
+    normalize_tags,
+    post_scores,
+)
 
 POSTS_COLLECTION = "posts"
+COUNTERS_COLLECTION = "counters"
+BODIES_COLLECTION = "post_bodies"
+"""Bodies stored apart from their posts, keyed by the post's _id."""
+TAGS_COLLECTION = "tags"
+"""Usage count of each tag, keyed by the tag."""
+TOTAL_COUNTER = "posts"
+"""Counter _id of the total post count, subforum counters append ":<title>"."""
+RANKINGS_COLLECTIONS = {
+    window: f"post_rankings_{window}" for window, span in WINDOWS.items() if span
+}
+"""Windowed sort scores of the posts created within each window, keyed by
+the post's _id and kept up to date by refresh_rankings."""
+LISTING_SORT = [("creation_date", DESCENDING), ("_id", DESCENDING)]
+"""Newest first, ties broken by _id so that cursors are unambiguous."""
+HOT_SORT = [("hot", DESCENDING), ("_id", DESCENDING)]
+"""Highest hot score first, ties broken by _id."""
+LISTING_SORTS = dict(new=LISTING_SORT, hot=HOT_SORT) | {
+    sort: [(sort, DESCENDING), ("_id", DESCENDING)] for sort in WINDOWED_SORTS
+}
+"""Sort of each listing order, cursors point into its first field."""
+_NET_VOTES = {"$subtract": ["$likes", "$dislikes"]}
+_TOTAL_VOTES = {"$add": ["$likes", "$dislikes"]}
+HOT_SCORE = {
+    "$add": [
+        {
+            "$multiply": [
+                {"$cmp": [_NET_VOTES, 0]},
+                {"$log10": {"$max": [{"$abs": _NET_VOTES}, 1]}},
+            ]
+        },
+        {
+            "$divide": [
+                {"$subtract": ["$creation_date", HOT_EPOCH]},
+                HOT_TIMESCALE * 1000,
+            ]
+        },
+    ]
+}
+"""hot_score as an aggregation expression, for updates to apply on the server."""
+_WILSON_Z2 = WILSON_Z * WILSON_Z
+_WILSON_CENTER = {
+    "$add": ["$$ratio", {"$divide": [_WILSON_Z2, {"$multiply": [2, "$$total"]}]}]
+}
+_WILSON_VARIANCE = {
+    "$add": [
+        {"$multiply": ["$$ratio", {"$subtract": [1, "$$ratio"]}]},
+        {"$divide": [_WILSON_Z2, {"$multiply": [4, "$$total"]}]},
+    ]
+}
+_WILSON_SPREAD = {
+    "$multiply": [WILSON_Z, {"$sqrt": {"$divide": [_WILSON_VARIANCE, "$$total"]}}]
+}
+TOP_SCORE = {
+    "$let": {
+        "vars": dict(total=_TOTAL_VOTES),
+        "in": {
+            "$cond": [
+                {"$eq": ["$$total", 0]},
+                0.0,
+                {
+                    "$let": {
+                        "vars": dict(ratio={"$divide": ["$likes", "$$total"]}),
+                        "in": {
+                            "$divide": [
+                                {"$subtract": [_WILSON_CENTER, _WILSON_SPREAD]},
+                                {"$add": [1, {"$divide": [_WILSON_Z2, "$$total"]}]},
+                            ]
+                        },
+                    }
+                },
+            ]
+        },
+    }
+}
+"""wilson_score as an aggregation expression."""
+CONTROVERSIAL_SCORE = {
+    "$cond": [
+        {"$and": [{"$gt": ["$likes", 0]}, {"$gt": ["$dislikes", 0]}]},
+        {
+            "$pow": [
+                _TOTAL_VOTES,
+                {
+                    "$divide": [
+                        {"$min": ["$likes", "$dislikes"]},
+                        {"$max": ["$likes", "$dislikes"]},
+                    ]
+                },
+            ]
+        },
+        0.0,
+    ]
+}
+"""controversy_score as an aggregation expression."""
+SCORES = dict(hot=HOT_SCORE, top=TOP_SCORE, controversial=CONTROVERSIAL_SCORE)
+"""Score of each sort other than new as an aggregation expression."""
+SCORE_UPDATE = {"$set": SCORES | dict(rank_stale=True)}
+"""Update pipeline stage that scores a post again after its votes changed,
+marking it for refresh_rankings."""
+LIST_PROJECTION = dict(
+    op=True,
+    subforum=True,
+    title=True,
+    media=True,
+    tags=True,
+    creation_date=True,
+    modified_date=True,
+    likes=True,
+    dislikes=True,
+    locked=True,
+    hot=True,
+    top=True,
+    controversial=True,
+    # Fall back for posts stored before previews were
+    preview={"$ifNull": ["$preview", {"$substrCP": ["$body", 0, PREVIEW_MAX]}]},
+)
+"""Post fields needed by listings, leaving out the body."""
+VERSION_PROJECTION = dict(
+    likes=True, dislikes=True, creation_date=True, modified_date=True, locked=True
+)
+"""Post fields of a PostVersion."""
+SEARCH_INDEX_WEIGHTS = SEARCH_WEIGHTS | dict(preview=1)
+"""Weight of each field in the search index. Previews stand in for bodies
+that are stored compressed or split off, which aren't indexed."""
+SEARCH_RANK = {
+    "$add": [
+        {"$log": [{"$meta": "textScore"}, 2]},
+        {
+            "$divide": [
+                {"$subtract": ["$creation_date", HOT_EPOCH]},
+                SEARCH_TIMESCALE * 1000,
+            ]
+        },
+    ]
+}
+"""search_rank of a post matched by $text as an aggregation expression."""
+RECONCILE_ATTEMPTS = 3
+"""Times reconcile_counts compares counts that keep changing while it runs."""
+SEARCH_CACHE_SIZE = 1024
+"""Most search result pages cached at once."""
+SEARCH_CACHE_TTL = 30
+"""Seconds a search result page is served from the cache."""
+RANKING_INDEXES = (
+    [IndexModel(sort) for sort in map(LISTING_SORTS.get, WINDOWED_SORTS)]
+    + [
+        IndexModel([("subforum", ASCENDING)] + sort)
+        for sort in map(LISTING_SORTS.get, WINDOWED_SORTS)
+    ]
+    + [IndexModel([("creation_date", ASCENDING)])]
+)
+"""Indexes of each RANKINGS_COLLECTIONS collection."""
+
+
+def tag_query(tags: list[str] | None, tag_match: str) -> dict:
+    """Return the query matching posts with any or all of `tags`."""
+    if not tags:
+        return {}
+
+    return {"tags": {"$all" if tag_match == "all" else "$in": tags}}
+
+
+def cursor_query(cursor: PostCursor, sort: str) -> dict:
+    """Return the query matching posts that follow `cursor` in `sort` order.
+
+    :raises InvalidId:
+    """
+    last_id = ObjectId(cursor["post_id"])
+    field = LISTING_SORTS[sort][0][0]
+    last = cursor["creation_date"] if sort == "new" else cursor["score"]
+
+    return {
+        "$or": [
+            {field: {"$lt": last}},
+            {field: last, "_id": {"$lt": last_id}},
+        ]
+    }
+
+
+def listing_query(
+    subforum: str | None,
+    tags: list[str] | None,
+    tag_match: str,
+    cursor: PostCursor | None = None,
+    sort: str = "new",
+) -> dict:
+    """Return the query matching the posts of a listing, after `cursor` if any.
+
+    :raises InvalidId:
+    """
+    query = subforum_query(subforum) | tag_query(tags, tag_match)
+
+    if cursor is not None:
+        query |= cursor_query(cursor, sort)
+
+    return query
+
+
+def subforum_query(subforum: str | None) -> dict:
+    """Return the query matching the posts of `subforum`, all of them if None."""
+    return {"subforum": subforum} if subforum else {}
+
+
+def post_counter_id(subforum: str | None) -> str:
+    """Return the counter _id of `subforum`'s post count, the total if None."""
+    return f"{TOTAL_COUNTER}:{subforum}" if subforum else TOTAL_COUNTER
+
+
+def is_ranked(sort: str, window: str) -> bool:
+    """Whether a listing is read from the window's rankings collection."""
+    return sort in WINDOWED_SORTS and window in RANKINGS_COLLECTIONS
+
+
+def find_listing(
+    collection, query: dict, projection: dict, sort: str, limit: int, skip: int, session
+):
+    """Return the cursor over a page of `collection` in `sort` order.
+
+    Collections of the sync and the async client are both queried this way.
+    """
+    return (
+        collection.find(query, projection=projection, session=session)
+        .sort(LISTING_SORTS[sort])
+        .limit(limit)
+        .skip(skip)
+    )
+
+
+def filter_post_result(post: dict) -> dict:
+    """Return a stored post with its post_id, and its body decoded if read."""
+    data = dict(post)
+
+    # Format _id
+    del data["_id"]
+    data["post_id"] = str(post["_id"])
+
+    if "body" in data:
+        data["body"] = decode_body(data["body"], data.pop("body_codec", None))
+
+    return data
+
+
+def ranked_posts(scores: dict, posts: dict, sort: str) -> list[Post]:
+    """Return the posts of a ranked listing page in the order they ranked.
+
+    :param scores: `sort` score of each ranked post keyed by _id, in order.
+    :param posts: Posts read for the page keyed by _id.
+    """
+    # Scores as ranked, so that cursors follow the rankings
+    return [
+        filter_post_result(posts[_id] | {sort: score})
+        for _id, score in scores.items()
+        if _id in posts
+    ]
 
 
 class MongoPostModel(MongoMixin, PostModel):
+    INDEXES = {
+        POSTS_COLLECTION: [
+            IndexModel(LISTING_SORT),
+            IndexModel([("subforum", ASCENDING)] + LISTING_SORT),
+            # Multikey, each tag's posts newest first
+            IndexModel([("tags", ASCENDING)] + LISTING_SORT),
+            IndexModel(HOT_SORT),
+            IndexModel([("subforum", ASCENDING)] + HOT_SORT),
+            IndexModel(LISTING_SORTS["top"]),
+            IndexModel([("subforum", ASCENDING)] + LISTING_SORTS["top"]),
+            IndexModel(LISTING_SORTS["controversial"]),
+            IndexModel([("subforum", ASCENDING)] + LISTING_SORTS["controversial"]),
+            IndexModel(
+                [(field, TEXT) for field in SEARCH_INDEX_WEIGHTS],
+                weights=SEARCH_INDEX_WEIGHTS,
+                name="search",
+            ),
+            # Posts refresh_rankings has yet to rank
+            IndexModel(
+                [("creation_date", ASCENDING)],
+                partialFilterExpression=dict(rank_stale=True),
+            ),
+        ],
+        TAGS_COLLECTION: [IndexModel([("count", DESCENDING)])],
+    } | {collection: RANKING_INDEXES for collection in RANKINGS_COLLECTIONS.values()}
+
+    _search_cache = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+    """Search result pages, shared by every instance in the process."""
+
     def __init__(self):
         super().__init__()
 
-    def __posts_collection(self):
-        return self._get_collection(POSTS_COLLECTION)
+    def __forget_searches(self):
+        """Drop the cached search results, a changed post may be on any page."""
+        MongoPostModel._search_cache.clear()
+
+    def __posts_collection(self, write: str | None = None):
+        return self._get_collection(POSTS_COLLECTION, write)
+
+    def __encode_body(self, body: str) -> dict:
+        """Return the fields to store a body with, see BodyCodec."""
+        database = DatabaseFactory.create_database("mongo")
+
+        return database.get_body_codec().encode(body)
+
+    def __counters_collection(self, write: str | None = None):
+        return self._get_collection(COUNTERS_COLLECTION, write)
 
-    def __filter_post_result(self, post):
-        data = dict(post)
+    def __bodies_collection(self, write: str | None = None):
+        return self._get_collection(BODIES_COLLECTION, write)
+
+    def __split_bodies(self) -> bool:
+        return DatabaseFactory.create_database("mongo").splits_post_bodies()
+
+    def __to_documents(
+        self, data: CreatePost, _id: ObjectId
+    ) -> tuple[dict, dict | None]:
+        """Return the post's document, and its body's document if stored apart."""
+        document = (
+            dict(data)
+            | dict(
+                _id=_id,
+                preview=data["body"][:PREVIEW_MAX],
+                rank_stale=True,
+            )
+            | post_scores(data["likes"], data["dislikes"], data["creation_date"])
+        )
+        body = self.__encode_body(data["body"])
 
-        # Format _id
-        del data["_id"]
-        data["post_id"] = str(post["_id"])
+        if not self.__split_bodies():
+            return document | body, None
+
+        del document["body"]
+
+        return document, body | dict(_id=_id)
+
+    def __tags_collection(self, write: str | None = None):
+        return self._get_collection(TAGS_COLLECTION, write)
+
+    def __rankings_collection(self, window: str, write: str | None = None):
+        return self._get_collection(RANKINGS_COLLECTIONS[window], write)
+
+    def prepare(self):
+        """Seed the post counters that don't exist yet from the posts.
+
+        Counters are only added to once posts are created or deleted, so
+        they must hold the posts stored before they existed. A subforum
+        without a counter after this has no posts, its counter starts at 0.
+        """
+        stored = {
+            counter["_id"]
+            for counter in self.__counters_collection().find(
+                {"_id": {"$regex": f"^{TOTAL_COUNTER}(:|$)"}},
+                projection=dict(_id=True),
+                session=self._session(),
+            )
+        }
+        subforums = self.__posts_collection().distinct(
+            "subforum", session=self._session()
+        )
 
-        return data
+        updates = []
+        for subforum in [None] + subforums:
+            counter_id = post_counter_id(subforum)
+
+            if counter_id in stored:
+                continue
+
+            count = self.__posts_collection().count_documents(
+                subforum_query(subforum), session=self._session()
+            )
+            updates.append(
+                UpdateOne(
+                    {"_id": counter_id},
+                    {"$setOnInsert": {"count": count}},
+                    upsert=True,
+                )
+            )
+
+        if updates:
+            self.__counters_collection("post").bulk_write(
+                updates, ordered=False, session=self._session()
+            )
+
+    def __add_to_counts(self, amounts: dict[str, int]):
+        """Add to the total and subforum post counts in one round trip.
+
+        Missing counters are created, see prepare for those of existing posts.
+
+        :param amounts: Amount to add keyed by subforum.
+        """
+        amounts = dict(amounts) | {None: sum(amounts.values())}
+
+        self.__counters_collection("post").bulk_write(
+            [
+                UpdateOne(
+                    {"_id": post_counter_id(counter)},
+                    {"$inc": {"count": amount}},
+                    upsert=True,
+                )
+                for counter, amount in amounts.items()
+            ],
+            session=self._session(),
+        )
+
+    def __add_to_tag_counts(self, amounts: dict[str, int]):
+        """Add to the usage counts of tags in one round trip.
+
+        :param amounts: Amount to add keyed by tag.
+        """
+        updates = [
+            UpdateOne({"_id": tag}, {"$inc": {"count": amount}}, upsert=True)
+            for tag, amount in amounts.items()
+            if amount != 0
+        ]
+
+        if updates:
+            self.__tags_collection("post").bulk_write(
+                updates, ordered=False, session=self._session()
+            )
 
     def create_post(self, data: CreatePost) -> bool:
-        result = self.__posts_collection().insert_one(dict(data))
+        document, body = self.__to_documents(data, ObjectId())
+
+        if body is not None:
+            # Body first, so that a post is never seen without one
+            self.__bodies_collection("post").insert_one(body, session=self._session())
+
+        result = self.__posts_collection("post").insert_one(
+            document, session=self._session()
+        )
+
+        if result.acknowledged:
+            self.__add_to_counts({data["subforum"]: 1})
+            self.__add_to_tag_counts(Counter(data["tags"] or []))
 
         return result.acknowledged
 
+    def import_posts(self, posts: list[ImportPost]) -> int:
+        documents = []
+        bodies = []
+        for post in posts:
+            try:
+                _id = ObjectId(post["post_id"])
+            except InvalidId:
+                continue
+
+            data = {key: value for key, value in post.items() if key != "post_id"}
+            document, body = self.__to_documents(data, _id)
+            documents.append(document)
+
+            if body is not None:
+                bodies.append(body)
+
+        # Bodies first, a repeated import skips posts that already exist
+        self._insert_new(self.__bodies_collection("post"), bodies)
+        inserted = self._insert_new(self.__posts_collection("post"), documents)
+
+        if inserted:
+            self.__add_to_counts(Counter(documents[i]["subforum"] for i in inserted))
+            self.__add_to_tag_counts(
+                Counter(tag for i in inserted for tag in documents[i]["tags"] or [])
+            )
+
+        return len(inserted)
+
     def get_by_post_id(self, post_id: str) -> Optional[Post]:
         try:
-            post = self.__posts_collection().find_one({"_id": ObjectId(post_id)})
+            post = self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)}, session=self._session()
+            )
+        except InvalidId:
+            return None
+
+        if post is None:
+            return None
+
+        if "body" not in post:
+            body = self.__bodies_collection().find_one(
+                {"_id": post["_id"]}, session=self._session()
+            )
+            post |= body or dict(body="")
+
+        return filter_post_result(post)
+
+    def post_exists(self, post_id: str) -> bool:
+        try:
+            post = self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)},
+                projection=dict(_id=True),
+                session=self._session(),
+            )
+        except InvalidId:
+            return False
+
+        return post is not None
+
+    def get_existing_post_ids(self, post_ids: list[str]) -> set[str]:
+        object_ids = []
+        for post_id in post_ids:
+            try:
+                object_ids.append(ObjectId(post_id))
+            except InvalidId:
+                continue
+
+        posts = self.__posts_collection().find(
+            {"_id": {"$in": object_ids}},
+            projection=dict(_id=True),
+            session=self._session(),
+        )
+
+        return {str(post["_id"]) for post in posts}
+
+    def get_vote_counts(self, post_id: str) -> Optional[PostVoteCounts]:
+        try:
+            post = self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)},
+                projection=dict(likes=True, dislikes=True),
+                session=self._session(),
+            )
+        except InvalidId:
+            return None
+
+        if post is None:
+            return None
+
+        return filter_post_result(post)
+
+    def get_post_version(self, post_id: str) -> Optional[PostVersion]:
+        try:
+            post = self.__posts_collection().find_one(
+                {"_id": ObjectId(post_id)},
+                projection=VERSION_PROJECTION,
+                session=self._session(),
+            )
         except InvalidId:
             return None
 
         if post is None:
             return None
 
-        return self.__filter_post_result(post)
+        return filter_post_result(post)
 
     def delete_by_post_id(self, post_id: str) -> bool:
         try:
-            result = self.__posts_collection().delete_one({"_id": ObjectId(post_id)})
+            post = self.__posts_collection("post").find_one_and_delete(
+                {"_id": ObjectId(post_id)},
+                projection=dict(subforum=True, tags=True),
+                session=self._session(),
+            )
         except InvalidId:
             return False
 
-        return result.deleted_count != 0
+        if post is None:
+            return False
+
+        self.__bodies_collection("post").delete_one(
+            {"_id": post["_id"]}, session=self._session()
+        )
+        for window in RANKINGS_COLLECTIONS:
+            self.__rankings_collection(window, "post").delete_one(
+                {"_id": post["_id"]}, session=self._session()
+            )
+        self.__add_to_counts({post["subforum"]: -1})
+        self.__add_to_tag_counts({tag: -1 for tag in post.get("tags") or []})
+        self.__forget_searches()
+
+        return True
 
     def clear_posts(self, username: str) -> bool:
-        result = self.__posts_collection().delete_many({"username": username})
+        query = {"op": username}
+        posts = list(
+            self.__posts_collection().find(
+                query,
+                projection=dict(subforum=True, tags=True),
+                session=self._session(),
+            )
+        )
+        post_ids = [post["_id"] for post in posts]
+        result = self.__posts_collection("post").delete_many(
+            query, session=self._session()
+        )
+        if posts:
+            subforums = Counter(post["subforum"] for post in posts)
+            self.__add_to_counts(
+                {subforum: -count for subforum, count in subforums.items()}
+            )
+
+        removed = Counter(tag for post in posts for tag in post.get("tags") or [])
+        self.__add_to_tag_counts({tag: -count for tag, count in removed.items()})
+        self.__bodies_collection("post").delete_many(
+            {"_id": {"$in": post_ids}}, session=self._session()
+        )
+        for window in RANKINGS_COLLECTIONS:
+            self.__rankings_collection(window, "post").delete_many(
+                {"_id": {"$in": post_ids}}, session=self._session()
+            )
+        self.__forget_searches()
 
         return result.acknowledged
 
     def edit_post(self, post_id: str, data: BasePost) -> bool:
         try:
-            result = self.__posts_collection().update_one(
-                {"_id": ObjectId(post_id)},
-                {
-                    "$set": dict(
-                        op=data["op"],
-                        title=data["title"],
-                        body=data["body"],
-                        media=data["media"],
-                        tags=data["tags"],
-                        modified_date=data["modified_date"],
-                        likes=data["likes"],
-                        dislikes=data["dislikes"],
-                    )
-                },
-            )
+            _id = ObjectId(post_id)
         except InvalidId:
             return False
 
-        return result.modified_count != 0
+        body = self.__encode_body(data["body"])
+        update = {
+            "$set": dict(
+                op=data["op"],
+                title=data["title"],
+                preview=data["body"][:PREVIEW_MAX],
+                media=data["media"],
+                tags=data["tags"],
+                modified_date=data["modified_date"],
+                # Rankings hold tags too
+                rank_stale=True,
+            )
+        }
 
-    def lock_post(self, post_id: str) -> bool:
+        if self.__split_bodies():
+            # Body first, the inline one keeps being read until it's unset
+            self.__bodies_collection("post").replace_one(
+                {"_id": _id}, body, upsert=True, session=self._session()
+            )
+            update["$unset"] = dict(body=True, body_codec=True)
+        else:
+            update["$set"] |= body
+
+            if "body_codec" not in body:
+                update["$unset"] = dict(body_codec=True)
+
+        post = self.__posts_collection("post").find_one_and_update(
+            {"_id": _id},
+            update,
+            projection=dict(tags=True),
+            return_document=ReturnDocument.BEFORE,
+            session=self._session(),
+        )
+
+        if post is None:
+            if self.__split_bodies():
+                # No such post, drop the body stored for it
+                self.__bodies_collection("post").delete_one(
+                    {"_id": _id}, session=self._session()
+                )
+
+            return False
+
+        amounts = Counter(data["tags"] or [])
+        amounts.subtract(post.get("tags") or [])
+        self.__add_to_tag_counts(amounts)
+        self.__forget_searches()
+
+        return True
+
+    def increment_votes(self, post_id: str, likes: int = 0, dislikes: int = 0) -> bool:
         try:
-            result = self.__posts_collection().update_one(
-                {"_id": ObjectId(post_id)}, {"$set": dict(locked=True)}
+            # Pipeline update so the floor is applied atomically on the server
+            result = self.__posts_collection("vote_counter").update_one(
+                {"_id": ObjectId(post_id)},
+                [
+                    {
+                        "$set": dict(
+                            likes={"$max": [{"$add": ["$likes", likes]}, 0]},
+                            dislikes={"$max": [{"$add": ["$dislikes", dislikes]}, 0]},
+                        )
+                    },
+                    SCORE_UPDATE,
+                ],
+                session=self._session(),
             )
         except InvalidId:
             return False
 
-        return result.modified_count != 0
+        if not result.acknowledged:
+            # Unacknowledged vote_counter writes, the post is assumed to exist
+            return True
+
+        return result.matched_count != 0
+
+    def add_vote_counts(self, counts: list[PostVoteCounts]) -> int:
+        updates = []
+        for count in counts:
+            try:
+                _id = ObjectId(count["post_id"])
+            except InvalidId:
+                continue
+
+            updates.append(
+                UpdateOne(
+                    {"_id": _id},
+                    [
+                        {
+                            "$set": dict(
+                                likes={"$add": ["$likes", count["likes"]]},
+                                dislikes={"$add": ["$dislikes", count["dislikes"]]},
+                            )
+                        },
+                        SCORE_UPDATE,
+                    ],
+                )
+            )
+
+        if not updates:
+            return 0
+
+        result = self.__posts_collection("vote_counter").bulk_write(
+            updates, ordered=False, session=self._session()
+        )
+
+        if not result.acknowledged:
+            # Unacknowledged vote_counter writes, the posts are assumed to exist
+            return len(updates)
+
+        return result.matched_count
+
+    def set_vote_counts(self, counts: list[PostVoteCounts]) -> int:
+        """Overwrite the vote counters of posts, scoring them again.
+
+        Mongo specific, used to recount posts after duplicate votes were
+        removed, see MongoVoteModel.remove_duplicates.
+
+        :return: Amount of posts whose counters changed.
+        """
+        updates = []
+        for count in counts:
+            try:
+                _id = ObjectId(count["post_id"])
+            except InvalidId:
+                continue
+
+            updates.append(
+                UpdateOne(
+                    {"_id": _id},
+                    [
+                        {
+                            "$set": dict(
+                                likes=count["likes"], dislikes=count["dislikes"]
+                            )
+                        },
+                        SCORE_UPDATE,
+                    ],
+                )
+            )
+
+        if not updates:
+            return 0
+
+        result = self.__posts_collection("post").bulk_write(
+            updates, ordered=False, session=self._session()
+        )
+
+        return result.modified_count
+
+    def lock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, True)
 
     def unlock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, False)
+
+    def __set_locked(self, post_id: str, locked: bool) -> bool:
         try:
-            result = self.__posts_collection().update_one(
-                {"_id": ObjectId(post_id)}, {"$set": dict(locked=False)}
+            result = self.__posts_collection("post").update_one(
+                {"_id": ObjectId(post_id)},
+                {"$set": dict(locked=locked)},
+                session=self._session(),
             )
         except InvalidId:
             return False
 
-        return result.modified_count != 0
+        if result.modified_count == 0:
+            return False
+
+        self.__forget_searches()
+
+        return True
+
+    def __list_posts(
+        self, query: dict, limit: int, skip: int, sort: str, window: str
+    ) -> list[Post]:
+        """Return the posts matching a listing query in `sort` order.
+
+        Windowed sorts are read from the window's rankings, then their posts
+        are read by _id.
+        """
+        if not is_ranked(sort, window):
+            results = find_listing(
+                self.__posts_collection(),
+                query,
+                LIST_PROJECTION,
+                sort,
+                limit,
+                skip,
+                self._session(),
+            )
+
+            return list(map(filter_post_result, results))
+
+        rankings = find_listing(
+            self.__rankings_collection(window),
+            query,
+            {sort: True},
+            sort,
+            limit,
+            skip,
+            self._session(),
+        )
+        scores = {ranking["_id"]: ranking[sort] for ranking in rankings}
+        posts = {
+            post["_id"]: post
+            for post in self.__posts_collection().find(
+                {"_id": {"$in": list(scores)}},
+                projection=LIST_PROJECTION,
+                session=self._session(),
+            )
+        }
+
+        return ranked_posts(scores, posts, sort)
+
+    def get_posts(
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ):
+        query = listing_query(subforum, tags, tag_match)
+
+        return self.__list_posts(query, limit, skip, sort, window)
+
+    def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ):
+        try:
+            query = listing_query(subforum, tags, tag_match, cursor, sort)
+        except InvalidId:
+            return []
+
+        return self.__list_posts(query, limit, 0, sort, window)
+
+    def search_posts(
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None = None,
+        subforum: str | None = None,
+    ) -> list[Post]:
+        key = (query, limit, subforum)
+        if cursor is not None:
+            key += (cursor["score"], cursor["post_id"])
+
+        posts = MongoPostModel._search_cache.get(key)
+        if posts is None:
+            posts = self.__search_posts(query, limit, cursor, subforum)
+            MongoPostModel._search_cache.set(key, posts)
+
+        # Callers add to the posts they're given
+        return [dict(post) for post in posts]
+
+    def __search_posts(
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None,
+    ) -> list[Post]:
+        match = {"$text": {"$search": query}}
+        if subforum:
+            match["subforum"] = subforum
+
+        pipeline = [
+            {"$match": match},
+            {"$project": LIST_PROJECTION | dict(rank=SEARCH_RANK)},
+        ]
+
+        if cursor is not None:
+            try:
+                last_id = ObjectId(cursor["post_id"])
+            except InvalidId:
+                return []
+
+            last = cursor["score"]
+            pipeline.append(
+                {
+                    "$match": {
+                        "$or": [
+                            {"rank": {"$lt": last}},
+                            {"rank": last, "_id": {"$lt": last_id}},
+                        ]
+                    }
+                }
+            )
+
+        pipeline += [{"$sort": dict(rank=-1, _id=-1)}, {"$limit": limit}]
+        results = self.__posts_collection().aggregate(pipeline, session=self._session())
+
+        return list(map(filter_post_result, results))
+
+    def get_count(self, subforum: str | None = None) -> int:
+        counter_id = post_counter_id(subforum)
+        counter = self.__counters_collection().find_one(
+            {"_id": counter_id}, session=self._session()
+        )
+
+        if counter is not None:
+            return counter["count"]
 
-    def get_posts(self, limit: int, skip: int, subforum: str | None = None):
+        # Seed a missing counter, unless a concurrent update created it first.
+        # Counted on the primary, a stale count would be kept for good
+        posts = self.__posts_collection().with_options(
+            read_preference=ReadPreference.PRIMARY
+        )
+        count = posts.count_documents(subforum_query(subforum), session=self._session())
+        self.__counters_collection().update_one(
+            {"_id": counter_id},
+            {"$setOnInsert": {"count": count}},
+            upsert=True,
+            session=self._session(),
+        )
+
+        return count
+
+    def get_tags(self, limit: int) -> list[TagCount]:
         results = (
-            self.__posts_collection()
-            .find({"subforum": subforum} if subforum else {})
-            .sort("creation_date", DESCENDING)
+            self.__tags_collection()
+            .find({"count": {"$gt": 0}}, session=self._session())
+            .sort("count", DESCENDING)
             .limit(limit)
-            .skip(skip)
         )
 
-        filtered = map(self.__filter_post_result, results)
+        return [dict(tag=result["_id"], count=result["count"]) for result in results]
 
-        return list(filtered)
+    def recompute_scores(self) -> int:
+        unchanged = {
+            "$and": [{"$eq": [f"${sort}", score]} for sort, score in SCORES.items()]
+        }
+        result = self.__posts_collection("post").update_many(
+            {},
+            [
+                # Only posts whose scores change need to be ranked again
+                {"$set": dict(rank_stale={"$cond": [unchanged, "$rank_stale", True]})},
+                {"$set": SCORES},
+            ],
+            session=self._session(),
+        )
 
-    def get_count(self, subforum: str | None = None) -> int:
-        return self.__posts_collection().count_documents(
-            {"subforum": subforum} if subforum else {}
+        return result.modified_count
+
+    def refresh_rankings(self, batch_size: int = 1000) -> int:
+        now = datetime.now()
+        starts = {
+            window: now - WINDOWS[window] for window in RANKINGS_COLLECTIONS.keys()
+        }
+        oldest = min(starts.values())
+
+        for window, start in starts.items():
+            self.__rankings_collection(window, "post").delete_many(
+                {"creation_date": {"$lt": start}}, session=self._session()
+            )
+
+        # Too old to be ranked in any window
+        self.__posts_collection("post").update_many(
+            {"rank_stale": True, "creation_date": {"$lt": oldest}},
+            {"$unset": dict(rank_stale=True)},
+            session=self._session(),
         )
+
+        ranked = 0
+
+        while True:
+            posts = list(
+                self.__posts_collection()
+                .find(
+                    {"rank_stale": True, "creation_date": {"$gte": oldest}},
+                    projection=dict(
+                        subforum=True,
+                        tags=True,
+                        creation_date=True,
+                        likes=True,
+                        dislikes=True,
+                    ),
+                    session=self._session(),
+                )
+                .limit(batch_size)
+            )
+
+            if not posts:
+                break
+
+            for window, start in starts.items():
+                rankings = [
+                    ReplaceOne(
+                        {"_id": post["_id"]},
+                        dict(
+                            subforum=post["subforum"],
+                            tags=post.get("tags"),
+                            creation_date=post["creation_date"],
+                        )
+                        | {
+                            sort: score
+                            for sort, score in post_scores(
+                                post["likes"], post["dislikes"], post["creation_date"]
+                            ).items()
+                            if sort in WINDOWED_SORTS
+                        },
+                        upsert=True,
+                    )
+                    for post in posts
+                    if post["creation_date"] >= start
+                ]
+
+                if rankings:
+                    self.__rankings_collection(window, "post").bulk_write(
+                        rankings, ordered=False, session=self._session()
+                    )
+
+            # Posts voted on meanwhile stay stale for the next round
+            result = self.__posts_collection("post").bulk_write(
+                [
+                    UpdateOne(
+                        {
+                            "_id": post["_id"],
+                            "likes": post["likes"],
+                            "dislikes": post["dislikes"],
+                        },
+                        {"$unset": dict(rank_stale=True)},
+                    )
+                    for post in posts
+                ],
+                ordered=False,
+                session=self._session(),
+            )
+
+            if result.modified_count == 0:
+                # Every post of the batch was voted on meanwhile, try again later
+                break
+
+            ranked += result.modified_count
+
+        return ranked
+
+    def split_bodies(self, batch_size: int = 1000) -> int:
+        """Move bodies stored inside their posts to BODIES_COLLECTION.
+
+        Mongo specific, see the split-post-bodies command. Bodies stored
+        inside posts take precedence over moved ones, so posts stay readable
+        throughout and repeating the move is safe. A body edited while being
+        moved is left inside its post.
+
+        :return: Amount of bodies moved.
+        """
+        moved = 0
+
+        while True:
+            posts = list(
+                self.__posts_collection()
+                .find(
+                    {"body": {"$exists": True}},
+                    projection=dict(body=True, body_codec=True),
+                    session=self._session(),
+                )
+                .limit(batch_size)
+            )
+
+            if not posts:
+                break
+
+            self.__bodies_collection("post").bulk_write(
+                [ReplaceOne({"_id": post["_id"]}, post, upsert=True) for post in posts],
+                ordered=False,
+                session=self._session(),
+            )
+            result = self.__posts_collection("post").bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": post["_id"], "body": post["body"]},
+                        {"$unset": dict(body=True, body_codec=True)},
+                    )
+                    for post in posts
+                ],
+                ordered=False,
+                session=self._session(),
+            )
+
+            if result.modified_count == 0:
+                # Every body of the batch was edited meanwhile, try again later
+                break
+
+            moved += result.modified_count
+
+        return moved
+
+    def reconcile_counts(self) -> int:
+        def count_posts() -> dict[str, int]:
+            counts = {
+                post_counter_id(result["_id"]): result["count"]
+                for result in self.__posts_collection().aggregate(
+                    [{"$group": {"_id": "$subforum", "count": {"$sum": 1}}}],
+                    session=self._session(),
+                )
+            }
+            counts[TOTAL_COUNTER] = sum(counts.values())
+
+            return counts
+
+        def count_tags() -> dict[str, int]:
+            return {
+                result["_id"]: result["count"]
+                for result in self.__posts_collection().aggregate(
+                    [
+                        {"$unwind": "$tags"},
+                        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+                    ],
+                    session=self._session(),
+                )
+            }
+
+        # Subforums whose posts are all gone keep a counter of 0, tags no post
+        # uses anymore are dropped
+        return self.__reconcile(
+            self.__counters_collection,
+            {"_id": {"$regex": f"^{TOTAL_COUNTER}(:|$)"}},
+            count_posts,
+            drop_unused=False,
+        ) + self.__reconcile(self.__tags_collection, {}, count_tags, drop_unused=True)
+
+    def __reconcile(
+        self, collection, stored_filter: dict, count, drop_unused: bool
+    ) -> int:
+        """Correct the counts stored in a collection to the ones `count` returns.
+
+        Posts can be created and deleted while counting, so counts are only
+        written over the stored count they were compared with. Those that
+        changed in between are counted again, up to RECONCILE_ATTEMPTS times.
+
+        :param collection: Collection getter, like __counters_collection.
+        :param count: Returns the actual counts keyed by _id.
+        :param drop_unused: Whether to delete counts that became 0, rather than set them.
+        :return: Amount of counts that were corrected.
+        """
+        corrected = 0
+
+        for _ in range(RECONCILE_ATTEMPTS):
+            # Stored first, posts counted after it was read are changes to retry
+            stored = {
+                document["_id"]: document["count"]
+                for document in collection().find(
+                    stored_filter, session=self._session()
+                )
+            }
+            counts = count()
+
+            updates = []
+            for _id in stored.keys() | counts.keys():
+                actual = counts.get(_id, 0)
+
+                if _id not in stored:
+                    updates.append(
+                        UpdateOne(
+                            {"_id": _id},
+                            {"$setOnInsert": {"count": actual}},
+                            upsert=True,
+                        )
+                    )
+                elif stored[_id] == actual:
+                    continue
+                elif actual == 0 and drop_unused:
+                    updates.append(DeleteOne({"_id": _id, "count": stored[_id]}))
+                else:
+                    updates.append(
+                        UpdateOne(
+                            {"_id": _id, "count": stored[_id]},
+                            {"$set": {"count": actual}},
+                        )
+                    )
+
+            if not updates:
+                break
+
+            result = collection().bulk_write(
+                updates, ordered=False, session=self._session()
+            )
+            corrected += (
+                result.modified_count + result.upserted_count + result.deleted_count
+            )
+
+            if (
+                result.matched_count + result.upserted_count + result.deleted_count
+                == len(updates)
+            ):
+                break
+
+        return corrected
+
+    def normalize_stored_tags(self, batch_size: int = 1000) -> int:
+        normalized = 0
+        updates = []
+
+        def write():
+            result = self.__posts_collection("post").bulk_write(
+                updates, ordered=False, session=self._session()
+            )
+            updates.clear()
+
+            return result.modified_count
+
+        for post in self.__posts_collection().find(
+            {"tags.0": {"$exists": True}},
+            projection=dict(tags=True),
+            session=self._session(),
+        ):
+            tags = normalize_tags(post["tags"])
+
+            if tags != post["tags"]:
+                # Tags edited meanwhile are already normalized
+                updates.append(
+                    UpdateOne(
+                        {"_id": post["_id"], "tags": post["tags"]},
+                        {"$set": dict(tags=tags, rank_stale=True)},
+                    )
+                )
+
+            if len(updates) >= batch_size:
+                normalized += write()
+
+        if updates:
+            normalized += write()
+
+        if normalized:
+            self.__forget_searches()
+
+        return normalized
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from pymongo import IndexModel
+
 from backend.data.models.mongo.MongoMixin import MongoMixin
 from backend.data.models.SubForumModel import SubForum, SubForumModel
 
@@ -7,35 +9,60 @@ SUBFORUMS_COLLECTION = "subforums"
 
 
 class MongoSubForumModel(MongoMixin, SubForumModel):
+    INDEXES = {SUBFORUMS_COLLECTION: [IndexModel("title", unique=True)]}
+
     def __init__(self):
         super().__init__()
 
-    def __subforums_collection(self):
-        return self._get_collection(SUBFORUMS_COLLECTION)
+    def __subforums_collection(self, write: str | None = None):
+        return self._get_collection(SUBFORUMS_COLLECTION, write)
 
     def create_subforum(self, data: SubForum) -> bool:
-        result = self.__subforums_collection().insert_one(
+        result = self.__subforums_collection("subforum_create").insert_one(
             {
                 "creator": data["creator"],
                 "title": data["title"],
                 "description": data["description"],
                 "creation_date": data["creation_date"],
-            }
+            },
+            session=self._session(),
         )
         return result.acknowledged
 
+    def import_subforums(self, subforums: list[SubForum]) -> int:
+        inserted = self._insert_new(
+            self.__subforums_collection("subforum_create"),
+            [
+                {
+                    "creator": data["creator"],
+                    "title": data["title"],
+                    "description": data["description"],
+                    "creation_date": data["creation_date"],
+                }
+                for data in subforums
+            ],
+        )
+
+        return len(inserted)
+
     def delete_subforum(self, title: str) -> bool:
-        result = self.__subforums_collection().delete_one({"title": title})
+        result = self.__subforums_collection("subforum_delete").delete_one(
+            {"title": title}, session=self._session()
+        )
         return result.deleted_count != 0
 
     def edit_subforum(self, title: str, description: str) -> bool:
-        result = self.__subforums_collection().update_one(
-            {"title": title}, {"$set": {"description": description}}
+        result = self.__subforums_collection("subforum_edit").update_one(
+            {"title": title},
+            {"$set": {"description": description}},
+            session=self._session(),
         )
         return result.modified_count != 0
 
     def get_subforum_by_title(self, title: str) -> Optional[SubForum]:
-        subforum = self.__subforums_collection().find_one({"title": title})
+        subforum = self.__subforums_collection().find_one(
+            {"title": title}, session=self._session()
+        )
 
         if subforum is None:
             return None
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from pymongo import IndexModel
+
 from backend.data.models.mongo.MongoMixin import MongoMixin
 from backend.data.models.UserModel import User, UserModel
 
@@ -7,20 +9,25 @@ USERS_COLLECTION = "users"
 
 
 class MongoUserModel(MongoMixin, UserModel):
+    INDEXES = {USERS_COLLECTION: [IndexModel("username", unique=True)]}
+
     def __init__(self):
         super().__init__()
 
     def create_user(self, data: User) -> bool:
-        return self._get_collection(USERS_COLLECTION).insert_one(
+        return self._get_collection(USERS_COLLECTION, "user_create").insert_one(
             {
                 "username": data["username"],
                 "password": data["password"],
                 "registration_date": data["registration_date"],
-            }
+            },
+            session=self._session(),
         )
 
     def get_by_username(self, username: str) -> Optional[User]:
-        user = self._get_collection(USERS_COLLECTION).find_one({"username": username})
+        user = self._get_collection(USERS_COLLECTION).find_one(
+            {"username": username}, session=self._session()
+        )
 
         if user is None:
             return None
@@ -33,6 +40,8 @@ class MongoUserModel(MongoMixin, UserModel):
 
     def delete_user(self, username) -> bool:
         # Delete user document
-        user = self._get_collection(USERS_COLLECTION).delete_one({"username": username})
+        user = self._get_collection(USERS_COLLECTION, "user_delete").delete_one(
+            {"username": username}, session=self._session()
+        )
 
         return user.deleted_count != 0
@@ -1,27 +1,103 @@
 from typing import Optional
 from bson.errors import InvalidId
 from bson.objectid import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 
 from backend.data.models.mongo.MongoMixin import MongoMixin
-from backend.data.models.VoteModel import BaseVote, Vote, VoteModel
+from backend.data.models.mongo.MongoPostModel import MongoPostModel
+from backend.data.models.VoteModel import BaseVote, ContentType, Vote, VoteModel
 
 VOTES_COLLECTION = "votes"
+VOTE_KEY = ("username", "content_id", "content_type")
+"""Fields unique to a vote."""
 
 
 class MongoVoteModel(MongoMixin, VoteModel):
+    INDEXES = {
+        VOTES_COLLECTION: [
+            IndexModel([(field, ASCENDING) for field in VOTE_KEY], unique=True),
+            IndexModel("content_id"),
+        ]
+    }
+
     def __init__(self):
         super().__init__()
 
+    def remove_duplicates(self, collection_name: str) -> int:
+        """Keep only the latest of a user's votes on the same content.
+
+        Duplicates were left by concurrent votes before the unique index
+        existed, each of them counted. The posts they were on are recounted.
+        """
+        votes = self._get_collection(VOTES_COLLECTION, "vote")
+        duplicates = votes.aggregate(
+            [
+                {"$sort": dict(creation_date=DESCENDING, _id=DESCENDING)},
+                {
+                    "$group": {
+                        "_id": {field: f"${field}" for field in VOTE_KEY},
+                        "ids": {"$push": "$_id"},
+                    }
+                },
+                {"$match": {"ids.1": {"$exists": True}}},
+            ],
+            allowDiskUse=True,
+            session=self._session(),
+        )
+
+        removed = []
+        post_ids = set()
+        for duplicate in duplicates:
+            removed += duplicate["ids"][1:]
+
+            if duplicate["_id"]["content_type"] == str(ContentType.POST):
+                post_ids.add(duplicate["_id"]["content_id"])
+
+        if removed:
+            votes.delete_many({"_id": {"$in": removed}}, session=self._session())
+
+        counts = {
+            post_id: dict(post_id=str(post_id), likes=0, dislikes=0)
+            for post_id in post_ids
+        }
+        for count in votes.aggregate(
+            [
+                {
+                    "$match": dict(
+                        content_id={"$in": list(post_ids)},
+                        content_type=str(ContentType.POST),
+                    )
+                },
+                {
+                    "$group": {
+                        "_id": "$content_id",
+                        "likes": {"$sum": {"$cond": ["$is_like", 1, 0]}},
+                        "dislikes": {"$sum": {"$cond": ["$is_like", 0, 1]}},
+                    }
+                },
+            ],
+            session=self._session(),
+        ):
+            counts[count["_id"]] |= dict(
+                likes=count["likes"], dislikes=count["dislikes"]
+            )
+
+        MongoPostModel().set_vote_counts(list(counts.values()))
+
+        return len(removed)
+
     def add_vote(self, data: Vote) -> bool:
         try:
-            result = self._get_collection(VOTES_COLLECTION).insert_one(
+            result = self._get_collection(VOTES_COLLECTION, "vote").insert_one(
                 dict(
                     username=data["username"],
                     content_id=ObjectId(data["content_id"]),
                     content_type=data["content_type"],
                     is_like=data["is_like"],
                     creation_date=data["creation_date"],
-                )
+                ),
+                session=self._session(),
             )
         except InvalidId:
             return False
@@ -35,7 +111,8 @@ class MongoVoteModel(MongoMixin, VoteModel):
                     username=data["username"],
                     content_id=ObjectId(data["content_id"]),
                     content_type=data["content_type"],
-                )
+                ),
+                session=self._session(),
             )
         except InvalidId:
             return None
@@ -51,9 +128,110 @@ class MongoVoteModel(MongoMixin, VoteModel):
             creation_date=vote["creation_date"],
         )
 
+    def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        object_ids = []
+        for content_id in content_ids:
+            try:
+                object_ids.append(ObjectId(content_id))
+            except InvalidId:
+                continue
+
+        votes = self._get_collection(VOTES_COLLECTION).find(
+            dict(
+                username=username,
+                content_id={"$in": object_ids},
+                content_type=content_type,
+            ),
+            projection=dict(_id=False, content_id=True, is_like=True),
+            session=self._session(),
+        )
+
+        return {str(vote["content_id"]): vote["is_like"] for vote in votes}
+
+    def upsert_vote(self, data: Vote) -> bool | None:
+        try:
+            query = dict(
+                username=data["username"],
+                content_id=ObjectId(data["content_id"]),
+                content_type=data["content_type"],
+            )
+        except InvalidId:
+            return None
+
+        update = {
+            "$set": dict(is_like=data["is_like"], creation_date=data["creation_date"])
+        }
+
+        try:
+            previous = self._get_collection(
+                VOTES_COLLECTION, "vote"
+            ).find_one_and_update(
+                query,
+                update,
+                projection=dict(_id=False, is_like=True),
+                upsert=True,
+                return_document=ReturnDocument.BEFORE,
+                session=self._session(),
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert inserted the vote first, it can now be updated
+            previous = self._get_collection(
+                VOTES_COLLECTION, "vote"
+            ).find_one_and_update(
+                query,
+                update,
+                projection=dict(_id=False, is_like=True),
+                return_document=ReturnDocument.BEFORE,
+                session=self._session(),
+            )
+
+        if previous is None:
+            return None
+
+        return previous["is_like"]
+
+    def import_votes(self, votes: list[Vote]) -> list[Vote]:
+        imported = []
+        updates = []
+        for vote in votes:
+            try:
+                content_id = ObjectId(vote["content_id"])
+            except InvalidId:
+                continue
+
+            imported.append(vote)
+            # Upserts rather than inserts, as duplicates would abort a unit of work
+            updates.append(
+                UpdateOne(
+                    dict(
+                        username=vote["username"],
+                        content_id=content_id,
+                        content_type=vote["content_type"],
+                    ),
+                    {
+                        "$setOnInsert": dict(
+                            is_like=vote["is_like"],
+                            creation_date=vote["creation_date"],
+                        )
+                    },
+                    upsert=True,
+                )
+            )
+
+        if not updates:
+            return []
+
+        result = self._get_collection(VOTES_COLLECTION, "vote").bulk_write(
+            updates, ordered=False, session=self._session()
+        )
+
+        return [imported[i] for i in sorted(result.upserted_ids)]
+
     def update_vote(self, data: Vote) -> bool:
         try:
-            result = self._get_collection(VOTES_COLLECTION).update_one(
+            result = self._get_collection(VOTES_COLLECTION, "vote").update_one(
                 dict(
                     username=data["username"],
                     content_id=ObjectId(data["content_id"]),
@@ -65,6 +243,7 @@ class MongoVoteModel(MongoMixin, VoteModel):
                         creation_date=data["creation_date"],
                     )
                 },
+                session=self._session(),
             )
         except InvalidId:
             return False
@@ -73,12 +252,13 @@ class MongoVoteModel(MongoMixin, VoteModel):
 
     def remove_vote(self, data: BaseVote) -> bool:
         try:
-            result = self._get_collection(VOTES_COLLECTION).delete_one(
+            result = self._get_collection(VOTES_COLLECTION, "vote").delete_one(
                 dict(
                     username=data["username"],
                     content_id=ObjectId(data["content_id"]),
                     content_type=data["content_type"],
-                )
+                ),
+                session=self._session(),
             )
         except InvalidId:
             return False
@@ -86,15 +266,15 @@ class MongoVoteModel(MongoMixin, VoteModel):
         return result.deleted_count != 0
 
     def clear_votes_by_username(self, username: str) -> bool:
-        result = self._get_collection(VOTES_COLLECTION).delete_many(
-            dict(username=username)
+        result = self._get_collection(VOTES_COLLECTION, "vote").delete_many(
+            dict(username=username), session=self._session()
         )
         return result.acknowledged
 
     def clear_votes_by_id(self, content_id: str) -> bool:
         try:
-            result = self._get_collection(VOTES_COLLECTION).delete_many(
-                dict(content_id=ObjectId(content_id))
+            result = self._get_collection(VOTES_COLLECTION, "vote").delete_many(
+                dict(content_id=ObjectId(content_id)), session=self._session()
             )
         except InvalidId:
             return False
@@ -0,0 +1,49 @@
+import json
+import sqlite3
+from contextlib import AbstractContextManager, contextmanager
+from typing import Iterator
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.databases.SQLiteDatabase import SQLiteDatabase
+
+
+def to_json(value: list | None) -> str | None:
+    return None if value is None else json.dumps(value)
+
+
+def from_json(value: str | None) -> list | None:
+    return None if value is None else json.loads(value)
+
+
+def placeholders(values: list) -> str:
+    """Return a parameter list for the SQL IN operator, one per value."""
+    return ", ".join("?" * len(values))
+
+
+class SQLiteMixin:
+    SCHEMA: list[str] = []
+    """Tables, indexes and triggers a model relies on, as SQL statements.
+
+    Registered with SQLiteDatabase and created during setup.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Only register what the subclass itself declares
+        SQLiteDatabase.register_schema(cls.__dict__.get("SCHEMA", []))
+
+    def __init__(self):
+        pass
+
+    def _connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Connection to read with, the unit of work's if there's one in progress."""
+        return DatabaseFactory.create_database("sqlite").connection()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Connection to write with, inside a unit of work joined or begun for it."""
+        database = DatabaseFactory.create_database("sqlite")
+
+        with database.unit_of_work(), database.connection() as connection:
+            yield connection
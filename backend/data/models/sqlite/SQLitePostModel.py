@@ -0,0 +1,528 @@
+import re
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from bson.objectid import ObjectId
+
+from backend.data.databases.SQLiteDatabase import from_timestamp, to_timestamp
+from backend.data.models.PostModel import (
+    PREVIEW_MAX,
+    SEARCH_WEIGHTS,
+    SORTS,
+    WINDOWED_SORTS,
+    WINDOWS,
+    BasePost,
+    CreatePost,
+    ImportPost,
+    Post,
+    PostCursor,
+    PostModel,
+    PostVersion,
+    PostVoteCounts,
+    TagCount,
+    normalize_tags,
+    post_scores,
+)
+from backend.data.models.sqlite.SQLiteMixin import (
+    SQLiteMixin,
+    from_json,
+    placeholders,
+    to_json,
+)
+
+LIST_COLUMNS = ", ".join(
+    f"posts.{column}"
+    for column in (
+        "post_id op subforum title preview media tags likes dislikes locked "
+        "creation_date modified_date hot top controversial"
+    ).split()
+)
+"""Post columns needed by listings, leaving out the body. Qualified, as
+searches join posts with posts_search, which has columns of the same name."""
+SORT_COLUMNS = {sort: "creation_date" if sort == "new" else sort for sort in SORTS}
+"""Column each of SORTS orders listings by, ties broken by post ID."""
+INSERT_POST = (
+    "INSERT OR IGNORE INTO posts (post_id, op, subforum, title, body, preview, "
+    "media, tags, likes, dislikes, locked, creation_date, modified_date, hot, top, "
+    "controversial) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SET_SCORES = (
+    "hot = hot_score(likes, dislikes, creation_date), "
+    "top = wilson_score(likes, dislikes), "
+    "controversial = controversy_score(likes, dislikes)"
+)
+"""Scores of a post computed from its votes, see SQL_FUNCTIONS."""
+ADD_VOTES = (
+    "UPDATE posts SET likes = likes + ?, dislikes = dislikes + ? WHERE post_id = ?"
+)
+SEARCH_WEIGHT_ARGUMENTS = ", ".join(map(str, SEARCH_WEIGHTS.values()))
+"""bm25 weights of the posts_search columns, in order."""
+TERM_PATTERN = re.compile(r"\w+")
+"""Words searched by search_posts, matched case-insensitively."""
+
+_INDEXED_SORTS = [
+    f"CREATE INDEX IF NOT EXISTS posts_{sort} ON posts ({column}, post_id)"
+    for sort, column in SORT_COLUMNS.items()
+] + [
+    f"CREATE INDEX IF NOT EXISTS posts_subforum_{sort} "
+    f"ON posts (subforum, {column}, post_id)"
+    for sort, column in SORT_COLUMNS.items()
+]
+_INSERT_TAGS = (
+    "INSERT OR IGNORE INTO post_tags "
+    "SELECT value, new.post_id, new.creation_date FROM json_each(new.tags);"
+)
+_INSERT_SEARCH = (
+    "INSERT INTO posts_search (rowid, title, tags, body) "
+    "VALUES (new.id, new.title, new.tags, new.body);"
+)
+_DELETE_SEARCH = (
+    "INSERT INTO posts_search (posts_search, rowid, title, tags, body) "
+    "VALUES ('delete', old.id, old.title, old.tags, old.body);"
+)
+
+
+def _to_post(row: sqlite3.Row) -> Post:
+    post = dict(row)
+
+    post.update(
+        media=from_json(post["media"]),
+        tags=from_json(post["tags"]),
+        locked=bool(post["locked"]),
+        creation_date=from_timestamp(post["creation_date"]),
+        modified_date=from_timestamp(post["modified_date"]),
+    )
+    post.pop("id", None)
+
+    return post
+
+
+def _search_query(query: str) -> str | None:
+    """Return an FTS5 query matching posts with any of the words of `query`."""
+    terms = set(TERM_PATTERN.findall(query.lower()))
+
+    return " OR ".join(f'"{term}"' for term in terms) or None
+
+
+class SQLitePostModel(SQLiteMixin, PostModel):
+    SCHEMA = [
+        # Explicit rowid, posts_search refers to it and it must survive VACUUM
+        """CREATE TABLE IF NOT EXISTS posts (
+            id INTEGER PRIMARY KEY,
+            post_id TEXT NOT NULL UNIQUE,
+            op TEXT NOT NULL,
+            subforum TEXT NOT NULL,
+            title TEXT NOT NULL,
+            body TEXT NOT NULL,
+            preview TEXT NOT NULL,
+            media TEXT,
+            tags TEXT,
+            likes INTEGER NOT NULL,
+            dislikes INTEGER NOT NULL,
+            locked INTEGER NOT NULL,
+            creation_date TEXT NOT NULL,
+            modified_date TEXT,
+            hot REAL NOT NULL,
+            top REAL NOT NULL,
+            controversial REAL NOT NULL
+        )""",
+        *_INDEXED_SORTS,
+        "CREATE INDEX IF NOT EXISTS posts_op ON posts (op)",
+        # Each tag's posts newest first, kept in sync with posts.tags
+        """CREATE TABLE IF NOT EXISTS post_tags (
+            tag TEXT NOT NULL,
+            post_id TEXT NOT NULL,
+            creation_date TEXT NOT NULL,
+            PRIMARY KEY (tag, creation_date, post_id)
+        ) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS post_tags_post_id ON post_tags (post_id)",
+        # Indexes the columns of posts without storing them again
+        """CREATE VIRTUAL TABLE IF NOT EXISTS posts_search USING fts5 (
+            title, tags, body, content='posts', content_rowid='id'
+        )""",
+        f"""CREATE TRIGGER IF NOT EXISTS posts_insert AFTER INSERT ON posts BEGIN
+            {_INSERT_TAGS}
+            {_INSERT_SEARCH}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS posts_delete AFTER DELETE ON posts BEGIN
+            DELETE FROM post_tags WHERE post_id = old.post_id;
+            {_DELETE_SEARCH}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS posts_update
+        AFTER UPDATE OF title, tags, body ON posts BEGIN
+            DELETE FROM post_tags WHERE post_id = old.post_id;
+            {_INSERT_TAGS}
+            {_DELETE_SEARCH}
+            {_INSERT_SEARCH}
+        END""",
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+    def __to_row(self, data: CreatePost, post_id: str) -> tuple:
+        scores = post_scores(data["likes"], data["dislikes"], data["creation_date"])
+
+        return (
+            post_id,
+            data["op"],
+            data["subforum"],
+            data["title"],
+            data["body"],
+            data["body"][:PREVIEW_MAX],
+            to_json(data["media"]),
+            to_json(data["tags"]),
+            data["likes"],
+            data["dislikes"],
+            data["locked"],
+            to_timestamp(data["creation_date"]),
+            to_timestamp(data["modified_date"]),
+            scores["hot"],
+            scores["top"],
+            scores["controversial"],
+        )
+
+    def create_post(self, data: CreatePost) -> bool:
+        with self._write() as connection:
+            connection.execute(INSERT_POST, self.__to_row(data, str(ObjectId())))
+
+        return True
+
+    def import_posts(self, posts: list[ImportPost]) -> int:
+        with self._write() as connection:
+            cursor = connection.executemany(
+                INSERT_POST, (self.__to_row(post, post["post_id"]) for post in posts)
+            )
+
+        return cursor.rowcount
+
+    def get_by_post_id(self, post_id: str) -> Optional[Post]:
+        with self._connection() as connection:
+            post = connection.execute(
+                "SELECT * FROM posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+
+        return None if post is None else _to_post(post)
+
+    def post_exists(self, post_id: str) -> bool:
+        with self._connection() as connection:
+            post = connection.execute(
+                "SELECT 1 FROM posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+
+        return post is not None
+
+    def get_existing_post_ids(self, post_ids: list[str]) -> set[str]:
+        if not post_ids:
+            return set()
+
+        with self._connection() as connection:
+            posts = connection.execute(
+                f"SELECT post_id FROM posts WHERE post_id IN ({placeholders(post_ids)})",
+                post_ids,
+            ).fetchall()
+
+        return {post["post_id"] for post in posts}
+
+    def get_vote_counts(self, post_id: str) -> Optional[PostVoteCounts]:
+        with self._connection() as connection:
+            post = connection.execute(
+                "SELECT post_id, likes, dislikes FROM posts WHERE post_id = ?",
+                (post_id,),
+            ).fetchone()
+
+        return None if post is None else dict(post)
+
+    def get_post_version(self, post_id: str) -> Optional[PostVersion]:
+        with self._connection() as connection:
+            post = connection.execute(
+                "SELECT post_id, likes, dislikes, creation_date, modified_date, locked "
+                "FROM posts WHERE post_id = ?",
+                (post_id,),
+            ).fetchone()
+
+        if post is None:
+            return None
+
+        return dict(post) | dict(
+            creation_date=from_timestamp(post["creation_date"]),
+            modified_date=from_timestamp(post["modified_date"]),
+            locked=bool(post["locked"]),
+        )
+
+    def delete_by_post_id(self, post_id: str) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "DELETE FROM posts WHERE post_id = ?", (post_id,)
+            )
+
+        return cursor.rowcount != 0
+
+    def clear_posts(self, username: str) -> bool:
+        with self._write() as connection:
+            connection.execute("DELETE FROM posts WHERE op = ?", (username,))
+
+        return True
+
+    def edit_post(self, post_id: str, data: BasePost) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE posts SET op = ?, title = ?, body = ?, preview = ?, media = ?, "
+                "tags = ?, modified_date = ? WHERE post_id = ?",
+                (
+                    data["op"],
+                    data["title"],
+                    data["body"],
+                    data["body"][:PREVIEW_MAX],
+                    to_json(data["media"]),
+                    to_json(data["tags"]),
+                    to_timestamp(data["modified_date"]),
+                    post_id,
+                ),
+            )
+
+        return cursor.rowcount != 0
+
+    def increment_votes(self, post_id: str, likes: int = 0, dislikes: int = 0) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE posts SET likes = max(likes + ?, 0), "
+                "dislikes = max(dislikes + ?, 0) WHERE post_id = ?",
+                (likes, dislikes, post_id),
+            )
+            connection.execute(
+                f"UPDATE posts SET {SET_SCORES} WHERE post_id = ?", (post_id,)
+            )
+
+        return cursor.rowcount != 0
+
+    def add_vote_counts(self, counts: list[PostVoteCounts]) -> int:
+        with self._write() as connection:
+            cursor = connection.executemany(
+                ADD_VOTES,
+                [
+                    (count["likes"], count["dislikes"], count["post_id"])
+                    for count in counts
+                ],
+            )
+            connection.executemany(
+                f"UPDATE posts SET {SET_SCORES} WHERE post_id = ?",
+                [(count["post_id"],) for count in counts],
+            )
+
+        return cursor.rowcount
+
+    def lock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, True)
+
+    def unlock_post(self, post_id: str) -> bool:
+        return self.__set_locked(post_id, False)
+
+    def __set_locked(self, post_id: str, locked: bool) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE posts SET locked = ? WHERE post_id = ? AND locked != ?",
+                (locked, post_id, locked),
+            )
+
+        return cursor.rowcount != 0
+
+    def __list_posts(
+        self,
+        limit: int,
+        skip: int,
+        cursor: PostCursor | None,
+        subforum: str | None,
+        sort: str,
+        window: str,
+        tags: list[str] | None,
+        tag_match: str,
+    ) -> list[Post]:
+        """Return the posts of a listing in `sort` order.
+
+        Windowed sorts are computed as posts are read, rather than kept in
+        rankings, so they are never out of date. Only the posts inside the
+        window are ranked, they are read from the creation date index.
+        """
+        column = SORT_COLUMNS[sort]
+        table = "posts"
+        conditions = []
+        parameters = []
+
+        if subforum:
+            conditions.append("subforum = ?")
+            parameters.append(subforum)
+
+        if sort in WINDOWED_SORTS and WINDOWS.get(window) is not None:
+            # The score index would avoid sorting, but walk every older post
+            table += (
+                " INDEXED BY posts_subforum_new"
+                if subforum
+                else " INDEXED BY posts_new"
+            )
+            conditions.append("creation_date >= ?")
+            parameters.append(to_timestamp(datetime.now() - WINDOWS[window]))
+
+        if tags:
+            tagged = (
+                f"SELECT post_id FROM post_tags WHERE tag IN ({placeholders(tags)})"
+            )
+            if tag_match == "all":
+                tagged += " GROUP BY post_id HAVING count(*) = ?"
+
+            conditions.append(f"post_id IN ({tagged})")
+            parameters += tags
+            if tag_match == "all":
+                parameters.append(len(set(tags)))
+
+        if cursor is not None:
+            last = cursor["creation_date"] if sort == "new" else cursor["score"]
+            conditions.append(f"({column}, post_id) < (?, ?)")
+            parameters += [
+                to_timestamp(last) if sort == "new" else last,
+                cursor["post_id"],
+            ]
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._connection() as connection:
+            posts = connection.execute(
+                f"SELECT {LIST_COLUMNS} FROM {table} {where} "
+                f"ORDER BY {column} DESC, post_id DESC LIMIT ? OFFSET ?",
+                (*parameters, limit, skip),
+            ).fetchall()
+
+        return list(map(_to_post, posts))
+
+    def get_posts(
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        return self.__list_posts(
+            limit, skip, None, subforum, sort, window, tags, tag_match
+        )
+
+    def get_posts_after(
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        return self.__list_posts(
+            limit, 0, cursor, subforum, sort, window, tags, tag_match
+        )
+
+    def search_posts(
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None = None,
+        subforum: str | None = None,
+    ) -> list[Post]:
+        match = _search_query(query)
+
+        if match is None:
+            return []
+
+        conditions = ["posts_search MATCH ?"]
+        parameters = [match]
+
+        if subforum:
+            conditions.append("posts.subforum = ?")
+            parameters.append(subforum)
+
+        after = ""
+        if cursor is not None:
+            after = "WHERE (rank, post_id) < (?, ?)"
+            parameters += [cursor["score"], cursor["post_id"]]
+
+        # Ranked in a subquery, rank is also a hidden column of posts_search
+        with self._connection() as connection:
+            posts = connection.execute(
+                f"SELECT * FROM (SELECT {LIST_COLUMNS}, search_rank("
+                f"-bm25(posts_search, {SEARCH_WEIGHT_ARGUMENTS}), posts.creation_date"
+                ") AS rank FROM posts_search JOIN posts ON posts.id = posts_search.rowid "
+                f"WHERE {' AND '.join(conditions)}) {after} "
+                "ORDER BY rank DESC, post_id DESC LIMIT ?",
+                (*parameters, limit),
+            ).fetchall()
+
+        return list(map(_to_post, posts))
+
+    def get_count(self, subforum: str | None = None) -> int:
+        with self._connection() as connection:
+            if subforum:
+                row = connection.execute(
+                    "SELECT count(*) FROM posts WHERE subforum = ?", (subforum,)
+                ).fetchone()
+            else:
+                row = connection.execute("SELECT count(*) FROM posts").fetchone()
+
+        return row[0]
+
+    def reconcile_counts(self) -> int:
+        """Does nothing, posts and tags are counted as they are read.
+
+        :return: 0, there are no maintained counts to correct.
+        """
+        return 0
+
+    def normalize_stored_tags(self) -> int:
+        with self._write() as connection:
+            posts = connection.execute(
+                "SELECT post_id, tags FROM posts WHERE tags IS NOT NULL"
+            ).fetchall()
+            updates = []
+
+            for post in posts:
+                tags = from_json(post["tags"])
+                normalized = normalize_tags(tags)
+
+                if normalized != tags:
+                    updates.append((to_json(normalized), post["post_id"]))
+
+            # posts_update keeps post_tags and the search index in sync
+            connection.executemany(
+                "UPDATE posts SET tags = ? WHERE post_id = ?", updates
+            )
+
+        return len(updates)
+
+    def get_tags(self, limit: int) -> list[TagCount]:
+        with self._connection() as connection:
+            tags = connection.execute(
+                "SELECT tag, count(*) AS count FROM post_tags GROUP BY tag "
+                "ORDER BY count DESC, tag LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+        return list(map(dict, tags))
+
+    def recompute_scores(self) -> int:
+        with self._write() as connection:
+            cursor = connection.execute(
+                f"UPDATE posts SET {SET_SCORES} WHERE "
+                "hot != hot_score(likes, dislikes, creation_date) "
+                "OR top != wilson_score(likes, dislikes) "
+                "OR controversial != controversy_score(likes, dislikes)"
+            )
+
+        return cursor.rowcount
+
+    def refresh_rankings(self) -> int:
+        """Does nothing, windowed listings are ranked as they are read.
+
+        :return: 0, there are no rankings to refresh.
+        """
+        return 0
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from backend.data.databases.SQLiteDatabase import from_timestamp, to_timestamp
+from backend.data.models.sqlite.SQLiteMixin import SQLiteMixin
+from backend.data.models.SubForumModel import SubForum, SubForumModel
+
+INSERT_SUBFORUM = "INSERT OR IGNORE INTO subforums VALUES (?, ?, ?, ?)"
+
+
+class SQLiteSubForumModel(SQLiteMixin, SubForumModel):
+    SCHEMA = ["""CREATE TABLE IF NOT EXISTS subforums (
+            title TEXT PRIMARY KEY,
+            creator TEXT NOT NULL,
+            description TEXT NOT NULL,
+            creation_date TEXT NOT NULL
+        ) WITHOUT ROWID"""]
+
+    def __init__(self):
+        super().__init__()
+
+    def __to_row(self, data: SubForum) -> tuple:
+        return (
+            data["title"],
+            data["creator"],
+            data["description"],
+            to_timestamp(data["creation_date"]),
+        )
+
+    def create_subforum(self, data: SubForum) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(INSERT_SUBFORUM, self.__to_row(data))
+
+        return cursor.rowcount != 0
+
+    def import_subforums(self, subforums: list[SubForum]) -> int:
+        with self._write() as connection:
+            cursor = connection.executemany(
+                INSERT_SUBFORUM, map(self.__to_row, subforums)
+            )
+
+        return cursor.rowcount
+
+    def delete_subforum(self, title: str) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "DELETE FROM subforums WHERE title = ?", (title,)
+            )
+
+        return cursor.rowcount != 0
+
+    def edit_subforum(self, title: str, description: str) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE subforums SET description = ? "
+                "WHERE title = ? AND description != ?",
+                (description, title, description),
+            )
+
+        return cursor.rowcount != 0
+
+    def get_subforum_by_title(self, title: str) -> Optional[SubForum]:
+        with self._connection() as connection:
+            subforum = connection.execute(
+                "SELECT * FROM subforums WHERE title = ?", (title,)
+            ).fetchone()
+
+        if subforum is None:
+            return None
+
+        return {
+            "creator": subforum["creator"],
+            "title": subforum["title"],
+            "description": subforum["description"],
+            "creation_date": from_timestamp(subforum["creation_date"]),
+        }
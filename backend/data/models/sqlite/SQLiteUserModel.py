@@ -0,0 +1,52 @@
+from typing import Optional
+
+from backend.data.databases.SQLiteDatabase import from_timestamp, to_timestamp
+from backend.data.models.sqlite.SQLiteMixin import SQLiteMixin
+from backend.data.models.UserModel import User, UserModel
+
+
+class SQLiteUserModel(SQLiteMixin, UserModel):
+    SCHEMA = ["""CREATE TABLE IF NOT EXISTS users (
+            username TEXT PRIMARY KEY,
+            password TEXT NOT NULL,
+            registration_date TEXT NOT NULL
+        ) WITHOUT ROWID"""]
+
+    def __init__(self):
+        super().__init__()
+
+    def create_user(self, data: User) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO users VALUES (?, ?, ?)",
+                (
+                    data["username"],
+                    data["password"],
+                    to_timestamp(data["registration_date"]),
+                ),
+            )
+
+        return cursor.rowcount != 0
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        with self._connection() as connection:
+            user = connection.execute(
+                "SELECT * FROM users WHERE username = ?", (username,)
+            ).fetchone()
+
+        if user is None:
+            return None
+
+        return {
+            "username": user["username"],
+            "password": user["password"],
+            "registration_date": from_timestamp(user["registration_date"]),
+        }
+
+    def delete_user(self, username) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                "DELETE FROM users WHERE username = ?", (username,)
+            )
+
+        return cursor.rowcount != 0
@@ -0,0 +1,135 @@
+from typing import Optional
+
+from backend.data.databases.SQLiteDatabase import from_timestamp, to_timestamp
+from backend.data.models.sqlite.SQLiteMixin import SQLiteMixin, placeholders
+from backend.data.models.VoteModel import BaseVote, Vote, VoteModel
+
+VOTE_KEY = "username = ? AND content_id = ? AND content_type = ?"
+"""Condition matching a single vote, see _key."""
+INSERT_VOTE = "INSERT OR IGNORE INTO votes VALUES (?, ?, ?, ?, ?)"
+
+
+def _key(data: BaseVote) -> tuple:
+    return (data["username"], data["content_id"], str(data["content_type"]))
+
+
+def _to_row(data: Vote) -> tuple:
+    return _key(data) + (data["is_like"], to_timestamp(data["creation_date"]))
+
+
+class SQLiteVoteModel(SQLiteMixin, VoteModel):
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS votes (
+            username TEXT NOT NULL,
+            content_id TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            is_like INTEGER NOT NULL,
+            creation_date TEXT NOT NULL,
+            PRIMARY KEY (username, content_id, content_type)
+        ) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS votes_content_id ON votes (content_id)",
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+    def add_vote(self, data: Vote) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(INSERT_VOTE, _to_row(data))
+
+        return cursor.rowcount != 0
+
+    def get_vote(self, data: BaseVote) -> Optional[Vote]:
+        with self._connection() as connection:
+            vote = connection.execute(
+                f"SELECT * FROM votes WHERE {VOTE_KEY}", _key(data)
+            ).fetchone()
+
+        if vote is None:
+            return None
+
+        return dict(
+            username=vote["username"],
+            content_id=vote["content_id"],
+            content_type=vote["content_type"],
+            is_like=bool(vote["is_like"]),
+            creation_date=from_timestamp(vote["creation_date"]),
+        )
+
+    def get_votes_by_ids(
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        if not content_ids:
+            return {}
+
+        with self._connection() as connection:
+            votes = connection.execute(
+                "SELECT content_id, is_like FROM votes "
+                "WHERE username = ? AND content_type = ? "
+                f"AND content_id IN ({placeholders(content_ids)})",
+                (username, str(content_type), *content_ids),
+            ).fetchall()
+
+        return {vote["content_id"]: bool(vote["is_like"]) for vote in votes}
+
+    def upsert_vote(self, data: Vote) -> bool | None:
+        with self._write() as connection:
+            previous = connection.execute(
+                f"SELECT is_like FROM votes WHERE {VOTE_KEY}", _key(data)
+            ).fetchone()
+            connection.execute(
+                "INSERT INTO votes VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT DO UPDATE SET "
+                "is_like = excluded.is_like, creation_date = excluded.creation_date",
+                _to_row(data),
+            )
+
+        return None if previous is None else bool(previous["is_like"])
+
+    def import_votes(self, votes: list[Vote]) -> list[Vote]:
+        imported = []
+
+        with self._write() as connection:
+            for vote in votes:
+                if connection.execute(INSERT_VOTE, _to_row(vote)).rowcount != 0:
+                    imported.append(vote)
+
+        return imported
+
+    def update_vote(self, data: Vote) -> bool:
+        creation_date = to_timestamp(data["creation_date"])
+
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE votes SET is_like = ?, creation_date = ? "
+                f"WHERE {VOTE_KEY} AND (is_like != ? OR creation_date != ?)",
+                (
+                    data["is_like"],
+                    creation_date,
+                    *_key(data),
+                    data["is_like"],
+                    creation_date,
+                ),
+            )
+
+        return cursor.rowcount != 0
+
+    def remove_vote(self, data: BaseVote) -> bool:
+        with self._write() as connection:
+            cursor = connection.execute(
+                f"DELETE FROM votes WHERE {VOTE_KEY}", _key(data)
+            )
+
+        return cursor.rowcount != 0
+
+    def clear_votes_by_username(self, username: str) -> bool:
+        with self._write() as connection:
+            connection.execute("DELETE FROM votes WHERE username = ?", (username,))
+
+        return True
+
+    def clear_votes_by_id(self, content_id: str) -> bool:
+        with self._write() as connection:
+            connection.execute("DELETE FROM votes WHERE content_id = ?", (content_id,))
+
+        return True
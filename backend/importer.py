@@ -0,0 +1,281 @@
+"""Bulk import of subforums, posts and votes from NDJSON or CSV files.
+
+Rows are validated by the managers and written in batches. After every batch
+the amount of rows handled is saved to a checkpoint, so an interrupted import
+resumes where it stopped. Content that already exists is skipped, which makes
+repeating the batch that was in progress safe.
+
+Import subforums first, then posts, then votes. See the import command.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, TypedDict
+
+from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
+from backend.data.managers.ManagerFactory import ManagerFactory
+from backend.data.models.PostModel import ImportPost
+from backend.data.models.SubForumModel import SubForum
+from backend.data.models.VoteModel import ContentType, Vote
+
+KINDS = ("subforums", "posts", "votes")
+"""Kinds of content that can be imported, in the order to import them."""
+BATCH_SIZE = 1000
+"""Default amount of rows written at once."""
+LIST_SEPARATOR = "|"
+"""Separator of list items, like tags, within a CSV field."""
+
+
+class InvalidRowError(Exception):
+    pass
+
+
+class BatchResult(TypedDict):
+    """Outcome of importing a batch of rows."""
+
+    rows: int
+    """Row number of the last row handled so far."""
+    imported: int
+    """Amount of content created."""
+    skipped: int
+    """Amount of content that already existed."""
+    rejected: dict[int, str]
+    """Reason each invalid row was rejected, keyed by row number."""
+
+
+class Checkpoint:
+    """Progress of importing a file, saved as JSON to `path`.
+
+    :raises ValueError: If `path` holds the checkpoint of another import.
+    """
+
+    def __init__(self, path: str, kind: str, source: str):
+        self.path = path
+        self.kind = kind
+        self.source = os.path.abspath(source)
+        self.rows = 0
+        """Row number of the last row handled."""
+
+        if not os.path.exists(path):
+            return
+
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+
+        if saved["kind"] != kind or saved["source"] != self.source:
+            raise ValueError(f"{path} is the checkpoint of another import")
+
+        self.rows = saved["rows"]
+
+    def save(self, rows: int):
+        self.rows = rows
+
+        # Replace the previous checkpoint atomically
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(dict(kind=self.kind, source=self.source, rows=rows), f)
+        os.replace(temporary, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def import_post_id(source_id) -> str:
+    """Return the ID a post is imported under, given its ID in the source.
+
+    IDs made of 24 hex digits are kept, others are hashed into one, so that
+    votes can refer to posts by their source IDs.
+    """
+    source_id = str(source_id)
+
+    if re.fullmatch("[0-9a-fA-F]{24}", source_id) is not None:
+        return source_id.lower()
+
+    return hashlib.sha1(source_id.encode("utf-8")).hexdigest()[:24]
+
+
+def read_rows(path: str) -> Iterator[tuple[int, dict | None]]:
+    """Yield the rows of an NDJSON or CSV file with their row number.
+
+    Files ending in .csv are read as CSV with a header, others as NDJSON.
+    Lines that aren't JSON objects are yielded as None, blank lines are left
+    out but still numbered.
+    """
+    if path.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from enumerate(csv.DictReader(f), start=1)
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if line.strip() == "":
+                continue
+
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = None
+
+            yield number, row if isinstance(row, dict) else None
+
+
+def _text(row: dict, key: str) -> str:
+    value = row.get(key)
+
+    if value is None or value == "":
+        raise InvalidRowError(f"Missing {key}")
+
+    return str(value)
+
+
+def _date(value, default: datetime | None = None) -> datetime:
+    """Parse an ISO 8601 date, `default` or now if missing."""
+    if value is None or value == "":
+        return default or datetime.now()
+
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise InvalidRowError(f"Invalid date: {value}")
+
+
+def _list(value) -> list[str] | None:
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, list):
+        return value
+
+    return str(value).split(LIST_SEPARATOR)
+
+
+def _bool(value, default: bool | None = None) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    if (value is None or value == "") and default is not None:
+        return default
+
+    if str(value).lower() in ("true", "1"):
+        return True
+    elif str(value).lower() in ("false", "0"):
+        return False
+
+    raise InvalidRowError(f"Invalid boolean: {value}")
+
+
+def parse_subforum(row: dict) -> SubForum:
+    """Parse a row with creator, title, description and optionally creation_date.
+
+    :raises InvalidRowError:
+    """
+    return dict(
+        creator=_text(row, "creator"),
+        title=_text(row, "title"),
+        description=_text(row, "description"),
+        creation_date=_date(row.get("creation_date")),
+    )
+
+
+def parse_post(row: dict) -> ImportPost:
+    """Parse a row with id, op, subforum, title, body and optionally media,
+    tags, locked, creation_date and modified_date.
+
+    :raises InvalidRowError:
+    """
+    creation_date = _date(row.get("creation_date"))
+
+    return dict(
+        post_id=import_post_id(_text(row, "id")),
+        op=_text(row, "op"),
+        subforum=_text(row, "subforum"),
+        title=_text(row, "title"),
+        body=_text(row, "body"),
+        media=_list(row.get("media")),
+        tags=_list(row.get("tags")),
+        likes=0,
+        dislikes=0,
+        locked=_bool(row.get("locked"), False),
+        creation_date=creation_date,
+        modified_date=_date(row.get("modified_date"), creation_date),
+    )
+
+
+def parse_vote(row: dict) -> Vote:
+    """Parse a row with username, post_id, is_like and optionally creation_date.
+
+    post_id is the ID the post has in the source, like the post's id.
+
+    :raises InvalidRowError:
+    """
+    return dict(
+        username=_text(row, "username"),
+        content_id=import_post_id(_text(row, "post_id")),
+        content_type=ContentType.POST,
+        is_like=_bool(row.get("is_like")),
+        creation_date=_date(row.get("creation_date")),
+    )
+
+
+def import_file(
+    kind: str,
+    path: str,
+    checkpoint: Checkpoint,
+    batch_size: int = BATCH_SIZE,
+    manager_factory: type[AbstractManagerFactory] = ManagerFactory,
+) -> Iterator[BatchResult]:
+    """Import the rows of a file in batches, yielding the outcome of each.
+
+    Rows up to the checkpoint are skipped, and the checkpoint is saved after
+    each batch.
+
+    :param kind: One of KINDS.
+    """
+    if kind == "subforums":
+        parse = parse_subforum
+        import_batch = manager_factory.create_subforum_manager().import_subforums
+    elif kind == "posts":
+        parse = parse_post
+        import_batch = manager_factory.create_post_manager().import_posts
+    elif kind == "votes":
+        parse = parse_vote
+        import_batch = manager_factory.create_vote_manager().import_votes
+    else:
+        raise ValueError(f"Unknown kind of content: {kind}")
+
+    rows = (
+        (number, row) for number, row in read_rows(path) if number > checkpoint.rows
+    )
+
+    while batch := list(islice(rows, batch_size)):
+        numbers = []
+        items = []
+        rejected = {}
+
+        for number, row in batch:
+            try:
+                if row is None:
+                    raise InvalidRowError("Row is not a JSON object")
+
+                items.append(parse(row))
+                numbers.append(number)
+            except InvalidRowError as e:
+                rejected[number] = str(e)
+
+        result = import_batch(items) if items else dict(imported=0, rejected={})
+        rejected |= {numbers[i]: reason for i, reason in result["rejected"].items()}
+
+        checkpoint.save(batch[-1][0])
+
+        yield dict(
+            rows=checkpoint.rows,
+            imported=result["imported"],
+            skipped=len(items) - result["imported"] - len(result["rejected"]),
+            rejected=dict(sorted(rejected.items())),
+        )
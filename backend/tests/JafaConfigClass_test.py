@@ -0,0 +1,19 @@
+import unittest
+
+from backend.JafaConfigClass import parse_write_concerns
+
+
+class JafaConfigClassTestCase(unittest.TestCase):
+    def test_parse_write_concerns(self):
+        self.assertIsNone(parse_write_concerns(""), "Empty is unset")
+        self.assertIsNone(parse_write_concerns("  "))
+
+        self.assertEqual(
+            parse_write_concerns("vote=1, vote_counter=0,post = majority"),
+            dict(vote=1, vote_counter=0, post="majority"),
+        )
+
+        for value in ("vote", "vote=", "=1", "vote=1,", "vote=1=2"):
+            with self.subTest(value):
+                with self.assertRaisesRegex(ValueError, "DATABASE_WRITE_CONCERNS"):
+                    parse_write_concerns(value)
@@ -19,8 +19,11 @@ def setup_test_context(app: Flask, f: Callable, data: dict | None = None):
         f()
 
 
-def set_data_wrapper(data: dict):
-    """Return a set_data function with that updates the given data dict."""
+def set_data_wrapper(data: dict, return_value=None):
+    """Return a set_data function with that updates the given data dict.
+
+    The function returns `return_value` when called.
+    """
     data["args"] = None
     data["kwargs"] = None
 
@@ -28,4 +31,18 @@ def set_data_wrapper(data: dict):
         data["args"] = args
         data["kwargs"] = kwargs
 
+        return return_value
+
     return set_data
+
+
+def async_wrapper(f: Callable):
+    """Return a coroutine function that returns the result of calling `f`.
+
+    Lets the synchronous stubs above stand in for async model methods.
+    """
+
+    async def wrapper(*args, **kwargs):
+        return f(*args, **kwargs)
+
+    return wrapper
@@ -6,6 +6,8 @@ from flask import Flask, session
 from backend.app import create_app
 from backend.constants import DATA
 from backend.data.managers.AbstractManagerFactory import AbstractManagerFactory
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
 from backend.data.managers.PostMananger import PostManager
 from backend.data.managers.SubForumManager import SubForumManager
 from backend.data.managers.UserManager import UserManager
@@ -39,6 +41,14 @@ class TestManagerFactory(AbstractManagerFactory):
     def create_vote_manager() -> VoteManager:  # NOSONAR
         pass
 
+    @staticmethod
+    def create_async_post_manager() -> AsyncPostManager:  # NOSONAR
+        pass
+
+    @staticmethod
+    def create_async_subforum_manager() -> AsyncSubForumManager:  # NOSONAR
+        pass
+
 
 def blueprint_test_success(
     tc: unittest.TestCase,
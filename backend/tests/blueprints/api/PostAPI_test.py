@@ -3,6 +3,7 @@ from backend.data.managers.PostMananger import (
     InvalidPostBody,
     InvalidPostTag,
     InvalidPostTitle,
+    InvalidSearchError,
     NoPostFoundError,
     PostAlreadyLockedError,
     PostManager,
@@ -16,7 +17,7 @@ from backend.data.managers.VoteManager import (
     NoVoteFoundError,
     VoteManager,
 )
-from backend.data.models.PostModel import Post
+from backend.data.models.PostModel import Post, PostVersion, PostVoteCounts
 from backend.data.models.VoteModel import ContentType, Vote
 from backend.tests.blueprints import (
     BlueprintTestCase,
@@ -67,11 +68,42 @@ class TestPostManager(PostManager):
     ) -> bool:  # NOSONAR
         pass
 
+    def get_vote_counts(self, post_id: str) -> PostVoteCounts:  # NOSONAR
+        pass
+
+    def get_post_version(
+        self, post_id: str, allow_stale: bool = False
+    ) -> PostVersion:  # NOSONAR
+        pass
+
+    def update_vote_counts(
+        self, post_id: str, likes: int = 0, dislikes: int = 0
+    ):  # NOSONAR
+        pass
+
     def get_post_list(
-        self, subforum: str | None = None, page: int = 0, page_limit=None
+        self,
+        subforum: str | None = None,
+        page: int = 0,
+        page_limit=None,
+        cursor: str | None = None,
+        username: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
     ) -> list[Post]:  # NOSONAR
         pass
 
+    def get_next_cursor(
+        self,
+        posts: list[Post],
+        page_limit=None,
+        sort: str = "new",
+        window: str = "all",
+    ) -> str | None:  # NOSONAR
+        pass
+
 
 class TestVoteManager(VoteManager):
     def get_vote(
@@ -359,3 +391,59 @@ class PostEndpointTestCase(BlueprintTestCase):
             method,
             [InvalidContentType, InvalidContent, NoVoteFoundError],
         )
+
+    def test_tags(self):
+        data = dict()
+
+        def get_tags(limit=None):
+            data["limit"] = limit
+            return [dict(tag="python", count=2)]
+
+        self.post_manager.get_tags = get_tags
+
+        with self.app.test_request_context(query_string=dict(limit="5")):
+            response = self.post_api.tags().get_json()
+
+        self.assertEqual(data["limit"], 5)
+        self.assertEqual(response, dict(tags=[dict(tag="python", count=2)]))
+
+    def test_search(self):
+        data = dict()
+
+        def search_posts(
+            query, subforum=None, page_limit=None, cursor=None, username=None
+        ):
+            data["query"] = query
+            data["subforum"] = subforum
+            data["cursor"] = cursor
+            return [dict(post_id="1")]
+
+        self.post_manager.search_posts = search_posts
+        self.post_manager.get_next_cursor = (
+            lambda posts, page_limit=None, sort="new", window="all": sort
+        )
+
+        with self.subTest("Successful request"):
+            with self.app.test_request_context(
+                query_string=dict(q="forum", subforum="Test", cursor="cursor")
+            ):
+                response = self.post_api.search().get_json()
+
+            self.assertEqual(
+                data, dict(query="forum", subforum="Test", cursor="cursor")
+            )
+            self.assertEqual(
+                response, dict(posts=[dict(post_id="1")], next_cursor="rank")
+            )
+
+        with self.subTest("Invalid search"):
+
+            def raise_e(*args, **kwargs):
+                raise InvalidSearchError("Search cannot be empty")
+
+            self.post_manager.search_posts = raise_e
+
+            with self.app.test_request_context():
+                response = self.post_api.search().get_json()
+
+            self.assertEqual(response["type"], "InvalidSearchError")
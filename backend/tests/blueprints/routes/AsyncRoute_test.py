@@ -0,0 +1,146 @@
+from backend.blueprints.routes.AsyncRoute import AsyncRoute
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
+from backend.data.managers.PostMananger import InvalidPageError, NoPostFoundError
+from backend.data.managers.SubForumManager import NoSubForumFoundError
+from backend.tests import async_wrapper
+from backend.tests.blueprints import BlueprintTestCase, setup_test_context
+from backend.tests.data.managers import TestAsyncModelFactory
+
+
+class AsyncRouteTestCase(BlueprintTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.post_manger = AsyncPostManager(TestAsyncModelFactory())
+        self.test_manager_factory.create_async_post_manager = lambda: self.post_manger
+
+        self.subforum_manager = AsyncSubForumManager(TestAsyncModelFactory())
+        self.test_manager_factory.create_async_subforum_manager = (
+            lambda: self.subforum_manager
+        )
+
+        self.async_route = AsyncRoute(manager_factory=self.test_manager_factory)
+
+        self.test_post_data = [
+            dict(title="Test Post", body="Test Post"),
+            dict(title="Test Post 2", body="Test Post 2"),
+        ]
+        self.test_info_data = dict(post_count=5, page_count=1, current_page=1)
+
+    def test_root(self):
+        with self.subTest("Invalid page number"):
+
+            def test():
+                def raise_e(*args, **kwargs):
+                    raise InvalidPageError()
+
+                self.post_manger.get_post_list = async_wrapper(raise_e)
+                self.subforum_manager.get_subforum_info = async_wrapper(
+                    lambda title=None, current_page=0, page_limit=None: {}
+                )
+
+                response = self.async_route.root().get_json()
+
+                self.assertEqual("InvalidPageError", response["type"])
+                self.assertIsInstance(response["error"], str)
+
+            setup_test_context(self.app, test)
+
+        with self.subTest("Successful request"):
+
+            def test():
+                self.post_manger.get_post_list = async_wrapper(
+                    lambda subforum=None, page=0, page_limit=None, cursor=None, username=None, sort="new", window="all", tags=None, tag_match="any": (
+                        self.test_post_data
+                    )
+                )
+                self.subforum_manager.get_subforum_info = async_wrapper(
+                    lambda title=None, current_page=0, page_limit=None: self.test_info_data
+                )
+
+                response = self.async_route.root().get_json()
+
+                self.assertEqual(self.test_post_data, response["posts"])
+                self.assertEqual(self.test_info_data, response["info"])
+                self.assertIsNone(response["next_cursor"])
+
+            setup_test_context(self.app, test)
+
+    def test_subforum(self):
+        with self.subTest("Invalid subforum"):
+
+            def test():
+                def raise_e(*args, **kwargs):
+                    raise NoSubForumFoundError()
+
+                self.subforum_manager.get_subforum_info = async_wrapper(raise_e)
+                self.post_manger.get_post_list = async_wrapper(
+                    lambda *args, **kwargs: []
+                )
+
+                response = self.async_route.subforum("Test_Subforum").get_json()
+
+                self.assertEqual("NoSubForumFoundError", response["type"])
+
+            setup_test_context(self.app, test)
+
+        with self.subTest("Successful request"):
+
+            def test():
+                data = dict()
+
+                def get_post_list(
+                    subforum=None,
+                    page=0,
+                    page_limit=None,
+                    cursor=None,
+                    username=None,
+                    sort="new",
+                    window="all",
+                    tags=None,
+                    tag_match="any",
+                ):
+                    data["subforum"] = subforum
+                    return self.test_post_data
+
+                self.post_manger.get_post_list = async_wrapper(get_post_list)
+                self.subforum_manager.get_subforum_info = async_wrapper(
+                    lambda title=None, current_page=0, page_limit=None: self.test_info_data
+                )
+
+                response = self.async_route.subforum("Test_Subforum").get_json()
+
+                self.assertEqual(data["subforum"], "Test_Subforum")
+                self.assertEqual(self.test_post_data, response["posts"])
+                self.assertEqual(self.test_info_data, response["info"])
+
+            setup_test_context(self.app, test)
+
+    def test_post(self):
+        with self.subTest("Invalid post"):
+
+            def test():
+                def raise_e(post_id, allow_stale=False):
+                    raise NoPostFoundError()
+
+                self.post_manger.get_post = async_wrapper(raise_e)
+
+                response = self.async_route.post("").get_json()
+
+                self.assertEqual("NoPostFoundError", response["type"])
+
+            setup_test_context(self.app, test)
+
+        with self.subTest("Post returned"):
+
+            def test():
+                self.post_manger.get_post = async_wrapper(
+                    lambda post_id, allow_stale=False: self.test_post_data[0]
+                )
+
+                response = self.async_route.post("").get_json()
+
+                self.assertEqual(self.test_post_data[0], response)
+
+            setup_test_context(self.app, test)
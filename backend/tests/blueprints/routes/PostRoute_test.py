@@ -1,4 +1,7 @@
+from datetime import datetime
+
 from backend.blueprints.routes.PostRoute import PostRoute
+from backend.constants import HTTP
 from backend.data.managers.PostMananger import NoPostFoundError
 from backend.tests.blueprints import BlueprintTestCase, setup_test_context
 from backend.tests.blueprints.api.PostAPI_test import TestPostManager
@@ -17,10 +20,10 @@ class PostRouteTestCase(BlueprintTestCase):
         with self.subTest("Invalid post"):
 
             def test():
-                def raise_e(post_id):
+                def raise_e(post_id, allow_stale=False):
                     raise NoPostFoundError()
 
-                self.post_manger.get_post = raise_e
+                self.post_manger.get_post_version = raise_e
 
                 response = self.post_route.post("").get_json()
 
@@ -37,10 +40,63 @@ class PostRouteTestCase(BlueprintTestCase):
             def test():
                 test_data = dict(title="Test Post", body="Test Post")
 
-                self.post_manger.get_post = lambda post_id: test_data
+                self.post_manger.get_post_version = (
+                    lambda post_id, allow_stale=False: test_data
+                )
+                self.post_manger.get_post = lambda post_id, allow_stale=False: test_data
 
                 response = self.post_route.post("").get_json()
 
                 self.assertEqual(test_data, response)
 
             setup_test_context(self.app, test)
+
+    def test_conditional_get(self):
+        post = dict(
+            post_id="id",
+            title="Test Post",
+            body="Test Post",
+            modified_date=datetime(2024, 1, 1),
+            likes=1,
+            dislikes=0,
+            locked=False,
+        )
+        reads = []
+
+        def get_post(post_id, allow_stale=False):
+            reads.append(post_id)
+            return dict(post)
+
+        self.post_manger.get_post = get_post
+        self.post_manger.get_post_version = lambda post_id, allow_stale=False: {
+            key: value for key, value in post.items() if key not in ("title", "body")
+        }
+
+        with self.app.test_request_context():
+            response = self.post_route.post("id")
+
+        etag, _ = response.get_etag()
+        self.assertIsNotNone(etag)
+        self.assertEqual(
+            datetime(2024, 1, 1), response.last_modified.replace(tzinfo=None)
+        )
+
+        with self.subTest("Unchanged post"):
+            with self.app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+                response = self.post_route.post("id")
+
+            self.assertEqual(HTTP.NOT_MODIFIED, response.status_code)
+            self.assertEqual(reads, ["id"], "Post only read for the first response")
+            self.assertEqual(
+                datetime(2024, 1, 1), response.last_modified.replace(tzinfo=None)
+            )
+
+        with self.subTest("Voted on post"):
+            post["likes"] = 2
+
+            with self.app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+                response = self.post_route.post("id")
+
+            self.assertEqual(HTTP.SUCCESS, response.status_code)
+            self.assertEqual(2, response.get_json()["likes"])
+            self.assertNotEqual(etag, response.get_etag()[0])
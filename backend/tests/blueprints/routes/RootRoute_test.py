@@ -1,4 +1,5 @@
 from backend.blueprints.routes.RootRoute import RootRoute
+from backend.constants import HTTP
 from backend.data.managers.PostMananger import InvalidPageError
 from backend.tests.blueprints import BlueprintTestCase, setup_test_context
 from backend.tests.blueprints.api.PostAPI_test import TestPostManager
@@ -23,7 +24,17 @@ class RootRouteTestCase(BlueprintTestCase):
         with self.subTest("Invalid page number"):
 
             def test():
-                def raise_e(subforum, page=0, page_limit=None):
+                def raise_e(
+                    subforum=None,
+                    page=0,
+                    page_limit=None,
+                    cursor=None,
+                    username=None,
+                    sort="new",
+                    window="all",
+                    tags=None,
+                    tag_match="any",
+                ):
                     raise InvalidPageError()
 
                 self.post_manger.get_post_list = raise_e
@@ -48,8 +59,8 @@ class RootRouteTestCase(BlueprintTestCase):
 
                 test_info_data = dict(post_count=5, page_count=1, current_page=1)
 
-                self.post_manger.get_post_list = (
-                    lambda subforum, page=0, page_limit=None: test_post_data
+                self.post_manger.get_post_list = lambda subforum=None, page=0, page_limit=None, cursor=None, username=None, sort="new", window="all", tags=None, tag_match="any": (
+                    test_post_data
                 )
                 self.subforum_manager.get_subforum_info = (
                     lambda title=None, current_page=0, page_limit=None: test_info_data
@@ -59,5 +70,84 @@ class RootRouteTestCase(BlueprintTestCase):
 
                 self.assertEqual(test_post_data, response["posts"])
                 self.assertEqual(test_info_data, response["info"])
+                self.assertIsNone(response["next_cursor"])
 
             setup_test_context(self.app, test)
+
+        with self.subTest("Cursor is passed through"):
+            data = dict()
+
+            def get_post_list(
+                subforum=None,
+                page=0,
+                page_limit=None,
+                cursor=None,
+                username=None,
+                sort="new",
+                window="all",
+                tags=None,
+                tag_match="any",
+            ):
+                data["cursor"] = cursor
+                data["sort"] = sort
+                data["window"] = window
+                data["tags"] = tags
+                data["tag_match"] = tag_match
+                return []
+
+            self.post_manger.get_post_list = get_post_list
+            self.post_manger.get_next_cursor = (
+                lambda posts, page_limit=None, sort="new", window="all": "next"
+            )
+            self.subforum_manager.get_subforum_info = (
+                lambda title=None, current_page=0, page_limit=None: {}
+            )
+
+            with self.app.test_request_context(
+                query_string=dict(
+                    cursor="cursor", sort="top", t="week", tag="a,b", match="all"
+                )
+            ):
+                response = self.root_route.root().get_json()
+
+            self.assertEqual(data["cursor"], "cursor")
+            self.assertEqual(data["sort"], "top")
+            self.assertEqual(data["window"], "week")
+            self.assertEqual(data["tags"], ["a", "b"])
+            self.assertEqual(data["tag_match"], "all")
+            self.assertEqual(response["next_cursor"], "next")
+
+    def test_conditional_get(self):
+        posts = [dict(post_id="id", likes=0, dislikes=0, my_vote=None)]
+        info = dict(post_count=1, page_count=1, current_page=0)
+
+        self.post_manger.get_post_list = lambda *args, **kwargs: [
+            dict(post) for post in posts
+        ]
+        self.post_manger.get_next_cursor = lambda posts, **kwargs: None
+        self.subforum_manager.get_subforum_info = lambda *args, **kwargs: dict(info)
+
+        with self.app.test_request_context():
+            etag, _ = self.root_route.root().get_etag()
+
+        def request():
+            with self.app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+                return self.root_route.root()
+
+        with self.subTest("Unchanged listing"):
+            response = request()
+
+            self.assertEqual(HTTP.NOT_MODIFIED, response.status_code)
+            self.assertTrue(response.cache_control.private, "Holds the user's votes")
+            self.assertIn("Cookie", response.vary)
+
+        with self.subTest("User voted on a post"):
+            posts[0]["my_vote"] = True
+
+            self.assertEqual(HTTP.SUCCESS, request().status_code)
+
+        with self.subTest("Post added"):
+            posts[0]["my_vote"] = None
+            info["post_count"] = 2
+
+            self.assertEqual(HTTP.SUCCESS, request().status_code)
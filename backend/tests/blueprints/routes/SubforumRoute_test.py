@@ -1,4 +1,5 @@
 from backend.blueprints.routes.SubforumRoute import SubforumRoute
+from backend.constants import HTTP
 from backend.data.managers.PostMananger import InvalidPageError
 from backend.data.managers.SubForumManager import NoSubForumFoundError
 from backend.tests.blueprints import (
@@ -55,8 +56,8 @@ class SubForumRouteTestCase(BlueprintTestCase):
 
                 test_info_data = dict(post_count=5, page_count=1, current_page=1)
 
-                self.post_manger.get_post_list = (
-                    lambda subforum, page=0, page_limit=None: test_post_data
+                self.post_manger.get_post_list = lambda subforum=None, page=0, page_limit=None, cursor=None, username=None, sort="new", window="all", tags=None, tag_match="any": (
+                    test_post_data
                 )
                 self.subforum_manager.get_subforum_info = (
                     lambda title=None, current_page=0, page_limit=None: test_info_data
@@ -66,5 +67,65 @@ class SubForumRouteTestCase(BlueprintTestCase):
 
                 self.assertEqual(test_post_data, response["posts"])
                 self.assertEqual(test_info_data, response["info"])
+                self.assertIsNone(response["next_cursor"])
 
             setup_test_context(self.app, test)
+
+        with self.subTest("Cursor is passed through"):
+            data = dict()
+
+            def get_post_list(
+                subforum=None,
+                page=0,
+                page_limit=None,
+                cursor=None,
+                username=None,
+                sort="new",
+                window="all",
+                tags=None,
+                tag_match="any",
+            ):
+                data["cursor"] = cursor
+                return []
+
+            self.post_manger.get_post_list = get_post_list
+            self.post_manger.get_next_cursor = (
+                lambda posts, page_limit=None, sort="new", window="all": "next"
+            )
+            self.subforum_manager.get_subforum_info = (
+                lambda title=None, current_page=0, page_limit=None: {}
+            )
+
+            with self.app.test_request_context(query_string=dict(cursor="cursor")):
+                response = self.subforum_route.subforum().get_json()
+
+            self.assertEqual(data["cursor"], "cursor")
+            self.assertEqual(response["next_cursor"], "next")
+
+    def test_conditional_get(self):
+        posts = [dict(post_id="id", likes=0, dislikes=0)]
+
+        self.post_manger.get_post_list = lambda *args, **kwargs: [
+            dict(post) for post in posts
+        ]
+        self.post_manger.get_next_cursor = lambda posts, **kwargs: None
+        self.subforum_manager.get_subforum_info = lambda *args, **kwargs: {}
+
+        with self.app.test_request_context():
+            etag, _ = self.subforum_route.subforum("title").get_etag()
+
+        def request():
+            with self.app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+                return self.subforum_route.subforum("title")
+
+        with self.subTest("Unchanged listing"):
+            response = request()
+
+            self.assertEqual(HTTP.NOT_MODIFIED, response.status_code)
+            self.assertTrue(response.cache_control.private, "Holds the user's votes")
+            self.assertIn("Cookie", response.vary)
+
+        with self.subTest("Post voted on"):
+            posts[0]["dislikes"] = 1
+
+            self.assertEqual(HTTP.SUCCESS, request().status_code)
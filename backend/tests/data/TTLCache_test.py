@@ -0,0 +1,53 @@
+import unittest
+from unittest import mock
+
+from backend.data import TTLCache as tc
+
+
+class TTLCacheTestCase(unittest.TestCase):
+    def test_get(self):
+        cache = tc.TTLCache(maxsize=2, ttl=10)
+
+        with self.subTest("Missing"):
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("a", 1), 1)
+
+        with self.subTest("Set"):
+            cache.set("a", "A")
+            self.assertEqual(cache.get("a"), "A")
+
+        with self.subTest("Hits and misses are counted"):
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(cache.misses, 2)
+
+        with self.subTest("Delete"):
+            cache.delete("a")
+            self.assertIsNone(cache.get("a"))
+
+    def test_expiry(self):
+        cache = tc.TTLCache(maxsize=2, ttl=10)
+
+        with mock.patch.object(tc.time, "monotonic", return_value=100):
+            cache.set("a", "A")
+
+        with mock.patch.object(tc.time, "monotonic", return_value=109.9):
+            self.assertEqual(cache.get("a"), "A")
+
+        with mock.patch.object(tc.time, "monotonic", return_value=110):
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(len(cache), 0, "Expired entries are dropped")
+
+    def test_eviction(self):
+        cache = tc.TTLCache(maxsize=2, ttl=10)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"), "Least recently used is evicted")
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("c"), "C")
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,82 @@
+import sys
+import unittest
+
+from backend.data.databases.AsyncMongoDatabase import (
+    AsyncMongoDatabase,
+    UnsupportedWorkerError,
+    gevent_patched,
+)
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+
+
+class TestMonkey:
+    """Stands in for gevent.monkey with threading patched."""
+
+    @staticmethod
+    def is_module_patched(name: str) -> bool:
+        return name == "threading"
+
+
+class TestMongoDatabase:
+    """Stands in for the regular Mongo database, recording its calls."""
+
+    def __init__(self, client=None):
+        self.client = client
+        self.calls = []
+
+    def get_client(self):
+        return self.client
+
+    def connect(
+        self, hostname: str, port=None, username=None, password=None, **options
+    ):
+        self.client = object()
+        self.calls.append(("connect", hostname, port, options))
+
+    def setup(self):
+        self.calls.append(("setup",))
+
+
+class AsyncMongoDatabaseTestCase(unittest.TestCase):
+    def test_gevent_patched(self):
+        monkey = sys.modules.pop("gevent.monkey", None)
+        # Cleanups run last in first out, the stand-in goes before the original returns
+        if monkey is not None:
+            self.addCleanup(sys.modules.__setitem__, "gevent.monkey", monkey)
+        self.addCleanup(sys.modules.pop, "gevent.monkey", None)
+
+        self.assertFalse(gevent_patched(), "Not imported, not patched")
+
+        sys.modules["gevent.monkey"] = TestMonkey
+        self.assertTrue(gevent_patched())
+
+        with self.assertRaises(UnsupportedWorkerError):
+            AsyncMongoDatabase().connect("localhost")
+
+    def test_setup(self):
+        cached = DatabaseFactory._cache.pop("mongo", None)
+        if cached is not None:
+            self.addCleanup(DatabaseFactory._cache.__setitem__, "mongo", cached)
+        self.addCleanup(DatabaseFactory._cache.pop, "mongo", None)
+
+        database = AsyncMongoDatabase()
+        database._AsyncMongoDatabase__connection = (
+            "localhost",
+            27017,
+            None,
+            None,
+            dict(min_pool_size=1),
+        )
+
+        with self.subTest("Set up as the DATABASE_TYPE"):
+            mongo = DatabaseFactory._cache["mongo"] = TestMongoDatabase(object())
+            database.setup()
+            self.assertEqual(mongo.calls, [])
+
+        with self.subTest("Connected and set up otherwise"):
+            mongo = DatabaseFactory._cache["mongo"] = TestMongoDatabase()
+            database.setup()
+            self.assertEqual(
+                mongo.calls,
+                [("connect", "localhost", 27017, dict(min_pool_size=1)), ("setup",)],
+            )
@@ -0,0 +1,142 @@
+import unittest
+
+from pymongo import IndexModel, WriteConcern
+from pymongo.errors import OperationFailure
+from pymongo.read_preferences import Nearest, SecondaryPreferred
+
+from backend.data.databases.MongoDatabase import (
+    DUPLICATE_KEY,
+    IndexBuildError,
+    MongoDatabase,
+    make_body_storage,
+    make_compressors,
+    make_read_preference,
+    make_write_concerns,
+    snappy,
+    zstd,
+)
+
+
+class TestCollection:
+    """Collection whose first `failures` index builds find duplicate keys."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+
+    def create_indexes(self, indexes: list[IndexModel]) -> list[str]:
+        if self.failures > 0:
+            self.failures -= 1
+            raise OperationFailure("Duplicate key", code=DUPLICATE_KEY)
+
+        return [index.document["name"] for index in indexes]
+
+
+class TestModel:
+    removed = []
+
+    def remove_duplicates(self, collection_name: str) -> int:
+        TestModel.removed.append(collection_name)
+
+        return 1
+
+
+class MongoDatabaseTestCase(unittest.TestCase):
+    def test_make_read_preference(self):
+        self.assertIsNone(make_read_preference(None), "Unset stays on the primary")
+        self.assertIsNone(make_read_preference("primary"))
+
+        self.assertEqual(
+            make_read_preference("secondaryPreferred"), SecondaryPreferred()
+        )
+        self.assertEqual(
+            make_read_preference("nearest", 120), Nearest(max_staleness=120)
+        )
+
+        with self.assertRaises(ValueError):
+            make_read_preference("secondaryPrefered")
+
+    def test_make_compressors(self):
+        self.assertIsNone(make_compressors(None), "Uncompressed by default")
+        self.assertIsNone(make_compressors(""))
+
+        self.assertEqual(make_compressors("zlib"), ["zlib"])
+
+        with self.assertRaises(ValueError):
+            make_compressors("zlib,lz4")
+
+        for compressor, library in (("zstd", zstd), ("snappy", snappy)):
+            with self.subTest(compressor):
+                value = f"{compressor}, zlib"
+
+                if library is None:
+                    with self.assertRaisesRegex(ValueError, compressor):
+                        make_compressors(value)
+                else:
+                    self.assertEqual(make_compressors(value), [compressor, "zlib"])
+
+    def test_make_body_storage(self):
+        self.assertEqual(make_body_storage(None), "inline", "Inline by default")
+        self.assertEqual(make_body_storage("split"), "split")
+
+        with self.assertRaises(ValueError):
+            make_body_storage("separate")
+
+    def test_stale_reads(self):
+        database = MongoDatabase()
+        database._MongoDatabase__stale_read_preference = SecondaryPreferred()
+
+        self.assertIsNone(database.get_read_preference(), "Primary by default")
+
+        with database.stale_reads():
+            self.assertEqual(database.get_read_preference(), SecondaryPreferred())
+
+        self.assertIsNone(database.get_read_preference(), "Reset on exit")
+
+    def test_make_write_concerns(self):
+        write_concerns = make_write_concerns()
+        self.assertEqual(write_concerns["user_create"], WriteConcern(w="majority"))
+        self.assertEqual(write_concerns["subforum_delete"], WriteConcern(w="majority"))
+        self.assertEqual(write_concerns["vote"], WriteConcern(w=1))
+        self.assertIsNone(write_concerns["post"], "Client default")
+
+        write_concerns = make_write_concerns(dict(vote_counter=0, post="majority"))
+        self.assertFalse(write_concerns["vote_counter"].acknowledged)
+        self.assertEqual(write_concerns["post"], WriteConcern(w="majority"))
+
+        with self.assertRaises(ValueError, msg="Upserts need acknowledgement"):
+            make_write_concerns(dict(vote=0))
+
+        with self.assertRaises(ValueError, msg="Unknown kind of write"):
+            make_write_concerns(dict(votes=1))
+
+    def test_build_unique_indexes(self):
+        database = MongoDatabase()
+        build = database._MongoDatabase__build_unique_indexes
+        indexes = [IndexModel("key", unique=True)]
+        MongoDatabase._index_models["test_duplicates"] = TestModel
+        self.addCleanup(MongoDatabase._index_models.pop, "test_duplicates")
+
+        with self.subTest("Built"):
+            database._MongoDatabase__db = dict(test_duplicates=TestCollection(0))
+            TestModel.removed = []
+
+            build("test_duplicates", indexes)
+            self.assertEqual(TestModel.removed, [], "Nothing to remove")
+
+        with self.subTest("Built once duplicates are removed"):
+            database._MongoDatabase__db = dict(test_duplicates=TestCollection(1))
+
+            build("test_duplicates", indexes)
+            self.assertEqual(TestModel.removed, ["test_duplicates"])
+
+        with self.subTest("Duplicates remain"):
+            database._MongoDatabase__db = dict(test_duplicates=TestCollection(2))
+
+            with self.assertRaises(IndexBuildError):
+                build("test_duplicates", indexes)
+
+        with self.subTest("No model to remove duplicates"):
+            database._MongoDatabase__db = dict(test_users=TestCollection(1))
+
+            with self.assertRaises(IndexBuildError):
+                build("test_users", indexes)
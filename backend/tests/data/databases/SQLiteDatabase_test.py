@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from backend.data.databases.SQLiteDatabase import (
+    SQLiteDatabase,
+    from_timestamp,
+    to_timestamp,
+)
+
+
+class SQLiteDatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = SQLiteDatabase()
+        self.database.connect(os.path.join(self.directory.name, "jafa.db"))
+
+        with self.database.unit_of_work(), self.database.connection() as connection:
+            connection.execute("CREATE TABLE items (name TEXT PRIMARY KEY)")
+
+    def tearDown(self):
+        self.database.disconnect()
+        self.directory.cleanup()
+
+    def names(self) -> list[str]:
+        with self.database.connection() as connection:
+            return [row["name"] for row in connection.execute("SELECT * FROM items")]
+
+    def test_timestamps(self):
+        date = datetime(2024, 1, 2, 3, 4, 5)
+
+        self.assertEqual(to_timestamp(date), "2024-01-02 03:04:05.000000")
+        self.assertEqual(from_timestamp(to_timestamp(date)), date)
+        self.assertIsNone(to_timestamp(None))
+        self.assertEqual(
+            to_timestamp(date.replace(tzinfo=timezone(timedelta(hours=2)))),
+            "2024-01-02 01:04:05.000000",
+            "Aware dates are stored in UTC",
+        )
+        self.assertLess(
+            to_timestamp(date), to_timestamp(date + timedelta(microseconds=1))
+        )
+
+    def test_wal(self):
+        with self.database.connection() as connection:
+            mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(mode, "wal")
+
+    def test_unit_of_work(self):
+        with self.subTest("Committed"):
+            with self.database.unit_of_work():
+                with self.database.connection() as connection:
+                    connection.execute("INSERT INTO items VALUES ('a')")
+
+                # Nested units and connections join the one in progress
+                with self.database.unit_of_work(), self.database.connection() as inner:
+                    self.assertIs(inner, connection)
+                    inner.execute("INSERT INTO items VALUES ('b')")
+
+            self.assertEqual(self.names(), ["a", "b"])
+
+        with self.subTest("Rolled back"):
+            with self.assertRaises(ValueError):
+                with self.database.unit_of_work():
+                    with self.database.connection() as connection:
+                        connection.execute("INSERT INTO items VALUES ('c')")
+
+                    raise ValueError()
+
+            self.assertEqual(self.names(), ["a", "b"])
+
+    def test_connection(self):
+        with self.database.connection() as first:
+            with self.database.connection() as second:
+                self.assertIsNot(first, second, "Never shared while checked out")
+
+        with self.database.connection() as third:
+            self.assertIn(third, (first, second), "Reused once checked in")
@@ -0,0 +1,162 @@
+import unittest
+from datetime import datetime
+
+import backend.data.managers.PostMananger as pm
+from backend.data.managers.AsyncPostManager import AsyncPostManager
+from backend.data.models.AsyncPostModel import AsyncPostModel
+from backend.data.models.AsyncVoteModel import AsyncVoteModel
+from backend.data.models.PostModel import Post, PostCursor
+from backend.data.models.VoteModel import BaseVote, ContentType, Vote
+from backend.tests import async_wrapper, set_data_wrapper
+from backend.tests.data.managers import TestAsyncModelFactory
+
+
+class TestAsyncPostModel(AsyncPostModel):
+    async def get_by_post_id(self, post_id: str) -> Post | None:  # NOSONAR
+        pass
+
+    async def post_exists(self, post_id: str) -> bool:  # NOSONAR
+        pass
+
+    async def get_posts(  # NOSONAR
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        pass
+
+    async def get_posts_after(  # NOSONAR
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        pass
+
+    async def get_count(self, subforum: str | None = None) -> int:  # NOSONAR
+        pass
+
+
+class TestAsyncVoteModel(AsyncVoteModel):
+    async def get_vote(self, data: BaseVote) -> Vote | None:  # NOSONAR
+        pass
+
+    async def get_votes_by_ids(  # NOSONAR
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        pass
+
+
+class AsyncPostManagerTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.post_model = TestAsyncPostModel()
+        self.vote_model = TestAsyncVoteModel()
+
+        test_model_factory = TestAsyncModelFactory()
+        test_model_factory.create_post_model = lambda: self.post_model
+        test_model_factory.create_vote_model = lambda: self.vote_model
+        self.post_manager = AsyncPostManager(test_model_factory)
+        self.data = {}
+
+    async def test_get_post(self):
+        self.post_model.get_by_post_id = async_wrapper(lambda post_id: None)
+        with self.assertRaises(pm.NoPostFoundError, msg="Nonexistant post"):
+            await self.post_manager.get_post("")
+
+        test_data = dict(op="Test", title="Test Post", body="Test Body")
+
+        self.post_model.get_by_post_id = async_wrapper(lambda post_id: test_data)
+        self.assertEqual(
+            await self.post_manager.get_post(""), test_data, "Post data is unmodified"
+        )
+
+    async def test_get_post_list(self):
+        with self.subTest("Test for OverflowError"):
+
+            def raise_overflow(limit, skip, subforum, sort, window, tags, tag_match):
+                raise OverflowError()
+
+            self.post_model.get_posts = async_wrapper(raise_overflow)
+
+            with self.assertRaises(pm.InvalidPageError):
+                await self.post_manager.get_post_list("")
+
+        self.post_model.get_posts = async_wrapper(set_data_wrapper(self.data, []))
+        with self.subTest("Pagelimit of 10, page 50"):
+            await self.post_manager.get_post_list(
+                subforum="Test_Subforum", page=50, page_limit=10
+            )
+
+            self.assertEqual(self.data["args"], (10, 500, "Test_Subforum"))
+
+    async def test_get_post_list_cursor(self):
+        test_posts = [
+            dict(post_id=str(i), creation_date=datetime(2024, 1, 1, 0, 0, i))
+            for i in range(10)
+        ]
+
+        with self.subTest("No cursor on a partial page"):
+            self.assertIsNone(
+                self.post_manager.get_next_cursor(test_posts, page_limit=20)
+            )
+
+        with self.subTest("Cursor round trip"):
+            cursor = self.post_manager.get_next_cursor(test_posts, page_limit=10)
+
+            self.post_model.get_posts_after = async_wrapper(
+                set_data_wrapper(self.data, [])
+            )
+            await self.post_manager.get_post_list(
+                subforum="Test_Subforum", page_limit=10, cursor=cursor
+            )
+
+            self.assertEqual(
+                self.data["args"],
+                (
+                    10,
+                    dict(creation_date=test_posts[-1]["creation_date"], post_id="9"),
+                    "Test_Subforum",
+                ),
+            )
+
+        with self.subTest("Invalid cursor"):
+            with self.assertRaises(pm.InvalidCursorError):
+                await self.post_manager.get_post_list(cursor="garbage")
+
+    async def test_get_post_list_votes(self):
+        test_posts = [dict(post_id="1"), dict(post_id="2"), dict(post_id="3")]
+        self.post_model.get_posts = async_wrapper(
+            lambda limit, skip, subforum, sort, window, tags, tag_match: [
+                post.copy() for post in test_posts
+            ]
+        )
+
+        with self.subTest("Anonymous"):
+            self.vote_model.get_votes_by_ids = async_wrapper(
+                lambda *args: self.fail("Votes should not be queried")
+            )
+
+            posts = await self.post_manager.get_post_list()
+            self.assertEqual([post["my_vote"] for post in posts], [None] * 3)
+
+        with self.subTest("Logged in, single query"):
+            self.vote_model.get_votes_by_ids = async_wrapper(
+                set_data_wrapper(self.data, {"1": True, "3": False})
+            )
+
+            posts = await self.post_manager.get_post_list(username="test")
+
+            self.assertEqual(
+                self.data["args"],
+                ("test", ["1", "2", "3"], str(ContentType.POST)),
+            )
+            self.assertEqual([post["my_vote"] for post in posts], [True, None, False])
@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from datetime import datetime
+
+import backend.data.managers.SubForumManager as sfm
+from backend.data.managers.AsyncSubForumManager import AsyncSubForumManager
+from backend.data.models.AsyncSubForumModel import AsyncSubForumModel
+from backend.data.models.SubForumModel import SubForum
+from backend.tests import async_wrapper
+from backend.tests.data.managers import TestAsyncModelFactory
+from backend.tests.data.managers.AsyncPostManager_test import TestAsyncPostModel
+
+
+class TestAsyncSubForumModel(AsyncSubForumModel):
+    async def get_subforum_by_title(self, title: str) -> SubForum | None:  # NOSONAR
+        pass
+
+
+class AsyncSubForumManagerTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.subforum_model = TestAsyncSubForumModel()
+        self.post_model = TestAsyncPostModel()
+
+        test_model_factory = TestAsyncModelFactory()
+        test_model_factory.create_subforum_model = lambda: self.subforum_model
+        test_model_factory.create_post_model = lambda: self.post_model
+        self.subforum_manager = AsyncSubForumManager(test_model_factory)
+
+    async def test_get_subforum(self):
+        self.subforum_model.get_subforum_by_title = async_wrapper(lambda title: None)
+        with self.assertRaises(sfm.NoSubForumFoundError):
+            await self.subforum_manager.get_subforum("")
+
+    async def test_get_subforum_info(self):
+        self.subforum_model.get_subforum_by_title = async_wrapper(lambda title: None)
+        self.post_model.get_count = async_wrapper(lambda title=None: 0)
+
+        with self.assertRaises(sfm.NoSubForumFoundError, msg="Invalid subforum"):
+            await self.subforum_manager.get_subforum_info("")
+
+        test_data = dict(
+            creator="test",
+            title="Test_SubForum",
+            description="Test description",
+            creation_date=datetime.now(),
+        )
+
+        self.subforum_model.get_subforum_by_title = async_wrapper(
+            lambda title: test_data
+        )
+        self.post_model.get_count = async_wrapper(lambda title=None: 100)
+        self.assertEqual(
+            await self.subforum_manager.get_subforum_info(
+                "", current_page=0, page_limit=9
+            ),
+            test_data | dict(post_count=100, page_count=12, current_page=0),
+            "Subforum with 100 posts, 9 page limit",
+        )
+
+        self.assertEqual(
+            await self.subforum_manager.get_subforum_info(
+                None, current_page=0, page_limit=9
+            ),
+            dict(post_count=100, page_count=12, current_page=0),
+            "Subforum is None, with 100 posts, 9 page limit",
+        )
+
+    async def test_get_subforum_info_concurrent(self):
+        started = asyncio.Event()
+
+        async def get_subforum_by_title(title):
+            # Only completes if the count is read at the same time
+            await asyncio.wait_for(started.wait(), 1)
+            return dict(title=title)
+
+        async def get_count(title=None):
+            started.set()
+            return 0
+
+        self.subforum_model.get_subforum_by_title = get_subforum_by_title
+        self.post_model.get_count = get_count
+
+        info = await self.subforum_manager.get_subforum_info("Test_SubForum")
+        self.assertEqual(info["title"], "Test_SubForum")
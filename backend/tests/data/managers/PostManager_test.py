@@ -1,10 +1,23 @@
 import sys
 import unittest
+from contextlib import contextmanager
 from datetime import datetime
 
 import backend.data.managers.PostMananger as pm
+from backend.data.EntityCache import EntityCache
 from backend.data.managers.SubForumManager import NoSubForumFoundError
-from backend.data.models.PostModel import BasePost, CreatePost, Post, PostModel
+from backend.data.models.VoteModel import ContentType
+from backend.data.models.PostModel import (
+    BasePost,
+    CreatePost,
+    ImportPost,
+    Post,
+    PostCursor,
+    PostModel,
+    PostVersion,
+    PostVoteCounts,
+    TagCount,
+)
 from backend.tests import assertTimeInRange
 from backend.tests.data.managers import TestModelFactory
 from backend.tests.data.managers.VoteManager_test import TestVoteModel
@@ -18,6 +31,15 @@ class TestPostModel(PostModel):
     def get_by_post_id(self, post_id: str) -> Post | None:  # NOSONAR
         pass
 
+    def post_exists(self, post_id: str) -> bool:  # NOSONAR
+        pass
+
+    def get_vote_counts(self, post_id: str) -> PostVoteCounts | None:  # NOSONAR
+        pass
+
+    def get_post_version(self, post_id: str) -> PostVersion | None:  # NOSONAR
+        pass
+
     def delete_by_post_id(self, post_id: str) -> bool:  # NOSONAR
         pass
 
@@ -27,6 +49,11 @@ class TestPostModel(PostModel):
     def edit_post(self, post_id: str, data: BasePost) -> bool:  # NOSONAR
         pass
 
+    def increment_votes(  # NOSONAR
+        self, post_id: str, likes: int = 0, dislikes: int = 0
+    ) -> bool:
+        pass
+
     def lock_post(self, post_id: str) -> bool:  # NOSONAR
         pass
 
@@ -34,13 +61,65 @@ class TestPostModel(PostModel):
         pass
 
     def get_posts(  # NOSONAR
-        self, limit: int, skip: int, subforum: str | None = None
+        self,
+        limit: int,
+        skip: int,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
+    ) -> list[Post]:
+        pass
+
+    def get_posts_after(  # NOSONAR
+        self,
+        limit: int,
+        cursor: PostCursor | None,
+        subforum: str | None = None,
+        sort: str = "new",
+        window: str = "all",
+        tags: list[str] | None = None,
+        tag_match: str = "any",
     ) -> list[Post]:
         pass
 
     def get_count(self, subforum: str | None = None) -> int:  # NOSONAR
         pass
 
+    def search_posts(  # NOSONAR
+        self,
+        query: str,
+        limit: int,
+        cursor: PostCursor | None = None,
+        subforum: str | None = None,
+    ) -> list[Post]:
+        pass
+
+    def reconcile_counts(self) -> int:  # NOSONAR
+        pass
+
+    def normalize_stored_tags(self) -> int:  # NOSONAR
+        pass
+
+    def get_tags(self, limit: int) -> list[TagCount]:  # NOSONAR
+        pass
+
+    def recompute_scores(self) -> int:  # NOSONAR
+        pass
+
+    def refresh_rankings(self) -> int:  # NOSONAR
+        pass
+
+    def import_posts(self, posts: list[ImportPost]) -> int:  # NOSONAR
+        pass
+
+    def get_existing_post_ids(self, post_ids: list[str]) -> set[str]:  # NOSONAR
+        pass
+
+    def add_vote_counts(self, counts: list[PostVoteCounts]) -> int:  # NOSONAR
+        pass
+
 
 class PostManagerTestCase(unittest.TestCase):
     def setUp(self):
@@ -226,10 +305,10 @@ class PostManagerTestCase(unittest.TestCase):
             )
 
             # Limit
-            test_data["tags"] = ["T"] * (pm.TAGS_LIMIT - 1)
+            test_data["tags"] = [f"t{i}" for i in range(pm.TAGS_LIMIT - 1)]
             test_post_creation("BOUNDARY: Tags = TAGS_LIMIT - 1")
 
-            test_data["tags"] = ["T"] * (pm.TAGS_LIMIT)
+            test_data["tags"] = [f"t{i}" for i in range(pm.TAGS_LIMIT)]
             test_post_creation("BOUNDARY: Tags = TAGS_LIMIT")
 
             with self.assertRaises(
@@ -246,10 +325,10 @@ class PostManagerTestCase(unittest.TestCase):
                 )
 
             # Length
-            test_data["tags"] = ["T" * (pm.TAG_MAX - 1)]
+            test_data["tags"] = ["t" * (pm.TAG_MAX - 1)]
             test_post_creation("BOUNDARY: Tags = TAG_MAX - 1")
 
-            test_data["tags"] = ["T" * (pm.TAG_MAX)]
+            test_data["tags"] = ["t" * (pm.TAG_MAX)]
             test_post_creation("BOUNDARY: Tags = TAG_MAX")
 
             with self.assertRaises(
@@ -288,11 +367,37 @@ class PostManagerTestCase(unittest.TestCase):
                     tags=test_data["tags"],
                 )
 
-            test_data["tags"] = ["   T   ", "           T   ", "   T      "]
+            test_data["tags"] = ["   a   ", "           b   ", "   c      "]
             compare_data = test_data.copy()
-            compare_data["tags"] = ["T", "T", "T"]
+            compare_data["tags"] = ["a", "b", "c"]
             test_post_creation("Strip spaces", compare_data=compare_data)
 
+            test_data["tags"] = ["Python", "python", " PYTHON ", "Flask"]
+            compare_data = test_data.copy()
+            compare_data["tags"] = ["python", "flask"]
+            test_post_creation("Lowercase and deduplicate", compare_data=compare_data)
+
+        with self.subTest("Post is created in a unit of work"):
+            calls = []
+
+            @contextmanager
+            def unit_of_work():
+                calls.append("begin")
+                yield
+                calls.append("commit")
+
+            self.post_manager.model_factory.unit_of_work = unit_of_work
+            self.post_model.create_post = lambda data: calls.append("create_post")
+
+            self.post_manager.create_post(
+                op=test_data["op"],
+                subforum=test_data["subforum"],
+                title=test_data["title"],
+                body=test_data["body"],
+            )
+
+            self.assertEqual(calls, ["begin", "create_post", "commit"])
+
     def test_edit_post(self):
         self.post_model.edit_post = set_data_wrapper(self.data)
         self.post_model.get_by_post_id = lambda post_id: None
@@ -470,10 +575,10 @@ class PostManagerTestCase(unittest.TestCase):
             )
 
             # Limit
-            test_data["tags"] = ["T"] * (pm.TAGS_LIMIT - 1)
+            test_data["tags"] = [f"t{i}" for i in range(pm.TAGS_LIMIT - 1)]
             test_post_creation("BOUNDARY: Tags = TAGS_LIMIT - 1")
 
-            test_data["tags"] = ["T"] * (pm.TAGS_LIMIT)
+            test_data["tags"] = [f"t{i}" for i in range(pm.TAGS_LIMIT)]
             test_post_creation("BOUNDARY: Tags = TAGS_LIMIT")
 
             with self.assertRaises(
@@ -490,10 +595,10 @@ class PostManagerTestCase(unittest.TestCase):
                 )
 
             # Length
-            test_data["tags"] = ["T" * (pm.TAG_MAX - 1)]
+            test_data["tags"] = ["t" * (pm.TAG_MAX - 1)]
             test_post_creation("BOUNDARY: Tags = TAG_MAX - 1")
 
-            test_data["tags"] = ["T" * (pm.TAG_MAX)]
+            test_data["tags"] = ["t" * (pm.TAG_MAX)]
             test_post_creation("BOUNDARY: Tags = TAG_MAX")
 
             with self.assertRaises(
@@ -532,10 +637,14 @@ class PostManagerTestCase(unittest.TestCase):
                     tags=test_data["tags"],
                 )
 
-            test_data["tags"] = ["   T   ", "           T   ", "   T      "]
-            compare_data = dict(tags=["T", "T", "T"])
+            test_data["tags"] = ["   a   ", "           b   ", "   c      "]
+            compare_data = dict(tags=["a", "b", "c"])
             test_post_creation("Strip spaces", compare_data=compare_data)
 
+            test_data["tags"] = ["Python", "python", " PYTHON ", "Flask"]
+            compare_data = dict(tags=["python", "flask"])
+            test_post_creation("Lowercase and deduplicate", compare_data=compare_data)
+
     def test_delete_post(self):
         self.post_model.get_by_post_id = lambda post_id: None
         with self.assertRaises(pm.NoPostFoundError, msg="Nonexistant post"):
@@ -562,6 +671,29 @@ class PostManagerTestCase(unittest.TestCase):
 
             self.assertTrue(test_data["called"])
 
+        with self.subTest("Votes and post are deleted in one unit of work"):
+            calls = []
+
+            @contextmanager
+            def unit_of_work():
+                calls.append("begin")
+                yield
+                calls.append("commit")
+
+            self.post_manager.model_factory.unit_of_work = unit_of_work
+            self.vote_model.clear_votes_by_id = lambda content_id: calls.append(
+                "clear_votes_by_id"
+            )
+            self.post_model.delete_by_post_id = lambda post_id: calls.append(
+                "delete_by_post_id"
+            )
+
+            self.post_manager.delete_post(test_data["op"], "")
+
+            self.assertEqual(
+                calls, ["begin", "clear_votes_by_id", "delete_by_post_id", "commit"]
+            )
+
     def test_get_post(self):
         self.post_model.get_by_post_id = lambda post_id: None
         with self.assertRaises(pm.NoPostFoundError, msg="Nonexistant post"):
@@ -583,6 +715,90 @@ class PostManagerTestCase(unittest.TestCase):
             self.post_manager.get_post(""), test_data, "Post data is unmodified"
         )
 
+        with self.subTest("Stale reads only when allowed"):
+            calls = []
+
+            @contextmanager
+            def stale_reads():
+                calls.append("begin")
+                try:
+                    yield
+                finally:
+                    calls.append("end")
+
+            self.post_manager.model_factory.stale_reads = stale_reads
+            self.post_model.get_by_post_id = lambda post_id: calls.append(
+                "get_by_post_id"
+            )
+
+            with self.assertRaises(pm.NoPostFoundError):
+                self.post_manager.get_post("")
+            self.assertEqual(calls, ["get_by_post_id"])
+
+            calls.clear()
+            with self.assertRaises(pm.NoPostFoundError):
+                self.post_manager.get_post("", allow_stale=True)
+            self.assertEqual(calls, ["begin", "get_by_post_id", "end"])
+
+    def test_entity_cache(self):
+        cache = EntityCache(10, 60)
+        self.post_manager.model_factory.entity_cache = lambda: cache
+
+        reads = []
+        test_data = dict(op="test", locked=False, likes=0, dislikes=0)
+
+        def get_by_post_id(post_id):
+            reads.append(post_id)
+            return dict(test_data)
+
+        self.post_model.get_by_post_id = get_by_post_id
+
+        with self.subTest("Served from the cache when stale reads are allowed"):
+            self.post_manager.get_post("a", allow_stale=True)
+            post = self.post_manager.get_post("a", allow_stale=True)
+            post["op"] = "modified"
+
+            self.assertEqual(
+                self.post_manager.get_post("a", allow_stale=True), test_data
+            )
+            self.assertEqual(reads, ["a"])
+            self.assertEqual(cache.stats()["posts"], dict(hits=2, misses=1, size=1))
+
+        with self.subTest("Read from the model otherwise"):
+            self.post_manager.get_post("a")
+            self.assertEqual(reads, ["a", "a"])
+
+        with self.subTest("Missing posts are not cached"):
+            self.post_model.get_by_post_id = lambda post_id: None
+
+            with self.assertRaises(pm.NoPostFoundError):
+                self.post_manager.get_post("b", allow_stale=True)
+            self.assertEqual(len(cache.posts), 1)
+
+        self.post_model.get_by_post_id = get_by_post_id
+        self.post_model.lock_post = lambda post_id: True
+        self.post_model.edit_post = lambda post_id, data: True
+        self.post_model.increment_votes = lambda post_id, likes, dislikes: True
+        self.post_model.delete_by_post_id = lambda post_id: True
+        self.vote_model.clear_votes_by_id = lambda content_id: True
+
+        for name, change in (
+            ("lock_post", lambda: self.post_manager.lock_post("test", "a")),
+            (
+                "edit_post",
+                lambda: self.post_manager.edit_post("test", "a", "Title", "Post body"),
+            ),
+            (
+                "update_vote_counts",
+                lambda: self.post_manager.update_vote_counts("a", likes=1),
+            ),
+            ("delete_post", lambda: self.post_manager.delete_post("test", "a")),
+        ):
+            with self.subTest(f"Forgotten on {name}"):
+                self.post_manager.get_post("a", allow_stale=True)
+                change()
+                self.assertIsNone(cache.posts.get("a"))
+
     def test_lock_post(self):
         self.post_model.get_by_post_id = lambda post_id: None
         with self.assertRaises(pm.NoPostFoundError, msg="Invalid post"):
@@ -648,62 +864,96 @@ class PostManagerTestCase(unittest.TestCase):
             self.assertTrue(test_data["called"])
 
     def test_add_like(self):
-        test_data = dict(
-            op="Test",
-            title="Test Post",
-            body="Test Body",
-            media=None,
-            tags=None,
-            modified_date=datetime.now(),
-            likes=0,
-            dislikes=0,
-        )
-
-        self.post_model.get_by_post_id = lambda post_id: None
+        self.post_model.increment_votes = lambda post_id, likes=0, dislikes=0: False
         with self.assertRaises(pm.NoPostFoundError, msg="Invalid post"):
             self.post_manager.add_like("test", False)
 
-        self.post_model.get_by_post_id = lambda post_id: test_data
-        self.post_model.edit_post = set_data_wrapper(self.data)
+        self.post_model.get_by_post_id = lambda post_id: self.fail(
+            "Post should not be read"
+        )
+        self.post_model.edit_post = lambda post_id, data: self.fail(
+            "Post should not be rewritten"
+        )
+
+        def increment_votes(post_id, likes=0, dislikes=0):
+            self.data["counts"] = dict(likes=likes, dislikes=dislikes)
+            return True
+
+        self.post_model.increment_votes = increment_votes
 
         with self.subTest("Run tests as likes and dislikes"):
-            for is_like, key in [(True, "likes"), (False, "dislikes")]:
+            for is_like, key, other in [
+                (True, "likes", "dislikes"),
+                (False, "dislikes", "likes"),
+            ]:
                 with self.subTest("Increment"):
-                    self.post_manager.add_like(
-                        post_id="", is_like=is_like, positive=True
+                    self.assertTrue(
+                        self.post_manager.add_like(
+                            post_id="", is_like=is_like, positive=True
+                        )
                     )
-                    self.assertEqual(self.data["args"][1][key], 1)
+                    self.assertEqual(self.data["counts"], {key: 1, other: 0})
 
                 with self.subTest("Decrement"):
                     self.post_manager.add_like(
                         post_id="", is_like=is_like, positive=False
                     )
-                    self.assertEqual(self.data["args"][1][key], 0)
-
-                with self.subTest("No negatives"):
-                    self.post_manager.add_like(
-                        post_id="", is_like=is_like, positive=False
-                    )
-                    self.assertEqual(self.data["args"][1][key], 0)
-
-                with self.subTest("Simulate a lot of calls"):
-                    test_data[key] = 2**1024
-                    self.post_manager.add_like(
-                        post_id="", is_like=is_like, positive=True
-                    )
-                    self.assertEqual(self.data["args"][1][key], 2**1024 + 1)
+                    self.assertEqual(self.data["counts"], {key: -1, other: 0})
 
     def test_post_exists(self):
-        self.post_model.get_by_post_id = lambda post_id: None
+        self.post_model.get_by_post_id = lambda post_id: self.fail(
+            "Post should not be read"
+        )
+
+        self.post_model.post_exists = lambda post_id: False
         self.assertFalse(self.post_manager.post_exists(""))
 
-        self.post_model.get_by_post_id = lambda post_id: {}
+        self.post_model.post_exists = lambda post_id: True
         self.assertTrue(self.post_manager.post_exists(""))
 
+    def test_get_vote_counts(self):
+        self.post_model.get_vote_counts = lambda post_id: None
+        with self.assertRaises(pm.NoPostFoundError, msg="Nonexistant post"):
+            self.post_manager.get_vote_counts("")
+
+        test_data = dict(post_id="", likes=1, dislikes=2)
+        self.post_model.get_vote_counts = lambda post_id: test_data
+        self.assertEqual(self.post_manager.get_vote_counts(""), test_data)
+
+    def test_get_post_version(self):
+        self.post_model.get_post_version = lambda post_id: None
+        with self.assertRaises(pm.NoPostFoundError, msg="Nonexistant post"):
+            self.post_manager.get_post_version("")
+
+        post = dict(
+            post_id="a",
+            op="Test",
+            body="Test Body",
+            creation_date=datetime(2024, 1, 1),
+            modified_date=datetime(2024, 1, 2),
+            likes=1,
+            dislikes=2,
+            locked=False,
+        )
+        version = {key: post[key] for key in PostVersion.__annotations__}
+        self.post_model.get_post_version = lambda post_id: version
+        self.assertEqual(self.post_manager.get_post_version("a"), version)
+
+        with self.subTest("Same version as the cached post"):
+            cache = EntityCache(10, 60)
+            self.post_manager.model_factory.entity_cache = lambda: cache
+            cache.posts.set("a", dict(post, likes=5))
+
+            self.assertEqual(
+                pm.post_version(self.post_manager.get_post_version("a", True)),
+                pm.post_version(dict(post, likes=5)),
+            )
+            self.assertEqual(self.post_manager.get_post_version("a"), version)
+
     def test_get_post_list(self):
         with self.subTest("Test for OverflowError"):
 
-            def raise_overflow(limit, skip, subforum):
+            def raise_overflow(limit, skip, subforum, sort, window, tags, tag_match):
                 raise OverflowError()
 
             self.post_model.get_posts = raise_overflow
@@ -711,7 +961,7 @@ class PostManagerTestCase(unittest.TestCase):
             with self.assertRaises(pm.InvalidPageError):
                 self.post_manager.get_post_list("")
 
-        self.post_model.get_posts = set_data_wrapper(self.data)
+        self.post_model.get_posts = set_data_wrapper(self.data, [])
         test_data = dict(title="Test_Subforum")
         with self.subTest("Pagelimit of 10, page 0"):
             self.post_manager.get_post_list(
@@ -732,3 +982,317 @@ class PostManagerTestCase(unittest.TestCase):
                 self.data["args"],
                 (10, 500, test_data["title"]),
             )
+
+    def test_get_post_list_cursor(self):
+        test_posts = [
+            dict(post_id=str(i), creation_date=datetime(2024, 1, 1, 0, 0, i))
+            for i in range(10)
+        ]
+
+        with self.subTest("No cursor on a partial page"):
+            self.assertIsNone(
+                self.post_manager.get_next_cursor(test_posts, page_limit=20)
+            )
+            self.assertIsNone(self.post_manager.get_next_cursor([], page_limit=20))
+
+        with self.subTest("Cursor round trip"):
+            cursor = self.post_manager.get_next_cursor(test_posts, page_limit=10)
+            self.assertIsInstance(cursor, str)
+
+            self.post_model.get_posts_after = set_data_wrapper(self.data, [])
+            self.post_manager.get_post_list(
+                subforum="Test_Subforum", page=50, page_limit=10, cursor=cursor
+            )
+
+            self.assertEqual(
+                self.data["args"],
+                (
+                    10,
+                    dict(creation_date=test_posts[-1]["creation_date"], post_id="9"),
+                    "Test_Subforum",
+                ),
+                "Cursor takes priority over page",
+            )
+
+        for cursor in ["", "garbage", "Z2FyYmFnZQ==", "!!!"]:
+            with self.subTest("Invalid cursor", cursor=cursor):
+                with self.assertRaises(pm.InvalidCursorError):
+                    self.post_manager.get_post_list(cursor=cursor)
+
+    def test_get_post_list_sort(self):
+        test_posts = [dict(post_id=str(i), hot=10.5 - i) for i in range(10)]
+
+        with self.subTest("Sort is passed through"):
+            self.post_model.get_posts = set_data_wrapper(self.data, [])
+            self.post_manager.get_post_list(sort="hot")
+
+            self.assertEqual(
+                self.data["kwargs"],
+                dict(sort="hot", window="all", tags=None, tag_match="any"),
+            )
+
+        with self.subTest("Cursor round trip"):
+            cursor = self.post_manager.get_next_cursor(
+                test_posts, page_limit=10, sort="hot"
+            )
+
+            self.post_model.get_posts_after = set_data_wrapper(self.data, [])
+            self.post_manager.get_post_list(page_limit=10, cursor=cursor, sort="hot")
+
+            self.assertEqual(
+                self.data["args"], (10, dict(score=1.5, post_id="9"), None)
+            )
+            self.assertEqual(
+                self.data["kwargs"],
+                dict(sort="hot", window="all", tags=None, tag_match="any"),
+            )
+
+            with self.assertRaises(pm.InvalidCursorError, msg="Cursor of another sort"):
+                self.post_manager.get_post_list(cursor=cursor)
+
+        with self.subTest("Windowed cursor round trip"):
+            test_posts = [dict(post_id=str(i), top=1 / (i + 1)) for i in range(10)]
+            cursor = self.post_manager.get_next_cursor(
+                test_posts, page_limit=10, sort="top", window="week"
+            )
+
+            self.post_model.get_posts_after = set_data_wrapper(self.data, [])
+            self.post_manager.get_post_list(
+                page_limit=10, cursor=cursor, sort="top", window="week"
+            )
+
+            self.assertEqual(
+                self.data["args"], (10, dict(score=0.1, post_id="9"), None)
+            )
+            self.assertEqual(
+                self.data["kwargs"],
+                dict(sort="top", window="week", tags=None, tag_match="any"),
+            )
+
+            with self.assertRaises(
+                pm.InvalidCursorError, msg="Cursor of another window"
+            ):
+                self.post_manager.get_post_list(cursor=cursor, sort="top", window="day")
+
+        with self.subTest("Windows only matter to windowed sorts"):
+            cursor = self.post_manager.get_next_cursor(
+                [dict(post_id="1", hot=2.0)], page_limit=1, sort="hot", window="all"
+            )
+            self.post_manager.get_post_list(cursor=cursor, sort="hot", window="day")
+
+        with self.subTest("Invalid sort"):
+            with self.assertRaises(pm.InvalidSortError):
+                self.post_manager.get_post_list(sort="garbage")
+
+            with self.assertRaises(pm.InvalidSortError):
+                self.post_manager.get_post_list(sort="top", window="year")
+
+    def test_get_post_list_tags(self):
+        self.post_model.get_posts = set_data_wrapper(self.data, [])
+
+        with self.subTest("Tags are normalized like post tags"):
+            self.post_manager.get_post_list(tags=[" Python", "python", "", "FLASK"])
+
+            self.assertEqual(
+                self.data["kwargs"],
+                dict(
+                    sort="new", window="all", tags=["python", "flask"], tag_match="any"
+                ),
+            )
+
+        with self.subTest("Match is passed through"):
+            self.post_manager.get_post_list(tags=["python"], tag_match="all")
+
+            self.assertEqual(self.data["kwargs"]["tag_match"], "all")
+
+        with self.subTest("Blank tags don't filter"):
+            self.post_manager.get_post_list(tags=[" ", ""])
+
+            self.assertIsNone(self.data["kwargs"]["tags"])
+
+        with self.subTest("Invalid match"):
+            with self.assertRaises(pm.InvalidTagFilterError):
+                self.post_manager.get_post_list(tags=["python"], tag_match="none")
+
+        with self.subTest("BOUNDARY: Tags = TAGS_LIMIT + 1"):
+            self.post_manager.get_post_list(
+                tags=[f"t{i}" for i in range(pm.TAGS_LIMIT)]
+            )
+
+            with self.assertRaises(pm.InvalidTagFilterError):
+                self.post_manager.get_post_list(
+                    tags=[f"t{i}" for i in range(pm.TAGS_LIMIT + 1)]
+                )
+
+    def test_search_posts(self):
+        test_posts = [dict(post_id=str(i), rank=10.5 - i) for i in range(10)]
+
+        with self.subTest("Query is stripped"):
+            self.post_model.search_posts = set_data_wrapper(self.data, [])
+            self.post_manager.search_posts("  forum  ", subforum="Test")
+
+            self.assertEqual(self.data["args"], ("forum", pm.PAGE_LIMIT))
+            self.assertEqual(self.data["kwargs"], dict(cursor=None, subforum="Test"))
+
+        with self.subTest("Cursor round trip"):
+            cursor = self.post_manager.get_next_cursor(
+                test_posts, page_limit=10, sort="rank"
+            )
+            self.post_manager.search_posts("forum", page_limit=10, cursor=cursor)
+
+            self.assertEqual(
+                self.data["kwargs"]["cursor"], dict(score=1.5, post_id="9")
+            )
+
+            with self.assertRaises(pm.InvalidCursorError, msg="Cursor of a listing"):
+                self.post_manager.search_posts(
+                    "forum",
+                    cursor=self.post_manager.get_next_cursor(
+                        [dict(post_id="1", hot=1.0)], page_limit=1, sort="hot"
+                    ),
+                )
+
+        with self.subTest("Votes are added"):
+            self.post_model.search_posts = lambda *args, **kwargs: [dict(post_id="1")]
+
+            posts = self.post_manager.search_posts("forum")
+            self.assertIsNone(posts[0]["my_vote"])
+
+        with self.assertRaises(pm.InvalidSearchError, msg="Empty search"):
+            self.post_manager.search_posts("   ")
+
+        self.post_manager.search_posts("t" * pm.SEARCH_MAX)
+        with self.assertRaises(pm.InvalidSearchError, msg="BOUNDARY: SEARCH_MAX + 1"):
+            self.post_manager.search_posts("t" * (pm.SEARCH_MAX + 1))
+
+    def test_get_tags(self):
+        self.post_model.get_tags = set_data_wrapper(self.data, [])
+
+        self.post_manager.get_tags()
+        self.assertEqual(self.data["args"], (pm.TAG_LIST_LIMIT,))
+
+        self.post_manager.get_tags(5)
+        self.assertEqual(self.data["args"], (5,))
+
+        self.post_manager.get_tags(pm.TAG_LIST_LIMIT + 1)
+        self.assertEqual(self.data["args"], (pm.TAG_LIST_LIMIT,))
+
+    def test_recompute_scores(self):
+        self.post_model.recompute_scores = lambda: 3
+        self.assertEqual(self.post_manager.recompute_scores(), 3)
+
+    def test_refresh_rankings(self):
+        self.post_model.refresh_rankings = lambda: 4
+        self.assertEqual(self.post_manager.refresh_rankings(), 4)
+
+    def test_get_post_list_votes(self):
+        test_posts = [dict(post_id="1"), dict(post_id="2"), dict(post_id="3")]
+        self.post_model.get_posts = (
+            lambda limit, skip, subforum, sort, window, tags, tag_match: [
+                post.copy() for post in test_posts
+            ]
+        )
+
+        with self.subTest("Anonymous"):
+            self.vote_model.get_votes_by_ids = lambda *args: self.fail(
+                "Votes should not be queried"
+            )
+
+            posts = self.post_manager.get_post_list()
+            self.assertEqual([post["my_vote"] for post in posts], [None] * 3)
+
+        with self.subTest("Logged in, single query"):
+            self.vote_model.get_votes_by_ids = set_data_wrapper(
+                self.data, {"1": True, "3": False}
+            )
+
+            posts = self.post_manager.get_post_list(username="test")
+
+            self.assertEqual(
+                self.data["args"],
+                ("test", ["1", "2", "3"], str(ContentType.POST)),
+            )
+            self.assertEqual([post["my_vote"] for post in posts], [True, None, False])
+
+        with self.subTest("Votes are not read stale"):
+            calls = []
+
+            @contextmanager
+            def stale_reads():
+                calls.append("begin")
+                try:
+                    yield
+                finally:
+                    calls.append("end")
+
+            def get_posts(limit, skip, subforum, sort, window, tags, tag_match):
+                calls.append("get_posts")
+                return [post.copy() for post in test_posts]
+
+            def get_votes_by_ids(*args):
+                calls.append("get_votes_by_ids")
+                return {}
+
+            self.post_manager.model_factory.stale_reads = stale_reads
+            self.post_model.get_posts = get_posts
+            self.vote_model.get_votes_by_ids = get_votes_by_ids
+
+            self.post_manager.get_post_list(username="test")
+
+            self.assertEqual(calls, ["begin", "get_posts", "end", "get_votes_by_ids"])
+
+    def test_reconcile_post_counts(self):
+        self.post_model.reconcile_counts = lambda: 2
+        self.assertEqual(self.post_manager.reconcile_post_counts(), 2)
+
+    def test_import_posts(self):
+        self.post_model.import_posts = set_data_wrapper(self.data, return_value=1)
+        checked = []
+        self.subforum_model.get_subforum_by_title = lambda title: (
+            checked.append(title) or ({} if title == "Test_Subforum" else None)
+        )
+
+        now = datetime.now()
+        base_post = dict(
+            post_id="0" * 24,
+            op="test",
+            subforum="Test_Subforum",
+            title="Test Title",
+            body="Test Body",
+            media=None,
+            tags=None,
+            likes=5,
+            dislikes=5,
+            locked=False,
+            creation_date=now,
+            modified_date=now,
+        )
+        posts = [
+            base_post | dict(title="   Test Post   ", tags=[" tag "]),
+            base_post | dict(title=""),
+            base_post | dict(subforum="Missing"),
+            base_post | dict(body=""),
+            base_post | dict(tags=["t"] * (pm.TAGS_LIMIT + 1)),
+            base_post,
+        ]
+
+        result = self.post_manager.import_posts(posts)
+
+        self.assertEqual(result["imported"], 1)
+        self.assertEqual(sorted(result["rejected"]), [1, 2, 3, 4])
+        self.assertEqual(
+            sorted(checked), ["Missing", "Test_Subforum"], "Subforums checked once"
+        )
+
+        imported = self.data["args"][0]
+        self.assertEqual(len(imported), 2)
+        self.assertEqual(imported[0]["title"], "Test Post")
+        self.assertEqual(imported[0]["tags"], ["tag"])
+        self.assertEqual(imported[1], base_post | dict(likes=0, dislikes=0))
+
+        with self.subTest("Nothing valid"):
+            self.data["args"] = None
+            result = self.post_manager.import_posts(posts[1:5])
+
+            self.assertEqual(result["imported"], 0)
+            self.assertIsNone(self.data["args"], "Model is not called")
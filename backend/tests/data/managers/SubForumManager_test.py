@@ -3,6 +3,7 @@ import unittest
 from datetime import datetime
 
 import backend.data.managers.SubForumManager as sfm
+from backend.data.EntityCache import EntityCache
 from backend.data.models.SubForumModel import SubForum, SubForumModel
 from backend.tests import assertTimeInRange
 from backend.tests.data.managers import TestModelFactory
@@ -23,6 +24,9 @@ class TestSubForumModel(SubForumModel):
     def get_subforum_by_title(self, title: str) -> SubForum | None:  # NOSONAR
         pass
 
+    def import_subforums(self, subforums: list[SubForum]) -> int:  # NOSONAR
+        pass
+
 
 class SubForumManagerTestCase(unittest.TestCase):
     def setUp(self):
@@ -55,6 +59,35 @@ class SubForumManagerTestCase(unittest.TestCase):
             "Subforum data is unmodified",
         )
 
+    def test_entity_cache(self):
+        cache = EntityCache(10, 60)
+        self.subforum_manager.model_factory.entity_cache = lambda: cache
+
+        reads = []
+        test_data = dict(creator="test", title="Test_Subforum")
+
+        def get_subforum_by_title(title):
+            reads.append(title)
+            return dict(test_data)
+
+        self.subforum_model.get_subforum_by_title = get_subforum_by_title
+        self.subforum_model.edit_subforum = lambda title, description: True
+        self.subforum_model.delete_subforum = lambda title: True
+
+        self.subforum_manager.get_subforum("a")["creator"] = "modified"
+        self.assertEqual(self.subforum_manager.get_subforum("a"), test_data)
+        self.assertEqual(reads, ["a"])
+        self.assertEqual(cache.stats()["subforums"], dict(hits=1, misses=1, size=1))
+
+        with self.subTest("Forgotten on edit_subforum"):
+            self.subforum_manager.edit_subforum("test", "a", "New description")
+            self.assertIsNone(cache.subforums.get("a"))
+
+        with self.subTest("Forgotten on delete_subforum"):
+            self.subforum_manager.get_subforum("a")
+            self.subforum_manager.delete_subforum("test", "a")
+            self.assertIsNone(cache.subforums.get("a"))
+
     def test_create_subforum(self):
         self.subforum_model.create_subforum = set_data_wrapper(self.data)
         self.subforum_model.get_subforum_by_title = lambda title: None
@@ -317,3 +350,28 @@ class SubForumManagerTestCase(unittest.TestCase):
             dict(post_count=100, page_count=12, current_page=0),
             "Subforum is None, with 100 posts, 9 page limit",
         )
+
+    def test_import_subforums(self):
+        self.subforum_model.import_subforums = set_data_wrapper(
+            self.data, return_value=1
+        )
+
+        test_data = dict(
+            creator="test",
+            description="Test description",
+            title="Test_Subforum",
+            creation_date=datetime.now(),
+        )
+
+        result = self.subforum_manager.import_subforums(
+            [
+                test_data,
+                test_data | dict(description=""),
+                test_data | dict(title="_Test"),
+                test_data | dict(title="T" * (sfm.TITLE_MAX + 1)),
+            ]
+        )
+
+        self.assertEqual(result["imported"], 1)
+        self.assertEqual(sorted(result["rejected"]), [1, 2, 3])
+        self.assertEqual(self.data["args"][0], [test_data])
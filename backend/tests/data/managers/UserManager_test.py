@@ -6,6 +6,7 @@ from hashlib import sha256
 from bcrypt import gensalt, hashpw
 
 import backend.data.managers.UserManager as um
+from backend.data.EntityCache import EntityCache
 from backend.data.models.UserModel import User, UserModel
 from backend.tests import assertTimeInRange
 from backend.tests.data.managers import TestModelFactory
@@ -41,6 +42,24 @@ class UserManagerTestCase(unittest.TestCase):
             self.user_model.get_by_username = lambda username: {}
             self.assertTrue(self.user_manager.user_exists(""))
 
+    def test_entity_cache(self):
+        cache = EntityCache(10, 60)
+        self.user_manager.model_factory.entity_cache = lambda: cache
+
+        reads = []
+
+        def get_by_username(username):
+            reads.append(username)
+            return dict(username=username) if username == "a" else None
+
+        self.user_model.get_by_username = get_by_username
+
+        self.assertTrue(self.user_manager.user_exists("a"))
+        self.assertTrue(self.user_manager.user_exists("a"))
+        self.assertFalse(self.user_manager.user_exists("b"))
+        self.assertFalse(self.user_manager.user_exists("b"))
+        self.assertEqual(reads, ["a", "b", "b"], "Missing users are not cached")
+
     def test_check_password(self):
         self.user_model.get_by_username = lambda username: None
         self.assertEqual(
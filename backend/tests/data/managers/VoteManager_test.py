@@ -1,7 +1,9 @@
 import unittest
+from contextlib import contextmanager
+from datetime import datetime
 
 import backend.data.managers.VoteManager as vm
-from backend.data.models.VoteModel import BaseVote, Vote, VoteModel
+from backend.data.models.VoteModel import BaseVote, ContentType, Vote, VoteModel
 from backend.tests import assertTimeInRange
 from backend.tests.data.managers import TestModelFactory
 from backend.tests import set_data_wrapper
@@ -14,6 +16,14 @@ class TestVoteModel(VoteModel):
     def get_vote(self, data: BaseVote) -> Vote | None:  # NOSONAR
         pass
 
+    def get_votes_by_ids(  # NOSONAR
+        self, username: str, content_ids: list[str], content_type: str
+    ) -> dict[str, bool]:
+        pass
+
+    def upsert_vote(self, data: Vote) -> bool | None:  # NOSONAR
+        pass
+
     def update_vote(self, data: Vote) -> bool:  # NOSONAR
         pass
 
@@ -26,6 +36,9 @@ class TestVoteModel(VoteModel):
     def clear_votes_by_id(self, content_id: str) -> bool:  # NOSONAR
         pass
 
+    def import_votes(self, votes: list[Vote]) -> list[Vote]:  # NOSONAR
+        pass
+
 
 class VoteManagerTestCase(unittest.TestCase):
     def setUp(self):
@@ -79,97 +92,85 @@ class VoteManagerTestCase(unittest.TestCase):
                 )
 
     def test_add_vote(self):
-        self.vote_model.get_vote = lambda vote: None
-
-        test_data = dict(username="test", content_id="")
-        test_post = dict(
-            op="Test",
-            title="Test Post",
-            body="Test Body",
-            media=None,
-            tags=None,
-            modified_date=None,
-            likes=0,
-            dislikes=0,
+        test_data = dict(
+            username="test", content_id="", content_type=vm.ContentType.POST
         )
 
-        def test_vote_addition(msg=None, expect_like_update=True):
-            # add vote and update vote essentially act the same way
-            self.vote_model.add_vote = set_data_wrapper(self.data)
-            self.vote_model.update_vote = set_data_wrapper(self.data)
-            self.post_model.get_by_post_id = lambda post_id: test_post
+        def add_vote(is_like: bool, previous: bool | None):
+            self.data["counts"] = None
+            self.data["removed"] = None
+            self.vote_model.get_vote = lambda vote: self.fail("Vote should not be read")
+            self.post_model.get_by_post_id = lambda post_id: self.fail(
+                "Post should not be read"
+            )
 
-            # Ensure add_like is called for the respective content type
-            if expect_like_update:
-                self.data["like_update_called"] = False
-                if test_data["content_type"] == vm.ContentType.POST:
+            def upsert_vote(vote):
+                self.data["vote"] = vote
+                return previous
 
-                    def callback(post_id, data):
-                        self.data["like_update_called"] = True
-                        return True
+            def increment_votes(post_id, likes=0, dislikes=0):
+                self.data["counts"] = (likes, dislikes)
+                return True
 
-                    self.post_model.edit_post = callback
+            self.vote_model.upsert_vote = upsert_vote
+            self.post_model.increment_votes = increment_votes
 
-            self.vote_manager.add_vote(
+            result = self.vote_manager.add_vote(
                 username=test_data["username"],
                 content_id=test_data["content_id"],
                 content_type=test_data["content_type"],
-                is_like=test_data["is_like"],
+                is_like=is_like,
             )
 
-            # Translate content type to string
-            test_data_copy = test_data.copy()
-            test_data_copy["content_type"] = str(test_data["content_type"])
-
-            with self.subTest(msg=msg):
-                vote = self.data["args"][0]
-                assertTimeInRange(self, vote["creation_date"])
-
-                self.assertEqual(vote, vote | test_data_copy)
-
-                if expect_like_update:
-                    self.assertTrue(self.data["like_update_called"])
-
-        for is_like in [True, False]:
-            with self.subTest("Posts"):
-                test_data["content_type"] = vm.ContentType.POST
-                test_data["is_like"] = is_like
+            vote = self.data["vote"]
+            assertTimeInRange(self, vote["creation_date"])
+            self.assertEqual(
+                vote,
+                vote
+                | test_data
+                | dict(content_type=str(test_data["content_type"]), is_like=is_like),
+            )
 
-                base_vote = test_data.copy()
+            return result
 
-                with self.assertRaises(vm.InvalidContent, msg="Invalid post"):
-                    self.post_model.get_by_post_id = lambda post_id: None
-                    self.vote_manager.add_vote(
-                        username=test_data["username"],
-                        content_id=test_data["content_id"],
-                        content_type=test_data["content_type"],
-                        is_like=test_data["is_like"],
-                    )
+        for is_like, like_delta in [(True, (1, 0)), (False, (0, 1))]:
+            with self.subTest("Add brand new vote", is_like=is_like):
+                self.assertTrue(add_vote(is_like, None))
+                self.assertEqual(self.data["counts"], like_delta)
 
-                self.vote_model.get_vote = lambda vote: None
-                test_vote_addition("Add brand new vote")
+            with self.subTest("Unchanged vote", is_like=is_like):
+                self.assertTrue(add_vote(is_like, is_like))
+                self.assertIsNone(self.data["counts"], "Counts are not updated")
 
-                base_vote["content_type"] = str(test_data["content_type"])
-                self.vote_model.get_vote = lambda vote, base_vote=base_vote: base_vote
-                test_vote_addition(
-                    f"Update vote from is_like={is_like} -> is_like={is_like}",
-                    expect_like_update=False,
+            with self.subTest("Flipped vote", is_like=is_like):
+                self.assertTrue(add_vote(is_like, not is_like))
+                self.assertEqual(
+                    self.data["counts"], (like_delta[0] * 2 - 1, like_delta[1] * 2 - 1)
                 )
 
-                base_vote["is_like"] = not is_like
-                base_vote["content_type"] = str(test_data["content_type"])
-                self.vote_model.get_vote = lambda vote, base_vote=base_vote: base_vote
-                test_vote_addition(
-                    f"Update vote from is_like={not is_like} -> is_like={is_like}"
+        with self.subTest("Invalid post"):
+            self.vote_model.upsert_vote = lambda vote: None
+            self.post_model.increment_votes = lambda post_id, likes=0, dislikes=0: False
+            self.vote_model.remove_vote = set_data_wrapper(self.data)
+
+            with self.assertRaises(vm.InvalidContent):
+                self.vote_manager.add_vote(
+                    username=test_data["username"],
+                    content_id=test_data["content_id"],
+                    content_type=test_data["content_type"],
+                    is_like=True,
                 )
 
+            removed = self.data["args"][0]
+            self.assertEqual(removed["username"], test_data["username"])
+            self.assertEqual(removed["content_id"], test_data["content_id"])
+
         with self.assertRaises(vm.InvalidContentType, msg="Invalid content type"):
-            test_data["content_type"] = None
             self.vote_manager.add_vote(
                 username=test_data["username"],
                 content_id=test_data["content_id"],
-                content_type=test_data["content_type"],
-                is_like=test_data["is_like"],
+                content_type=None,
+                is_like=True,
             )
 
     def test_remove_vote(self):
@@ -194,7 +195,7 @@ class VoteManagerTestCase(unittest.TestCase):
             ):
                 base_vote["content_type"] = "random"
                 self.vote_model.get_vote = lambda vote: base_vote
-                self.post_model.get_by_post_id = lambda id: None
+                self.post_model.post_exists = lambda id: False
 
                 self.vote_manager.remove_vote(
                     test_data["username"],
@@ -205,7 +206,7 @@ class VoteManagerTestCase(unittest.TestCase):
             with self.assertRaises(vm.InvalidContent, msg="Invalid post"):
                 base_vote["content_type"] = str(test_data["content_type"])
                 self.vote_model.get_vote = lambda vote: base_vote
-                self.post_model.get_by_post_id = lambda id: None
+                self.post_model.post_exists = lambda id: False
 
                 self.vote_manager.remove_vote(
                     test_data["username"],
@@ -227,3 +228,69 @@ class VoteManagerTestCase(unittest.TestCase):
             self.vote_manager.clear_votes_by_id("")
 
             self.assertTrue(test_data["called"])
+
+    def test_import_votes(self):
+        calls = []
+
+        @contextmanager
+        def unit_of_work():
+            calls.append("begin")
+            yield
+            calls.append("commit")
+
+        def import_votes(votes):
+            calls.append("import_votes")
+            # The first vote already exists
+            return votes[1:]
+
+        def add_vote_counts(counts):
+            calls.append("add_vote_counts")
+            self.data["counts"] = counts
+            return len(counts)
+
+        self.vote_manager.model_factory.unit_of_work = unit_of_work
+        self.post_model.get_existing_post_ids = lambda post_ids: {"post1", "post2"}
+        self.vote_model.import_votes = import_votes
+        self.post_model.add_vote_counts = add_vote_counts
+
+        now = datetime.now()
+        base_vote = dict(
+            username="test",
+            content_id="post1",
+            content_type=ContentType.POST,
+            is_like=True,
+            creation_date=now,
+        )
+
+        result = self.vote_manager.import_votes(
+            [
+                base_vote,
+                base_vote | dict(username="test2"),
+                base_vote | dict(username="test3", is_like=False),
+                base_vote | dict(content_id="post2"),
+                base_vote | dict(content_id="missing"),
+                base_vote | dict(content_type=ContentType.COMMENT),
+            ]
+        )
+
+        self.assertEqual(result["imported"], 3)
+        self.assertEqual(sorted(result["rejected"]), [4, 5])
+        self.assertEqual(calls, ["begin", "import_votes", "add_vote_counts", "commit"])
+        self.assertCountEqual(
+            self.data["counts"],
+            [
+                dict(post_id="post1", likes=1, dislikes=1),
+                dict(post_id="post2", likes=1, dislikes=0),
+            ],
+        )
+
+        with self.subTest("Nothing valid"):
+            calls.clear()
+            result = self.vote_manager.import_votes(
+                [base_vote | dict(content_id="missing")]
+            )
+
+            self.assertEqual(
+                result, dict(imported=0, rejected={0: "Invalid post given"})
+            )
+            self.assertEqual(calls, [])
@@ -1,4 +1,9 @@
+from backend.data.models.AbstractAsyncModelFactory import AbstractAsyncModelFactory
 from backend.data.models.AbstractModelFactory import AbstractModelFactory
+from backend.data.models.AsyncPostModel import AsyncPostModel
+from backend.data.models.AsyncSubForumModel import AsyncSubForumModel
+from backend.data.models.AsyncUserModel import AsyncUserModel
+from backend.data.models.AsyncVoteModel import AsyncVoteModel
 from typing import Dict
 from backend.data.models.PostModel import PostModel
 from backend.data.models.SubForumModel import SubForumModel
@@ -23,3 +28,21 @@ class TestModelFactory(AbstractModelFactory):
     @staticmethod
     def create_post_model() -> PostModel:  # NOSONAR
         pass
+
+
+class TestAsyncModelFactory(AbstractAsyncModelFactory):
+    @staticmethod
+    def create_user_model() -> AsyncUserModel:  # NOSONAR
+        pass
+
+    @staticmethod
+    def create_subforum_model() -> AsyncSubForumModel:  # NOSONAR
+        pass
+
+    @staticmethod
+    def create_vote_model() -> AsyncVoteModel:  # NOSONAR
+        pass
+
+    @staticmethod
+    def create_post_model() -> AsyncPostModel:  # NOSONAR
+        pass
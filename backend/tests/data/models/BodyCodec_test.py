@@ -0,0 +1,45 @@
+import unittest
+
+from backend.data.models.mongo import BodyCodec as bc
+
+
+class BodyCodecTestCase(unittest.TestCase):
+    def test_encode(self):
+        body = "Test body " * 1000
+
+        with self.subTest("No codec"):
+            self.assertEqual(bc.BodyCodec().encode(body), dict(body=body))
+
+        with self.subTest("zlib"):
+            stored = bc.BodyCodec("zlib").encode(body)
+
+            self.assertEqual(stored["body_codec"], "zlib")
+            self.assertLess(len(stored["body"]), len(body))
+            self.assertEqual(bc.decode_body(stored["body"], stored["body_codec"]), body)
+
+        with self.subTest("Below threshold"):
+            codec = bc.BodyCodec("zlib", threshold=len(body) + 1)
+            self.assertEqual(codec.encode(body), dict(body=body))
+
+        with self.subTest("Incompressible"):
+            codec = bc.BodyCodec("zlib", threshold=0)
+            # zlib output of a short body is larger than the body itself
+            self.assertEqual(codec.encode("Short"), dict(body="Short"))
+
+        with self.subTest("Unknown codec"):
+            with self.assertRaises(ValueError):
+                bc.BodyCodec("lz4")
+
+    @unittest.skipIf(bc.zstd is not None, "zstd is installed")
+    def test_zstd_unavailable(self):
+        with self.assertRaises(ValueError):
+            bc.BodyCodec("zstd")
+
+        with self.assertRaises(ValueError):
+            bc.decode_body(b"", "zstd")
+
+    def test_decode_body(self):
+        self.assertEqual(bc.decode_body("Test body", None), "Test body")
+
+        with self.assertRaises(ValueError):
+            bc.decode_body(b"", "lz4")
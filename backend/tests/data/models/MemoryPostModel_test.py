@@ -0,0 +1,12 @@
+import unittest
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.models.memory.MemoryPostModel import MemoryPostModel
+from backend.tests.data.models.PostModelContract import PostModelContract
+
+
+class MemoryPostModelTestCase(PostModelContract, unittest.TestCase):
+    def setUp(self):
+        DatabaseFactory.create_database("memory").connect(None)
+        self.post_model = MemoryPostModel()
+        super().setUp()
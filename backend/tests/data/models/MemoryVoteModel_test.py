@@ -0,0 +1,11 @@
+import unittest
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.models.memory.MemoryVoteModel import MemoryVoteModel
+from backend.tests.data.models.VoteModelContract import VoteModelContract
+
+
+class MemoryVoteModelTestCase(VoteModelContract, unittest.TestCase):
+    def setUp(self):
+        DatabaseFactory.create_database("memory").connect(None)
+        self.vote_model = MemoryVoteModel()
@@ -0,0 +1,46 @@
+import unittest
+
+from pymongo.errors import BulkWriteError
+
+from backend.data.databases.MongoDatabase import DUPLICATE_KEY
+from backend.data.models.mongo.MongoMixin import MongoMixin
+
+
+class TestCollection:
+    """Collection that already holds the documents at `duplicates`."""
+
+    def __init__(self, duplicates: list[int], code: int = DUPLICATE_KEY):
+        self.duplicates = duplicates
+        self.code = code
+
+    def insert_many(self, documents: list[dict], ordered=True, session=None):
+        if self.duplicates:
+            raise BulkWriteError(
+                dict(
+                    writeErrors=[
+                        dict(index=index, code=self.code) for index in self.duplicates
+                    ]
+                )
+            )
+
+
+class MongoMixinTestCase(unittest.TestCase):
+    def setUp(self):
+        # _insert_new doesn't touch the database handle set up by __init__
+        self.model = MongoMixin.__new__(MongoMixin)
+
+    def test_insert_new(self):
+        documents = [dict(a=1), dict(a=2), dict(a=3)]
+
+        self.assertEqual(self.model._insert_new(TestCollection([]), []), [])
+        self.assertEqual(
+            self.model._insert_new(TestCollection([]), documents), [0, 1, 2]
+        )
+        self.assertEqual(
+            self.model._insert_new(TestCollection([0, 2]), documents),
+            [1],
+            "Duplicates are skipped",
+        )
+
+        with self.assertRaises(BulkWriteError, msg="Other errors are raised"):
+            self.model._insert_new(TestCollection([1], code=121), documents)
@@ -0,0 +1,145 @@
+import unittest
+from types import SimpleNamespace
+
+from bson.objectid import ObjectId
+from pymongo import DeleteOne
+
+from backend.data.models.mongo.MongoPostModel import (
+    MongoPostModel,
+    listing_query,
+    ranked_posts,
+)
+
+
+class TestCollection:
+    """Counts collection applying the filtered $set, $setOnInsert and deletes
+    reconciling writes."""
+
+    def __init__(self, counts: dict[str, int]):
+        self.counts = dict(counts)
+
+    def find(self, query: dict, session=None):
+        return [dict(_id=_id, count=count) for _id, count in self.counts.items()]
+
+    def bulk_write(self, updates: list, ordered=True, session=None):
+        result = SimpleNamespace(
+            matched_count=0, modified_count=0, upserted_count=0, deleted_count=0
+        )
+
+        for update in updates:
+            _id = update._filter["_id"]
+            count = update._filter.get("count", self.counts.get(_id))
+
+            if _id not in self.counts:
+                if not isinstance(update, DeleteOne):
+                    self.counts[_id] = update._doc["$setOnInsert"]["count"]
+                    result.upserted_count += 1
+            elif self.counts[_id] != count:
+                continue
+            elif isinstance(update, DeleteOne):
+                del self.counts[_id]
+                result.deleted_count += 1
+            else:
+                result.matched_count += 1
+
+                if "$set" in update._doc:
+                    self.counts[_id] = update._doc["$set"]["count"]
+                    result.modified_count += 1
+
+        return result
+
+
+class TestPosts:
+    """Posts collection whose updates all modify a post."""
+
+    def update_one(self, query: dict, update: dict, session=None):
+        return SimpleNamespace(modified_count=1)
+
+
+class MongoPostModelTestCase(unittest.TestCase):
+    def setUp(self):
+        # __reconcile only touches the collection it's given
+        self.model = MongoPostModel.__new__(MongoPostModel)
+        self.reconcile = self.model._MongoPostModel__reconcile
+
+    def test_reconcile(self):
+        collection = TestCollection(dict(a=5, b=1, gone=2))
+        actual = dict(a=3, b=1, new=4)
+
+        corrected = self.reconcile(
+            lambda: collection, {}, lambda: dict(actual), drop_unused=True
+        )
+        self.assertEqual(corrected, 3)
+        self.assertEqual(collection.counts, actual)
+
+        collection = TestCollection(dict(gone=2))
+        self.reconcile(lambda: collection, {}, dict, drop_unused=False)
+        self.assertEqual(collection.counts, dict(gone=0), "Kept at 0")
+
+    def test_reconcile_concurrent_writes(self):
+        collection = TestCollection(dict(a=5))
+        created = []
+
+        def count():
+            if not created:
+                # A post is created after the stored count was read
+                collection.counts["a"] += 1
+                created.append(True)
+
+            return dict(a=4)
+
+        self.assertEqual(
+            self.reconcile(lambda: collection, {}, count, drop_unused=False), 1
+        )
+        self.assertEqual(collection.counts, dict(a=4), "Written over the change")
+
+    def test_search_cache(self):
+        self.addCleanup(MongoPostModel._search_cache.clear)
+        searched = []
+
+        def search_posts(*args):
+            searched.append(args)
+            return [dict(title="Post")]
+
+        other = MongoPostModel.__new__(MongoPostModel)
+        for model in (self.model, other):
+            model._MongoPostModel__search_posts = search_posts
+            model._MongoPostModel__posts_collection = lambda write=None: TestPosts()
+
+        self.model.search_posts("post", 10)
+        self.assertEqual(other.search_posts("post", 10), [dict(title="Post")])
+        self.assertEqual(len(searched), 1, "Shared by every model")
+
+        self.assertTrue(other.lock_post(str(ObjectId())))
+        self.model.search_posts("post", 10)
+        self.assertEqual(len(searched), 2, "Forgotten once a post changes")
+
+
+class ListingTestCase(unittest.TestCase):
+    def test_listing_query(self):
+        _id = ObjectId()
+
+        self.assertEqual(listing_query(None, None, "any"), {})
+        self.assertEqual(
+            listing_query("a", ["x"], "all"), dict(subforum="a", tags={"$all": ["x"]})
+        )
+        self.assertEqual(
+            listing_query(None, None, "any", dict(score=1.0, post_id=str(_id)), "hot"),
+            {"$or": [{"hot": {"$lt": 1.0}}, {"hot": 1.0, "_id": {"$lt": _id}}]},
+        )
+
+    def test_ranked_posts(self):
+        first, second, gone = ObjectId(), ObjectId(), ObjectId()
+        posts = {
+            second: dict(_id=second, title="Second"),
+            first: dict(_id=first, title="First"),
+        }
+
+        self.assertEqual(
+            ranked_posts({first: 2.0, gone: 1.5, second: 1.0}, posts, "top"),
+            [
+                dict(title="First", post_id=str(first), top=2.0),
+                dict(title="Second", post_id=str(second), top=1.0),
+            ],
+            "In ranked order, without deleted posts",
+        )
@@ -0,0 +1,240 @@
+from datetime import datetime, timedelta
+
+from backend.data.models.PostModel import PostModel, PostVersion, hot_score
+
+
+def make_post(i: int, now: datetime, **data) -> dict:
+    return (
+        dict(
+            op="op",
+            subforum="a" if i % 2 == 0 else "b",
+            title=f"Post {i}",
+            body=f"Body of post {i}",
+            media=None,
+            tags=None,
+            likes=0,
+            dislikes=0,
+            locked=False,
+            creation_date=now - timedelta(hours=i),
+            modified_date=now,
+        )
+        | data
+    )
+
+
+class PostModelContract:
+    """Post model tests every database must pass, mixed into a TestCase per database.
+
+    setUp expects the database connected and `post_model` set, subclasses
+    do both before calling it.
+    """
+
+    post_model: PostModel
+
+    def setUp(self):
+        self.now = datetime.now()
+
+        for i in range(10):
+            self.post_model.create_post(make_post(i, self.now, likes=i))
+
+        self.posts = self.post_model.get_posts(10, 0)
+
+    def titles(self, posts) -> list[str]:
+        return [post["title"] for post in posts]
+
+    def test_get_posts(self):
+        with self.subTest("Newest first without bodies"):
+            self.assertEqual(self.titles(self.posts), [f"Post {i}" for i in range(10)])
+            self.assertNotIn("body", self.posts[0])
+            self.assertEqual(self.posts[0]["preview"], "Body of post 0")
+
+        with self.subTest("Skip and subforum"):
+            posts = self.post_model.get_posts(2, 1, "b")
+            self.assertEqual(self.titles(posts), ["Post 3", "Post 5"])
+
+        with self.subTest("Hot"):
+            posts = self.post_model.get_posts(10, 0, sort="hot")
+            self.assertEqual(
+                [post["hot"] for post in posts],
+                sorted((post["hot"] for post in self.posts), reverse=True),
+            )
+
+        with self.subTest("Windowed"):
+            posts = self.post_model.get_posts(10, 0, sort="top", window="day")
+            self.assertEqual(len(posts), 10)
+
+            self.post_model.create_post(
+                make_post(0, self.now - timedelta(days=2), likes=100)
+            )
+            posts = self.post_model.get_posts(1, 0, sort="top")
+            self.assertEqual(posts[0]["likes"], 100)
+            posts = self.post_model.get_posts(1, 0, sort="top", window="day")
+            self.assertEqual(posts[0]["likes"], 9, "Older than the window")
+
+    def test_get_posts_after(self):
+        with self.subTest("New"):
+            cursor = dict(
+                creation_date=self.posts[3]["creation_date"],
+                post_id=self.posts[3]["post_id"],
+            )
+            posts = self.post_model.get_posts_after(3, cursor)
+            self.assertEqual(self.titles(posts), ["Post 4", "Post 5", "Post 6"])
+
+        with self.subTest("Ties broken by post ID"):
+            hot = self.post_model.get_posts(10, 0, sort="hot")
+            cursor = dict(score=hot[4]["hot"], post_id=hot[4]["post_id"])
+            posts = self.post_model.get_posts_after(10, cursor, sort="hot")
+            self.assertEqual(posts, hot[5:])
+
+        with self.subTest("Windowed"):
+            self.post_model.create_post(
+                make_post(0, self.now - timedelta(days=2), likes=100)
+            )
+            top = self.post_model.get_posts(10, 0, "a", sort="top", window="day")
+            self.assertEqual(self.titles(top), [f"Post {i}" for i in (8, 6, 4, 2, 0)])
+            self.assertEqual(
+                self.post_model.get_posts(2, 1, "a", sort="top", window="day"), top[1:3]
+            )
+
+            cursor = dict(score=top[1]["top"], post_id=top[1]["post_id"])
+            posts = self.post_model.get_posts_after(
+                2, cursor, "a", sort="top", window="day"
+            )
+            self.assertEqual(posts, top[2:4])
+
+    def test_tags(self):
+        self.post_model.create_post(make_post(0, self.now, tags=["x", "y"]))
+        self.post_model.create_post(make_post(1, self.now, tags=["x"]))
+
+        self.assertEqual(len(self.post_model.get_posts(10, 0, tags=["x"])), 2)
+        self.assertEqual(len(self.post_model.get_posts(10, 0, tags=["y", "z"])), 1)
+        self.assertEqual(
+            len(self.post_model.get_posts(10, 0, tags=["x", "y"], tag_match="all")), 1
+        )
+        self.assertEqual(
+            self.post_model.get_tags(10),
+            [dict(tag="x", count=2), dict(tag="y", count=1)],
+        )
+
+    def test_normalize_stored_tags(self):
+        self.post_model.create_post(make_post(0, self.now, tags=[" X", "x", "y"]))
+        self.post_model.create_post(make_post(1, self.now, tags=["x"]))
+        self.post_model.create_post(make_post(2, self.now, tags=[" "]))
+
+        self.assertEqual(self.post_model.normalize_stored_tags(), 2)
+        self.assertEqual(self.post_model.normalize_stored_tags(), 0, "Normalized")
+        self.post_model.reconcile_counts()
+        self.assertEqual(
+            self.post_model.get_tags(10),
+            [dict(tag="x", count=2), dict(tag="y", count=1)],
+        )
+        self.assertEqual(
+            len(self.post_model.get_posts(10, 0, tags=["x", "y"], tag_match="all")), 1
+        )
+
+    def test_votes(self):
+        post_id = self.posts[0]["post_id"]
+
+        self.assertTrue(self.post_model.increment_votes(post_id, likes=5))
+        self.assertTrue(self.post_model.increment_votes(post_id, dislikes=-1))
+        post = self.post_model.get_by_post_id(post_id)
+        self.assertEqual((post["likes"], post["dislikes"]), (5, 0))
+        self.assertEqual(
+            self.post_model.get_vote_counts(post_id),
+            dict(post_id=post_id, likes=5, dislikes=0),
+        )
+        self.assertEqual(
+            self.post_model.get_post_version(post_id),
+            {key: post[key] for key in PostVersion.__annotations__},
+        )
+        self.assertEqual(
+            self.post_model.get_by_post_id(post_id)["hot"],
+            hot_score(5, 0, self.posts[0]["creation_date"]),
+        )
+        self.assertEqual(
+            self.post_model.add_vote_counts(
+                [dict(post_id=post_id, likes=10, dislikes=0)]
+            ),
+            1,
+        )
+        self.assertEqual(
+            self.post_model.get_posts(1, 0, sort="top")[0]["post_id"], post_id
+        )
+        self.assertFalse(self.post_model.increment_votes("missing", likes=1))
+        self.assertEqual(self.post_model.recompute_scores(), 0)
+
+    def test_counts(self):
+        self.assertEqual(self.post_model.get_count(), 10)
+        self.assertEqual(self.post_model.get_count("a"), 5)
+
+        self.assertTrue(self.post_model.delete_by_post_id(self.posts[0]["post_id"]))
+        self.assertFalse(self.post_model.delete_by_post_id(self.posts[0]["post_id"]))
+        self.assertEqual(self.post_model.get_count("a"), 4)
+        self.assertEqual(self.post_model.get_posts(1, 0)[0]["title"], "Post 1")
+
+        self.post_model.clear_posts("op")
+        self.assertEqual(self.post_model.get_count(), 0)
+        self.assertEqual(self.post_model.reconcile_counts(), 0)
+
+    def test_import_posts(self):
+        post = make_post(0, self.now) | dict(post_id="imported")
+
+        self.assertEqual(self.post_model.import_posts([post]), 1)
+        self.assertEqual(self.post_model.import_posts([post]), 0, "Existing ID")
+        self.assertEqual(
+            self.post_model.get_existing_post_ids(["imported", "missing"]),
+            {"imported"},
+        )
+
+    def test_edit_post(self):
+        post_id = self.posts[0]["post_id"]
+
+        self.assertTrue(
+            self.post_model.edit_post(
+                post_id,
+                dict(
+                    op="op",
+                    title="Edited",
+                    body="Zebra",
+                    media=None,
+                    tags=["z"],
+                    modified_date=self.now,
+                    likes=0,
+                    dislikes=0,
+                ),
+            )
+        )
+        self.assertEqual(self.post_model.get_by_post_id(post_id)["body"], "Zebra")
+        self.assertEqual(
+            self.titles(self.post_model.search_posts("zebra", 10)), ["Edited"]
+        )
+        self.assertEqual(
+            self.post_model.search_posts("post 0", 10)[0]["title"], "Post 1"
+        )
+
+        self.assertTrue(self.post_model.lock_post(post_id))
+        self.assertFalse(self.post_model.lock_post(post_id), "Already locked")
+        self.assertTrue(self.post_model.unlock_post(post_id))
+
+    def test_search_posts(self):
+        posts = self.post_model.search_posts("post", 4)
+        self.assertEqual(
+            self.titles(posts), [f"Post {i}" for i in range(4)], "Newer first"
+        )
+
+        with self.subTest("Cursor"):
+            # SQLite's bm25 relevance depends on every post, check before adding any
+            cursor = dict(score=posts[1]["rank"], post_id=posts[1]["post_id"])
+            after = self.post_model.search_posts("post", 2, cursor=cursor)
+            self.assertEqual(self.titles(after), ["Post 2", "Post 3"])
+
+        with self.subTest("Title over body"):
+            self.post_model.create_post(
+                make_post(20, self.now, title="Zebra", body="Nothing")
+            )
+            self.post_model.create_post(make_post(0, self.now, body="Zebra"))
+
+            self.assertEqual(
+                self.titles(self.post_model.search_posts("zebra", 10)),
+                ["Zebra", "Post 0"],
+            )
@@ -0,0 +1,49 @@
+import unittest
+from datetime import datetime, timedelta
+
+from backend.data.models.PostModel import (
+    HOT_TIMESCALE,
+    SEARCH_TIMESCALE,
+    controversy_score,
+    hot_score,
+    search_rank,
+    wilson_score,
+)
+
+
+class PostModelTestCase(unittest.TestCase):
+    def test_hot_score(self):
+        now = datetime(2025, 6, 1)
+        later = now + timedelta(seconds=HOT_TIMESCALE)
+
+        self.assertGreater(hot_score(2, 0, now), hot_score(0, 0, now))
+        self.assertLess(hot_score(0, 5, now), hot_score(0, 0, now))
+        self.assertEqual(hot_score(3, 3, now), hot_score(0, 0, now))
+        self.assertGreater(hot_score(0, 0, later), hot_score(5, 0, now), "Age wins")
+        self.assertAlmostEqual(
+            hot_score(10, 0, now), hot_score(0, 0, later), msg="10x votes per timescale"
+        )
+
+    def test_search_rank(self):
+        now = datetime(2025, 6, 1)
+        later = now + timedelta(seconds=SEARCH_TIMESCALE)
+
+        self.assertGreater(search_rank(2, now), search_rank(1, now))
+        self.assertGreater(search_rank(1, later), search_rank(1.5, now), "Age wins")
+        self.assertAlmostEqual(
+            search_rank(2, now), search_rank(1, later), msg="2x relevance per timescale"
+        )
+
+    def test_wilson_score(self):
+        self.assertEqual(wilson_score(0, 0), 0)
+        self.assertGreater(wilson_score(100, 10), wilson_score(10, 1), "More votes")
+        self.assertGreater(wilson_score(10, 1), wilson_score(10, 10))
+        self.assertGreater(wilson_score(1, 0), wilson_score(0, 1))
+        self.assertLess(wilson_score(1000, 0), 1)
+
+    def test_controversy_score(self):
+        self.assertEqual(controversy_score(10, 0), 0)
+        self.assertEqual(controversy_score(0, 10), 0)
+        self.assertEqual(controversy_score(10, 10), 20)
+        self.assertGreater(controversy_score(10, 10), controversy_score(15, 5), "Even")
+        self.assertGreater(controversy_score(50, 50), controversy_score(10, 10))
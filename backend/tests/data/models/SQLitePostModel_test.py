@@ -0,0 +1,22 @@
+import os
+import tempfile
+import unittest
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.models.sqlite.SQLitePostModel import SQLitePostModel
+from backend.tests.data.models.PostModelContract import PostModelContract
+
+
+class SQLitePostModelTestCase(PostModelContract, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        database = DatabaseFactory.create_database("sqlite")
+        database.connect(os.path.join(self.directory.name, "jafa.db"))
+        database.setup()
+
+        self.post_model = SQLitePostModel()
+        super().setUp()
+
+    def tearDown(self):
+        DatabaseFactory.create_database("sqlite").disconnect()
+        self.directory.cleanup()
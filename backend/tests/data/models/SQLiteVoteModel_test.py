@@ -0,0 +1,21 @@
+import os
+import tempfile
+import unittest
+
+from backend.data.databases.DatabaseFactory import DatabaseFactory
+from backend.data.models.sqlite.SQLiteVoteModel import SQLiteVoteModel
+from backend.tests.data.models.VoteModelContract import VoteModelContract
+
+
+class SQLiteVoteModelTestCase(VoteModelContract, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        database = DatabaseFactory.create_database("sqlite")
+        database.connect(os.path.join(self.directory.name, "jafa.db"))
+        database.setup()
+
+        self.vote_model = SQLiteVoteModel()
+
+    def tearDown(self):
+        DatabaseFactory.create_database("sqlite").disconnect()
+        self.directory.cleanup()
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from backend.data.models.VoteModel import VoteModel
+
+
+def make_vote(username: str, content_id: str, is_like: bool = True) -> dict:
+    return dict(
+        username=username,
+        content_id=content_id,
+        content_type="post",
+        is_like=is_like,
+        creation_date=datetime(2024, 1, 1),
+    )
+
+
+class VoteModelContract:
+    """Vote model tests every database must pass, mixed into a TestCase per database.
+
+    Subclasses connect the database and set `vote_model` in setUp.
+    """
+
+    vote_model: VoteModel
+
+    def test_add_vote(self):
+        self.assertTrue(self.vote_model.add_vote(make_vote("a", "1")))
+        self.assertFalse(self.vote_model.add_vote(make_vote("a", "1", False)))
+        self.assertTrue(self.vote_model.get_vote(make_vote("a", "1"))["is_like"])
+
+    def test_upsert_vote(self):
+        self.assertIsNone(self.vote_model.upsert_vote(make_vote("a", "1")))
+        self.assertTrue(self.vote_model.upsert_vote(make_vote("a", "1", False)))
+        self.assertFalse(self.vote_model.get_vote(make_vote("a", "1"))["is_like"])
+
+    def test_update_vote(self):
+        self.assertFalse(self.vote_model.update_vote(make_vote("a", "1")))
+
+        self.vote_model.add_vote(make_vote("a", "1"))
+        self.assertFalse(self.vote_model.update_vote(make_vote("a", "1")))
+        self.assertTrue(self.vote_model.update_vote(make_vote("a", "1", False)))
+
+    def test_get_votes_by_ids(self):
+        self.vote_model.import_votes(
+            [make_vote("a", "1"), make_vote("a", "2", False), make_vote("b", "3")]
+        )
+
+        self.assertEqual(
+            self.vote_model.get_votes_by_ids("a", ["1", "2", "3"], "post"),
+            {"1": True, "2": False},
+        )
+
+    def test_clear_votes(self):
+        imported = self.vote_model.import_votes(
+            [make_vote("a", "1"), make_vote("a", "2"), make_vote("b", "1")]
+        )
+        self.assertEqual(len(imported), 3)
+        self.assertEqual(self.vote_model.import_votes([make_vote("a", "1")]), [])
+
+        self.vote_model.clear_votes_by_username("a")
+        self.assertIsNone(self.vote_model.get_vote(make_vote("a", "2")))
+        self.assertIsNotNone(self.vote_model.get_vote(make_vote("b", "1")))
+
+        self.vote_model.clear_votes_by_id("1")
+        self.assertIsNone(self.vote_model.get_vote(make_vote("b", "1")))
+        self.assertFalse(self.vote_model.remove_vote(make_vote("b", "1")))
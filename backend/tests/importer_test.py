@@ -0,0 +1,174 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import backend.importer as importer
+from backend.data.models.VoteModel import ContentType
+from backend.tests.blueprints import TestManagerFactory
+
+
+class TestImportManager:
+    """Records imported batches, rejecting posts titled "Rejected"."""
+
+    def __init__(self):
+        self.batches = []
+
+    def import_posts(self, posts):
+        self.batches.append(posts)
+        rejected = {
+            i: "Rejected" for i, post in enumerate(posts) if post["title"] == "Rejected"
+        }
+
+        return dict(imported=len(posts) - len(rejected), rejected=rejected)
+
+
+class ImporterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = TestImportManager()
+
+        self.test_manager_factory = TestManagerFactory()
+        self.test_manager_factory.create_post_manager = lambda: self.manager
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        return path
+
+    def write_posts(self, titles: list[str]) -> str:
+        return self.write(
+            "posts.ndjson",
+            "".join(
+                json.dumps(
+                    dict(id=i, op="test", subforum="test", title=title, body="Body")
+                )
+                + "\n"
+                for i, title in enumerate(titles)
+            ),
+        )
+
+    def test_import_post_id(self):
+        object_id = "65a1B2c3d4e5f60718293a4b"
+        self.assertEqual(importer.import_post_id(object_id), object_id.lower())
+
+        post_id = importer.import_post_id(123)
+        self.assertEqual(len(post_id), 24)
+        self.assertEqual(post_id, importer.import_post_id("123"), "IDs are stable")
+        self.assertNotEqual(post_id, importer.import_post_id("124"))
+
+    def test_read_rows(self):
+        with self.subTest("NDJSON"):
+            path = self.write("rows.ndjson", '{"a": 1}\n\nnot json\n[1]\n{"a": 2}\n')
+
+            self.assertEqual(
+                list(importer.read_rows(path)),
+                [(1, dict(a=1)), (3, None), (4, None), (5, dict(a=2))],
+            )
+
+        with self.subTest("CSV"):
+            path = self.write("rows.csv", "a,b\n1,x|y\n2,\n")
+
+            self.assertEqual(
+                list(importer.read_rows(path)),
+                [(1, dict(a="1", b="x|y")), (2, dict(a="2", b=""))],
+            )
+
+    def test_parse_rows(self):
+        with self.subTest("Post"):
+            post = importer.parse_post(
+                dict(
+                    id="1",
+                    op="test",
+                    subforum="test",
+                    title="Title",
+                    body="Body",
+                    tags="a|b",
+                    locked="true",
+                    creation_date="2024-01-02T03:04:05",
+                )
+            )
+
+            self.assertEqual(post["post_id"], importer.import_post_id("1"))
+            self.assertEqual(post["tags"], ["a", "b"])
+            self.assertIsNone(post["media"])
+            self.assertTrue(post["locked"])
+            self.assertEqual(post["creation_date"], datetime(2024, 1, 2, 3, 4, 5))
+            self.assertEqual(post["modified_date"], post["creation_date"])
+
+            with self.assertRaises(importer.InvalidRowError, msg="Missing id"):
+                importer.parse_post(dict(op="test", title="Title", body="Body"))
+
+            with self.assertRaises(importer.InvalidRowError, msg="Invalid date"):
+                importer.parse_post(
+                    dict(
+                        id="1",
+                        op="test",
+                        subforum="test",
+                        title="Title",
+                        body="Body",
+                        creation_date="yesterday",
+                    )
+                )
+
+        with self.subTest("Vote"):
+            vote = importer.parse_vote(dict(username="test", post_id=1, is_like="0"))
+
+            self.assertEqual(vote["content_id"], importer.import_post_id("1"))
+            self.assertEqual(vote["content_type"], ContentType.POST)
+            self.assertFalse(vote["is_like"])
+
+            with self.assertRaises(importer.InvalidRowError, msg="Invalid boolean"):
+                importer.parse_vote(dict(username="test", post_id=1, is_like="maybe"))
+
+    def test_import_file(self):
+        path = self.write_posts(["Title 0", "Rejected", "Title 2", "Title 3"])
+        # Missing fields
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"id": 4}\n')
+
+        checkpoint = importer.Checkpoint(f"{path}.checkpoint", "posts", path)
+        batches = list(
+            importer.import_file(
+                "posts", path, checkpoint, 2, manager_factory=self.test_manager_factory
+            )
+        )
+
+        self.assertEqual([batch["rows"] for batch in batches], [2, 4, 5])
+        self.assertEqual(sum(batch["imported"] for batch in batches), 3)
+        self.assertEqual(batches[0]["rejected"], {2: "Rejected"})
+        self.assertEqual(batches[2]["rejected"], {5: "Missing op"})
+        self.assertEqual([len(batch) for batch in self.manager.batches], [2, 2])
+        self.assertEqual(importer.Checkpoint(checkpoint.path, "posts", path).rows, 5)
+
+    def test_resume(self):
+        path = self.write_posts(["Title 0", "Title 1", "Title 2"])
+
+        checkpoint = importer.Checkpoint(f"{path}.checkpoint", "posts", path)
+        checkpoint.save(2)
+
+        checkpoint = importer.Checkpoint(checkpoint.path, "posts", path)
+        batches = list(
+            importer.import_file(
+                "posts", path, checkpoint, manager_factory=self.test_manager_factory
+            )
+        )
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(
+            [post["title"] for post in self.manager.batches[0]],
+            ["Title 2"],
+            "Rows before the checkpoint are skipped",
+        )
+
+        with self.assertRaises(ValueError, msg="Checkpoint of another kind"):
+            importer.Checkpoint(checkpoint.path, "votes", path)
+
+        checkpoint.remove()
+        self.assertFalse(os.path.exists(checkpoint.path))
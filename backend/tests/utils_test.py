@@ -1,14 +1,19 @@
 import unittest
+from datetime import datetime
+
 from backend.constants import HTTP
 from backend.tests import setup_test_context
 from backend.app import create_app
 
 from backend.utils import (
     ceil_division,
+    fingerprint,
     make_blueprint,
+    make_conditional_success,
     make_error,
     make_success,
     require_keys,
+    split_list,
 )
 
 
@@ -81,6 +86,70 @@ class UtilsTestCase(unittest.TestCase):
 
             setup_test_context(self.app, test)
 
+    def test_fingerprint(self):
+        date = datetime(2024, 1, 1)
+
+        self.assertEqual(
+            fingerprint([1, date], dict(a=1)), fingerprint([1, date], dict(a=1))
+        )
+        self.assertNotEqual(fingerprint([1, date]), fingerprint([2, date]))
+        self.assertNotEqual(fingerprint(dict(a=1)), fingerprint(dict(a=2)))
+
+    def test_make_conditional_success(self):
+        etag = fingerprint("version")
+        date = datetime(2024, 1, 1, 12)
+
+        with self.subTest("Without conditions"):
+
+            def test():
+                response = make_conditional_success(dict(data="Test"), etag, date)
+
+                self.assertEqual(response.status_code, HTTP.SUCCESS)
+                self.assertEqual(dict(data="Test"), response.get_json())
+                self.assertEqual((etag, False), response.get_etag())
+                self.assertEqual(
+                    "Mon, 01 Jan 2024 12:00:00 GMT", response.headers["Last-Modified"]
+                )
+                self.assertTrue(response.cache_control.no_cache)
+                self.assertFalse(response.cache_control.private)
+
+            setup_test_context(self.app, test)
+
+        with self.subTest("Matching If-None-Match"):
+            with self.app.test_request_context(
+                headers={"If-None-Match": f'"other", "{etag}"'}
+            ):
+                response = make_conditional_success(dict(data="Test"), etag, date)
+
+            self.assertEqual(response.status_code, HTTP.NOT_MODIFIED)
+            self.assertEqual(b"", response.get_data())
+            self.assertEqual((etag, False), response.get_etag())
+
+        with self.subTest("Other If-None-Match"):
+            with self.app.test_request_context(headers={"If-None-Match": '"other"'}):
+                response = make_conditional_success(dict(data="Test"), etag, date)
+
+            self.assertEqual(response.status_code, HTTP.SUCCESS)
+
+        with self.subTest("Private"):
+            for headers in ({}, {"If-None-Match": f'"{etag}"'}):
+                with self.app.test_request_context(headers=headers):
+                    response = make_conditional_success(
+                        dict(data="Test"), etag, date, private=True
+                    )
+
+                self.assertTrue(response.cache_control.private)
+                self.assertTrue(response.cache_control.no_cache)
+                self.assertIn("Cookie", response.vary)
+
+        with self.subTest("If-Modified-Since alone"):
+            with self.app.test_request_context(
+                headers={"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"}
+            ):
+                response = make_conditional_success(dict(data="Test"), etag, date)
+
+            self.assertEqual(response.status_code, HTTP.SUCCESS)
+
     def test_require_keys(self):
         with self.subTest("Empty list should never fail"):
 
@@ -200,6 +269,13 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(-76, ceil_division(1481237419283, -19328718923))
         self.assertEqual(77, ceil_division(-1481237419283, -19328718923))
 
+    def test_split_list(self):
+        self.assertEqual(["a", "b"], split_list("a,b"))
+        self.assertEqual(["a"], split_list("a"))
+        self.assertIsNone(split_list(None))
+        self.assertIsNone(split_list(""))
+        self.assertIsNone(split_list("   "))
+
     def test_make_blueprint(self):
         with self.subTest("Empty url_prefix becomes /name"):
             blueprint = make_blueprint("name", "import_name", url_prefix=None)
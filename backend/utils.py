@@ -1,6 +1,10 @@
+import hashlib
+import json
+from datetime import datetime
 from functools import wraps
 
 from flask import Blueprint, Response, jsonify, make_response, request
+from werkzeug.http import is_resource_modified
 
 from .constants import HTTP
 
@@ -67,6 +71,46 @@ def make_success(data: str | dict):
     return response
 
 
+def fingerprint(*parts) -> str:
+    """Return a hash of JSON serializable parts, as a strong ETag for them."""
+    data = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def make_conditional_success(
+    data: dict | None,
+    etag: str,
+    last_modified: datetime | None = None,
+    private: bool = False,
+) -> Response:
+    """Construct a Flask Response for a version of a piece of data
+
+    Data is only serialized when the request's If-None-Match doesn't have
+    `etag`, otherwise the response is an empty 304 Not Modified, and `data`
+    may be None. Votes don't move `last_modified`, so If-Modified-Since alone
+    is never answered with 304. Caches must revalidate before reusing the
+    response.
+
+    :param private: Whether `data` depends on the logged in user. Shared caches
+    then don't keep the response, and browsers keep it per session cookie.
+    """
+    if is_resource_modified(request.environ, etag=etag):
+        response = make_success(data)
+    else:
+        response = make_response("", HTTP.NOT_MODIFIED)
+
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+
+    if private:
+        response.cache_control.private = True
+        response.vary.add("Cookie")
+
+    return response
+
+
 def require_keys(keys: list[str]):
     """Decorator: Requires all keys to be present in request
 
@@ -100,6 +144,17 @@ def ceil_division(a: int, b: int) -> int:
     return -(a // -b)
 
 
+def split_list(value: str | None) -> list[str] | None:
+    """Split a comma separated form value or get parameter.
+
+    :return: None if the value is missing or blank.
+    """
+    if value is None or value.strip() == "":
+        return None
+
+    return value.split(",")
+
+
 def make_blueprint(name: str, import_name: str, url_prefix: str | None = None):
     """Return a blueprint with a given name.
 
@@ -109,5 +164,3 @@ def make_blueprint(name: str, import_name: str, url_prefix: str | None = None):
         url_prefix = f"/{name}"
 
     return Blueprint(name, import_name, url_prefix=url_prefix)
-
-
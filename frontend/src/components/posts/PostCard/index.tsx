@@ -4,7 +4,7 @@ import "./index.css";
 import PostVote from "../PostVote";
 
 export interface PostData {
-  body: string;
+  preview: string;
   creation_date: string;
   dislikes: number;
   likes: number;
@@ -36,7 +36,7 @@ export default function PostCard({ data }: Readonly<PostCardProps>) {
         <Link to={`/post/${data.post_id}`} className="postcard-title">
           {data.title}
         </Link>
-        <p className="postcard-body">{data.body}</p>
+        <p className="postcard-body">{data.preview}</p>
       </div>
     </div>
   );